@@ -3,10 +3,76 @@
 from collections.abc import Iterator
 from typing import Any
 
+from cuvis_ai_schemas.execution.aggregation import (
+    ExponentialMovingAverage,
+    MetricAggregator,
+    MetricSummary,
+    RollingWindow,
+    merge_summaries,
+)
 from cuvis_ai_schemas.execution.context import Context
+from cuvis_ai_schemas.execution.encoding import (
+    ArtifactEncoder,
+    EncodedArtifact,
+    ImageEncodingPolicy,
+)
+from cuvis_ai_schemas.execution.metric_buffer import MetricBuffer
 from cuvis_ai_schemas.execution.monitoring import Artifact, Metric
+from cuvis_ai_schemas.execution.openmetrics import (
+    CONTENT_TYPE as OPENMETRICS_CONTENT_TYPE,
+)
+from cuvis_ai_schemas.execution.openmetrics import OpenMetricsRenderer, render_openmetrics
+from cuvis_ai_schemas.execution.pyramid import (
+    ArtifactPyramidReader,
+    PyramidIndex,
+    PyramidLevel,
+    write_artifact_pyramid,
+    write_pyramid,
+)
+from cuvis_ai_schemas.execution.sampling import (
+    ArtifactSampler,
+    ArtifactSamplingPolicy,
+    ArtifactSamplingRule,
+)
+from cuvis_ai_schemas.execution.shm_ring import (
+    ArtifactDescriptor,
+    ArtifactRingReader,
+    ArtifactRingWriter,
+)
+from cuvis_ai_schemas.execution.sink import AsyncRecordSink, SinkConfig, SinkStats
 
 # Type alias for data streaming
 InputStream = Iterator[dict[str, Any]]
 
-__all__ = ["Context", "Artifact", "Metric", "InputStream"]
+__all__ = [
+    "Context",
+    "Artifact",
+    "Metric",
+    "MetricBuffer",
+    "InputStream",
+    "OPENMETRICS_CONTENT_TYPE",
+    "OpenMetricsRenderer",
+    "render_openmetrics",
+    "AsyncRecordSink",
+    "SinkConfig",
+    "SinkStats",
+    "ArtifactEncoder",
+    "EncodedArtifact",
+    "ImageEncodingPolicy",
+    "ArtifactSampler",
+    "ArtifactSamplingPolicy",
+    "ArtifactSamplingRule",
+    "ArtifactDescriptor",
+    "ArtifactRingReader",
+    "ArtifactRingWriter",
+    "ArtifactPyramidReader",
+    "PyramidIndex",
+    "PyramidLevel",
+    "write_artifact_pyramid",
+    "write_pyramid",
+    "ExponentialMovingAverage",
+    "MetricAggregator",
+    "MetricSummary",
+    "RollingWindow",
+    "merge_summaries",
+]
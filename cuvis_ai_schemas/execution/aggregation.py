@@ -0,0 +1,357 @@
+"""Online aggregation of ``Metric`` streams.
+
+Instead of forwarding every raw step, producers feed
+:class:`~cuvis_ai_schemas.execution.monitoring.Metric` records into a
+:class:`MetricAggregator` and emit its aggregated values: a rolling-window
+mean/min/max and an exponential moving average per ``(name, stage)``, and a
+running per-``(name, stage, epoch)`` summary. Every update is O(1) (amortized
+for the window extrema).
+
+Epoch summaries are :class:`MetricSummary` snapshots (count, mean, sum of
+squared deviations, min, max, last) that merge exactly with Chan's parallel
+formula, so data-parallel ranks can aggregate locally and combine snapshots
+once per epoch:
+
+>>> merged = merge_summaries(rank_snapshots)  # one snapshot dict per rank
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Literal
+
+from cuvis_ai_schemas.enums.types import ExecutionStage
+from cuvis_ai_schemas.execution.monitoring import Metric
+
+SummaryKey = tuple[str, ExecutionStage, int]
+"""``(name, stage, epoch)`` key of an epoch summary."""
+
+SummaryField = Literal["mean", "min", "max", "last", "std", "count"]
+
+
+class RollingWindow:
+    """Mean, min, and max over the last ``size`` samples.
+
+    The running sum gives an O(1) mean; monotonic deques give amortized O(1)
+    extrema.
+
+    Parameters
+    ----------
+    size : int
+        Window length in samples.
+
+    Raises
+    ------
+    ValueError
+        If ``size`` < 1.
+    """
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError(f"Window size must be >= 1, got {size}")
+        self.size = size
+        self._values: deque[float] = deque()
+        self._sum = 0.0
+        self._index = 0
+        self._mins: deque[tuple[int, float]] = deque()
+        self._maxs: deque[tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        """Number of samples currently in the window."""
+        return len(self._values)
+
+    def update(self, value: float) -> None:
+        """Push one sample, evicting the oldest once the window is full."""
+        self._values.append(value)
+        self._sum += value
+        if len(self._values) > self.size:
+            self._sum -= self._values.popleft()
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((self._index, value))
+        while self._maxs and self._maxs[-1][1] <= value:
+            self._maxs.pop()
+        self._maxs.append((self._index, value))
+        oldest = self._index - self.size
+        if self._mins[0][0] <= oldest:
+            self._mins.popleft()
+        if self._maxs[0][0] <= oldest:
+            self._maxs.popleft()
+        self._index += 1
+
+    @property
+    def mean(self) -> float:
+        """Window mean (``nan`` when empty)."""
+        return self._sum / len(self._values) if self._values else math.nan
+
+    @property
+    def min(self) -> float:
+        """Window minimum (``nan`` when empty)."""
+        return self._mins[0][1] if self._mins else math.nan
+
+    @property
+    def max(self) -> float:
+        """Window maximum (``nan`` when empty)."""
+        return self._maxs[0][1] if self._maxs else math.nan
+
+
+class ExponentialMovingAverage:
+    """Bias-corrected exponential moving average.
+
+    Parameters
+    ----------
+    alpha : float
+        Weight of the newest sample, in ``(0, 1]``.
+
+    Raises
+    ------
+    ValueError
+        If ``alpha`` is outside ``(0, 1]``.
+    """
+
+    def __init__(self, alpha: float) -> None:
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"EMA alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self._biased = 0.0
+        self._decay = 1.0
+
+    def update(self, value: float) -> None:
+        """Fold in one sample."""
+        self._biased = (1.0 - self.alpha) * self._biased + self.alpha * value
+        self._decay *= 1.0 - self.alpha
+
+    @property
+    def value(self) -> float:
+        """Current average (``nan`` before the first sample).
+
+        Dividing by ``1 - (1 - alpha)**n`` removes the bias toward the zero
+        initial state, so early values are not dragged toward 0.
+        """
+        if self._decay == 1.0:
+            return math.nan
+        return self._biased / (1.0 - self._decay)
+
+
+@dataclass(frozen=True)
+class MetricSummary:
+    """Mergeable running statistics of one metric series.
+
+    Attributes
+    ----------
+    count : int
+        Number of samples.
+    mean : float
+        Sample mean.
+    m2 : float
+        Sum of squared deviations from the mean (Welford's ``M2``).
+    min, max : float
+        Extremes.
+    last : float
+        Most recent sample (for merges, the right-hand operand's).
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    last: float = math.nan
+
+    @property
+    def variance(self) -> float:
+        """Population variance (``nan`` when empty)."""
+        return self.m2 / self.count if self.count else math.nan
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation (``nan`` when empty)."""
+        return math.sqrt(self.variance)
+
+    def update(self, value: float) -> MetricSummary:
+        """Return the summary with one more sample (Welford's update)."""
+        count = self.count + 1
+        delta = value - self.mean
+        mean = self.mean + delta / count
+        return MetricSummary(
+            count=count,
+            mean=mean,
+            m2=self.m2 + delta * (value - mean),
+            min=min(self.min, value),
+            max=max(self.max, value),
+            last=value,
+        )
+
+    def merge(self, other: MetricSummary) -> MetricSummary:
+        """Combine two disjoint summaries exactly (Chan et al.)."""
+        if not other.count:
+            return self
+        if not self.count:
+            return other
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return MetricSummary(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta * delta * self.count * other.count / count,
+            min=min(self.min, other.min),
+            max=max(self.max, other.max),
+            last=other.last,
+        )
+
+    def get(self, field: SummaryField) -> float:
+        """Value of one summary statistic by name."""
+        return float(self.count) if field == "count" else float(getattr(self, field))
+
+
+def merge_summaries(
+    snapshots: Iterable[Mapping[SummaryKey, MetricSummary]],
+) -> dict[SummaryKey, MetricSummary]:
+    """Merge per-rank :meth:`MetricAggregator.snapshot` results key by key."""
+    merged: dict[SummaryKey, MetricSummary] = {}
+    for snapshot in snapshots:
+        for key, summary in snapshot.items():
+            current = merged.get(key)
+            merged[key] = summary if current is None else current.merge(summary)
+    return merged
+
+
+class MetricAggregator:
+    """Aggregate a ``Metric`` stream into windows, EMAs, and epoch summaries.
+
+    Parameters
+    ----------
+    window : int | None
+        Rolling-window length per ``(name, stage)``; ``None`` disables windows.
+    ema_alpha : float | None
+        EMA weight per ``(name, stage)``; ``None`` disables the EMA.
+
+    Examples
+    --------
+    >>> aggregator = MetricAggregator(window=50, ema_alpha=0.1)
+    >>> aggregator.update(Metric(name="loss", value=0.7, stage=ExecutionStage.TRAIN))
+    >>> aggregator.emit_epoch(ExecutionStage.TRAIN, epoch=0)
+    [Metric(name='loss', value=0.7, stage=<ExecutionStage.TRAIN: 'train'>, epoch=0, batch_idx=0)]
+    """
+
+    def __init__(self, window: int | None = None, ema_alpha: float | None = None) -> None:
+        if window is not None and window < 1:
+            raise ValueError(f"Window size must be >= 1, got {window}")
+        if ema_alpha is not None and not 0.0 < ema_alpha <= 1.0:
+            raise ValueError(f"EMA alpha must be in (0, 1], got {ema_alpha}")
+        self.window_size = window
+        self.ema_alpha = ema_alpha
+        self._windows: dict[tuple[str, ExecutionStage], RollingWindow] = {}
+        self._emas: dict[tuple[str, ExecutionStage], ExponentialMovingAverage] = {}
+        self._summaries: dict[SummaryKey, MetricSummary] = {}
+
+    def update(self, metric: Metric) -> None:
+        """Fold one metric into every enabled aggregate."""
+        stage = ExecutionStage(metric.stage)
+        series = (metric.name, stage)
+        if self.window_size is not None:
+            window = self._windows.get(series)
+            if window is None:
+                window = self._windows[series] = RollingWindow(self.window_size)
+            window.update(metric.value)
+        if self.ema_alpha is not None:
+            ema = self._emas.get(series)
+            if ema is None:
+                ema = self._emas[series] = ExponentialMovingAverage(self.ema_alpha)
+            ema.update(metric.value)
+        key = (metric.name, stage, metric.epoch)
+        self._summaries[key] = self._summaries.get(key, MetricSummary()).update(metric.value)
+
+    def update_many(self, metrics: Iterable[Metric]) -> None:
+        """Fold in every metric of ``metrics``."""
+        for metric in metrics:
+            self.update(metric)
+
+    def window(self, name: str, stage: ExecutionStage) -> RollingWindow | None:
+        """Rolling window of a series, if windows are enabled and it was seen."""
+        return self._windows.get((name, stage))
+
+    def ema(self, name: str, stage: ExecutionStage) -> float:
+        """Current EMA of a series (``nan`` if disabled or unseen)."""
+        ema = self._emas.get((name, stage))
+        return math.nan if ema is None else ema.value
+
+    def summary(self, name: str, stage: ExecutionStage, epoch: int) -> MetricSummary:
+        """Epoch summary of a series (empty if unseen)."""
+        return self._summaries.get((name, stage, epoch), MetricSummary())
+
+    def snapshot(self) -> dict[SummaryKey, MetricSummary]:
+        """Picklable copy of all epoch summaries, for merging across ranks."""
+        return dict(self._summaries)
+
+    def merge(self, snapshot: Mapping[SummaryKey, MetricSummary]) -> None:
+        """Merge another rank's :meth:`snapshot` into this aggregator."""
+        self._summaries = merge_summaries((self._summaries, snapshot))
+
+    def emit_window(
+        self, stage: ExecutionStage, batch_idx: int = 0, epoch: int = 0
+    ) -> list[Metric]:
+        """Current window mean and EMA of every series in ``stage`` as metrics.
+
+        Window means keep the metric name; EMAs are suffixed ``"/ema"``.
+        """
+        metrics = [
+            Metric(name=name, value=window.mean, stage=stage, epoch=epoch, batch_idx=batch_idx)
+            for (name, series_stage), window in self._windows.items()
+            if series_stage == stage
+        ]
+        metrics.extend(
+            Metric(
+                name=f"{name}/ema", value=ema.value, stage=stage, epoch=epoch, batch_idx=batch_idx
+            )
+            for (name, series_stage), ema in self._emas.items()
+            if series_stage == stage
+        )
+        return metrics
+
+    def emit_epoch(
+        self,
+        stage: ExecutionStage,
+        epoch: int,
+        field: SummaryField = "mean",
+        pop: bool = False,
+    ) -> list[Metric]:
+        """One metric per series with the epoch's reduced ``field``.
+
+        Parameters
+        ----------
+        stage, epoch
+            Which summaries to emit.
+        field : {"mean", "min", "max", "last", "std", "count"}
+            Statistic to report as ``Metric.value``.
+        pop : bool
+            Drop the emitted summaries afterwards (bounded memory over long runs).
+        """
+        keys = [key for key in self._summaries if key[1] == stage and key[2] == epoch]
+        metrics = [
+            Metric(name=key[0], value=self._summaries[key].get(field), stage=stage, epoch=epoch)
+            for key in keys
+        ]
+        if pop:
+            for key in keys:
+                del self._summaries[key]
+        return metrics
+
+    def reset(self) -> None:
+        """Drop all windows, EMAs, and summaries."""
+        self._windows.clear()
+        self._emas.clear()
+        self._summaries.clear()
+
+
+__all__ = [
+    "ExponentialMovingAverage",
+    "MetricAggregator",
+    "MetricSummary",
+    "RollingWindow",
+    "SummaryKey",
+    "merge_summaries",
+]
@@ -0,0 +1,322 @@
+"""Worker-pool encoding and downsampling of image artifacts.
+
+An ``ArtifactType.IMAGE`` :class:`~cuvis_ai_schemas.execution.monitoring.Artifact`
+carries a raw ``(H, W, 1 | 3)`` array. :class:`ArtifactEncoder` validates that
+shape on the calling thread (so a bad artifact fails at the call site, not in a
+worker), then downsamples and encodes it on a thread or process pool according
+to a per-``ArtifactType`` :class:`ImageEncodingPolicy`. Sinks receive compact
+:class:`EncodedArtifact` bytes instead of encoding full-resolution arrays
+themselves.
+
+PNG encoding is a small pure-``zlib`` writer (8-bit grayscale / RGB), so no
+imaging library is needed; ``zlib`` releases the GIL, which makes the thread
+pool effective. Requires NumPy (``[numpy]`` extra).
+"""
+
+from __future__ import annotations
+
+import io
+import math
+import struct
+import zlib
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import ModuleType, TracebackType
+from typing import Any, Literal
+
+from pydantic import Field
+
+from cuvis_ai_schemas.base import BaseSchemaModel
+from cuvis_ai_schemas.enums.types import ArtifactType, ExecutionStage
+from cuvis_ai_schemas.execution.monitoring import Artifact
+
+_MEDIA_TYPES = {"png": "image/png", "npy": "application/x-npy"}
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _require_numpy() -> ModuleType:
+    """Import numpy lazily, with a clear error when the optional extra is absent."""
+    try:
+        import numpy
+    except ImportError as exc:
+        msg = (
+            "Artifact encoding requires NumPy. Install it with: pip install cuvis-ai-schemas[numpy]"
+        )
+        raise ImportError(msg) from exc
+    return numpy
+
+
+class ImageEncodingPolicy(BaseSchemaModel):
+    """How artifacts of one ``ArtifactType`` are downsampled and encoded."""
+
+    max_resolution: int | None = Field(
+        default=1024,
+        ge=1,
+        description=(
+            "Longest output side in pixels; larger images are area-downsampled "
+            "(None keeps full size)"
+        ),
+    )
+    format: Literal["png", "npy"] = Field(
+        default="png",
+        description="'png' for 8-bit viewable images, 'npy' to keep the raw dtype and values",
+    )
+    quality: int = Field(
+        default=6,
+        ge=0,
+        le=9,
+        description="PNG zlib compression level (0 = fastest, 9 = smallest)",
+    )
+
+
+DEFAULT_ENCODING_POLICIES: dict[ArtifactType, ImageEncodingPolicy] = {
+    ArtifactType.IMAGE: ImageEncodingPolicy(),
+}
+"""Policy per ``ArtifactType`` used when an :class:`ArtifactEncoder` gets none."""
+
+
+@dataclass(frozen=True)
+class EncodedArtifact:
+    """An artifact's metadata plus its encoded payload.
+
+    Attributes
+    ----------
+    name, el_id, desc, type, stage, epoch, batch_idx
+        Copied from the source :class:`Artifact` (the array is not retained).
+    format : str
+        ``"png"`` or ``"npy"``.
+    data : bytes
+        Encoded payload.
+    shape : tuple[int, ...]
+        Shape after downsampling.
+    source_shape : tuple[int, ...]
+        Shape of the original array.
+    """
+
+    name: str
+    el_id: int
+    desc: str
+    type: ArtifactType
+    stage: ExecutionStage
+    epoch: int
+    batch_idx: int
+    format: str
+    data: bytes
+    shape: tuple[int, ...]
+    source_shape: tuple[int, ...]
+
+    @property
+    def media_type(self) -> str:
+        """MIME type of :attr:`data`."""
+        return _MEDIA_TYPES[self.format]
+
+
+def validate_artifact(artifact: Artifact) -> None:
+    """Check the documented shape constraint for the artifact's type.
+
+    Raises
+    ------
+    ValueError
+        If an ``IMAGE`` artifact's value is not a 3-D ``(H, W, 1 | 3)`` array
+        with non-zero height and width.
+    """
+    if artifact.type != ArtifactType.IMAGE:
+        return
+    shape = getattr(artifact.value, "shape", None)
+    if shape is None or len(shape) != 3 or shape[2] not in (1, 3) or 0 in shape[:2]:
+        raise ValueError(
+            f"Image artifact {artifact.name!r} must have shape (H, W, 1) or (H, W, 3), got {shape}"
+        )
+
+
+def downsample(value: Any, max_resolution: int | None) -> Any:
+    """Area-downsample an ``(H, W, C)`` array so its longest side fits.
+
+    Uses an integer block mean (factor ``ceil(max(H, W) / max_resolution)``);
+    trailing rows/columns that do not fill a block are dropped. Integer inputs
+    are rounded back to their dtype.
+    """
+    np = _require_numpy()
+    height, width = value.shape[:2]
+    if max_resolution is None or max(height, width) <= max_resolution:
+        return value
+    factor = math.ceil(max(height, width) / max_resolution)
+    out_h, out_w = max(height // factor, 1), max(width // factor, 1)
+    block_h, block_w = min(factor, height), min(factor, width)
+    cropped = value[: out_h * block_h, : out_w * block_w]
+    blocks = cropped.reshape(out_h, block_h, out_w, block_w, value.shape[2])
+    reduced = blocks.mean(axis=(1, 3))
+    if np.issubdtype(value.dtype, np.integer):
+        return np.rint(reduced).astype(value.dtype)
+    return reduced.astype(value.dtype, copy=False)
+
+
+def _to_uint8(value: Any) -> Any:
+    """Map an array to 8-bit: floats as ``[0, 1]`` intensities, ints clipped."""
+    np = _require_numpy()
+    if value.dtype == np.uint8:
+        return value
+    if value.dtype == np.bool_:
+        return value.astype(np.uint8) * 255
+    if np.issubdtype(value.dtype, np.floating):
+        scaled = np.nan_to_num(value, nan=0.0, posinf=1.0, neginf=0.0)
+        return (np.clip(scaled, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+    return np.clip(value, 0, 255).astype(np.uint8)
+
+
+def _png_chunk(tag: bytes, payload: bytes) -> bytes:
+    """One length-prefixed, CRC-terminated PNG chunk."""
+    return (
+        struct.pack(">I", len(payload))
+        + tag
+        + payload
+        + struct.pack(">I", zlib.crc32(payload, zlib.crc32(tag)))
+    )
+
+
+def encode_png(value: Any, level: int = 6) -> bytes:
+    """Encode an ``(H, W, 1 | 3)`` array as an 8-bit grayscale / RGB PNG."""
+    np = _require_numpy()
+    pixels = np.ascontiguousarray(_to_uint8(value))
+    height, width, channels = pixels.shape
+    color_type = 0 if channels == 1 else 2
+    rows = np.empty((height, 1 + width * channels), dtype=np.uint8)
+    rows[:, 0] = 0  # filter type "None" per scanline
+    rows[:, 1:] = pixels.reshape(height, width * channels)
+    header = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    return b"".join(
+        (
+            _PNG_SIGNATURE,
+            _png_chunk(b"IHDR", header),
+            _png_chunk(b"IDAT", zlib.compress(rows.tobytes(), level)),
+            _png_chunk(b"IEND", b""),
+        )
+    )
+
+
+def encode_npy(value: Any) -> bytes:
+    """Serialize an array in ``.npy`` format (dtype and values preserved)."""
+    np = _require_numpy()
+    buffer = io.BytesIO()
+    np.save(buffer, value, allow_pickle=False)
+    return buffer.getvalue()
+
+
+def encode_artifact(artifact: Artifact, policy: ImageEncodingPolicy) -> EncodedArtifact:
+    """Validate, downsample, and encode one artifact (runs inside pool workers).
+
+    Raises
+    ------
+    ValueError
+        If the artifact violates its type's shape constraint.
+    """
+    validate_artifact(artifact)
+    source_shape = tuple(artifact.value.shape)
+    value = downsample(artifact.value, policy.max_resolution)
+    data = encode_png(value, policy.quality) if policy.format == "png" else encode_npy(value)
+    return EncodedArtifact(
+        name=artifact.name,
+        el_id=artifact.el_id,
+        desc=artifact.desc,
+        type=artifact.type,
+        stage=artifact.stage,
+        epoch=artifact.epoch,
+        batch_idx=artifact.batch_idx,
+        format=policy.format,
+        data=data,
+        shape=tuple(value.shape),
+        source_shape=source_shape,
+    )
+
+
+class ArtifactEncoder:
+    """Encode artifacts on a worker pool according to per-type policies.
+
+    Parameters
+    ----------
+    policies : Mapping[ArtifactType, ImageEncodingPolicy] | None
+        Policy per artifact type; defaults to :data:`DEFAULT_ENCODING_POLICIES`.
+    max_workers : int | None
+        Pool size (``None`` uses the executor default).
+    executor : {"thread", "process"}
+        Pool kind. Threads avoid pickling the array and suit the GIL-releasing
+        ``zlib`` / NumPy work; processes isolate very large encodes.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[ArtifactType, ImageEncodingPolicy] | None = None,
+        max_workers: int | None = None,
+        executor: Literal["thread", "process"] = "thread",
+    ) -> None:
+        self.policies = dict(DEFAULT_ENCODING_POLICIES if policies is None else policies)
+        self._executor: Executor
+        if executor == "process":
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="cuvis-ai-encoder"
+            )
+
+    def __enter__(self) -> ArtifactEncoder:
+        """Return the encoder."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Shut the pool down after pending encodes finish."""
+        self.shutdown()
+
+    def policy_for(self, artifact_type: ArtifactType) -> ImageEncodingPolicy:
+        """Return the policy for ``artifact_type``.
+
+        Raises
+        ------
+        KeyError
+            If no policy is registered for the type.
+        """
+        try:
+            return self.policies[artifact_type]
+        except KeyError:
+            raise KeyError(f"No encoding policy for artifact type {artifact_type!r}") from None
+
+    def submit(self, artifact: Artifact) -> Future[EncodedArtifact]:
+        """Validate ``artifact`` now and schedule its encoding on the pool.
+
+        Raises
+        ------
+        ValueError
+            If the artifact violates its type's shape constraint (raised here,
+            on the calling thread).
+        KeyError
+            If no policy is registered for the artifact's type.
+        """
+        validate_artifact(artifact)
+        return self._executor.submit(encode_artifact, artifact, self.policy_for(artifact.type))
+
+    def encode_many(self, artifacts: Iterable[Artifact]) -> list[EncodedArtifact]:
+        """Encode ``artifacts`` in parallel and return results in input order."""
+        futures = [self.submit(artifact) for artifact in artifacts]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and release the pool."""
+        self._executor.shutdown(wait=wait)
+
+
+__all__ = [
+    "DEFAULT_ENCODING_POLICIES",
+    "ArtifactEncoder",
+    "EncodedArtifact",
+    "ImageEncodingPolicy",
+    "downsample",
+    "encode_artifact",
+    "encode_npy",
+    "encode_png",
+    "validate_artifact",
+]
@@ -0,0 +1,311 @@
+"""Columnar in-memory buffer for scalar metrics with bulk export.
+
+Logging one :class:`~cuvis_ai_schemas.execution.monitoring.Metric` per scalar
+per step creates millions of small Python objects over a long run. A
+:class:`MetricBuffer` instead interns each metric name once and appends every
+sample to five typed :mod:`array` columns (name id, value, step, epoch, stage
+code), about 29 bytes per sample and no per-sample objects for the garbage
+collector to track, so memory grows linearly and GC pressure stays flat.
+
+Appending needs only the standard library. Vectorized per-epoch reductions
+view the columns as NumPy arrays without copying (``[numpy]`` extra), and
+:meth:`MetricBuffer.to_parquet` needs ``pyarrow`` (installed separately).
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import math
+from array import array
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Any
+
+from cuvis_ai_schemas.enums.types import ExecutionStage
+from cuvis_ai_schemas.execution.monitoring import Metric
+
+_STAGES: tuple[ExecutionStage, ...] = tuple(ExecutionStage)
+_STAGE_CODES: dict[ExecutionStage, int] = {stage: code for code, stage in enumerate(_STAGES)}
+_COLUMNS = ("name", "value", "step", "epoch", "stage")
+
+
+def _require_numpy() -> ModuleType:
+    """Import numpy lazily, with a clear error when the optional extra is absent."""
+    try:
+        import numpy
+    except ImportError as exc:
+        msg = (
+            "MetricBuffer reductions require NumPy. "
+            "Install it with: pip install cuvis-ai-schemas[numpy]"
+        )
+        raise ImportError(msg) from exc
+    return numpy
+
+
+def _require_pyarrow() -> ModuleType:
+    """Import pyarrow lazily, with a clear error when the optional extra is absent."""
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401 - registers the parquet submodule
+    except ImportError as exc:
+        msg = "MetricBuffer.to_parquet requires pyarrow. Install it with: pip install pyarrow"
+        raise ImportError(msg) from exc
+    return pyarrow
+
+
+@contextmanager
+def _open_text(target: str | Path | IO[str]) -> Iterator[IO[str]]:
+    """Yield a writable text stream for a path or pass an open stream through."""
+    if isinstance(target, str | Path):
+        with Path(target).open("w", encoding="utf-8", newline="") as handle:
+            yield handle
+    else:
+        yield target
+
+
+class MetricBuffer:
+    """Append-only, array-backed store of scalar metric samples.
+
+    Examples
+    --------
+    >>> buffer = MetricBuffer()
+    >>> buffer.append("loss/train", 0.5, step=0, epoch=0, stage=ExecutionStage.TRAIN)
+    >>> buffer.add(Metric(name="loss/train", value=0.25, stage=ExecutionStage.TRAIN))
+    >>> len(buffer), buffer.names
+    (2, ('loss/train',))
+    """
+
+    def __init__(self) -> None:
+        self._name_ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._name_col = array("I")
+        self._value_col = array("d")
+        self._step_col = array("q")
+        self._epoch_col = array("q")
+        self._stage_col = array("b")
+
+    def __len__(self) -> int:
+        """Number of buffered samples."""
+        return len(self._value_col)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Interned metric names in first-seen order."""
+        return tuple(self._names)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column storage (excluding the name table)."""
+        return sum(col.itemsize * len(col) for col in self._columns())
+
+    def _intern(self, name: str) -> int:
+        """Return the id of ``name``, assigning the next id on first sight."""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._name_ids[name] = name_id
+            self._names.append(name)
+        return name_id
+
+    def append(
+        self,
+        name: str,
+        value: float,
+        step: int,
+        epoch: int = 0,
+        stage: ExecutionStage = ExecutionStage.INFERENCE,
+    ) -> None:
+        """Append one sample without creating a ``Metric`` object."""
+        self._name_col.append(self._intern(name))
+        self._value_col.append(value)
+        self._step_col.append(step)
+        self._epoch_col.append(epoch)
+        self._stage_col.append(_STAGE_CODES[ExecutionStage(stage)])
+
+    def add(self, metric: Metric, step: int | None = None) -> None:
+        """Append a ``Metric``; ``step`` defaults to ``metric.batch_idx``."""
+        self.append(
+            metric.name,
+            metric.value,
+            metric.batch_idx if step is None else step,
+            metric.epoch,
+            metric.stage,
+        )
+
+    def extend(self, metrics: Iterable[Metric]) -> None:
+        """Append every ``Metric`` in ``metrics`` (step = ``batch_idx``)."""
+        for metric in metrics:
+            self.add(metric)
+
+    def clear(self) -> None:
+        """Drop all samples and interned names."""
+        self._name_ids.clear()
+        self._names.clear()
+        for col in self._columns():
+            del col[:]
+
+    def _columns(self) -> tuple[array[Any], ...]:
+        """The five storage columns in ``name, value, step, epoch, stage`` order."""
+        return self._name_col, self._value_col, self._step_col, self._epoch_col, self._stage_col
+
+    # ------------------------------------------------------------------
+    # Vectorized access (NumPy)
+    # ------------------------------------------------------------------
+
+    def columns(self) -> dict[str, Any]:
+        """Return NumPy copies of the raw columns.
+
+        Keys are ``name_id``, ``value``, ``step``, ``epoch``, and
+        ``stage_code``; decode with :attr:`names` and ``tuple(ExecutionStage)``.
+        """
+        return {key: view.copy() for key, view in self._views().items()}
+
+    def _views(self) -> dict[str, Any]:
+        """Zero-copy NumPy views of the columns.
+
+        An :class:`array.array` cannot grow while a view exports its buffer, so
+        views must not outlive the calling method.
+        """
+        np = _require_numpy()
+        return {
+            "name_id": np.frombuffer(self._name_col, dtype=np.uint32),
+            "value": np.frombuffer(self._value_col, dtype=np.float64),
+            "step": np.frombuffer(self._step_col, dtype=np.int64),
+            "epoch": np.frombuffer(self._epoch_col, dtype=np.int64),
+            "stage_code": np.frombuffer(self._stage_col, dtype=np.int8),
+        }
+
+    def _mask(self, cols: dict[str, Any], name: str, stage: ExecutionStage | None) -> Any:
+        """Boolean row mask selecting ``name`` (and ``stage`` when given)."""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            return cols["name_id"] != cols["name_id"]
+        mask = cols["name_id"] == name_id
+        if stage is not None:
+            mask &= cols["stage_code"] == _STAGE_CODES[ExecutionStage(stage)]
+        return mask
+
+    def series(self, name: str, stage: ExecutionStage | None = None) -> tuple[Any, Any]:
+        """Return ``(steps, values)`` arrays for one metric in append order."""
+        cols = self._views()
+        mask = self._mask(cols, name, stage)
+        return cols["step"][mask], cols["value"][mask]
+
+    def reduce_by_epoch(self, name: str, stage: ExecutionStage | None = None) -> dict[str, Any]:
+        """Reduce one metric per epoch in a single vectorized pass.
+
+        Parameters
+        ----------
+        name : str
+            Metric name.
+        stage : ExecutionStage | None
+            Restrict to one stage; ``None`` pools every stage.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Equal-length arrays ``epoch`` (ascending), ``count``, ``mean``,
+            ``min``, ``max``, and ``last`` (the most recently appended value).
+        """
+        np = _require_numpy()
+        cols = self._views()
+        mask = self._mask(cols, name, stage)
+        epochs = cols["epoch"][mask]
+        values = cols["value"][mask]
+        if not len(values):
+            empty = np.empty(0, dtype=np.float64)
+            return {
+                "epoch": np.empty(0, dtype=np.int64),
+                "count": np.empty(0, dtype=np.int64),
+                "mean": empty,
+                "min": empty,
+                "max": empty,
+                "last": empty,
+            }
+        unique, inverse, counts = np.unique(epochs, return_inverse=True, return_counts=True)
+        order = np.argsort(inverse, kind="stable")
+        grouped = values[order]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        return {
+            "epoch": unique,
+            "count": counts,
+            "mean": np.bincount(inverse, weights=values) / counts,
+            "min": np.minimum.reduceat(grouped, starts),
+            "max": np.maximum.reduceat(grouped, starts),
+            "last": grouped[starts + counts - 1],
+        }
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def iter_rows(self) -> Iterator[tuple[str, float, int, int, str]]:
+        """Yield ``(name, value, step, epoch, stage)`` tuples in append order."""
+        names = self._names
+        for name_id, value, step, epoch, code in zip(
+            self._name_col,
+            self._value_col,
+            self._step_col,
+            self._epoch_col,
+            self._stage_col,
+            strict=True,
+        ):
+            yield names[name_id], value, step, epoch, _STAGES[code].value
+
+    def to_ndjson(self, target: str | Path | IO[str]) -> None:
+        """Write one JSON object per sample (keys ``name, value, step, epoch, stage``).
+
+        Non-finite values (NaN, infinities) are written as ``null`` so every line
+        stays valid JSON.
+        """
+        with _open_text(target) as handle:
+            for name, value, step, epoch, stage in self.iter_rows():
+                row = {
+                    "name": name,
+                    "value": value if math.isfinite(value) else None,
+                    "step": step,
+                    "epoch": epoch,
+                    "stage": stage,
+                }
+                handle.write(json.dumps(row, allow_nan=False))
+                handle.write("\n")
+
+    def to_csv(self, target: str | Path | IO[str]) -> None:
+        """Write a CSV file with a ``name,value,step,epoch,stage`` header."""
+        with _open_text(target) as handle:
+            writer = csv.writer(handle, lineterminator="\n")
+            writer.writerow(_COLUMNS)
+            writer.writerows(self.iter_rows())
+
+    def to_parquet(self, target: str | Path) -> None:
+        """Write a Parquet file; ``name`` and ``stage`` are dictionary-encoded.
+
+        Requires ``pyarrow``.
+        """
+        pa = _require_pyarrow()
+
+        def column(col: array[Any], dtype: Any) -> Any:
+            """Zero-copy Arrow array over one column buffer."""
+            return pa.Array.from_buffers(dtype, len(col), [None, pa.py_buffer(col)])
+
+        table = pa.table(
+            {
+                "name": pa.DictionaryArray.from_arrays(
+                    column(self._name_col, pa.uint32()), pa.array(self._names, pa.string())
+                ),
+                "value": column(self._value_col, pa.float64()),
+                "step": column(self._step_col, pa.int64()),
+                "epoch": column(self._epoch_col, pa.int64()),
+                "stage": pa.DictionaryArray.from_arrays(
+                    column(self._stage_col, pa.int8()),
+                    pa.array([stage.value for stage in _STAGES], pa.string()),
+                ),
+            }
+        )
+        pa.parquet.write_table(table, str(target))
+
+
+__all__ = ["MetricBuffer"]
@@ -0,0 +1,233 @@
+"""OpenMetrics text exposition for profiling stats and ``Metric`` records.
+
+Renders :class:`~cuvis_ai_schemas.pipeline.profiling.NodeProfilingStats`,
+:class:`~cuvis_ai_schemas.pipeline.profiling.EdgeProfilingStats`, and
+:class:`~cuvis_ai_schemas.execution.monitoring.Metric` records into the
+OpenMetrics text format (which Prometheus scrapes natively) with stable
+metric-family names and ``node`` / ``stage`` / ``session`` labels.
+
+:class:`OpenMetricsRenderer` is the incremental form: it keeps the latest
+sample per series and caches each series' preformatted label string, so a
+scrape endpoint only re-formats the numbers. :func:`render_openmetrics` is the
+one-shot convenience wrapper.
+
+Family names (all prefixed ``cuvis_ai_``):
+
+- ``node_duration_seconds`` (summary: median as ``quantile="0.5"``, ``_sum``, ``_count``)
+- ``node_duration_{mean,min,max,stddev,last}_seconds`` (gauges)
+- ``node_{peak,alloc,device_peak}_bytes`` / ``node_alloc_blocks`` (gauges, only when traced)
+- ``edge_transfer_bytes`` / ``edge_transfer_tensors`` / ``edge_steps`` (counters)
+- ``metric`` (gauge, ``name`` label carries the ``Metric.name``)
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from cuvis_ai_schemas.execution.monitoring import Metric
+from cuvis_ai_schemas.pipeline.profiling import EdgeProfilingStats, NodeProfilingStats
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+"""HTTP ``Content-Type`` for a scrape response carrying :meth:`OpenMetricsRenderer.render`."""
+
+_PREFIX = "cuvis_ai_"
+
+# (family suffix, type, unit, help, sample suffix, value getter)
+_Family = tuple[str, str, str, str, str, Callable[[Any], float | int | None]]
+
+_NODE_FAMILIES: tuple[_Family, ...] = (
+    ("node_duration_mean_seconds", "gauge", "seconds", "Mean node call duration.", "", lambda s: s.mean_ms / 1000.0),
+    ("node_duration_min_seconds", "gauge", "seconds", "Minimum node call duration.", "", lambda s: s.min_ms / 1000.0),
+    ("node_duration_max_seconds", "gauge", "seconds", "Maximum node call duration.", "", lambda s: s.max_ms / 1000.0),
+    ("node_duration_stddev_seconds", "gauge", "seconds", "Population standard deviation of node call duration.", "", lambda s: s.std_ms / 1000.0),
+    ("node_duration_last_seconds", "gauge", "seconds", "Most recent node call duration.", "", lambda s: s.last_ms / 1000.0),
+    ("node_peak_bytes", "gauge", "bytes", "Largest transient host allocation in a node call.", "", lambda s: s.peak_bytes),
+    ("node_alloc_bytes", "gauge", "bytes", "Largest net host allocation held at node exit.", "", lambda s: s.alloc_bytes),
+    ("node_alloc_blocks", "gauge", "", "Largest net count of host memory blocks held at node exit.", "", lambda s: s.alloc_count),
+    ("node_device_peak_bytes", "gauge", "bytes", "Largest device peak allocation in a node call.", "", lambda s: s.device_peak_bytes),
+)  # fmt: skip
+
+_EDGE_FAMILIES: tuple[_Family, ...] = (
+    ("edge_transfer_bytes", "counter", "bytes", "Payload bytes moved across a pipeline connection.", "_total", lambda s: s.total_bytes),
+    ("edge_transfer_tensors", "counter", "", "Array/tensor objects moved across a pipeline connection.", "_total", lambda s: s.total_tensors),
+    ("edge_steps", "counter", "", "Steps that fed a pipeline connection.", "_total", lambda s: s.count),
+)  # fmt: skip
+
+
+def _escape(value: str) -> str:
+    """Escape a label value per the OpenMetrics text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(pairs: Iterable[tuple[str, str]]) -> str:
+    """Preformat ``{k="v",...}`` for a series (empty values are dropped)."""
+    body = ",".join(f'{key}="{_escape(value)}"' for key, value in pairs if value)
+    return f"{{{body}}}"
+
+
+def _number(value: float | int) -> str:
+    """Format a sample value (ints verbatim, floats shortest round-trip)."""
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _header(lines: list[str], name: str, kind: str, unit: str, help_text: str) -> None:
+    """Append the ``# TYPE`` / ``# UNIT`` / ``# HELP`` metadata for one family."""
+    lines.append(f"# TYPE {name} {kind}")
+    if unit:
+        lines.append(f"# UNIT {name} {unit}")
+    lines.append(f"# HELP {name} {help_text}")
+
+
+class OpenMetricsRenderer:
+    """Incremental OpenMetrics renderer keeping the latest sample per series.
+
+    Feed it with :meth:`update_node_stats`, :meth:`update_edge_stats`, and
+    :meth:`observe` (any order, any number of times) and call :meth:`render`
+    per scrape. Label strings are formatted once per series and reused.
+
+    Parameters
+    ----------
+    session : str
+        Value of the ``session`` label on every series; empty omits the label.
+    """
+
+    def __init__(self, session: str = "") -> None:
+        self.session = session
+        self._nodes: dict[tuple[str, str], tuple[str, NodeProfilingStats]] = {}
+        self._edges: dict[tuple[str, str, str], tuple[str, EdgeProfilingStats]] = {}
+        self._metrics: dict[tuple[str, str], tuple[str, float]] = {}
+
+    def update_node_stats(self, stats: Iterable[NodeProfilingStats]) -> None:
+        """Replace the stored snapshot for each ``(node_name, stage)`` in ``stats``."""
+        for item in stats:
+            key = (item.node_name, item.stage)
+            cached = self._nodes.get(key)
+            labels = (
+                cached[0] if cached else self._series_labels(("node", item.node_name), item.stage)
+            )
+            self._nodes[key] = (labels, item)
+
+    def update_edge_stats(self, stats: Iterable[EdgeProfilingStats]) -> None:
+        """Replace the stored snapshot for each ``(source, target, stage)`` in ``stats``."""
+        for item in stats:
+            key = (item.source, item.target, item.stage)
+            cached = self._edges.get(key)
+            labels = (
+                cached[0]
+                if cached
+                else self._series_labels(
+                    ("source", item.source), item.stage, ("target", item.target)
+                )
+            )
+            self._edges[key] = (labels, item)
+
+    def observe(self, metrics: Iterable[Metric]) -> None:
+        """Record the latest value of each ``(Metric.name, stage)`` series."""
+        for metric in metrics:
+            key = (metric.name, metric.stage.value)
+            cached = self._metrics.get(key)
+            labels = cached[0] if cached else self._series_labels(("name", metric.name), key[1])
+            self._metrics[key] = (labels, float(metric.value))
+
+    def clear(self) -> None:
+        """Drop every stored series (e.g. after a profiling reset)."""
+        self._nodes.clear()
+        self._edges.clear()
+        self._metrics.clear()
+
+    def render(self) -> str:
+        """Return the full exposition, terminated by ``# EOF``."""
+        lines: list[str] = []
+        if self._nodes:
+            self._render_node_summary(lines)
+            self._render_families(lines, _NODE_FAMILIES, self._nodes.values())
+        if self._edges:
+            self._render_families(lines, _EDGE_FAMILIES, self._edges.values())
+        if self._metrics:
+            name = f"{_PREFIX}metric"
+            _header(lines, name, "gauge", "", "Latest value of a logged Metric.")
+            lines.extend(
+                f"{name}{labels} {_number(value)}" for labels, value in self._metrics.values()
+            )
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def _series_labels(self, first: tuple[str, str], stage: str, *rest: tuple[str, str]) -> str:
+        """Preformat the label set of one series."""
+        return _labels((first, *rest, ("stage", stage), ("session", self.session)))
+
+    def _render_node_summary(self, lines: list[str]) -> None:
+        """Append the ``node_duration_seconds`` summary family."""
+        name = f"{_PREFIX}node_duration_seconds"
+        _header(lines, name, "summary", "seconds", "Node call duration.")
+        for labels, stats in self._nodes.values():
+            quantile_labels = labels[:-1] + (
+                ',quantile="0.5"}' if labels != "{}" else 'quantile="0.5"}'
+            )
+            lines.append(f"{name}{quantile_labels} {_number(stats.median_ms / 1000.0)}")
+            lines.append(f"{name}_sum{labels} {_number(stats.total_ms / 1000.0)}")
+            lines.append(f"{name}_count{labels} {_number(stats.count)}")
+
+    @staticmethod
+    def _render_families(
+        lines: list[str],
+        families: tuple[_Family, ...],
+        series: Iterable[tuple[str, Any]],
+    ) -> None:
+        """Append each family's samples, skipping families with no values."""
+        rows = list(series)
+        for suffix, kind, unit, help_text, sample_suffix, getter in families:
+            samples: list[tuple[str, float | int]] = []
+            for labels, stats in rows:
+                value = getter(stats)
+                if value is not None:
+                    samples.append((labels, value))
+            if not samples:
+                continue
+            name = f"{_PREFIX}{suffix}"
+            _header(lines, name, kind, unit, help_text)
+            lines.extend(
+                f"{name}{sample_suffix}{labels} {_number(value)}" for labels, value in samples
+            )
+
+
+def render_openmetrics(
+    node_stats: Iterable[NodeProfilingStats] = (),
+    metrics: Iterable[Metric] = (),
+    edge_stats: Iterable[EdgeProfilingStats] = (),
+    session: str = "",
+) -> str:
+    """Render one OpenMetrics exposition from snapshots and metric records.
+
+    Parameters
+    ----------
+    node_stats : Iterable[NodeProfilingStats]
+        Per-node profiling snapshots.
+    metrics : Iterable[Metric]
+        Metric records; the last value per ``(name, stage)`` wins.
+    edge_stats : Iterable[EdgeProfilingStats]
+        Per-connection data-volume snapshots.
+    session : str
+        ``session`` label value; empty omits the label.
+
+    Returns
+    -------
+    str
+        OpenMetrics text terminated by ``# EOF``.
+    """
+    renderer = OpenMetricsRenderer(session=session)
+    renderer.update_node_stats(node_stats)
+    renderer.update_edge_stats(edge_stats)
+    renderer.observe(metrics)
+    return renderer.render()
+
+
+__all__ = ["CONTENT_TYPE", "OpenMetricsRenderer", "render_openmetrics"]
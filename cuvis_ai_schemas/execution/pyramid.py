@@ -0,0 +1,320 @@
+"""Tiled multi-resolution (pyramidal) storage for large image artifacts.
+
+A full-resolution heatmap can be hundreds of megabytes, yet a viewer only ever
+shows a thumbnail or the tiles inside its viewport. :func:`write_pyramid`
+stores an ``(H, W, C)`` array as a pyramid of 2x area-downsampled levels, each
+cut into fixed ``tile_size`` square tiles laid out contiguously in one binary
+file, plus a JSON :class:`PyramidIndex` sidecar. :class:`ArtifactPyramidReader`
+memory-maps that file, so fetching a tile or a region touches only the bytes it
+needs:
+
+>>> write_artifact_pyramid(artifact, "heatmap.pyr", tile_size=256)
+>>> with ArtifactPyramidReader("heatmap.pyr") as pyramid:
+...     level = pyramid.level_for(512)
+...     tile = pyramid.tile(level, row=0, col=1)
+
+Tiles at the right and bottom edges are zero-padded on disk and trimmed on
+read. Requires NumPy (``[numpy]`` extra).
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from types import ModuleType, TracebackType
+from typing import Any
+
+from pydantic import Field
+
+from cuvis_ai_schemas.base import BaseSchemaModel
+from cuvis_ai_schemas.execution.encoding import downsample, validate_artifact
+from cuvis_ai_schemas.execution.monitoring import Artifact
+
+INDEX_SUFFIX = ".index.json"
+
+
+def _require_numpy() -> ModuleType:
+    """Import numpy lazily, with a clear error when the optional extra is absent."""
+    try:
+        import numpy
+    except ImportError as exc:
+        msg = (
+            "Artifact pyramids require NumPy. Install it with: pip install cuvis-ai-schemas[numpy]"
+        )
+        raise ImportError(msg) from exc
+    return numpy
+
+
+class PyramidLevel(BaseSchemaModel):
+    """Geometry and file placement of one pyramid level."""
+
+    height: int = Field(ge=1, description="Level height in pixels")
+    width: int = Field(ge=1, description="Level width in pixels")
+    rows: int = Field(ge=1, description="Number of tile rows")
+    cols: int = Field(ge=1, description="Number of tile columns")
+    offset: int = Field(ge=0, description="Byte offset of the level's first tile in the data file")
+
+
+class PyramidIndex(BaseSchemaModel):
+    """Index describing a tile-contiguous pyramid data file.
+
+    Level 0 is full resolution; each following level halves both sides
+    (rounding up) until the whole image fits in a single tile. Tiles of a
+    level are stored row-major, each as a ``(tile_size, tile_size, channels)``
+    C-contiguous block.
+    """
+
+    name: str = Field(default="", description="Name of the source artifact")
+    tile_size: int = Field(ge=1, description="Edge length of the square tiles in pixels")
+    channels: int = Field(ge=1, description="Number of channels (last array axis)")
+    dtype: str = Field(description="NumPy dtype string of the stored values, e.g. '<f4'")
+    levels: list[PyramidLevel] = Field(description="Levels from full resolution to coarsest")
+
+    @property
+    def tile_nbytes(self) -> int:
+        """Size of one stored tile in bytes."""
+        itemsize: int = _require_numpy().dtype(self.dtype).itemsize
+        return self.tile_size * self.tile_size * self.channels * itemsize
+
+
+def pyramid_index_path(path: str | Path) -> Path:
+    """Path of the JSON index sidecar belonging to data file ``path``."""
+    return Path(f"{path}{INDEX_SUFFIX}")
+
+
+def _halve(value: Any) -> Any:
+    """2x area-downsample an ``(H, W, C)`` array; odd edges are replicated first."""
+    np = _require_numpy()
+    height, width = value.shape[:2]
+    if height % 2 or width % 2:
+        value = np.pad(value, ((0, height % 2), (0, width % 2), (0, 0)), mode="edge")
+    return downsample(value, max(value.shape[0], value.shape[1]) // 2)
+
+
+def write_pyramid(
+    value: Any, path: str | Path, tile_size: int = 256, name: str = ""
+) -> PyramidIndex:
+    """Build the pyramid of an ``(H, W, C)`` array and write it to ``path``.
+
+    Parameters
+    ----------
+    value : np.ndarray
+        Source array; its dtype is kept at every level.
+    path : str | Path
+        Data file to create; the index is written to :func:`pyramid_index_path`.
+    tile_size : int
+        Tile edge length in pixels.
+    name : str
+        Artifact name recorded in the index.
+
+    Returns
+    -------
+    PyramidIndex
+        The index that was written.
+
+    Raises
+    ------
+    ValueError
+        If ``value`` is not a non-empty 3-D array or ``tile_size`` < 1.
+    """
+    np = _require_numpy()
+    level_value = np.asarray(value)
+    if level_value.ndim != 3 or 0 in level_value.shape:
+        raise ValueError(f"Pyramid source must be a non-empty (H, W, C) array, got {value.shape}")
+    if tile_size < 1:
+        raise ValueError(f"tile_size must be >= 1, got {tile_size}")
+    channels = level_value.shape[2]
+    levels: list[PyramidLevel] = []
+    offset = 0
+    with Path(path).open("wb") as handle:
+        while True:
+            height, width = level_value.shape[:2]
+            rows, cols = math.ceil(height / tile_size), math.ceil(width / tile_size)
+            for row in range(rows):
+                band = np.zeros((tile_size, cols * tile_size, channels), dtype=level_value.dtype)
+                strip = level_value[row * tile_size : (row + 1) * tile_size]
+                band[: strip.shape[0], :width] = strip
+                tiles = band.reshape(tile_size, cols, tile_size, channels).swapaxes(0, 1)
+                handle.write(np.ascontiguousarray(tiles).tobytes())
+            levels.append(
+                PyramidLevel(height=height, width=width, rows=rows, cols=cols, offset=offset)
+            )
+            offset += rows * cols * tile_size * tile_size * channels * level_value.itemsize
+            if rows == 1 and cols == 1:
+                break
+            level_value = _halve(level_value)
+    index = PyramidIndex(
+        name=name,
+        tile_size=tile_size,
+        channels=channels,
+        dtype=level_value.dtype.str,
+        levels=levels,
+    )
+    pyramid_index_path(path).write_text(index.to_json(), encoding="utf-8")
+    return index
+
+
+def write_artifact_pyramid(
+    artifact: Artifact, path: str | Path, tile_size: int = 256
+) -> PyramidIndex:
+    """Validate an image artifact and write its pyramid (see :func:`write_pyramid`).
+
+    Raises
+    ------
+    ValueError
+        If the artifact violates its type's shape constraint.
+    """
+    validate_artifact(artifact)
+    return write_pyramid(artifact.value, path, tile_size=tile_size, name=artifact.name)
+
+
+class ArtifactPyramidReader:
+    """Random-access reader over a memory-mapped pyramid data file.
+
+    Parameters
+    ----------
+    path : str | Path
+        Data file written by :func:`write_pyramid`.
+    index : PyramidIndex | None
+        Index of the file; loaded from the sidecar when omitted.
+    """
+
+    def __init__(self, path: str | Path, index: PyramidIndex | None = None) -> None:
+        np = _require_numpy()
+        if index is None:
+            index = PyramidIndex.from_json(pyramid_index_path(path).read_text(encoding="utf-8"))
+        self.index = index
+        self._raw: Any = np.memmap(path, dtype=np.uint8, mode="r")
+
+    def __enter__(self) -> ArtifactPyramidReader:
+        """Return the reader."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Drop the memory map."""
+        self.close()
+
+    @property
+    def num_levels(self) -> int:
+        """Number of pyramid levels."""
+        return len(self.index.levels)
+
+    def _level(self, level: int) -> PyramidLevel:
+        """Index entry of ``level``, with a clear error when out of range."""
+        if not 0 <= level < self.num_levels:
+            raise IndexError(f"Pyramid level {level} out of range (0..{self.num_levels - 1})")
+        return self.index.levels[level]
+
+    def level_shape(self, level: int) -> tuple[int, int, int]:
+        """``(height, width, channels)`` of ``level``."""
+        entry = self._level(level)
+        return entry.height, entry.width, self.index.channels
+
+    def level_for(self, max_side: int) -> int:
+        """Coarsest level whose longest side is still at least ``max_side`` pixels.
+
+        Falls back to level 0 when even full resolution is smaller.
+        """
+        for level in range(self.num_levels - 1, -1, -1):
+            entry = self.index.levels[level]
+            if max(entry.height, entry.width) >= max_side:
+                return level
+        return 0
+
+    def _tiles(self, level: int) -> Any:
+        """Zero-copy ``(rows, cols, T, T, C)`` view of a level's tiles."""
+        entry = self._level(level)
+        size = self.index.tile_size
+        nbytes = entry.rows * entry.cols * self.index.tile_nbytes
+        return (
+            self._raw[entry.offset : entry.offset + nbytes]
+            .view(self.index.dtype)
+            .reshape(entry.rows, entry.cols, size, size, self.index.channels)
+        )
+
+    def tile(self, level: int, row: int, col: int) -> Any:
+        """Read-only view of one tile, trimmed to the image at right/bottom edges.
+
+        Raises
+        ------
+        IndexError
+            If the level or tile coordinates are out of range.
+        """
+        entry = self._level(level)
+        if not (0 <= row < entry.rows and 0 <= col < entry.cols):
+            raise IndexError(
+                f"Tile ({row}, {col}) out of range for level {level} "
+                f"({entry.rows} x {entry.cols} tiles)"
+            )
+        size = self.index.tile_size
+        return self._tiles(level)[
+            row, col, : min(size, entry.height - row * size), : min(size, entry.width - col * size)
+        ]
+
+    def tiles_for_region(
+        self, level: int, y: int, x: int, height: int, width: int
+    ) -> list[tuple[int, int]]:
+        """``(row, col)`` of every tile overlapping a pixel region of ``level``."""
+        entry = self._level(level)
+        size = self.index.tile_size
+        y0, x0 = max(y, 0), max(x, 0)
+        y1, x1 = min(y + height, entry.height), min(x + width, entry.width)
+        if y1 <= y0 or x1 <= x0:
+            return []
+        return [
+            (row, col)
+            for row in range(y0 // size, (y1 - 1) // size + 1)
+            for col in range(x0 // size, (x1 - 1) // size + 1)
+        ]
+
+    def read_region(self, level: int, y: int, x: int, height: int, width: int) -> Any:
+        """Copy a pixel region of ``level``, reading only the tiles it overlaps.
+
+        The region is clipped to the level's bounds.
+        """
+        np = _require_numpy()
+        entry = self._level(level)
+        size = self.index.tile_size
+        y0, x0 = max(y, 0), max(x, 0)
+        y1, x1 = min(y + height, entry.height), min(x + width, entry.width)
+        out = np.empty(
+            (max(y1 - y0, 0), max(x1 - x0, 0), self.index.channels), dtype=self.index.dtype
+        )
+        tiles = self._tiles(level)
+        for row, col in self.tiles_for_region(level, y, x, height, width):
+            ty, tx = row * size, col * size
+            sy0, sy1 = max(y0, ty), min(y1, ty + size)
+            sx0, sx1 = max(x0, tx), min(x1, tx + size)
+            out[sy0 - y0 : sy1 - y0, sx0 - x0 : sx1 - x0] = tiles[
+                row, col, sy0 - ty : sy1 - ty, sx0 - tx : sx1 - tx
+            ]
+        return out
+
+    def read_level(self, level: int) -> Any:
+        """Copy a whole level as an ``(H, W, C)`` array."""
+        height, width, _ = self.level_shape(level)
+        return self.read_region(level, 0, 0, height, width)
+
+    def thumbnail(self, max_side: int) -> Any:
+        """Image whose longest side is at most ``max_side``, read from the best level."""
+        return downsample(self.read_level(self.level_for(max_side)), max_side)
+
+    def close(self) -> None:
+        """Release the memory map; returned tile views keep it alive until dropped."""
+        self._raw = None
+
+
+__all__ = [
+    "INDEX_SUFFIX",
+    "ArtifactPyramidReader",
+    "PyramidIndex",
+    "PyramidLevel",
+    "pyramid_index_path",
+    "write_artifact_pyramid",
+    "write_pyramid",
+]
@@ -0,0 +1,199 @@
+"""Declarative artifact sampling and rate-limiting.
+
+An :class:`ArtifactSamplingPolicy` decides which
+:class:`~cuvis_ai_schemas.execution.monitoring.Artifact` records are worth
+producing. Its :class:`ArtifactSampler` evaluator answers from metadata alone
+(name, stage, epoch, batch index, element id, optional score), so a node can
+ask *before* it slices, copies, or encodes an array:
+
+>>> sampler = ArtifactSampler(
+...     ArtifactSamplingPolicy(rules=[ArtifactSamplingRule(pattern="heatmap*", every_n_steps=10)])
+... )
+>>> sampler.should_log("heatmap_0", ExecutionStage.VAL, epoch=0, batch_idx=20)
+True
+
+Rules are matched in order against the artifact name (``fnmatch`` patterns);
+the first match wins. Per-stage budgets cap how many artifacts are kept per
+``(stage, epoch)`` across all names.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from fnmatch import fnmatchcase
+from typing import Literal
+
+from pydantic import Field
+
+from cuvis_ai_schemas.base import BaseSchemaModel
+from cuvis_ai_schemas.enums.types import ExecutionStage
+from cuvis_ai_schemas.execution.monitoring import Artifact
+
+
+class ArtifactSamplingRule(BaseSchemaModel):
+    """Sampling limits for artifacts whose name matches ``pattern``."""
+
+    pattern: str = Field(default="*", description="fnmatch pattern over Artifact.name")
+    stages: list[ExecutionStage] | None = Field(
+        default=None, description="Stages the rule applies to (None = all stages)"
+    )
+    every_n_steps: int = Field(
+        default=1, ge=1, description="Keep only batches whose batch_idx is a multiple of N"
+    )
+    max_elements: int | None = Field(
+        default=None, ge=0, description="Keep only the first K elements per batch (el_id < K)"
+    )
+    top_k: int | None = Field(
+        default=None,
+        ge=0,
+        description="Keep the K highest-scoring elements per batch (see ArtifactSampler.select)",
+    )
+    drop: bool = Field(default=False, description="Drop every matching artifact")
+
+    def matches(self, name: str, stage: ExecutionStage) -> bool:
+        """Whether the rule applies to an artifact ``name`` logged in ``stage``."""
+        return (self.stages is None or stage in self.stages) and fnmatchcase(name, self.pattern)
+
+
+class ArtifactSamplingPolicy(BaseSchemaModel):
+    """Ordered sampling rules plus per-stage budgets."""
+
+    rules: list[ArtifactSamplingRule] = Field(
+        default_factory=list, description="Rules tried in order; the first match applies"
+    )
+    default: Literal["keep", "drop"] = Field(
+        default="keep", description="Outcome for artifacts no rule matches"
+    )
+    stage_budgets: dict[ExecutionStage, int] = Field(
+        default_factory=dict,
+        description="Maximum artifacts kept per (stage, epoch); stages not listed are unlimited",
+    )
+
+
+_DROP_ALL = ArtifactSamplingRule(drop=True)
+_KEEP_ALL = ArtifactSamplingRule()
+
+
+class ArtifactSampler:
+    """Stateful evaluator of an :class:`ArtifactSamplingPolicy`.
+
+    Keeps the per-``(stage, epoch)`` budget counters and a cache of the rule
+    resolved for each ``(name, stage)``, so a decision is a couple of dict
+    lookups. Not thread-safe; use one sampler per producer.
+
+    Parameters
+    ----------
+    policy : ArtifactSamplingPolicy | None
+        Policy to evaluate; defaults to keeping everything.
+    """
+
+    def __init__(self, policy: ArtifactSamplingPolicy | None = None) -> None:
+        self.policy = policy or ArtifactSamplingPolicy()
+        self._rules: dict[tuple[str, ExecutionStage], ArtifactSamplingRule] = {}
+        self._spent: dict[tuple[ExecutionStage, int], int] = {}
+
+    def rule_for(self, name: str, stage: ExecutionStage) -> ArtifactSamplingRule:
+        """Return the rule governing ``name`` in ``stage`` (cached)."""
+        key = (name, stage)
+        rule = self._rules.get(key)
+        if rule is None:
+            rule = next(
+                (r for r in self.policy.rules if r.matches(name, stage)),
+                _KEEP_ALL if self.policy.default == "keep" else _DROP_ALL,
+            )
+            self._rules[key] = rule
+        return rule
+
+    def remaining_budget(self, stage: ExecutionStage, epoch: int) -> int | None:
+        """Artifacts still allowed for ``(stage, epoch)``; ``None`` if unlimited."""
+        budget = self.policy.stage_budgets.get(stage)
+        if budget is None:
+            return None
+        return max(budget - self._spent.get((stage, epoch), 0), 0)
+
+    def _step_allowed(self, rule: ArtifactSamplingRule, batch_idx: int) -> bool:
+        """Whether the rule admits this batch at all."""
+        return not rule.drop and batch_idx % rule.every_n_steps == 0
+
+    def _spend(self, stage: ExecutionStage, epoch: int, count: int) -> int:
+        """Consume up to ``count`` budget units; return how many were granted."""
+        remaining = self.remaining_budget(stage, epoch)
+        granted = count if remaining is None else min(count, remaining)
+        if granted and remaining is not None:
+            self._spent[(stage, epoch)] = self._spent.get((stage, epoch), 0) + granted
+        return granted
+
+    def should_log(
+        self,
+        name: str,
+        stage: ExecutionStage,
+        epoch: int,
+        batch_idx: int,
+        el_id: int = 0,
+    ) -> bool:
+        """Decide one artifact from its metadata, consuming budget when kept.
+
+        ``top_k`` needs the scores of the whole batch and is applied by
+        :meth:`select`; here a rule with ``top_k`` only enforces its other limits.
+        """
+        rule = self.rule_for(name, stage)
+        if not self._step_allowed(rule, batch_idx):
+            return False
+        if rule.max_elements is not None and el_id >= rule.max_elements:
+            return False
+        return self._spend(stage, epoch, 1) == 1
+
+    def select(
+        self,
+        name: str,
+        stage: ExecutionStage,
+        epoch: int,
+        batch_idx: int,
+        scores: Sequence[float] | int,
+    ) -> list[int]:
+        """Return the element ids of one batch to materialize, in ascending order.
+
+        Parameters
+        ----------
+        name, stage, epoch, batch_idx
+            Artifact metadata shared by the batch.
+        scores : Sequence[float] | int
+            One score per element (``el_id`` = index), e.g. a per-image anomaly
+            score, or just the batch size when no ranking is available.
+
+        Returns
+        -------
+        list[int]
+            Kept ``el_id`` values after every-N, first-K, top-K, and the stage
+            budget (highest scores win when the budget is short).
+        """
+        rule = self.rule_for(name, stage)
+        if not self._step_allowed(rule, batch_idx):
+            return []
+        size = scores if isinstance(scores, int) else len(scores)
+        candidates = list(
+            range(size if rule.max_elements is None else min(size, rule.max_elements))
+        )
+        if not isinstance(scores, int):
+            candidates.sort(key=lambda el_id: scores[el_id], reverse=True)
+        if rule.top_k is not None:
+            candidates = candidates[: rule.top_k]
+        granted = self._spend(stage, epoch, len(candidates))
+        return sorted(candidates[:granted])
+
+    def filter(self, artifacts: Iterable[Artifact]) -> list[Artifact]:
+        """Apply :meth:`should_log` to already-built artifacts (no ``top_k``)."""
+        return [
+            artifact
+            for artifact in artifacts
+            if self.should_log(
+                artifact.name, artifact.stage, artifact.epoch, artifact.batch_idx, artifact.el_id
+            )
+        ]
+
+    def reset(self) -> None:
+        """Forget spent budgets (e.g. when a new run reuses epoch numbers)."""
+        self._spent.clear()
+
+
+__all__ = ["ArtifactSampler", "ArtifactSamplingPolicy", "ArtifactSamplingRule"]
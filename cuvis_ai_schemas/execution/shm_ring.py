@@ -0,0 +1,383 @@
+"""Zero-copy hand-off of artifact arrays to a separate logging process.
+
+The training process writes each ``Artifact.value`` into a slot of a
+shared-memory ring (:class:`ArtifactRingWriter`) and sends only a small,
+picklable :class:`ArtifactDescriptor` through a ``multiprocessing`` queue or
+pipe. A dedicated logger process attaches to the ring by name
+(:class:`ArtifactRingReader`), rebuilds the :class:`Artifact` around the
+shared bytes, encodes/writes it, and releases the slot. Encoding and disk I/O
+then run under the logger's GIL instead of the trainer's.
+
+This extends the ``ShmRef`` tensor transport of the gRPC contract: a
+descriptor's ``shm_name`` / ``byte_offset`` / ``byte_size`` mean the same as
+``ShmRef.name`` / ``byte_offset`` / ``byte_size`` (here the offset selects the
+ring slot), and arrays larger than a slot fall back to ``inline`` bytes, just
+as ``Tensor`` falls back to ``raw_data``.
+
+Segment layout (all integers little-endian ``uint64``)::
+
+    [0:64)    header: magic, slot count, slot size
+    per slot: 64-byte control block (seq, ack) + data area (slot size, 64-aligned)
+
+The ring is single-producer / single-consumer. The writer publishes a slot by
+storing its sequence number after the data; the reader acknowledges by storing
+the same number in ``ack``, which frees the slot for reuse. Requires NumPy.
+
+Examples
+--------
+>>> # trainer process                         # logger process
+>>> ring = ArtifactRingWriter(slot_size=1 << 22, num_slots=8)  # doctest: +SKIP
+>>> queue.put(ring.write(artifact))           # doctest: +SKIP
+>>> reader = ArtifactRingReader(ring.name)    # doctest: +SKIP
+>>> artifact = reader.read(queue.get())       # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from types import ModuleType, TracebackType
+from typing import Any
+
+from cuvis_ai_schemas.enums.types import ArtifactType, ExecutionStage
+from cuvis_ai_schemas.execution.monitoring import Artifact
+
+_MAGIC = 0x43555649535249  # "CUVISRI"
+_HEADER = struct.Struct("<QQQ")
+_CONTROL = struct.Struct("<QQ")
+_ALIGN = 64
+
+
+def _require_numpy() -> ModuleType:
+    """Import numpy lazily, with a clear error when the optional extra is absent."""
+    try:
+        import numpy
+    except ImportError as exc:
+        msg = (
+            "The shared-memory artifact ring requires NumPy. "
+            "Install it with: pip install cuvis-ai-schemas[numpy]"
+        )
+        raise ImportError(msg) from exc
+    return numpy
+
+
+def _aligned(size: int) -> int:
+    """Round ``size`` up to the slot alignment."""
+    return -(-size // _ALIGN) * _ALIGN
+
+
+class _NoTracking:
+    """Stand-in for ``resource_tracker`` that ignores shared-memory registration."""
+
+    @staticmethod
+    def register(name: str, rtype: str) -> None:
+        """Skip registration."""
+
+    @staticmethod
+    def unregister(name: str, rtype: str) -> None:
+        """Skip unregistration."""
+
+
+_ATTACH_LOCK = threading.Lock()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without letting this process unlink it on exit.
+
+    Before Python 3.13 attaching registers the segment with the resource
+    tracker, which unlinks it when the attaching process exits; the tracker
+    hook is bypassed for the duration of the attach instead.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    with _ATTACH_LOCK:
+        tracker = shared_memory.resource_tracker  # type: ignore[attr-defined]
+        shared_memory.resource_tracker = _NoTracking  # type: ignore[attr-defined]
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            shared_memory.resource_tracker = tracker  # type: ignore[attr-defined]
+
+
+def _buffer(segment: shared_memory.SharedMemory) -> memoryview:
+    """The segment's mapped buffer."""
+    buf = segment.buf
+    if buf is None:
+        raise ValueError(f"Shared-memory segment {segment.name!r} is closed")
+    return buf
+
+
+@dataclass(frozen=True)
+class ArtifactDescriptor:
+    """Picklable stand-in for an :class:`Artifact` whose array lives in the ring.
+
+    Attributes
+    ----------
+    name, el_id, desc, type, stage, epoch, batch_idx
+        Artifact metadata.
+    shape : tuple[int, ...]
+        Array shape.
+    dtype : str
+        NumPy dtype string (e.g. ``"<f4"``).
+    shm_name : str
+        Shared-memory segment name (as ``ShmRef.name``).
+    byte_offset : int
+        Offset of the array's first byte within the segment.
+    byte_size : int
+        Array size in bytes (as ``ShmRef.byte_size``).
+    seq : int
+        Slot sequence number; ``0`` when the payload is inline.
+    inline : bytes | None
+        Array bytes for payloads larger than a slot (no shared memory used).
+    """
+
+    name: str
+    el_id: int
+    desc: str
+    type: ArtifactType
+    stage: ExecutionStage
+    epoch: int
+    batch_idx: int
+    shape: tuple[int, ...]
+    dtype: str
+    shm_name: str
+    byte_offset: int
+    byte_size: int
+    seq: int
+    inline: bytes | None = None
+
+
+class _RingLayout:
+    """Offsets shared by writer and reader."""
+
+    def __init__(self, num_slots: int, slot_size: int) -> None:
+        self.num_slots = num_slots
+        self.slot_size = slot_size
+        self.stride = _ALIGN + _aligned(slot_size)
+
+    @property
+    def total_size(self) -> int:
+        """Segment size in bytes."""
+        return _ALIGN + self.num_slots * self.stride
+
+    def control(self, slot: int) -> int:
+        """Offset of a slot's control block."""
+        return _ALIGN + slot * self.stride
+
+    def data(self, slot: int) -> int:
+        """Offset of a slot's data area."""
+        return self.control(slot) + _ALIGN
+
+
+class ArtifactRingWriter:
+    """Producer side: owns the segment and copies arrays into ring slots.
+
+    Parameters
+    ----------
+    slot_size : int
+        Largest array (bytes) that travels through shared memory.
+    num_slots : int
+        Number of slots, i.e. artifacts in flight before :meth:`write` waits.
+    name : str | None
+        Segment name; ``None`` lets the OS pick one (see :attr:`name`).
+    """
+
+    def __init__(self, slot_size: int, num_slots: int = 8, name: str | None = None) -> None:
+        if slot_size <= 0 or num_slots <= 0:
+            raise ValueError("slot_size and num_slots must be positive")
+        self._layout = _RingLayout(num_slots, slot_size)
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=self._layout.total_size)
+        self._buf = _buffer(self._shm)
+        _HEADER.pack_into(self._buf, 0, _MAGIC, num_slots, slot_size)
+        for slot in range(num_slots):
+            _CONTROL.pack_into(self._buf, self._layout.control(slot), 0, 0)
+        self._seq = 0
+
+    @property
+    def name(self) -> str:
+        """Segment name to hand to :class:`ArtifactRingReader`."""
+        return self._shm.name
+
+    def __enter__(self) -> ArtifactRingWriter:
+        """Return the writer."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close and unlink the segment."""
+        self.close()
+
+    def _slot_free(self, seq: int) -> bool:
+        """Whether the slot for ``seq`` has been released by the reader."""
+        previous = seq - self._layout.num_slots
+        if previous <= 0:
+            return True
+        slot = (seq - 1) % self._layout.num_slots
+        _, ack = _CONTROL.unpack_from(self._buf, self._layout.control(slot))
+        return bool(ack >= previous)
+
+    def write(self, artifact: Artifact, timeout: float | None = 0.0) -> ArtifactDescriptor | None:
+        """Copy ``artifact.value`` into the next slot and return its descriptor.
+
+        Parameters
+        ----------
+        artifact : Artifact
+            Artifact to hand off.
+        timeout : float | None
+            Seconds to wait for the reader to free the next slot; ``0`` returns
+            immediately, ``None`` waits forever.
+
+        Returns
+        -------
+        ArtifactDescriptor | None
+            ``None`` when the ring stayed full for ``timeout`` (artifact dropped).
+        """
+        np = _require_numpy()
+        array = np.ascontiguousarray(artifact.value)
+        meta = {
+            "name": artifact.name,
+            "el_id": artifact.el_id,
+            "desc": artifact.desc,
+            "type": artifact.type,
+            "stage": artifact.stage,
+            "epoch": artifact.epoch,
+            "batch_idx": artifact.batch_idx,
+            "shape": tuple(array.shape),
+            "dtype": array.dtype.str,
+            "shm_name": self.name,
+            "byte_size": array.nbytes,
+        }
+        if array.nbytes > self._layout.slot_size:
+            return ArtifactDescriptor(**meta, byte_offset=0, seq=0, inline=array.tobytes())
+
+        seq = self._seq + 1
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._slot_free(seq):
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(0.0005)
+        slot = (seq - 1) % self._layout.num_slots
+        offset = self._layout.data(slot)
+        if array.nbytes:
+            self._buf[offset : offset + array.nbytes] = memoryview(array).cast("B")
+        _CONTROL.pack_into(self._buf, self._layout.control(slot), seq, 0)
+        self._seq = seq
+        return ArtifactDescriptor(**meta, byte_offset=offset, seq=seq)
+
+    def close(self) -> None:
+        """Release and unlink the segment (readers keep their mapping until they close)."""
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ArtifactRingReader:
+    """Consumer side: attaches to a ring by name and rebuilds artifacts.
+
+    Parameters
+    ----------
+    name : str
+        :attr:`ArtifactRingWriter.name` of the producer's ring.
+
+    Raises
+    ------
+    ValueError
+        If the segment is not an artifact ring.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._shm = _attach(name)
+        self._buf = _buffer(self._shm)
+        magic, num_slots, slot_size = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC:
+            self._shm.close()
+            raise ValueError(f"Shared-memory segment {name!r} is not an artifact ring")
+        self._layout = _RingLayout(num_slots, slot_size)
+
+    def __enter__(self) -> ArtifactRingReader:
+        """Return the reader."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Detach from the segment."""
+        self.close()
+
+    def _slot(self, descriptor: ArtifactDescriptor) -> int:
+        """Slot index of a shared-memory descriptor."""
+        return (descriptor.seq - 1) % self._layout.num_slots
+
+    def read(self, descriptor: ArtifactDescriptor, copy: bool = True) -> Artifact:
+        """Rebuild the artifact described by ``descriptor``.
+
+        Parameters
+        ----------
+        descriptor : ArtifactDescriptor
+            Descriptor received from the writer.
+        copy : bool
+            ``True`` copies the array out and releases the slot immediately.
+            ``False`` returns a read-only view into shared memory; call
+            :meth:`release` once done with it (the view must not be used after).
+
+        Raises
+        ------
+        RuntimeError
+            If the slot no longer holds this descriptor's payload.
+        """
+        np = _require_numpy()
+        if descriptor.inline is not None:
+            value = np.frombuffer(descriptor.inline, dtype=descriptor.dtype)
+        else:
+            seq, _ = _CONTROL.unpack_from(self._buf, self._layout.control(self._slot(descriptor)))
+            if seq != descriptor.seq:
+                raise RuntimeError(
+                    f"Ring slot for artifact {descriptor.name!r} was overwritten "
+                    f"(expected seq {descriptor.seq}, found {seq})"
+                )
+            count = descriptor.byte_size // np.dtype(descriptor.dtype).itemsize
+            value = np.frombuffer(
+                self._buf, dtype=descriptor.dtype, count=count, offset=descriptor.byte_offset
+            )
+            if copy:
+                value = value.copy()
+                self.release(descriptor)
+            else:
+                value.setflags(write=False)
+        artifact_value: Any = value.reshape(descriptor.shape)
+        return Artifact(
+            name=descriptor.name,
+            value=artifact_value,
+            el_id=descriptor.el_id,
+            desc=descriptor.desc,
+            type=descriptor.type,
+            stage=descriptor.stage,
+            epoch=descriptor.epoch,
+            batch_idx=descriptor.batch_idx,
+        )
+
+    def release(self, descriptor: ArtifactDescriptor) -> None:
+        """Free the descriptor's slot for the writer (no-op for inline payloads)."""
+        if descriptor.inline is None and descriptor.seq:
+            control = self._layout.control(self._slot(descriptor))
+            _CONTROL.pack_into(self._buf, control, descriptor.seq, descriptor.seq)
+
+    def close(self) -> None:
+        """Detach from the segment; zero-copy views must be dropped first."""
+        self._shm.close()
+
+
+__all__ = ["ArtifactDescriptor", "ArtifactRingReader", "ArtifactRingWriter"]
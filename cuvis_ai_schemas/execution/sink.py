@@ -0,0 +1,315 @@
+"""Asynchronous, batched sink for ``Artifact`` and ``Metric`` logging.
+
+The training step hands records to :meth:`AsyncRecordSink.submit`, which only
+appends to a bounded in-memory queue; a background writer thread drains the
+queue and passes batches to a user-supplied writer callable (TensorBoard,
+MLflow, files, a gRPC stream, ...). Slow writers therefore no longer stall the
+step; when the queue is full, :class:`SinkConfig.backpressure` decides whether
+the producer blocks, the oldest record is dropped, or new records are sampled.
+
+Batches never span an epoch boundary: the writer cuts the current batch as
+soon as a record's ``(stage, epoch)`` differs from the previous one, so every
+batch the writer sees belongs to exactly one stage/epoch. :meth:`AsyncRecordSink.flush`
+blocks until everything submitted before it has been written (call it at the
+end of an epoch when the logs must be durable before e.g. checkpointing).
+
+Records are passed by reference: do not mutate an ``Artifact.value`` array
+after submitting it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Literal
+
+from pydantic import Field
+
+from cuvis_ai_schemas.base import BaseSchemaModel
+from cuvis_ai_schemas.execution.monitoring import Artifact, Metric
+
+Record = Artifact | Metric
+BatchWriter = Callable[[list[Record]], None]
+
+
+class SinkConfig(BaseSchemaModel):
+    """Queueing, batching, and backpressure settings of an :class:`AsyncRecordSink`."""
+
+    max_queue_size: int = Field(default=1024, ge=1, description="Maximum queued records")
+    batch_size: int = Field(default=64, ge=1, description="Maximum records per writer call")
+    flush_interval_s: float = Field(
+        default=1.0,
+        gt=0.0,
+        description="Longest time a partial batch waits for more records before being written",
+    )
+    backpressure: Literal["block", "drop_oldest", "sample"] = Field(
+        default="block",
+        description=(
+            "Policy when the queue is full: 'block' waits for room, 'drop_oldest' evicts the "
+            "oldest queued record, 'sample' keeps one of every sample_every new records "
+            "(evicting the oldest) and drops the rest"
+        ),
+    )
+    sample_every: int = Field(
+        default=2,
+        ge=1,
+        description="Keep ratio of the 'sample' policy while the queue is full",
+    )
+    block_timeout_s: float | None = Field(
+        default=None,
+        gt=0.0,
+        description="Under 'block', drop the record after waiting this long (None waits forever)",
+    )
+
+
+@dataclass(frozen=True)
+class SinkStats:
+    """Snapshot of an :class:`AsyncRecordSink`'s counters.
+
+    Attributes
+    ----------
+    submitted : int
+        Records passed to ``submit``.
+    written : int
+        Records the writer accepted without raising.
+    dropped : int
+        Records discarded by the backpressure policy.
+    failed : int
+        Records in batches whose writer call raised.
+    batches : int
+        Writer calls made.
+    queued : int
+        Records currently waiting in the queue.
+    """
+
+    submitted: int
+    written: int
+    dropped: int
+    failed: int
+    batches: int
+    queued: int
+
+
+class _Barrier:
+    """Queue marker signalled once every record ahead of it is written."""
+
+    __slots__ = ("event",)
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+
+
+class AsyncRecordSink:
+    """Bounded queue + background writer thread for ``Artifact`` / ``Metric`` records.
+
+    Parameters
+    ----------
+    writer : Callable[[list[Artifact | Metric]], None]
+        Called on the writer thread with each batch. Exceptions are counted,
+        kept on :attr:`last_error`, and re-raised by :meth:`close`.
+    config : SinkConfig | None
+        Queueing settings; defaults to ``SinkConfig()``.
+
+    Examples
+    --------
+    >>> with AsyncRecordSink(lambda batch: None) as sink:
+    ...     sink.submit(Metric(name="loss", value=0.1))
+    True
+    """
+
+    def __init__(self, writer: BatchWriter, config: SinkConfig | None = None) -> None:
+        self.config = config or SinkConfig()
+        self.last_error: BaseException | None = None
+        self._writer = writer
+        self._queue: deque[Record | _Barrier] = deque()
+        self._records = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closing = False
+        self._overflow = 0
+        self._submitted = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+        self._thread = threading.Thread(target=self._run, name="cuvis-ai-record-sink", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> AsyncRecordSink:
+        """Return the running sink."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the sink, draining pending records."""
+        self.close()
+
+    @property
+    def stats(self) -> SinkStats:
+        """Current counters."""
+        with self._lock:
+            return SinkStats(
+                submitted=self._submitted,
+                written=self._written,
+                dropped=self._dropped,
+                failed=self._failed,
+                batches=self._batches,
+                queued=self._records,
+            )
+
+    def submit(self, record: Record) -> bool:
+        """Queue one record without waiting for the writer.
+
+        Returns
+        -------
+        bool
+            ``False`` if the backpressure policy dropped ``record``.
+
+        Raises
+        ------
+        RuntimeError
+            If the sink has been closed.
+        """
+        config = self.config
+        with self._lock:
+            if self._closing:
+                raise RuntimeError("Cannot submit to a closed AsyncRecordSink")
+            self._submitted += 1
+            if self._records >= config.max_queue_size:
+                if config.backpressure == "block":
+                    has_room = self._not_full.wait_for(
+                        lambda: self._records < config.max_queue_size or self._closing,
+                        timeout=config.block_timeout_s,
+                    )
+                    if not has_room or self._closing:
+                        self._dropped += 1
+                        return False
+                else:
+                    self._overflow += 1
+                    if (
+                        config.backpressure == "sample"
+                        and self._overflow % config.sample_every != 0
+                    ):
+                        self._dropped += 1
+                        return False
+                    self._evict_oldest()
+            self._queue.append(record)
+            self._records += 1
+            self._not_empty.notify()
+            return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every record submitted so far has been handed to the writer.
+
+        Returns
+        -------
+        bool
+            ``False`` if ``timeout`` elapsed first.
+        """
+        barrier = _Barrier()
+        with self._lock:
+            closing = self._closing
+            if not closing:
+                self._queue.append(barrier)
+                self._not_empty.notify()
+        if closing:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        return barrier.event.wait(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Drain the queue, stop the writer thread, and surface writer errors.
+
+        Raises
+        ------
+        RuntimeError
+            If any writer call raised; chained to :attr:`last_error`.
+        """
+        with self._lock:
+            self._closing = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        self._thread.join(timeout)
+        if self.last_error is not None:
+            raise RuntimeError(
+                f"AsyncRecordSink writer failed for {self._failed} record(s)"
+            ) from self.last_error
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest queued record (barriers stay in place). Caller holds the lock."""
+        for index, item in enumerate(self._queue):
+            if not isinstance(item, _Barrier):
+                del self._queue[index]
+                self._records -= 1
+                self._dropped += 1
+                return
+
+    def _write(self, batch: list[Record]) -> None:
+        """Hand one batch to the writer, recording the outcome."""
+        try:
+            self._writer(batch)
+        except Exception as exc:  # the writer is user code; record and keep draining
+            with self._lock:
+                self._batches += 1
+                self._failed += len(batch)
+                self.last_error = exc
+            return
+        with self._lock:
+            self._batches += 1
+            self._written += len(batch)
+
+    def _run(self) -> None:
+        """Writer-thread loop: drain, cut batches at size/epoch/barrier, write."""
+        batch_size = self.config.batch_size
+        interval = self.config.flush_interval_s
+        batch: list[Record] = []
+        deadline = 0.0
+        while True:
+            with self._lock:
+                while not self._queue and not self._closing:
+                    if not batch:
+                        self._not_empty.wait()
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._not_empty.wait(remaining)
+                items = [self._queue.popleft() for _ in range(min(len(self._queue), batch_size))]
+                self._records -= sum(not isinstance(item, _Barrier) for item in items)
+                closing = self._closing
+                self._not_full.notify_all()
+            if not items:
+                if batch:
+                    self._write(batch)
+                    batch = []
+                if closing:
+                    return
+                continue
+            for item in items:
+                if isinstance(item, _Barrier):
+                    if batch:
+                        self._write(batch)
+                        batch = []
+                    item.event.set()
+                    continue
+                if batch and (item.stage, item.epoch) != (batch[-1].stage, batch[-1].epoch):
+                    self._write(batch)
+                    batch = []
+                if not batch:
+                    deadline = time.monotonic() + interval
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    self._write(batch)
+                    batch = []
+
+
+__all__ = ["AsyncRecordSink", "BatchWriter", "Record", "SinkConfig", "SinkStats"]
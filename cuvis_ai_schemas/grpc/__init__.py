@@ -4,17 +4,39 @@ __all__: list[str] = []
 
 try:
     from cuvis_ai_schemas.grpc.conversions import (
+        context_to_proto,
+        execution_stage_to_proto,
         node_category_to_proto,
+        node_profiling_stats_to_proto,
         node_tag_to_proto,
+        proto_to_context,
+        proto_to_execution_stage,
         proto_to_node_category,
+        proto_to_node_profiling_stats,
         proto_to_node_tag,
     )
+    from cuvis_ai_schemas.grpc.events import TrainEventRing
+    from cuvis_ai_schemas.grpc.progress import (
+        CompactProgressDecoder,
+        CompactProgressEncoder,
+        TrainProgressStep,
+    )
 
     __all__ = [
         "node_category_to_proto",
         "proto_to_node_category",
         "node_tag_to_proto",
         "proto_to_node_tag",
+        "execution_stage_to_proto",
+        "proto_to_execution_stage",
+        "node_profiling_stats_to_proto",
+        "proto_to_node_profiling_stats",
+        "context_to_proto",
+        "proto_to_context",
+        "CompactProgressDecoder",
+        "CompactProgressEncoder",
+        "TrainProgressStep",
+        "TrainEventRing",
     ]
 except ImportError:
     # Proto files not generated yet or proto extra not installed
@@ -1,5 +1,6 @@
-"""Conversion helpers between Python ``NodeCategory`` / ``NodeTag`` enums and
-their proto enum integer wire values.
+"""Conversion helpers between Python ``NodeCategory`` / ``NodeTag`` /
+``ExecutionStage`` enums and their proto enum integer wire values, plus
+``Context`` and ``NodeProfilingStats`` message conversion.
 
 Lives in cuvis-ai-schemas because both producers (the gRPC populator in
 cuvis-ai-core) and consumers (the Qt UI client in cuvis-ai-ui) need the
@@ -7,8 +8,21 @@ helpers, and the UI already depends on schemas. Importing this module
 requires the ``[proto]`` extra (it imports ``cuvis_ai_pb2``).
 """
 
-from cuvis_ai_schemas.enums import NodeCategory, NodeTag
+from cuvis_ai_schemas.enums import ExecutionStage, NodeCategory, NodeTag
+from cuvis_ai_schemas.execution.context import Context
 from cuvis_ai_schemas.grpc.v1 import cuvis_ai_pb2
+from cuvis_ai_schemas.pipeline.profiling import NodeProfilingStats
+
+_STAGE_PY_TO_PROTO: dict[ExecutionStage, int] = {
+    ExecutionStage.ALWAYS: cuvis_ai_pb2.EXECUTION_STAGE_UNSPECIFIED,
+    ExecutionStage.TRAIN: cuvis_ai_pb2.EXECUTION_STAGE_TRAIN,
+    ExecutionStage.VAL: cuvis_ai_pb2.EXECUTION_STAGE_VAL,
+    ExecutionStage.TEST: cuvis_ai_pb2.EXECUTION_STAGE_TEST,
+    ExecutionStage.INFERENCE: cuvis_ai_pb2.EXECUTION_STAGE_INFERENCE,
+}
+_STAGE_PROTO_TO_PY: dict[int, ExecutionStage] = {v: k for k, v in _STAGE_PY_TO_PROTO.items()}
+
+_PROFILING_MEMORY_FIELDS = ("peak_bytes", "alloc_bytes", "alloc_count", "device_peak_bytes")
 
 _CATEGORY_PY_TO_PROTO: dict[NodeCategory, int] = {
     NodeCategory.UNSPECIFIED: cuvis_ai_pb2.NODE_CATEGORY_UNSPECIFIED,
@@ -114,3 +128,89 @@ def proto_to_node_tag(proto_value: int) -> NodeTag | None:
     that this client doesn't recognise.
     """
     return _TAG_PROTO_TO_PY.get(proto_value)
+
+
+def execution_stage_to_proto(stage: ExecutionStage | str) -> int:
+    """Map a Python ``ExecutionStage`` (or its value) to its proto enum integer.
+
+    ``ExecutionStage.ALWAYS`` has no proto counterpart and maps to
+    ``EXECUTION_STAGE_UNSPECIFIED``.
+    """
+    return _STAGE_PY_TO_PROTO.get(ExecutionStage(stage), cuvis_ai_pb2.EXECUTION_STAGE_UNSPECIFIED)
+
+
+def proto_to_execution_stage(proto_value: int) -> ExecutionStage:
+    """Map a wire integer back to ``ExecutionStage``.
+
+    ``EXECUTION_STAGE_UNSPECIFIED`` and unknown ints map to
+    ``ExecutionStage.ALWAYS``.
+    """
+    return _STAGE_PROTO_TO_PY.get(proto_value, ExecutionStage.ALWAYS)
+
+
+def context_to_proto(context: Context) -> cuvis_ai_pb2.Context:
+    """Convert an execution ``Context`` to its proto message."""
+    return cuvis_ai_pb2.Context(
+        stage=execution_stage_to_proto(context.stage),  # type: ignore[arg-type]
+        epoch=context.epoch,
+        batch_idx=context.batch_idx,
+        global_step=context.global_step,
+    )
+
+
+def proto_to_context(message: cuvis_ai_pb2.Context) -> Context:
+    """Convert a proto ``Context`` message to the execution ``Context``."""
+    return Context(
+        stage=proto_to_execution_stage(message.stage),
+        epoch=message.epoch,
+        batch_idx=message.batch_idx,
+        global_step=message.global_step,
+    )
+
+
+def node_profiling_stats_to_proto(stats: NodeProfilingStats) -> cuvis_ai_pb2.NodeProfilingStats:
+    """Convert a ``NodeProfilingStats`` dataclass to its proto message.
+
+    Memory fields left at ``None`` stay unset on the message.
+    """
+    message = cuvis_ai_pb2.NodeProfilingStats(
+        node_name=stats.node_name,
+        stage=execution_stage_to_proto(stats.stage),  # type: ignore[arg-type]
+        count=stats.count,
+        mean_ms=stats.mean_ms,
+        median_ms=stats.median_ms,
+        std_ms=stats.std_ms,
+        min_ms=stats.min_ms,
+        max_ms=stats.max_ms,
+        total_ms=stats.total_ms,
+        last_ms=stats.last_ms,
+    )
+    for name in _PROFILING_MEMORY_FIELDS:
+        value = getattr(stats, name)
+        if value is not None:
+            setattr(message, name, value)
+    return message
+
+
+def proto_to_node_profiling_stats(message: cuvis_ai_pb2.NodeProfilingStats) -> NodeProfilingStats:
+    """Convert a proto ``NodeProfilingStats`` message to the dataclass.
+
+    Unset optional memory fields become ``None``.
+    """
+    memory = {
+        name: getattr(message, name) if message.HasField(name) else None
+        for name in _PROFILING_MEMORY_FIELDS
+    }
+    return NodeProfilingStats(
+        node_name=message.node_name,
+        stage=proto_to_execution_stage(message.stage).value,
+        count=message.count,
+        mean_ms=message.mean_ms,
+        median_ms=message.median_ms,
+        std_ms=message.std_ms,
+        min_ms=message.min_ms,
+        max_ms=message.max_ms,
+        total_ms=message.total_ms,
+        last_ms=message.last_ms,
+        **memory,
+    )
@@ -0,0 +1,202 @@
+"""Bounded, sequenced log of ``TrainResponse`` events for resumable streams.
+
+A server appends every progress message of a training session to a
+:class:`TrainEventRing`, which stamps ``TrainResponse.seq`` (1, 2, ...) and
+keeps the most recent ``capacity`` events. ``Train`` and ``WatchTrain`` both
+stream from the ring, so a client that reconnects passes the last ``seq`` it
+saw plus one as ``WatchTrainRequest.from_seq`` and receives the missed events
+followed by live ones:
+
+>>> def WatchTrain(self, request, context):
+...     ring = self.sessions[request.session_id].events
+...     yield from ring.watch(request.from_seq, is_active=context.is_active)
+
+If the requested events were already evicted, replay starts at the oldest
+retained event; clients detect the gap because the first ``seq`` they get is
+larger than the one they asked for.
+
+Compact progress (see :mod:`cuvis_ai_schemas.grpc.progress`) announces each
+loss / metric name only once per stream. The ring keeps the cumulative name
+tables, and the first compact event each replay or watch returns carries every
+name announced up to it, so a subscriber that joins mid-stream decodes it with
+a fresh :class:`~cuvis_ai_schemas.grpc.progress.CompactProgressDecoder`.
+Importing this module requires the ``[proto]`` extra.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+
+from cuvis_ai_schemas.grpc.v1 import cuvis_ai_pb2
+
+
+class TrainEventRing:
+    """Thread-safe ring of the latest ``capacity`` train events of one session.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of retained events.
+
+    Raises
+    ------
+    ValueError
+        If ``capacity`` < 1.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        if capacity < 1:
+            raise ValueError(f"Event ring capacity must be >= 1, got {capacity}")
+        self.capacity = capacity
+        # (event, loss names announced before it, metric names announced before it)
+        self._events: deque[tuple[cuvis_ai_pb2.TrainResponse, int, int]] = deque(maxlen=capacity)
+        self._loss_names: list[str] = []
+        self._metric_names: list[str] = []
+        self._latest_seq = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def latest_seq(self) -> int:
+        """Sequence number of the newest event (0 before the first)."""
+        return self._latest_seq
+
+    @property
+    def oldest_seq(self) -> int:
+        """Sequence number of the oldest retained event (0 when empty)."""
+        with self._cond:
+            return self._events[0][0].seq if self._events else 0
+
+    @property
+    def closed(self) -> bool:
+        """Whether the session finished (no further events)."""
+        return self._closed
+
+    def append(self, response: cuvis_ai_pb2.TrainResponse) -> int:
+        """Stamp ``response.seq``, retain it, wake watchers, and return the seq.
+
+        Raises
+        ------
+        RuntimeError
+            If the ring was closed.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Cannot append to a closed train event ring")
+            self._latest_seq += 1
+            response.seq = self._latest_seq
+            self._events.append((response, len(self._loss_names), len(self._metric_names)))
+            if response.HasField("compact"):
+                self._loss_names.extend(response.compact.new_loss_names)
+                self._metric_names.extend(response.compact.new_metric_names)
+            self._cond.notify_all()
+            return self._latest_seq
+
+    def close(self) -> None:
+        """Mark the session finished; watchers drain the ring and stop."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def latest(self) -> cuvis_ai_pb2.TrainResponse | None:
+        """Newest event, e.g. for ``GetTrainStatusResponse.latest_progress``."""
+        with self._cond:
+            return self._events[-1][0] if self._events else None
+
+    def _since(
+        self, from_seq: int, known: tuple[int, int] = (0, 0)
+    ) -> tuple[list[cuvis_ai_pb2.TrainResponse], tuple[int, int]]:
+        """Retained events with ``seq >= from_seq`` (caller holds the lock).
+
+        ``known`` is how many loss and metric names the subscriber already
+        has. The first compact event is replaced by a copy that also announces
+        the names it missed. Returns the events and the updated ``known``.
+        """
+        if not self._events or from_seq > self._latest_seq:
+            return [], known
+        skip = max(from_seq - self._events[0][0].seq, 0)
+        entries = [self._events[i] for i in range(skip, len(self._events))]
+        events = [event for event, _, _ in entries]
+        compact = [i for i, (event, _, _) in enumerate(entries) if event.HasField("compact")]
+        if not compact:
+            return events, known
+        first, losses_before, metrics_before = entries[compact[0]]
+        if (losses_before, metrics_before) != known:
+            events[compact[0]] = self._with_tables(first, known, losses_before, metrics_before)
+        last, losses_before, metrics_before = entries[compact[-1]]
+        return events, (
+            losses_before + len(last.compact.new_loss_names),
+            metrics_before + len(last.compact.new_metric_names),
+        )
+
+    def _with_tables(
+        self,
+        event: cuvis_ai_pb2.TrainResponse,
+        known: tuple[int, int],
+        losses_before: int,
+        metrics_before: int,
+    ) -> cuvis_ai_pb2.TrainResponse:
+        """Copy of a compact ``event`` also announcing the names after ``known``."""
+        announced = cuvis_ai_pb2.TrainResponse()
+        announced.CopyFrom(event)
+        compact = announced.compact
+        losses = self._loss_names[known[0] : losses_before + len(compact.new_loss_names)]
+        metrics = self._metric_names[known[1] : metrics_before + len(compact.new_metric_names)]
+        del compact.new_loss_names[:], compact.new_metric_names[:]
+        compact.new_loss_names.extend(losses)
+        compact.new_metric_names.extend(metrics)
+        return announced
+
+    def replay(self, from_seq: int = 0) -> list[cuvis_ai_pb2.TrainResponse]:
+        """Retained events with ``seq >= from_seq``, oldest first (non-blocking).
+
+        The first compact event announces the full name tables up to it.
+        """
+        with self._cond:
+            return self._since(from_seq)[0]
+
+    def watch(
+        self,
+        from_seq: int = 0,
+        poll_interval: float = 0.5,
+        is_active: Callable[[], bool] | None = None,
+    ) -> Iterator[cuvis_ai_pb2.TrainResponse]:
+        """Replay events from ``from_seq``, then yield live ones as they arrive.
+
+        Parameters
+        ----------
+        from_seq : int
+            First sequence number wanted (inclusive); ``0`` starts at the oldest
+            retained event.
+        poll_interval : float
+            Seconds between checks of ``is_active`` while waiting.
+        is_active : Callable[[], bool] | None
+            Stop once this returns ``False`` (e.g. ``grpc.ServicerContext.is_active``).
+
+        Yields
+        ------
+        TrainResponse
+            Events in ``seq`` order; the first compact one announces the full
+            name tables up to it. Events evicted while the consumer lagged are
+            skipped (visible as a jump in ``seq``), and the next compact event
+            announces the names they carried.
+        """
+        next_seq = from_seq
+        known = (0, 0)
+        while is_active is None or is_active():
+            wanted = max(next_seq, 1)
+            with self._cond:
+                if not self._closed and self._latest_seq < wanted:
+                    self._cond.wait(timeout=poll_interval)
+                batch, known = self._since(next_seq, known)
+                closed = self._closed
+            if batch:
+                yield from batch
+                next_seq = batch[-1].seq + 1
+            elif closed:
+                return
+
+
+__all__ = ["TrainEventRing"]
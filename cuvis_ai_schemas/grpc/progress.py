@@ -0,0 +1,208 @@
+"""Encode and decode the compact, coalesced training progress stream.
+
+``TrainResponse.losses`` / ``metrics`` repeat every name string on every step
+and a server sends one message per step. When a client sets
+``TrainRequest.compact_progress``, the server instead fills
+``TrainResponse.compact``:
+
+- each loss / metric name is sent once per stream, in
+  ``CompactTrainProgress.new_loss_names`` / ``new_metric_names``; both sides
+  append them to a name table,
+- each step carries packed ``repeated double`` values in table order; a step
+  reporting only some names also sends their table indices, so every value,
+  ``NaN`` included (a diverging loss), survives the round trip,
+- up to ``TrainRequest.max_coalesced_steps`` steps share one message, each
+  with its own ``Context``.
+
+:class:`CompactProgressEncoder` keeps the server-side tables and step buffer;
+:class:`CompactProgressDecoder` rebuilds per-step dictionaries on the client
+and also accepts legacy map-based responses. One encoder / decoder per stream.
+Importing this module requires the ``[proto]`` extra.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+
+from cuvis_ai_schemas.execution.context import Context
+from cuvis_ai_schemas.grpc.conversions import context_to_proto, proto_to_context
+from cuvis_ai_schemas.grpc.v1 import cuvis_ai_pb2
+
+
+@dataclass(frozen=True)
+class TrainProgressStep:
+    """One decoded training step.
+
+    Attributes
+    ----------
+    context : Context
+        Position of the step.
+    losses : dict[str, float]
+        Loss values reported by the step.
+    metrics : dict[str, float]
+        Metric values reported by the step.
+    """
+
+    context: Context
+    losses: dict[str, float] = field(default_factory=dict)
+    metrics: dict[str, float] = field(default_factory=dict)
+
+
+class _NameTable:
+    """Append-only name table with the names not yet sent to the peer."""
+
+    def __init__(self) -> None:
+        self.index: dict[str, int] = {}
+        self.pending: list[str] = []
+
+    def pack(self, values: Mapping[str, float]) -> tuple[list[float], list[int]]:
+        """``(values, indices)`` in table order, registering unseen names.
+
+        ``indices`` is empty when the values cover the first ``len(values)``
+        table entries, which is the common case of a step reporting every name.
+        """
+        for name in values:
+            if name not in self.index:
+                self.index[name] = len(self.index)
+                self.pending.append(name)
+        ordered = sorted((self.index[name], value) for name, value in values.items())
+        indices = [index for index, _ in ordered]
+        if indices == list(range(len(indices))):
+            indices = []
+        return [value for _, value in ordered], indices
+
+    def take_pending(self) -> list[str]:
+        """Return and clear the names to announce in the next message."""
+        pending, self.pending = self.pending, []
+        return pending
+
+
+class CompactProgressEncoder:
+    """Server-side builder of compact ``TrainResponse`` messages.
+
+    Parameters
+    ----------
+    max_coalesced_steps : int
+        Steps per message; ``0`` and ``1`` both send one message per step
+        (mirrors ``TrainRequest.max_coalesced_steps``).
+
+    Examples
+    --------
+    >>> encoder = CompactProgressEncoder(max_coalesced_steps=10)
+    >>> for context, losses in steps:
+    ...     if (response := encoder.add_step(context, losses)) is not None:
+    ...         yield response
+    >>> yield encoder.finish()
+    """
+
+    def __init__(self, max_coalesced_steps: int = 1) -> None:
+        if max_coalesced_steps < 0:
+            raise ValueError(f"max_coalesced_steps must be >= 0, got {max_coalesced_steps}")
+        self.max_coalesced_steps = max(max_coalesced_steps, 1)
+        self._losses = _NameTable()
+        self._metrics = _NameTable()
+        self._steps: list[cuvis_ai_pb2.CompactTrainStep] = []
+        self._last_context: cuvis_ai_pb2.Context | None = None
+
+    @property
+    def pending_steps(self) -> int:
+        """Steps buffered but not yet emitted."""
+        return len(self._steps)
+
+    def add_step(
+        self,
+        context: Context,
+        losses: Mapping[str, float] | None = None,
+        metrics: Mapping[str, float] | None = None,
+    ) -> cuvis_ai_pb2.TrainResponse | None:
+        """Buffer one step; return a message once ``max_coalesced_steps`` are buffered."""
+        self._last_context = context_to_proto(context)
+        loss_values, loss_indices = self._losses.pack(losses or {})
+        metric_values, metric_indices = self._metrics.pack(metrics or {})
+        self._steps.append(
+            cuvis_ai_pb2.CompactTrainStep(
+                context=self._last_context,
+                losses=loss_values,
+                metrics=metric_values,
+                loss_indices=loss_indices,
+                metric_indices=metric_indices,
+            )
+        )
+        if len(self._steps) >= self.max_coalesced_steps:
+            return self._emit(cuvis_ai_pb2.TRAIN_STATUS_RUNNING, "")
+        return None
+
+    def flush(
+        self, status: int = cuvis_ai_pb2.TRAIN_STATUS_RUNNING, message: str = ""
+    ) -> cuvis_ai_pb2.TrainResponse | None:
+        """Emit the buffered steps now, or return ``None`` if there are none."""
+        if not self._steps:
+            return None
+        return self._emit(status, message)
+
+    def finish(
+        self, status: int = cuvis_ai_pb2.TRAIN_STATUS_COMPLETE, message: str = ""
+    ) -> cuvis_ai_pb2.TrainResponse:
+        """Emit the final message (buffered steps, possibly none) with ``status``."""
+        return self._emit(status, message)
+
+    def _emit(self, status: int, message: str) -> cuvis_ai_pb2.TrainResponse:
+        """Build a response from the buffered steps and newly seen names."""
+        response = cuvis_ai_pb2.TrainResponse(
+            status=status,  # type: ignore[arg-type]
+            message=message,
+            compact=cuvis_ai_pb2.CompactTrainProgress(
+                new_loss_names=self._losses.take_pending(),
+                new_metric_names=self._metrics.take_pending(),
+                steps=self._steps,
+            ),
+        )
+        if self._last_context is not None:
+            # Mirror the latest position for clients that only read ``context``.
+            response.context.CopyFrom(self._last_context)
+        self._steps = []
+        return response
+
+
+class CompactProgressDecoder:
+    """Client-side decoder of a training progress stream.
+
+    Handles both compact and legacy (``losses`` / ``metrics`` map) responses.
+    """
+
+    def __init__(self) -> None:
+        self.loss_names: list[str] = []
+        self.metric_names: list[str] = []
+
+    def decode(self, response: cuvis_ai_pb2.TrainResponse) -> list[TrainProgressStep]:
+        """Return the steps carried by ``response``, oldest first."""
+        if not response.HasField("compact"):
+            return [
+                TrainProgressStep(
+                    context=proto_to_context(response.context),
+                    losses=dict(response.losses),
+                    metrics=dict(response.metrics),
+                )
+            ]
+        compact = response.compact
+        self.loss_names.extend(compact.new_loss_names)
+        self.metric_names.extend(compact.new_metric_names)
+        return [
+            TrainProgressStep(
+                context=proto_to_context(step.context),
+                losses=_unpack(self.loss_names, step.losses, step.loss_indices),
+                metrics=_unpack(self.metric_names, step.metrics, step.metric_indices),
+            )
+            for step in compact.steps
+        ]
+
+
+def _unpack(names: list[str], values: Sequence[float], indices: Sequence[int]) -> dict[str, float]:
+    """Map packed values to table names; empty ``indices`` means table order."""
+    if not indices:
+        return dict(zip(names, values, strict=False))
+    return {names[index]: value for index, value in zip(indices, values, strict=True)}
+
+
+__all__ = ["CompactProgressDecoder", "CompactProgressEncoder", "TrainProgressStep"]
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'cuvis_ai_schemas/grpc/v1/cuvis_ai.proto\x12\x0b\x63uvis_ai.v1\"Z\n\x06ShmRef\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x1f\n\x0b\x62yte_offset\x18\x02 \x01(\x04R\nbyteOffset\x12\x1b\n\tbyte_size\x18\x03 \x01(\x04R\x08\x62yteSize\"\xa0\x01\n\x06Tensor\x12\x14\n\x05shape\x18\x01 \x03(\x03R\x05shape\x12(\n\x05\x64type\x18\x02 \x01(\x0e\x32\x12.cuvis_ai.v1.DTypeR\x05\x64type\x12\x1b\n\x08raw_data\x18\x03 \x01(\x0cH\x00R\x07rawData\x12.\n\x07shm_ref\x18\x04 \x01(\x0b\x32\x13.cuvis_ai.v1.ShmRefH\x00R\x06shmRefB\t\n\x07payload\"\x90\x01\n\x07\x43ontext\x12\x31\n\x05stage\x18\x01 \x01(\x0e\x32\x1b.cuvis_ai.v1.ExecutionStageR\x05stage\x12\x14\n\x05\x65poch\x18\x02 \x01(\x05R\x05\x65poch\x12\x1b\n\tbatch_idx\x18\x03 \x01(\x05R\x08\x62\x61tchIdx\x12\x1f\n\x0bglobal_step\x18\x04 \x01(\x05R\nglobalStep\"3\n\x0ePipelineConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"/\n\nDataConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"4\n\x0fOptimizerConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"4\n\x0fSchedulerConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"4\n\x0f\x43\x61llbacksConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"\xb8\x01\n\x10PipelineMetadata\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12 \n\x0b\x64\x65scription\x18\x02 \x01(\tR\x0b\x64\x65scription\x12\x18\n\x07\x63reated\x18\x03 \x01(\tR\x07\x63reated\x12(\n\x10\x63uvis_ai_version\x18\x04 \x01(\tR\x0e\x63uvisAiVersion\x12\x12\n\x04tags\x18\x05 \x03(\tR\x04tags\x12\x16\n\x06\x61uthor\x18\x06 \x01(\tR\x06\x61uthor\"\xd9\x01\n\x0cPipelineInfo\x12#\n\rpipeline_path\x18\x01 \x01(\tR\x0cpipelinePath\x12#\n\rresolved_path\x18\x02 \x01(\tR\x0cresolvedPath\x12\x39\n\x08metadata\x18\x03 \x01(\x0b\x32\x1d.cuvis_ai.v1.PipelineMetadataR\x08metadata\x12!\n\x0cweights_path\x18\x06 \x01(\tR\x0bweightsPath\x12!\n\x0cyaml_content\x18\x07 \x01(\tR\x0byamlContent\"3\n\x0eTrainingConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"3\n\x0eTrainRunConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"\xb0\x01\n\x0b\x42oundingBox\x12\x1d\n\nelement_id\x18\x01 \x01(\x05R\telementId\x12\x13\n\x05x_min\x18\x02 \x01(\x02R\x04xMin\x12\x13\n\x05y_min\x18\x03 \x01(\x02R\x04yMin\x12\x13\n\x05x_max\x18\x04 \x01(\x02R\x04xMax\x12\x13\n\x05y_max\x18\x05 \x01(\x02R\x04yMax\x12 \n\tobject_id\x18\x06 \x01(\x05H\x00R\x08objectId\x88\x01\x01\x42\x0c\n\n_object_id\"?\n\rBoundingBoxes\x12.\n\x05\x62oxes\x18\x01 \x03(\x0b\x32\x18.cuvis_ai.v1.BoundingBoxR\x05\x62oxes\"n\n\x05Point\x12\x1d\n\nelement_id\x18\x01 \x01(\x05R\telementId\x12\x0c\n\x01x\x18\x02 \x01(\x02R\x01x\x12\x0c\n\x01y\x18\x03 \x01(\x02R\x01y\x12*\n\x04type\x18\x04 \x01(\x0e\x32\x16.cuvis_ai.v1.PointTypeR\x04type\"4\n\x06Points\x12*\n\x06points\x18\x01 \x03(\x0b\x32\x12.cuvis_ai.v1.PointR\x06points\"\xcf\x04\n\nInputBatch\x12\x35\n\x0bwavelengths\x18\x01 \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x0bwavelengths\x12\'\n\x04\x63ube\x18\x02 \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x04\x63ube\x12\'\n\x04mask\x18\x03 \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x04mask\x12\x32\n\x06\x62\x62oxes\x18\x04 \x01(\x0b\x32\x1a.cuvis_ai.v1.BoundingBoxesR\x06\x62\x62oxes\x12+\n\x06points\x18\x05 \x01(\x0b\x32\x13.cuvis_ai.v1.PointsR\x06points\x12\x1f\n\x0btext_prompt\x18\x06 \x01(\tR\ntextPrompt\x12K\n\x0c\x65xtra_inputs\x18\x07 \x03(\x0b\x32(.cuvis_ai.v1.InputBatch.ExtraInputsEntryR\x0b\x65xtraInputs\x12\x32\n\nmesu_index\x18\x08 \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\tmesuIndex\x12\x30\n\trgb_image\x18\t \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x08rgbImage\x12.\n\x08\x66rame_id\x18\n \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x07\x66rameId\x1aS\n\x10\x45xtraInputsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x05value:\x02\x38\x01\"|\n\nTensorSpec\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x14\n\x05shape\x18\x02 \x03(\x03R\x05shape\x12(\n\x05\x64type\x18\x03 \x01(\x0e\x32\x12.cuvis_ai.v1.DTypeR\x05\x64type\x12\x1a\n\x08required\x18\x04 \x01(\x08R\x08required\"\x85\x03\n\rTrainResponse\x12.\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x14.cuvis_ai.v1.ContextR\x07\x63ontext\x12>\n\x06losses\x18\x02 \x03(\x0b\x32&.cuvis_ai.v1.TrainResponse.LossesEntryR\x06losses\x12\x41\n\x07metrics\x18\x03 \x03(\x0b\x32\'.cuvis_ai.v1.TrainResponse.MetricsEntryR\x07metrics\x12\x30\n\x06status\x18\x04 \x01(\x0e\x32\x18.cuvis_ai.v1.TrainStatusR\x06status\x12\x18\n\x07message\x18\x05 \x01(\tR\x07message\x1a\x39\n\x0bLossesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x02R\x05value:\x02\x38\x01\x1a:\n\x0cMetricsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x02R\x05value:\x02\x38\x01\"\xb6\x01\n\tParamSpec\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x12\n\x04type\x18\x02 \x01(\tR\x04type\x12\x1a\n\x08required\x18\x03 \x01(\x08R\x08required\x12#\n\rdefault_value\x18\x04 \x01(\tR\x0c\x64\x65\x66\x61ultValue\x12 \n\x0b\x64\x65scription\x18\x05 \x01(\tR\x0b\x64\x65scription\x12\x1e\n\nvalidation\x18\x06 \x01(\tR\nvalidation\"\x80\x01\n\x10\x43\x61llbackTypeInfo\x12\x12\n\x04type\x18\x01 \x01(\tR\x04type\x12 \n\x0b\x64\x65scription\x18\x02 \x01(\tR\x0b\x64\x65scription\x12\x36\n\nparameters\x18\x03 \x03(\x0b\x32\x16.cuvis_ai.v1.ParamSpecR\nparameters\"O\n\x15OptimizerParamsSchema\x12\x36\n\nparameters\x18\x01 \x03(\x0b\x32\x16.cuvis_ai.v1.ParamSpecR\nparameters\"O\n\x15SchedulerParamsSchema\x12\x36\n\nparameters\x18\x01 \x03(\x0b\x32\x16.cuvis_ai.v1.ParamSpecR\nparameters\"R\n\x1dListAvailablePipelinesRequest\x12\"\n\nfilter_tag\x18\x01 \x01(\tH\x00R\tfilterTag\x88\x01\x01\x42\r\n\x0b_filter_tag\"Y\n\x1eListAvailablePipelinesResponse\x12\x37\n\tpipelines\x18\x01 \x03(\x0b\x32\x19.cuvis_ai.v1.PipelineInfoR\tpipelines\"=\n\x16GetPipelineInfoRequest\x12#\n\rpipeline_path\x18\x01 \x01(\tR\x0cpipelinePath\"Y\n\x17GetPipelineInfoResponse\x12>\n\rpipeline_info\x18\x01 \x01(\x0b\x32\x19.cuvis_ai.v1.PipelineInfoR\x0cpipelineInfo\"\x16\n\x14\x43reateSessionRequest\"6\n\x15\x43reateSessionResponse\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"\x88\x01\n\x1cSetSessionSearchPathsRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12!\n\x0csearch_paths\x18\x02 \x03(\tR\x0bsearchPaths\x12\x1b\n\x06\x61ppend\x18\x03 \x01(\x08H\x00R\x06\x61ppend\x88\x01\x01\x42\t\n\x07_append\"\x85\x01\n\x1dSetSessionSearchPathsResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12#\n\rcurrent_paths\x18\x02 \x03(\tR\x0c\x63urrentPaths\x12%\n\x0erejected_paths\x18\x03 \x03(\tR\rrejectedPaths\"4\n\x13\x43loseSessionRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"0\n\x14\x43loseSessionResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\"\x88\x01\n\x14ResolveConfigRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x1f\n\x0b\x63onfig_type\x18\x02 \x01(\tR\nconfigType\x12\x12\n\x04path\x18\x03 \x01(\tR\x04path\x12\x1c\n\toverrides\x18\x04 \x03(\tR\toverrides\":\n\x15ResolveConfigResponse\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"<\n\x19GetParameterSchemaRequest\x12\x1f\n\x0b\x63onfig_type\x18\x01 \x01(\tR\nconfigType\"=\n\x1aGetParameterSchemaResponse\x12\x1f\n\x0bjson_schema\x18\x01 \x01(\tR\njsonSchema\"[\n\x15ValidateConfigRequest\x12\x1f\n\x0b\x63onfig_type\x18\x01 \x01(\tR\nconfigType\x12!\n\x0c\x63onfig_bytes\x18\x02 \x01(\x0cR\x0b\x63onfigBytes\"b\n\x16ValidateConfigResponse\x12\x14\n\x05valid\x18\x01 \x01(\x08R\x05valid\x12\x16\n\x06\x65rrors\x18\x02 \x03(\tR\x06\x65rrors\x12\x1a\n\x08warnings\x18\x03 \x03(\tR\x08warnings\"\xc1\x01\n\x1aLoadPipelineWeightsRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12#\n\x0cweights_path\x18\x02 \x01(\tH\x00R\x0bweightsPath\x12%\n\rweights_bytes\x18\x03 \x01(\x0cH\x00R\x0cweightsBytes\x12\x1b\n\x06strict\x18\x04 \x01(\x08H\x01R\x06strict\x88\x01\x01\x42\x10\n\x0eweights_sourceB\t\n\x07_strict\"\\\n\x1bLoadPipelineWeightsResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12#\n\rresolved_path\x18\x02 \x01(\tR\x0cresolvedPath\"n\n\x18SetTrainRunConfigRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x33\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\x1b.cuvis_ai.v1.TrainRunConfigR\x06\x63onfig\"g\n\x19SetTrainRunConfigResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12\x30\n\x14pipeline_from_config\x18\x02 \x01(\x08R\x12pipelineFromConfig\"\xd0\x01\n\x0cTrainRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12;\n\x0ctrainer_type\x18\x02 \x01(\x0e\x32\x18.cuvis_ai.v1.TrainerTypeR\x0btrainerType\x12+\n\x04\x64\x61ta\x18\x03 \x01(\x0b\x32\x17.cuvis_ai.v1.DataConfigR\x04\x64\x61ta\x12\x37\n\x08training\x18\x04 \x01(\x0b\x32\x1b.cuvis_ai.v1.TrainingConfigR\x08training\"6\n\x15GetTrainStatusRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"]\n\x16GetTrainStatusResponse\x12\x43\n\x0flatest_progress\x18\x01 \x01(\x0b\x32\x1a.cuvis_ai.v1.TrainResponseR\x0elatestProgress\" \n\x1eGetTrainingCapabilitiesRequest\"\xf5\x02\n\x1fGetTrainingCapabilitiesResponse\x12\x31\n\x14supported_optimizers\x18\x01 \x03(\tR\x13supportedOptimizers\x12\x31\n\x14supported_schedulers\x18\x02 \x03(\tR\x13supportedSchedulers\x12N\n\x13supported_callbacks\x18\x03 \x03(\x0b\x32\x1d.cuvis_ai.v1.CallbackTypeInfoR\x12supportedCallbacks\x12M\n\x10optimizer_params\x18\x04 \x01(\x0b\x32\".cuvis_ai.v1.OptimizerParamsSchemaR\x0foptimizerParams\x12M\n\x10scheduler_params\x18\x05 \x01(\x0b\x32\".cuvis_ai.v1.SchedulerParamsSchemaR\x0fschedulerParams\"\x94\x01\n\x13SavePipelineRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12#\n\rpipeline_path\x18\x02 \x01(\tR\x0cpipelinePath\x12\x39\n\x08metadata\x18\x03 \x01(\x0b\x32\x1d.cuvis_ai.v1.PipelineMetadataR\x08metadata\"x\n\x14SavePipelineResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12#\n\rpipeline_path\x18\x02 \x01(\tR\x0cpipelinePath\x12!\n\x0cweights_path\x18\x03 \x01(\tR\x0bweightsPath\"\x8e\x01\n\x13LoadPipelineRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x37\n\x08pipeline\x18\x02 \x01(\x0b\x32\x1b.cuvis_ai.v1.PipelineConfigR\x08pipeline\x12\x1f\n\x0b\x64\x61ta_module\x18\x03 \x01(\tR\ndataModule\"k\n\x14LoadPipelineResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12\x39\n\x08metadata\x18\x02 \x01(\x0b\x32\x1d.cuvis_ai.v1.PipelineMetadataR\x08metadata\"|\n\x13SaveTrainRunRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12#\n\rtrainrun_path\x18\x02 \x01(\tR\x0ctrainrunPath\x12!\n\x0csave_weights\x18\x03 \x01(\x08R\x0bsaveWeights\"\x9d\x01\n\x14SaveTrainRunResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12#\n\rtrainrun_path\x18\x02 \x01(\tR\x0ctrainrunPath\x12#\n\rpipeline_path\x18\x03 \x01(\tR\x0cpipelinePath\x12!\n\x0cweights_path\x18\x04 \x01(\tR\x0bweightsPath\"\x9e\x01\n\x16RestoreTrainRunRequest\x12#\n\rtrainrun_path\x18\x01 \x01(\tR\x0ctrainrunPath\x12&\n\x0cweights_path\x18\x02 \x01(\tH\x00R\x0bweightsPath\x88\x01\x01\x12\x1b\n\x06strict\x18\x03 \x01(\x08H\x01R\x06strict\x88\x01\x01\x42\x0f\n\r_weights_pathB\t\n\x07_strict\"q\n\x17RestoreTrainRunResponse\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x37\n\x08trainrun\x18\x02 \x01(\x0b\x32\x1b.cuvis_ai.v1.TrainRunConfigR\x08trainrun\"9\n\x18GetPipelineInputsRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"\xed\x01\n\x19GetPipelineInputsResponse\x12\x1f\n\x0binput_names\x18\x01 \x03(\tR\ninputNames\x12W\n\x0binput_specs\x18\x02 \x03(\x0b\x32\x36.cuvis_ai.v1.GetPipelineInputsResponse.InputSpecsEntryR\ninputSpecs\x1aV\n\x0fInputSpecsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12-\n\x05value\x18\x02 \x01(\x0b\x32\x17.cuvis_ai.v1.TensorSpecR\x05value:\x02\x38\x01\":\n\x19GetPipelineOutputsRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"\xf5\x01\n\x1aGetPipelineOutputsResponse\x12!\n\x0coutput_names\x18\x01 \x03(\tR\x0boutputNames\x12[\n\x0coutput_specs\x18\x02 \x03(\x0b\x32\x38.cuvis_ai.v1.GetPipelineOutputsResponse.OutputSpecsEntryR\x0boutputSpecs\x1aW\n\x10OutputSpecsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12-\n\x05value\x18\x02 \x01(\x0b\x32\x17.cuvis_ai.v1.TensorSpecR\x05value:\x02\x38\x01\"\x7f\n\x1fGetPipelineVisualizationRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x16\n\x06\x66ormat\x18\x02 \x01(\tR\x06\x66ormat\x12%\n\x0e\x63onfig_content\x18\x03 \x01(\tR\rconfigContent\"Y\n GetPipelineVisualizationResponse\x12\x1d\n\nimage_data\x18\x01 \x01(\x0cR\timageData\x12\x16\n\x06\x66ormat\x18\x02 \x01(\tR\x06\x66ormat\"\x85\x01\n\x10InferenceRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12/\n\x06inputs\x18\x02 \x01(\x0b\x32\x17.cuvis_ai.v1.InputBatchR\x06inputs\x12!\n\x0coutput_specs\x18\x03 \x03(\tR\x0boutputSpecs\"\xae\x02\n\x11InferenceResponse\x12\x45\n\x07outputs\x18\x01 \x03(\x0b\x32+.cuvis_ai.v1.InferenceResponse.OutputsEntryR\x07outputs\x12\x45\n\x07metrics\x18\x02 \x03(\x0b\x32+.cuvis_ai.v1.InferenceResponse.MetricsEntryR\x07metrics\x1aO\n\x0cOutputsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x05value:\x02\x38\x01\x1a:\n\x0cMetricsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x02R\x05value:\x02\x38\x01\"3\n\x0ePluginManifest\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"\x82\x01\n\nPluginInfo\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x12\n\x04type\x18\x02 \x01(\tR\x04type\x12\x16\n\x06source\x18\x03 \x01(\tR\x06source\x12\x10\n\x03tag\x18\x04 \x01(\tR\x03tag\x12\"\n\x0c\x63\x61pabilities\x18\x05 \x03(\tR\x0c\x63\x61pabilities\"\xb8\x01\n\x08PortSpec\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12(\n\x05\x64type\x18\x02 \x01(\x0e\x32\x12.cuvis_ai.v1.DTypeR\x05\x64type\x12\x14\n\x05shape\x18\x03 \x03(\x03R\x05shape\x12\x1a\n\x08optional\x18\x04 \x01(\x08R\x08optional\x12 \n\x0b\x64\x65scription\x18\x05 \x01(\tR\x0b\x64\x65scription\x12\x1a\n\x08variadic\x18\x06 \x01(\x08R\x08variadic\"\xbb\x04\n\x08NodeInfo\x12\x1d\n\nclass_name\x18\x01 \x01(\tR\tclassName\x12\x1b\n\tfull_path\x18\x02 \x01(\tR\x08\x66ullPath\x12\x16\n\x06source\x18\x03 \x01(\tR\x06source\x12\x1f\n\x0bplugin_name\x18\x04 \x01(\tR\npluginName\x12\x46\n\x0binput_specs\x18\x05 \x03(\x0b\x32%.cuvis_ai.v1.NodeInfo.InputSpecsEntryR\ninputSpecs\x12I\n\x0coutput_specs\x18\x06 \x03(\x0b\x32&.cuvis_ai.v1.NodeInfo.OutputSpecsEntryR\x0boutputSpecs\x12\x19\n\x08icon_svg\x18\x07 \x01(\x0cR\x07iconSvg\x12\x35\n\x08\x63\x61tegory\x18\x08 \x01(\x0e\x32\x19.cuvis_ai.v1.NodeCategoryR\x08\x63\x61tegory\x12(\n\x04tags\x18\t \x03(\x0e\x32\x14.cuvis_ai.v1.NodeTagR\x04tags\x1aT\n\x0fInputSpecsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x15.cuvis_ai.v1.PortSpecR\x05value:\x02\x38\x01\x1aU\n\x10OutputSpecsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x15.cuvis_ai.v1.PortSpecR\x05value:\x02\x38\x01\"k\n\x11LoadPluginRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x37\n\x08manifest\x18\x02 \x01(\x0b\x32\x1b.cuvis_ai.v1.PluginManifestR\x08manifest\"W\n\x12LoadPluginResponse\x12+\n\x11registered_plugin\x18\x01 \x01(\tR\x10registeredPlugin\x12\x14\n\x05\x65rror\x18\x02 \x01(\tR\x05\x65rror\"9\n\x18ListLoadedPluginsRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"N\n\x19ListLoadedPluginsResponse\x12\x31\n\x07plugins\x18\x01 \x03(\x0b\x32\x17.cuvis_ai.v1.PluginInfoR\x07plugins\"V\n\x14GetPluginInfoRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x1f\n\x0bplugin_name\x18\x02 \x01(\tR\npluginName\"H\n\x15GetPluginInfoResponse\x12/\n\x06plugin\x18\x01 \x01(\x0b\x32\x17.cuvis_ai.v1.PluginInfoR\x06plugin\":\n\x19ListAvailableNodesRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"I\n\x1aListAvailableNodesResponse\x12+\n\x05nodes\x18\x01 \x03(\x0b\x32\x15.cuvis_ai.v1.NodeInfoR\x05nodes\":\n\x17\x43learPluginCacheRequest\x12\x1f\n\x0bplugin_name\x18\x01 \x01(\tR\npluginName\"?\n\x18\x43learPluginCacheResponse\x12#\n\rcleared_count\x18\x01 \x01(\x05R\x0c\x63learedCount\"\xf0\x01\n\x13SetProfilingRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x18\n\x07\x65nabled\x18\x02 \x01(\x08R\x07\x65nabled\x12.\n\x10synchronize_cuda\x18\x03 \x01(\x08H\x00R\x0fsynchronizeCuda\x88\x01\x01\x12\x19\n\x05reset\x18\x04 \x01(\x08H\x01R\x05reset\x88\x01\x01\x12%\n\x0cskip_first_n\x18\x05 \x01(\x05H\x02R\nskipFirstN\x88\x01\x01\x42\x13\n\x11_synchronize_cudaB\x08\n\x06_resetB\x0f\n\r_skip_first_n\"C\n\x14SetProfilingResponse\x12+\n\x11profiling_enabled\x18\x01 \x01(\x08R\x10profilingEnabled\"}\n\x1aGetProfilingSummaryRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x36\n\x05stage\x18\x02 \x01(\x0e\x32\x1b.cuvis_ai.v1.ExecutionStageH\x00R\x05stage\x88\x01\x01\x42\x08\n\x06_stage\"]\n\x1bGetProfilingSummaryResponse\x12>\n\nnode_stats\x18\x01 \x03(\x0b\x32\x1f.cuvis_ai.v1.NodeProfilingStatsR\tnodeStats\"\xa9\x02\n\x12NodeProfilingStats\x12\x1b\n\tnode_name\x18\x01 \x01(\tR\x08nodeName\x12\x31\n\x05stage\x18\x02 \x01(\x0e\x32\x1b.cuvis_ai.v1.ExecutionStageR\x05stage\x12\x14\n\x05\x63ount\x18\x03 \x01(\x03R\x05\x63ount\x12\x17\n\x07mean_ms\x18\x04 \x01(\x01R\x06meanMs\x12\x1b\n\tmedian_ms\x18\x05 \x01(\x01R\x08medianMs\x12\x15\n\x06std_ms\x18\x06 \x01(\x01R\x05stdMs\x12\x15\n\x06min_ms\x18\x07 \x01(\x01R\x05minMs\x12\x15\n\x06max_ms\x18\x08 \x01(\x01R\x05maxMs\x12\x19\n\x08total_ms\x18\t \x01(\x01R\x07totalMs\x12\x17\n\x07last_ms\x18\n \x01(\x01R\x06lastMs\"\xd0\x01\n\x18InitializeSessionRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12!\n\x0csearch_paths\x18\x02 \x03(\tR\x0bsearchPaths\x12\x32\n\x15resolved_plugins_json\x18\x03 \x01(\x0cR\x13resolvedPluginsJson\x12\x1d\n\noutput_dir\x18\x04 \x01(\tR\toutputDir\x12\x1f\n\x0bscratch_dir\x18\x05 \x01(\tR\nscratchDir\"+\n\x19InitializeSessionResponse\x12\x0e\n\x02ok\x18\x01 \x01(\x08R\x02ok\"T\n\x0eStopRunRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12#\n\rgrace_seconds\x18\x02 \x01(\x05R\x0cgraceSeconds\"!\n\x0fStopRunResponse\x12\x0e\n\x02ok\x18\x01 \x01(\x08R\x02ok\"\x14\n\x12HealthCheckRequest\"\xca\x01\n\x13HealthCheckResponse\x12\x46\n\x06status\x18\x01 \x01(\x0e\x32..cuvis_ai.v1.HealthCheckResponse.ServingStatusR\x06status\"k\n\rServingStatus\x12\x1e\n\x1aSERVING_STATUS_UNSPECIFIED\x10\x00\x12\x1a\n\x16SERVING_STATUS_SERVING\x10\x01\x12\x1e\n\x1aSERVING_STATUS_NOT_SERVING\x10\x02*\xb4\x01\n\x0eProcessingMode\x12\x1f\n\x1bPROCESSING_MODE_UNSPECIFIED\x10\x00\x12\x17\n\x13PROCESSING_MODE_RAW\x10\x01\x12\x1f\n\x1bPROCESSING_MODE_REFLECTANCE\x10\x02\x12 \n\x1cPROCESSING_MODE_DARKSUBTRACT\x10\x03\x12%\n!PROCESSING_MODE_SPECTRAL_RADIANCE\x10\x04*\x9e\x01\n\x0e\x45xecutionStage\x12\x1f\n\x1b\x45XECUTION_STAGE_UNSPECIFIED\x10\x00\x12\x19\n\x15\x45XECUTION_STAGE_TRAIN\x10\x01\x12\x17\n\x13\x45XECUTION_STAGE_VAL\x10\x02\x12\x18\n\x14\x45XECUTION_STAGE_TEST\x10\x03\x12\x1d\n\x19\x45XECUTION_STAGE_INFERENCE\x10\x04*\xb5\x01\n\x05\x44Type\x12\x16\n\x12\x44_TYPE_UNSPECIFIED\x10\x00\x12\x12\n\x0e\x44_TYPE_FLOAT32\x10\x01\x12\x12\n\x0e\x44_TYPE_FLOAT64\x10\x02\x12\x10\n\x0c\x44_TYPE_INT32\x10\x03\x12\x10\n\x0c\x44_TYPE_INT64\x10\x04\x12\x10\n\x0c\x44_TYPE_UINT8\x10\x05\x12\x0f\n\x0b\x44_TYPE_BOOL\x10\x06\x12\x12\n\x0e\x44_TYPE_FLOAT16\x10\x07\x12\x11\n\rD_TYPE_UINT16\x10\x08*d\n\x0bTrainerType\x12\x1c\n\x18TRAINER_TYPE_UNSPECIFIED\x10\x00\x12\x1c\n\x18TRAINER_TYPE_STATISTICAL\x10\x01\x12\x19\n\x15TRAINER_TYPE_GRADIENT\x10\x02*x\n\x0bTrainStatus\x12\x1c\n\x18TRAIN_STATUS_UNSPECIFIED\x10\x00\x12\x18\n\x14TRAIN_STATUS_RUNNING\x10\x01\x12\x19\n\x15TRAIN_STATUS_COMPLETE\x10\x02\x12\x16\n\x12TRAIN_STATUS_ERROR\x10\x03*q\n\tPointType\x12\x1a\n\x16POINT_TYPE_UNSPECIFIED\x10\x00\x12\x17\n\x13POINT_TYPE_POSITIVE\x10\x01\x12\x17\n\x13POINT_TYPE_NEGATIVE\x10\x02\x12\x16\n\x12POINT_TYPE_NEUTRAL\x10\x03*\xf3\x02\n\x0cNodeCategory\x12\x1d\n\x19NODE_CATEGORY_UNSPECIFIED\x10\x00\x12\x18\n\x14NODE_CATEGORY_SOURCE\x10\x01\x12\x16\n\x12NODE_CATEGORY_SINK\x10\x02\x12\x1b\n\x17NODE_CATEGORY_TRANSFORM\x10\x03\x12\x17\n\x13NODE_CATEGORY_MODEL\x10\x04\x12\x16\n\x12NODE_CATEGORY_LOSS\x10\x05\x12\x18\n\x14NODE_CATEGORY_METRIC\x10\x06\x12\x1b\n\x17NODE_CATEGORY_OPTIMIZER\x10\x07\x12\x1b\n\x17NODE_CATEGORY_SCHEDULER\x10\x08\x12\x1d\n\x19NODE_CATEGORY_REGULARIZER\x10\t\x12\x18\n\x14NODE_CATEGORY_RUNNER\x10\n\x12\x1c\n\x18NODE_CATEGORY_VISUALIZER\x10\x0b\x12\x19\n\x15NODE_CATEGORY_CONTROL\x10\x0c*\xba\t\n\x07NodeTag\x12\x18\n\x14NODE_TAG_UNSPECIFIED\x10\x00\x12\x12\n\x0eNODE_TAG_IMAGE\x10\x64\x12\x12\n\x0eNODE_TAG_VIDEO\x10\x65\x12\x10\n\x0cNODE_TAG_RGB\x10\x66\x12\x1a\n\x16NODE_TAG_MULTISPECTRAL\x10g\x12\x1a\n\x16NODE_TAG_HYPERSPECTRAL\x10h\x12\x18\n\x14NODE_TAG_POINT_CLOUD\x10i\x12\x12\n\x0eNODE_TAG_DEPTH\x10j\x12\x11\n\rNODE_TAG_MASK\x10k\x12\x11\n\rNODE_TAG_BBOX\x10l\x12\x16\n\x12NODE_TAG_KEYPOINTS\x10m\x12\x11\n\rNODE_TAG_TEXT\x10n\x12\x12\n\x0eNODE_TAG_AUDIO\x10o\x12\x14\n\x10NODE_TAG_TABULAR\x10p\x12\x18\n\x14NODE_TAG_TIME_SERIES\x10q\x12\x15\n\x11NODE_TAG_METADATA\x10r\x12\x16\n\x12NODE_TAG_EMBEDDING\x10s\x12\x1c\n\x17NODE_TAG_CLASSIFICATION\x10\xc8\x01\x12\x1a\n\x15NODE_TAG_SEGMENTATION\x10\xc9\x01\x12\x17\n\x12NODE_TAG_DETECTION\x10\xca\x01\x12\x16\n\x11NODE_TAG_TRACKING\x10\xcb\x01\x12\x18\n\x13NODE_TAG_REGRESSION\x10\xcc\x01\x12\x18\n\x13NODE_TAG_GENERATION\x10\xcd\x01\x12\x1c\n\x17NODE_TAG_RECONSTRUCTION\x10\xce\x01\x12\x17\n\x12NODE_TAG_DENOISING\x10\xcf\x01\x12\x16\n\x11NODE_TAG_UNMIXING\x10\xd0\x01\x12\x1b\n\x16NODE_TAG_DIM_REDUCTION\x10\xd1\x01\x12\x18\n\x13NODE_TAG_CLUSTERING\x10\xd2\x01\x12\x15\n\x10NODE_TAG_ANOMALY\x10\xd3\x01\x12\x17\n\x12NODE_TAG_RETRIEVAL\x10\xd4\x01\x12\x1b\n\x16NODE_TAG_PREPROCESSING\x10\xac\x02\x12\x1c\n\x17NODE_TAG_POSTPROCESSING\x10\xad\x02\x12\x1a\n\x15NODE_TAG_AUGMENTATION\x10\xae\x02\x12\x19\n\x14NODE_TAG_CALIBRATION\x10\xaf\x02\x12\x1b\n\x16NODE_TAG_NORMALIZATION\x10\xb0\x02\x12\x16\n\x11NODE_TAG_TRAINING\x10\xb1\x02\x12\x18\n\x13NODE_TAG_EVALUATION\x10\xb2\x02\x12\x17\n\x12NODE_TAG_INFERENCE\x10\xb3\x02\x12\x17\n\x12NODE_TAG_LEARNABLE\x10\x90\x03\x12\x1c\n\x17NODE_TAG_DIFFERENTIABLE\x10\x91\x03\x12\x18\n\x13NODE_TAG_STOCHASTIC\x10\x92\x03\x12\x18\n\x13NODE_TAG_INVERTIBLE\x10\x93\x03\x12\x17\n\x12NODE_TAG_STREAMING\x10\x94\x03\x12\x15\n\x10NODE_TAG_BATCHED\x10\x95\x03\x12\x16\n\x11NODE_TAG_STATEFUL\x10\x96\x03\x12\x13\n\x0eNODE_TAG_TORCH\x10\xf4\x03\x12\x13\n\x0eNODE_TAG_NUMPY\x10\xf5\x03\x12\x11\n\x0cNODE_TAG_JAX\x10\xf6\x03\x12\x12\n\rNODE_TAG_ONNX\x10\xf7\x03\x32\xf8\x14\n\x0e\x43uvisAIService\x12q\n\x16ListAvailablePipelines\x12*.cuvis_ai.v1.ListAvailablePipelinesRequest\x1a+.cuvis_ai.v1.ListAvailablePipelinesResponse\x12\\\n\x0fGetPipelineInfo\x12#.cuvis_ai.v1.GetPipelineInfoRequest\x1a$.cuvis_ai.v1.GetPipelineInfoResponse\x12V\n\rCreateSession\x12!.cuvis_ai.v1.CreateSessionRequest\x1a\".cuvis_ai.v1.CreateSessionResponse\x12n\n\x15SetSessionSearchPaths\x12).cuvis_ai.v1.SetSessionSearchPathsRequest\x1a*.cuvis_ai.v1.SetSessionSearchPathsResponse\x12S\n\x0c\x43loseSession\x12 .cuvis_ai.v1.CloseSessionRequest\x1a!.cuvis_ai.v1.CloseSessionResponse\x12V\n\rResolveConfig\x12!.cuvis_ai.v1.ResolveConfigRequest\x1a\".cuvis_ai.v1.ResolveConfigResponse\x12\x65\n\x12GetParameterSchema\x12&.cuvis_ai.v1.GetParameterSchemaRequest\x1a\'.cuvis_ai.v1.GetParameterSchemaResponse\x12Y\n\x0eValidateConfig\x12\".cuvis_ai.v1.ValidateConfigRequest\x1a#.cuvis_ai.v1.ValidateConfigResponse\x12h\n\x13LoadPipelineWeights\x12\'.cuvis_ai.v1.LoadPipelineWeightsRequest\x1a(.cuvis_ai.v1.LoadPipelineWeightsResponse\x12\x62\n\x11SetTrainRunConfig\x12%.cuvis_ai.v1.SetTrainRunConfigRequest\x1a&.cuvis_ai.v1.SetTrainRunConfigResponse\x12@\n\x05Train\x12\x19.cuvis_ai.v1.TrainRequest\x1a\x1a.cuvis_ai.v1.TrainResponse0\x01\x12Y\n\x0eGetTrainStatus\x12\".cuvis_ai.v1.GetTrainStatusRequest\x1a#.cuvis_ai.v1.GetTrainStatusResponse\x12t\n\x17GetTrainingCapabilities\x12+.cuvis_ai.v1.GetTrainingCapabilitiesRequest\x1a,.cuvis_ai.v1.GetTrainingCapabilitiesResponse\x12S\n\x0cSavePipeline\x12 .cuvis_ai.v1.SavePipelineRequest\x1a!.cuvis_ai.v1.SavePipelineResponse\x12S\n\x0cLoadPipeline\x12 .cuvis_ai.v1.LoadPipelineRequest\x1a!.cuvis_ai.v1.LoadPipelineResponse\x12S\n\x0cSaveTrainRun\x12 .cuvis_ai.v1.SaveTrainRunRequest\x1a!.cuvis_ai.v1.SaveTrainRunResponse\x12\\\n\x0fRestoreTrainRun\x12#.cuvis_ai.v1.RestoreTrainRunRequest\x1a$.cuvis_ai.v1.RestoreTrainRunResponse\x12\x62\n\x11GetPipelineInputs\x12%.cuvis_ai.v1.GetPipelineInputsRequest\x1a&.cuvis_ai.v1.GetPipelineInputsResponse\x12\x65\n\x12GetPipelineOutputs\x12&.cuvis_ai.v1.GetPipelineOutputsRequest\x1a\'.cuvis_ai.v1.GetPipelineOutputsResponse\x12w\n\x18GetPipelineVisualization\x12,.cuvis_ai.v1.GetPipelineVisualizationRequest\x1a-.cuvis_ai.v1.GetPipelineVisualizationResponse\x12J\n\tInference\x12\x1d.cuvis_ai.v1.InferenceRequest\x1a\x1e.cuvis_ai.v1.InferenceResponse\x12M\n\nLoadPlugin\x12\x1e.cuvis_ai.v1.LoadPluginRequest\x1a\x1f.cuvis_ai.v1.LoadPluginResponse\x12\x62\n\x11ListLoadedPlugins\x12%.cuvis_ai.v1.ListLoadedPluginsRequest\x1a&.cuvis_ai.v1.ListLoadedPluginsResponse\x12V\n\rGetPluginInfo\x12!.cuvis_ai.v1.GetPluginInfoRequest\x1a\".cuvis_ai.v1.GetPluginInfoResponse\x12\x65\n\x12ListAvailableNodes\x12&.cuvis_ai.v1.ListAvailableNodesRequest\x1a\'.cuvis_ai.v1.ListAvailableNodesResponse\x12_\n\x10\x43learPluginCache\x12$.cuvis_ai.v1.ClearPluginCacheRequest\x1a%.cuvis_ai.v1.ClearPluginCacheResponse\x12S\n\x0cSetProfiling\x12 .cuvis_ai.v1.SetProfilingRequest\x1a!.cuvis_ai.v1.SetProfilingResponse\x12h\n\x13GetProfilingSummary\x12\'.cuvis_ai.v1.GetProfilingSummaryRequest\x1a(.cuvis_ai.v1.GetProfilingSummaryResponse2\xb5\x0b\n\nRunRuntime\x12\x62\n\x11InitializeSession\x12%.cuvis_ai.v1.InitializeSessionRequest\x1a&.cuvis_ai.v1.InitializeSessionResponse\x12S\n\x0cLoadPipeline\x12 .cuvis_ai.v1.LoadPipelineRequest\x1a!.cuvis_ai.v1.LoadPipelineResponse\x12h\n\x13LoadPipelineWeights\x12\'.cuvis_ai.v1.LoadPipelineWeightsRequest\x1a(.cuvis_ai.v1.LoadPipelineWeightsResponse\x12\\\n\x0fRestoreTrainRun\x12#.cuvis_ai.v1.RestoreTrainRunRequest\x1a$.cuvis_ai.v1.RestoreTrainRunResponse\x12S\n\x0cSavePipeline\x12 .cuvis_ai.v1.SavePipelineRequest\x1a!.cuvis_ai.v1.SavePipelineResponse\x12S\n\x0cSaveTrainRun\x12 .cuvis_ai.v1.SaveTrainRunRequest\x1a!.cuvis_ai.v1.SaveTrainRunResponse\x12\x62\n\x11GetPipelineInputs\x12%.cuvis_ai.v1.GetPipelineInputsRequest\x1a&.cuvis_ai.v1.GetPipelineInputsResponse\x12\x65\n\x12GetPipelineOutputs\x12&.cuvis_ai.v1.GetPipelineOutputsRequest\x1a\'.cuvis_ai.v1.GetPipelineOutputsResponse\x12w\n\x18GetPipelineVisualization\x12,.cuvis_ai.v1.GetPipelineVisualizationRequest\x1a-.cuvis_ai.v1.GetPipelineVisualizationResponse\x12\x62\n\x11SetTrainRunConfig\x12%.cuvis_ai.v1.SetTrainRunConfigRequest\x1a&.cuvis_ai.v1.SetTrainRunConfigResponse\x12J\n\tInference\x12\x1d.cuvis_ai.v1.InferenceRequest\x1a\x1e.cuvis_ai.v1.InferenceResponse\x12@\n\x05Train\x12\x19.cuvis_ai.v1.TrainRequest\x1a\x1a.cuvis_ai.v1.TrainResponse0\x01\x12Y\n\x0eGetTrainStatus\x12\".cuvis_ai.v1.GetTrainStatusRequest\x1a#.cuvis_ai.v1.GetTrainStatusResponse\x12S\n\x0c\x43loseSession\x12 .cuvis_ai.v1.CloseSessionRequest\x1a!.cuvis_ai.v1.CloseSessionResponse\x12\x44\n\x07StopRun\x12\x1b.cuvis_ai.v1.StopRunRequest\x1a\x1c.cuvis_ai.v1.StopRunResponse\x12P\n\x0bHealthCheck\x12\x1f.cuvis_ai.v1.HealthCheckRequest\x1a .cuvis_ai.v1.HealthCheckResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'cuvis_ai_schemas/grpc/v1/cuvis_ai.proto\x12\x0b\x63uvis_ai.v1\"Z\n\x06ShmRef\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x1f\n\x0b\x62yte_offset\x18\x02 \x01(\x04R\nbyteOffset\x12\x1b\n\tbyte_size\x18\x03 \x01(\x04R\x08\x62yteSize\"\xa0\x01\n\x06Tensor\x12\x14\n\x05shape\x18\x01 \x03(\x03R\x05shape\x12(\n\x05\x64type\x18\x02 \x01(\x0e\x32\x12.cuvis_ai.v1.DTypeR\x05\x64type\x12\x1b\n\x08raw_data\x18\x03 \x01(\x0cH\x00R\x07rawData\x12.\n\x07shm_ref\x18\x04 \x01(\x0b\x32\x13.cuvis_ai.v1.ShmRefH\x00R\x06shmRefB\t\n\x07payload\"\x90\x01\n\x07\x43ontext\x12\x31\n\x05stage\x18\x01 \x01(\x0e\x32\x1b.cuvis_ai.v1.ExecutionStageR\x05stage\x12\x14\n\x05\x65poch\x18\x02 \x01(\x05R\x05\x65poch\x12\x1b\n\tbatch_idx\x18\x03 \x01(\x05R\x08\x62\x61tchIdx\x12\x1f\n\x0bglobal_step\x18\x04 \x01(\x05R\nglobalStep\"3\n\x0ePipelineConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"/\n\nDataConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"4\n\x0fOptimizerConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"4\n\x0fSchedulerConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"4\n\x0f\x43\x61llbacksConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"\xb8\x01\n\x10PipelineMetadata\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12 \n\x0b\x64\x65scription\x18\x02 \x01(\tR\x0b\x64\x65scription\x12\x18\n\x07\x63reated\x18\x03 \x01(\tR\x07\x63reated\x12(\n\x10\x63uvis_ai_version\x18\x04 \x01(\tR\x0e\x63uvisAiVersion\x12\x12\n\x04tags\x18\x05 \x03(\tR\x04tags\x12\x16\n\x06\x61uthor\x18\x06 \x01(\tR\x06\x61uthor\"\xd9\x01\n\x0cPipelineInfo\x12#\n\rpipeline_path\x18\x01 \x01(\tR\x0cpipelinePath\x12#\n\rresolved_path\x18\x02 \x01(\tR\x0cresolvedPath\x12\x39\n\x08metadata\x18\x03 \x01(\x0b\x32\x1d.cuvis_ai.v1.PipelineMetadataR\x08metadata\x12!\n\x0cweights_path\x18\x06 \x01(\tR\x0bweightsPath\x12!\n\x0cyaml_content\x18\x07 \x01(\tR\x0byamlContent\"3\n\x0eTrainingConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"3\n\x0eTrainRunConfig\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"\xb0\x01\n\x0b\x42oundingBox\x12\x1d\n\nelement_id\x18\x01 \x01(\x05R\telementId\x12\x13\n\x05x_min\x18\x02 \x01(\x02R\x04xMin\x12\x13\n\x05y_min\x18\x03 \x01(\x02R\x04yMin\x12\x13\n\x05x_max\x18\x04 \x01(\x02R\x04xMax\x12\x13\n\x05y_max\x18\x05 \x01(\x02R\x04yMax\x12 \n\tobject_id\x18\x06 \x01(\x05H\x00R\x08objectId\x88\x01\x01\x42\x0c\n\n_object_id\"?\n\rBoundingBoxes\x12.\n\x05\x62oxes\x18\x01 \x03(\x0b\x32\x18.cuvis_ai.v1.BoundingBoxR\x05\x62oxes\"n\n\x05Point\x12\x1d\n\nelement_id\x18\x01 \x01(\x05R\telementId\x12\x0c\n\x01x\x18\x02 \x01(\x02R\x01x\x12\x0c\n\x01y\x18\x03 \x01(\x02R\x01y\x12*\n\x04type\x18\x04 \x01(\x0e\x32\x16.cuvis_ai.v1.PointTypeR\x04type\"4\n\x06Points\x12*\n\x06points\x18\x01 \x03(\x0b\x32\x12.cuvis_ai.v1.PointR\x06points\"\xcf\x04\n\nInputBatch\x12\x35\n\x0bwavelengths\x18\x01 \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x0bwavelengths\x12\'\n\x04\x63ube\x18\x02 \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x04\x63ube\x12\'\n\x04mask\x18\x03 \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x04mask\x12\x32\n\x06\x62\x62oxes\x18\x04 \x01(\x0b\x32\x1a.cuvis_ai.v1.BoundingBoxesR\x06\x62\x62oxes\x12+\n\x06points\x18\x05 \x01(\x0b\x32\x13.cuvis_ai.v1.PointsR\x06points\x12\x1f\n\x0btext_prompt\x18\x06 \x01(\tR\ntextPrompt\x12K\n\x0c\x65xtra_inputs\x18\x07 \x03(\x0b\x32(.cuvis_ai.v1.InputBatch.ExtraInputsEntryR\x0b\x65xtraInputs\x12\x32\n\nmesu_index\x18\x08 \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\tmesuIndex\x12\x30\n\trgb_image\x18\t \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x08rgbImage\x12.\n\x08\x66rame_id\x18\n \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x07\x66rameId\x1aS\n\x10\x45xtraInputsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x05value:\x02\x38\x01\"|\n\nTensorSpec\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x14\n\x05shape\x18\x02 \x03(\x03R\x05shape\x12(\n\x05\x64type\x18\x03 \x01(\x0e\x32\x12.cuvis_ai.v1.DTypeR\x05\x64type\x12\x1a\n\x08required\x18\x04 \x01(\x08R\x08required\"\xd4\x03\n\rTrainResponse\x12.\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x14.cuvis_ai.v1.ContextR\x07\x63ontext\x12>\n\x06losses\x18\x02 \x03(\x0b\x32&.cuvis_ai.v1.TrainResponse.LossesEntryR\x06losses\x12\x41\n\x07metrics\x18\x03 \x03(\x0b\x32\'.cuvis_ai.v1.TrainResponse.MetricsEntryR\x07metrics\x12\x30\n\x06status\x18\x04 \x01(\x0e\x32\x18.cuvis_ai.v1.TrainStatusR\x06status\x12\x18\n\x07message\x18\x05 \x01(\tR\x07message\x12;\n\x07\x63ompact\x18\x06 \x01(\x0b\x32!.cuvis_ai.v1.CompactTrainProgressR\x07\x63ompact\x12\x10\n\x03seq\x18\x07 \x01(\x04R\x03seq\x1a\x39\n\x0bLossesEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x02R\x05value:\x02\x38\x01\x1a:\n\x0cMetricsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x02R\x05value:\x02\x38\x01\"\xbe\x01\n\x10\x43ompactTrainStep\x12.\n\x07\x63ontext\x18\x01 \x01(\x0b\x32\x14.cuvis_ai.v1.ContextR\x07\x63ontext\x12\x16\n\x06losses\x18\x02 \x03(\x01R\x06losses\x12\x18\n\x07metrics\x18\x03 \x03(\x01R\x07metrics\x12!\n\x0closs_indices\x18\x04 \x03(\rR\x0blossIndices\x12%\n\x0emetric_indices\x18\x05 \x03(\rR\rmetricIndices\"\x9b\x01\n\x14\x43ompactTrainProgress\x12$\n\x0enew_loss_names\x18\x01 \x03(\tR\x0cnewLossNames\x12(\n\x10new_metric_names\x18\x02 \x03(\tR\x0enewMetricNames\x12\x33\n\x05steps\x18\x03 \x03(\x0b\x32\x1d.cuvis_ai.v1.CompactTrainStepR\x05steps\"\xb6\x01\n\tParamSpec\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x12\n\x04type\x18\x02 \x01(\tR\x04type\x12\x1a\n\x08required\x18\x03 \x01(\x08R\x08required\x12#\n\rdefault_value\x18\x04 \x01(\tR\x0c\x64\x65\x66\x61ultValue\x12 \n\x0b\x64\x65scription\x18\x05 \x01(\tR\x0b\x64\x65scription\x12\x1e\n\nvalidation\x18\x06 \x01(\tR\nvalidation\"\x80\x01\n\x10\x43\x61llbackTypeInfo\x12\x12\n\x04type\x18\x01 \x01(\tR\x04type\x12 \n\x0b\x64\x65scription\x18\x02 \x01(\tR\x0b\x64\x65scription\x12\x36\n\nparameters\x18\x03 \x03(\x0b\x32\x16.cuvis_ai.v1.ParamSpecR\nparameters\"O\n\x15OptimizerParamsSchema\x12\x36\n\nparameters\x18\x01 \x03(\x0b\x32\x16.cuvis_ai.v1.ParamSpecR\nparameters\"O\n\x15SchedulerParamsSchema\x12\x36\n\nparameters\x18\x01 \x03(\x0b\x32\x16.cuvis_ai.v1.ParamSpecR\nparameters\"R\n\x1dListAvailablePipelinesRequest\x12\"\n\nfilter_tag\x18\x01 \x01(\tH\x00R\tfilterTag\x88\x01\x01\x42\r\n\x0b_filter_tag\"Y\n\x1eListAvailablePipelinesResponse\x12\x37\n\tpipelines\x18\x01 \x03(\x0b\x32\x19.cuvis_ai.v1.PipelineInfoR\tpipelines\"=\n\x16GetPipelineInfoRequest\x12#\n\rpipeline_path\x18\x01 \x01(\tR\x0cpipelinePath\"Y\n\x17GetPipelineInfoResponse\x12>\n\rpipeline_info\x18\x01 \x01(\x0b\x32\x19.cuvis_ai.v1.PipelineInfoR\x0cpipelineInfo\"\x16\n\x14\x43reateSessionRequest\"6\n\x15\x43reateSessionResponse\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"\x88\x01\n\x1cSetSessionSearchPathsRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12!\n\x0csearch_paths\x18\x02 \x03(\tR\x0bsearchPaths\x12\x1b\n\x06\x61ppend\x18\x03 \x01(\x08H\x00R\x06\x61ppend\x88\x01\x01\x42\t\n\x07_append\"\x85\x01\n\x1dSetSessionSearchPathsResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12#\n\rcurrent_paths\x18\x02 \x03(\tR\x0c\x63urrentPaths\x12%\n\x0erejected_paths\x18\x03 \x03(\tR\rrejectedPaths\"4\n\x13\x43loseSessionRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"0\n\x14\x43loseSessionResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\"\x88\x01\n\x14ResolveConfigRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x1f\n\x0b\x63onfig_type\x18\x02 \x01(\tR\nconfigType\x12\x12\n\x04path\x18\x03 \x01(\tR\x04path\x12\x1c\n\toverrides\x18\x04 \x03(\tR\toverrides\":\n\x15ResolveConfigResponse\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"<\n\x19GetParameterSchemaRequest\x12\x1f\n\x0b\x63onfig_type\x18\x01 \x01(\tR\nconfigType\"=\n\x1aGetParameterSchemaResponse\x12\x1f\n\x0bjson_schema\x18\x01 \x01(\tR\njsonSchema\"[\n\x15ValidateConfigRequest\x12\x1f\n\x0b\x63onfig_type\x18\x01 \x01(\tR\nconfigType\x12!\n\x0c\x63onfig_bytes\x18\x02 \x01(\x0cR\x0b\x63onfigBytes\"b\n\x16ValidateConfigResponse\x12\x14\n\x05valid\x18\x01 \x01(\x08R\x05valid\x12\x16\n\x06\x65rrors\x18\x02 \x03(\tR\x06\x65rrors\x12\x1a\n\x08warnings\x18\x03 \x03(\tR\x08warnings\"\xc1\x01\n\x1aLoadPipelineWeightsRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12#\n\x0cweights_path\x18\x02 \x01(\tH\x00R\x0bweightsPath\x12%\n\rweights_bytes\x18\x03 \x01(\x0cH\x00R\x0cweightsBytes\x12\x1b\n\x06strict\x18\x04 \x01(\x08H\x01R\x06strict\x88\x01\x01\x42\x10\n\x0eweights_sourceB\t\n\x07_strict\"\\\n\x1bLoadPipelineWeightsResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12#\n\rresolved_path\x18\x02 \x01(\tR\x0cresolvedPath\"n\n\x18SetTrainRunConfigRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x33\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\x1b.cuvis_ai.v1.TrainRunConfigR\x06\x63onfig\"g\n\x19SetTrainRunConfigResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12\x30\n\x14pipeline_from_config\x18\x02 \x01(\x08R\x12pipelineFromConfig\"\xab\x02\n\x0cTrainRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12;\n\x0ctrainer_type\x18\x02 \x01(\x0e\x32\x18.cuvis_ai.v1.TrainerTypeR\x0btrainerType\x12+\n\x04\x64\x61ta\x18\x03 \x01(\x0b\x32\x17.cuvis_ai.v1.DataConfigR\x04\x64\x61ta\x12\x37\n\x08training\x18\x04 \x01(\x0b\x32\x1b.cuvis_ai.v1.TrainingConfigR\x08training\x12)\n\x10\x63ompact_progress\x18\x05 \x01(\x08R\x0f\x63ompactProgress\x12.\n\x13max_coalesced_steps\x18\x06 \x01(\rR\x11maxCoalescedSteps\"6\n\x15GetTrainStatusRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"]\n\x16GetTrainStatusResponse\x12\x43\n\x0flatest_progress\x18\x01 \x01(\x0b\x32\x1a.cuvis_ai.v1.TrainResponseR\x0elatestProgress\"M\n\x11WatchTrainRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x19\n\x08\x66rom_seq\x18\x02 \x01(\x04R\x07\x66romSeq\" \n\x1eGetTrainingCapabilitiesRequest\"\xf5\x02\n\x1fGetTrainingCapabilitiesResponse\x12\x31\n\x14supported_optimizers\x18\x01 \x03(\tR\x13supportedOptimizers\x12\x31\n\x14supported_schedulers\x18\x02 \x03(\tR\x13supportedSchedulers\x12N\n\x13supported_callbacks\x18\x03 \x03(\x0b\x32\x1d.cuvis_ai.v1.CallbackTypeInfoR\x12supportedCallbacks\x12M\n\x10optimizer_params\x18\x04 \x01(\x0b\x32\".cuvis_ai.v1.OptimizerParamsSchemaR\x0foptimizerParams\x12M\n\x10scheduler_params\x18\x05 \x01(\x0b\x32\".cuvis_ai.v1.SchedulerParamsSchemaR\x0fschedulerParams\"\x94\x01\n\x13SavePipelineRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12#\n\rpipeline_path\x18\x02 \x01(\tR\x0cpipelinePath\x12\x39\n\x08metadata\x18\x03 \x01(\x0b\x32\x1d.cuvis_ai.v1.PipelineMetadataR\x08metadata\"x\n\x14SavePipelineResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12#\n\rpipeline_path\x18\x02 \x01(\tR\x0cpipelinePath\x12!\n\x0cweights_path\x18\x03 \x01(\tR\x0bweightsPath\"\x8e\x01\n\x13LoadPipelineRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x37\n\x08pipeline\x18\x02 \x01(\x0b\x32\x1b.cuvis_ai.v1.PipelineConfigR\x08pipeline\x12\x1f\n\x0b\x64\x61ta_module\x18\x03 \x01(\tR\ndataModule\"k\n\x14LoadPipelineResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12\x39\n\x08metadata\x18\x02 \x01(\x0b\x32\x1d.cuvis_ai.v1.PipelineMetadataR\x08metadata\"|\n\x13SaveTrainRunRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12#\n\rtrainrun_path\x18\x02 \x01(\tR\x0ctrainrunPath\x12!\n\x0csave_weights\x18\x03 \x01(\x08R\x0bsaveWeights\"\x9d\x01\n\x14SaveTrainRunResponse\x12\x18\n\x07success\x18\x01 \x01(\x08R\x07success\x12#\n\rtrainrun_path\x18\x02 \x01(\tR\x0ctrainrunPath\x12#\n\rpipeline_path\x18\x03 \x01(\tR\x0cpipelinePath\x12!\n\x0cweights_path\x18\x04 \x01(\tR\x0bweightsPath\"\x9e\x01\n\x16RestoreTrainRunRequest\x12#\n\rtrainrun_path\x18\x01 \x01(\tR\x0ctrainrunPath\x12&\n\x0cweights_path\x18\x02 \x01(\tH\x00R\x0bweightsPath\x88\x01\x01\x12\x1b\n\x06strict\x18\x03 \x01(\x08H\x01R\x06strict\x88\x01\x01\x42\x0f\n\r_weights_pathB\t\n\x07_strict\"q\n\x17RestoreTrainRunResponse\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x37\n\x08trainrun\x18\x02 \x01(\x0b\x32\x1b.cuvis_ai.v1.TrainRunConfigR\x08trainrun\"9\n\x18GetPipelineInputsRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"\xed\x01\n\x19GetPipelineInputsResponse\x12\x1f\n\x0binput_names\x18\x01 \x03(\tR\ninputNames\x12W\n\x0binput_specs\x18\x02 \x03(\x0b\x32\x36.cuvis_ai.v1.GetPipelineInputsResponse.InputSpecsEntryR\ninputSpecs\x1aV\n\x0fInputSpecsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12-\n\x05value\x18\x02 \x01(\x0b\x32\x17.cuvis_ai.v1.TensorSpecR\x05value:\x02\x38\x01\":\n\x19GetPipelineOutputsRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"\xf5\x01\n\x1aGetPipelineOutputsResponse\x12!\n\x0coutput_names\x18\x01 \x03(\tR\x0boutputNames\x12[\n\x0coutput_specs\x18\x02 \x03(\x0b\x32\x38.cuvis_ai.v1.GetPipelineOutputsResponse.OutputSpecsEntryR\x0boutputSpecs\x1aW\n\x10OutputSpecsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12-\n\x05value\x18\x02 \x01(\x0b\x32\x17.cuvis_ai.v1.TensorSpecR\x05value:\x02\x38\x01\"\x7f\n\x1fGetPipelineVisualizationRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x16\n\x06\x66ormat\x18\x02 \x01(\tR\x06\x66ormat\x12%\n\x0e\x63onfig_content\x18\x03 \x01(\tR\rconfigContent\"Y\n GetPipelineVisualizationResponse\x12\x1d\n\nimage_data\x18\x01 \x01(\x0cR\timageData\x12\x16\n\x06\x66ormat\x18\x02 \x01(\tR\x06\x66ormat\"\x85\x01\n\x10InferenceRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12/\n\x06inputs\x18\x02 \x01(\x0b\x32\x17.cuvis_ai.v1.InputBatchR\x06inputs\x12!\n\x0coutput_specs\x18\x03 \x03(\tR\x0boutputSpecs\"\xae\x02\n\x11InferenceResponse\x12\x45\n\x07outputs\x18\x01 \x03(\x0b\x32+.cuvis_ai.v1.InferenceResponse.OutputsEntryR\x07outputs\x12\x45\n\x07metrics\x18\x02 \x03(\x0b\x32+.cuvis_ai.v1.InferenceResponse.MetricsEntryR\x07metrics\x1aO\n\x0cOutputsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x13.cuvis_ai.v1.TensorR\x05value:\x02\x38\x01\x1a:\n\x0cMetricsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n\x05value\x18\x02 \x01(\x02R\x05value:\x02\x38\x01\"3\n\x0ePluginManifest\x12!\n\x0c\x63onfig_bytes\x18\x01 \x01(\x0cR\x0b\x63onfigBytes\"\x82\x01\n\nPluginInfo\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12\x12\n\x04type\x18\x02 \x01(\tR\x04type\x12\x16\n\x06source\x18\x03 \x01(\tR\x06source\x12\x10\n\x03tag\x18\x04 \x01(\tR\x03tag\x12\"\n\x0c\x63\x61pabilities\x18\x05 \x03(\tR\x0c\x63\x61pabilities\"\xb8\x01\n\x08PortSpec\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12(\n\x05\x64type\x18\x02 \x01(\x0e\x32\x12.cuvis_ai.v1.DTypeR\x05\x64type\x12\x14\n\x05shape\x18\x03 \x03(\x03R\x05shape\x12\x1a\n\x08optional\x18\x04 \x01(\x08R\x08optional\x12 \n\x0b\x64\x65scription\x18\x05 \x01(\tR\x0b\x64\x65scription\x12\x1a\n\x08variadic\x18\x06 \x01(\x08R\x08variadic\"\xbb\x04\n\x08NodeInfo\x12\x1d\n\nclass_name\x18\x01 \x01(\tR\tclassName\x12\x1b\n\tfull_path\x18\x02 \x01(\tR\x08\x66ullPath\x12\x16\n\x06source\x18\x03 \x01(\tR\x06source\x12\x1f\n\x0bplugin_name\x18\x04 \x01(\tR\npluginName\x12\x46\n\x0binput_specs\x18\x05 \x03(\x0b\x32%.cuvis_ai.v1.NodeInfo.InputSpecsEntryR\ninputSpecs\x12I\n\x0coutput_specs\x18\x06 \x03(\x0b\x32&.cuvis_ai.v1.NodeInfo.OutputSpecsEntryR\x0boutputSpecs\x12\x19\n\x08icon_svg\x18\x07 \x01(\x0cR\x07iconSvg\x12\x35\n\x08\x63\x61tegory\x18\x08 \x01(\x0e\x32\x19.cuvis_ai.v1.NodeCategoryR\x08\x63\x61tegory\x12(\n\x04tags\x18\t \x03(\x0e\x32\x14.cuvis_ai.v1.NodeTagR\x04tags\x1aT\n\x0fInputSpecsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x15.cuvis_ai.v1.PortSpecR\x05value:\x02\x38\x01\x1aU\n\x10OutputSpecsEntry\x12\x10\n\x03key\x18\x01 \x01(\tR\x03key\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x15.cuvis_ai.v1.PortSpecR\x05value:\x02\x38\x01\"k\n\x11LoadPluginRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x37\n\x08manifest\x18\x02 \x01(\x0b\x32\x1b.cuvis_ai.v1.PluginManifestR\x08manifest\"W\n\x12LoadPluginResponse\x12+\n\x11registered_plugin\x18\x01 \x01(\tR\x10registeredPlugin\x12\x14\n\x05\x65rror\x18\x02 \x01(\tR\x05\x65rror\"9\n\x18ListLoadedPluginsRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"N\n\x19ListLoadedPluginsResponse\x12\x31\n\x07plugins\x18\x01 \x03(\x0b\x32\x17.cuvis_ai.v1.PluginInfoR\x07plugins\"V\n\x14GetPluginInfoRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x1f\n\x0bplugin_name\x18\x02 \x01(\tR\npluginName\"H\n\x15GetPluginInfoResponse\x12/\n\x06plugin\x18\x01 \x01(\x0b\x32\x17.cuvis_ai.v1.PluginInfoR\x06plugin\":\n\x19ListAvailableNodesRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\"I\n\x1aListAvailableNodesResponse\x12+\n\x05nodes\x18\x01 \x03(\x0b\x32\x15.cuvis_ai.v1.NodeInfoR\x05nodes\":\n\x17\x43learPluginCacheRequest\x12\x1f\n\x0bplugin_name\x18\x01 \x01(\tR\npluginName\"?\n\x18\x43learPluginCacheResponse\x12#\n\rcleared_count\x18\x01 \x01(\x05R\x0c\x63learedCount\"\xf0\x01\n\x13SetProfilingRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x18\n\x07\x65nabled\x18\x02 \x01(\x08R\x07\x65nabled\x12.\n\x10synchronize_cuda\x18\x03 \x01(\x08H\x00R\x0fsynchronizeCuda\x88\x01\x01\x12\x19\n\x05reset\x18\x04 \x01(\x08H\x01R\x05reset\x88\x01\x01\x12%\n\x0cskip_first_n\x18\x05 \x01(\x05H\x02R\nskipFirstN\x88\x01\x01\x42\x13\n\x11_synchronize_cudaB\x08\n\x06_resetB\x0f\n\r_skip_first_n\"C\n\x14SetProfilingResponse\x12+\n\x11profiling_enabled\x18\x01 \x01(\x08R\x10profilingEnabled\"}\n\x1aGetProfilingSummaryRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12\x36\n\x05stage\x18\x02 \x01(\x0e\x32\x1b.cuvis_ai.v1.ExecutionStageH\x00R\x05stage\x88\x01\x01\x42\x08\n\x06_stage\"\x9d\x01\n\x1bGetProfilingSummaryResponse\x12>\n\nnode_stats\x18\x01 \x03(\x0b\x32\x1f.cuvis_ai.v1.NodeProfilingStatsR\tnodeStats\x12>\n\nedge_stats\x18\x02 \x03(\x0b\x32\x1f.cuvis_ai.v1.EdgeProfilingStatsR\tedgeStats\"\x8f\x04\n\x12NodeProfilingStats\x12\x1b\n\tnode_name\x18\x01 \x01(\tR\x08nodeName\x12\x31\n\x05stage\x18\x02 \x01(\x0e\x32\x1b.cuvis_ai.v1.ExecutionStageR\x05stage\x12\x14\n\x05\x63ount\x18\x03 \x01(\x03R\x05\x63ount\x12\x17\n\x07mean_ms\x18\x04 \x01(\x01R\x06meanMs\x12\x1b\n\tmedian_ms\x18\x05 \x01(\x01R\x08medianMs\x12\x15\n\x06std_ms\x18\x06 \x01(\x01R\x05stdMs\x12\x15\n\x06min_ms\x18\x07 \x01(\x01R\x05minMs\x12\x15\n\x06max_ms\x18\x08 \x01(\x01R\x05maxMs\x12\x19\n\x08total_ms\x18\t \x01(\x01R\x07totalMs\x12\x17\n\x07last_ms\x18\n \x01(\x01R\x06lastMs\x12\"\n\npeak_bytes\x18\x0b \x01(\x03H\x00R\tpeakBytes\x88\x01\x01\x12$\n\x0b\x61lloc_bytes\x18\x0c \x01(\x03H\x01R\nallocBytes\x88\x01\x01\x12$\n\x0b\x61lloc_count\x18\r \x01(\x03H\x02R\nallocCount\x88\x01\x01\x12/\n\x11\x64\x65vice_peak_bytes\x18\x0e \x01(\x03H\x03R\x0f\x64\x65vicePeakBytes\x88\x01\x01\x42\r\n\x0b_peak_bytesB\x0e\n\x0c_alloc_bytesB\x0e\n\x0c_alloc_countB\x14\n\x12_device_peak_bytes\"\xd1\x02\n\x12\x45\x64geProfilingStats\x12\x16\n\x06source\x18\x01 \x01(\tR\x06source\x12\x16\n\x06target\x18\x02 \x01(\tR\x06target\x12\x31\n\x05stage\x18\x03 \x01(\x0e\x32\x1b.cuvis_ai.v1.ExecutionStageR\x05stage\x12\x14\n\x05\x63ount\x18\x04 \x01(\x03R\x05\x63ount\x12\x1f\n\x0btotal_bytes\x18\x05 \x01(\x03R\ntotalBytes\x12\x1d\n\nmean_bytes\x18\x06 \x01(\x01R\tmeanBytes\x12\x1b\n\tmax_bytes\x18\x07 \x01(\x03R\x08maxBytes\x12\x1d\n\nlast_bytes\x18\x08 \x01(\x03R\tlastBytes\x12#\n\rtotal_tensors\x18\t \x01(\x03R\x0ctotalTensors\x12!\n\x0clast_tensors\x18\n \x01(\x03R\x0blastTensors\"\xd0\x01\n\x18InitializeSessionRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12!\n\x0csearch_paths\x18\x02 \x03(\tR\x0bsearchPaths\x12\x32\n\x15resolved_plugins_json\x18\x03 \x01(\x0cR\x13resolvedPluginsJson\x12\x1d\n\noutput_dir\x18\x04 \x01(\tR\toutputDir\x12\x1f\n\x0bscratch_dir\x18\x05 \x01(\tR\nscratchDir\"+\n\x19InitializeSessionResponse\x12\x0e\n\x02ok\x18\x01 \x01(\x08R\x02ok\"T\n\x0eStopRunRequest\x12\x1d\n\nsession_id\x18\x01 \x01(\tR\tsessionId\x12#\n\rgrace_seconds\x18\x02 \x01(\x05R\x0cgraceSeconds\"!\n\x0fStopRunResponse\x12\x0e\n\x02ok\x18\x01 \x01(\x08R\x02ok\"\x14\n\x12HealthCheckRequest\"\xca\x01\n\x13HealthCheckResponse\x12\x46\n\x06status\x18\x01 \x01(\x0e\x32..cuvis_ai.v1.HealthCheckResponse.ServingStatusR\x06status\"k\n\rServingStatus\x12\x1e\n\x1aSERVING_STATUS_UNSPECIFIED\x10\x00\x12\x1a\n\x16SERVING_STATUS_SERVING\x10\x01\x12\x1e\n\x1aSERVING_STATUS_NOT_SERVING\x10\x02*\xb4\x01\n\x0eProcessingMode\x12\x1f\n\x1bPROCESSING_MODE_UNSPECIFIED\x10\x00\x12\x17\n\x13PROCESSING_MODE_RAW\x10\x01\x12\x1f\n\x1bPROCESSING_MODE_REFLECTANCE\x10\x02\x12 \n\x1cPROCESSING_MODE_DARKSUBTRACT\x10\x03\x12%\n!PROCESSING_MODE_SPECTRAL_RADIANCE\x10\x04*\x9e\x01\n\x0e\x45xecutionStage\x12\x1f\n\x1b\x45XECUTION_STAGE_UNSPECIFIED\x10\x00\x12\x19\n\x15\x45XECUTION_STAGE_TRAIN\x10\x01\x12\x17\n\x13\x45XECUTION_STAGE_VAL\x10\x02\x12\x18\n\x14\x45XECUTION_STAGE_TEST\x10\x03\x12\x1d\n\x19\x45XECUTION_STAGE_INFERENCE\x10\x04*\xb5\x01\n\x05\x44Type\x12\x16\n\x12\x44_TYPE_UNSPECIFIED\x10\x00\x12\x12\n\x0e\x44_TYPE_FLOAT32\x10\x01\x12\x12\n\x0e\x44_TYPE_FLOAT64\x10\x02\x12\x10\n\x0c\x44_TYPE_INT32\x10\x03\x12\x10\n\x0c\x44_TYPE_INT64\x10\x04\x12\x10\n\x0c\x44_TYPE_UINT8\x10\x05\x12\x0f\n\x0b\x44_TYPE_BOOL\x10\x06\x12\x12\n\x0e\x44_TYPE_FLOAT16\x10\x07\x12\x11\n\rD_TYPE_UINT16\x10\x08*d\n\x0bTrainerType\x12\x1c\n\x18TRAINER_TYPE_UNSPECIFIED\x10\x00\x12\x1c\n\x18TRAINER_TYPE_STATISTICAL\x10\x01\x12\x19\n\x15TRAINER_TYPE_GRADIENT\x10\x02*x\n\x0bTrainStatus\x12\x1c\n\x18TRAIN_STATUS_UNSPECIFIED\x10\x00\x12\x18\n\x14TRAIN_STATUS_RUNNING\x10\x01\x12\x19\n\x15TRAIN_STATUS_COMPLETE\x10\x02\x12\x16\n\x12TRAIN_STATUS_ERROR\x10\x03*q\n\tPointType\x12\x1a\n\x16POINT_TYPE_UNSPECIFIED\x10\x00\x12\x17\n\x13POINT_TYPE_POSITIVE\x10\x01\x12\x17\n\x13POINT_TYPE_NEGATIVE\x10\x02\x12\x16\n\x12POINT_TYPE_NEUTRAL\x10\x03*\xf3\x02\n\x0cNodeCategory\x12\x1d\n\x19NODE_CATEGORY_UNSPECIFIED\x10\x00\x12\x18\n\x14NODE_CATEGORY_SOURCE\x10\x01\x12\x16\n\x12NODE_CATEGORY_SINK\x10\x02\x12\x1b\n\x17NODE_CATEGORY_TRANSFORM\x10\x03\x12\x17\n\x13NODE_CATEGORY_MODEL\x10\x04\x12\x16\n\x12NODE_CATEGORY_LOSS\x10\x05\x12\x18\n\x14NODE_CATEGORY_METRIC\x10\x06\x12\x1b\n\x17NODE_CATEGORY_OPTIMIZER\x10\x07\x12\x1b\n\x17NODE_CATEGORY_SCHEDULER\x10\x08\x12\x1d\n\x19NODE_CATEGORY_REGULARIZER\x10\t\x12\x18\n\x14NODE_CATEGORY_RUNNER\x10\n\x12\x1c\n\x18NODE_CATEGORY_VISUALIZER\x10\x0b\x12\x19\n\x15NODE_CATEGORY_CONTROL\x10\x0c*\xba\t\n\x07NodeTag\x12\x18\n\x14NODE_TAG_UNSPECIFIED\x10\x00\x12\x12\n\x0eNODE_TAG_IMAGE\x10\x64\x12\x12\n\x0eNODE_TAG_VIDEO\x10\x65\x12\x10\n\x0cNODE_TAG_RGB\x10\x66\x12\x1a\n\x16NODE_TAG_MULTISPECTRAL\x10g\x12\x1a\n\x16NODE_TAG_HYPERSPECTRAL\x10h\x12\x18\n\x14NODE_TAG_POINT_CLOUD\x10i\x12\x12\n\x0eNODE_TAG_DEPTH\x10j\x12\x11\n\rNODE_TAG_MASK\x10k\x12\x11\n\rNODE_TAG_BBOX\x10l\x12\x16\n\x12NODE_TAG_KEYPOINTS\x10m\x12\x11\n\rNODE_TAG_TEXT\x10n\x12\x12\n\x0eNODE_TAG_AUDIO\x10o\x12\x14\n\x10NODE_TAG_TABULAR\x10p\x12\x18\n\x14NODE_TAG_TIME_SERIES\x10q\x12\x15\n\x11NODE_TAG_METADATA\x10r\x12\x16\n\x12NODE_TAG_EMBEDDING\x10s\x12\x1c\n\x17NODE_TAG_CLASSIFICATION\x10\xc8\x01\x12\x1a\n\x15NODE_TAG_SEGMENTATION\x10\xc9\x01\x12\x17\n\x12NODE_TAG_DETECTION\x10\xca\x01\x12\x16\n\x11NODE_TAG_TRACKING\x10\xcb\x01\x12\x18\n\x13NODE_TAG_REGRESSION\x10\xcc\x01\x12\x18\n\x13NODE_TAG_GENERATION\x10\xcd\x01\x12\x1c\n\x17NODE_TAG_RECONSTRUCTION\x10\xce\x01\x12\x17\n\x12NODE_TAG_DENOISING\x10\xcf\x01\x12\x16\n\x11NODE_TAG_UNMIXING\x10\xd0\x01\x12\x1b\n\x16NODE_TAG_DIM_REDUCTION\x10\xd1\x01\x12\x18\n\x13NODE_TAG_CLUSTERING\x10\xd2\x01\x12\x15\n\x10NODE_TAG_ANOMALY\x10\xd3\x01\x12\x17\n\x12NODE_TAG_RETRIEVAL\x10\xd4\x01\x12\x1b\n\x16NODE_TAG_PREPROCESSING\x10\xac\x02\x12\x1c\n\x17NODE_TAG_POSTPROCESSING\x10\xad\x02\x12\x1a\n\x15NODE_TAG_AUGMENTATION\x10\xae\x02\x12\x19\n\x14NODE_TAG_CALIBRATION\x10\xaf\x02\x12\x1b\n\x16NODE_TAG_NORMALIZATION\x10\xb0\x02\x12\x16\n\x11NODE_TAG_TRAINING\x10\xb1\x02\x12\x18\n\x13NODE_TAG_EVALUATION\x10\xb2\x02\x12\x17\n\x12NODE_TAG_INFERENCE\x10\xb3\x02\x12\x17\n\x12NODE_TAG_LEARNABLE\x10\x90\x03\x12\x1c\n\x17NODE_TAG_DIFFERENTIABLE\x10\x91\x03\x12\x18\n\x13NODE_TAG_STOCHASTIC\x10\x92\x03\x12\x18\n\x13NODE_TAG_INVERTIBLE\x10\x93\x03\x12\x17\n\x12NODE_TAG_STREAMING\x10\x94\x03\x12\x15\n\x10NODE_TAG_BATCHED\x10\x95\x03\x12\x16\n\x11NODE_TAG_STATEFUL\x10\x96\x03\x12\x13\n\x0eNODE_TAG_TORCH\x10\xf4\x03\x12\x13\n\x0eNODE_TAG_NUMPY\x10\xf5\x03\x12\x11\n\x0cNODE_TAG_JAX\x10\xf6\x03\x12\x12\n\rNODE_TAG_ONNX\x10\xf7\x03\x32\xc4\x15\n\x0e\x43uvisAIService\x12q\n\x16ListAvailablePipelines\x12*.cuvis_ai.v1.ListAvailablePipelinesRequest\x1a+.cuvis_ai.v1.ListAvailablePipelinesResponse\x12\\\n\x0fGetPipelineInfo\x12#.cuvis_ai.v1.GetPipelineInfoRequest\x1a$.cuvis_ai.v1.GetPipelineInfoResponse\x12V\n\rCreateSession\x12!.cuvis_ai.v1.CreateSessionRequest\x1a\".cuvis_ai.v1.CreateSessionResponse\x12n\n\x15SetSessionSearchPaths\x12).cuvis_ai.v1.SetSessionSearchPathsRequest\x1a*.cuvis_ai.v1.SetSessionSearchPathsResponse\x12S\n\x0c\x43loseSession\x12 .cuvis_ai.v1.CloseSessionRequest\x1a!.cuvis_ai.v1.CloseSessionResponse\x12V\n\rResolveConfig\x12!.cuvis_ai.v1.ResolveConfigRequest\x1a\".cuvis_ai.v1.ResolveConfigResponse\x12\x65\n\x12GetParameterSchema\x12&.cuvis_ai.v1.GetParameterSchemaRequest\x1a\'.cuvis_ai.v1.GetParameterSchemaResponse\x12Y\n\x0eValidateConfig\x12\".cuvis_ai.v1.ValidateConfigRequest\x1a#.cuvis_ai.v1.ValidateConfigResponse\x12h\n\x13LoadPipelineWeights\x12\'.cuvis_ai.v1.LoadPipelineWeightsRequest\x1a(.cuvis_ai.v1.LoadPipelineWeightsResponse\x12\x62\n\x11SetTrainRunConfig\x12%.cuvis_ai.v1.SetTrainRunConfigRequest\x1a&.cuvis_ai.v1.SetTrainRunConfigResponse\x12@\n\x05Train\x12\x19.cuvis_ai.v1.TrainRequest\x1a\x1a.cuvis_ai.v1.TrainResponse0\x01\x12Y\n\x0eGetTrainStatus\x12\".cuvis_ai.v1.GetTrainStatusRequest\x1a#.cuvis_ai.v1.GetTrainStatusResponse\x12J\n\nWatchTrain\x12\x1e.cuvis_ai.v1.WatchTrainRequest\x1a\x1a.cuvis_ai.v1.TrainResponse0\x01\x12t\n\x17GetTrainingCapabilities\x12+.cuvis_ai.v1.GetTrainingCapabilitiesRequest\x1a,.cuvis_ai.v1.GetTrainingCapabilitiesResponse\x12S\n\x0cSavePipeline\x12 .cuvis_ai.v1.SavePipelineRequest\x1a!.cuvis_ai.v1.SavePipelineResponse\x12S\n\x0cLoadPipeline\x12 .cuvis_ai.v1.LoadPipelineRequest\x1a!.cuvis_ai.v1.LoadPipelineResponse\x12S\n\x0cSaveTrainRun\x12 .cuvis_ai.v1.SaveTrainRunRequest\x1a!.cuvis_ai.v1.SaveTrainRunResponse\x12\\\n\x0fRestoreTrainRun\x12#.cuvis_ai.v1.RestoreTrainRunRequest\x1a$.cuvis_ai.v1.RestoreTrainRunResponse\x12\x62\n\x11GetPipelineInputs\x12%.cuvis_ai.v1.GetPipelineInputsRequest\x1a&.cuvis_ai.v1.GetPipelineInputsResponse\x12\x65\n\x12GetPipelineOutputs\x12&.cuvis_ai.v1.GetPipelineOutputsRequest\x1a\'.cuvis_ai.v1.GetPipelineOutputsResponse\x12w\n\x18GetPipelineVisualization\x12,.cuvis_ai.v1.GetPipelineVisualizationRequest\x1a-.cuvis_ai.v1.GetPipelineVisualizationResponse\x12J\n\tInference\x12\x1d.cuvis_ai.v1.InferenceRequest\x1a\x1e.cuvis_ai.v1.InferenceResponse\x12M\n\nLoadPlugin\x12\x1e.cuvis_ai.v1.LoadPluginRequest\x1a\x1f.cuvis_ai.v1.LoadPluginResponse\x12\x62\n\x11ListLoadedPlugins\x12%.cuvis_ai.v1.ListLoadedPluginsRequest\x1a&.cuvis_ai.v1.ListLoadedPluginsResponse\x12V\n\rGetPluginInfo\x12!.cuvis_ai.v1.GetPluginInfoRequest\x1a\".cuvis_ai.v1.GetPluginInfoResponse\x12\x65\n\x12ListAvailableNodes\x12&.cuvis_ai.v1.ListAvailableNodesRequest\x1a\'.cuvis_ai.v1.ListAvailableNodesResponse\x12_\n\x10\x43learPluginCache\x12$.cuvis_ai.v1.ClearPluginCacheRequest\x1a%.cuvis_ai.v1.ClearPluginCacheResponse\x12S\n\x0cSetProfiling\x12 .cuvis_ai.v1.SetProfilingRequest\x1a!.cuvis_ai.v1.SetProfilingResponse\x12h\n\x13GetProfilingSummary\x12\'.cuvis_ai.v1.GetProfilingSummaryRequest\x1a(.cuvis_ai.v1.GetProfilingSummaryResponse2\x81\x0c\n\nRunRuntime\x12\x62\n\x11InitializeSession\x12%.cuvis_ai.v1.InitializeSessionRequest\x1a&.cuvis_ai.v1.InitializeSessionResponse\x12S\n\x0cLoadPipeline\x12 .cuvis_ai.v1.LoadPipelineRequest\x1a!.cuvis_ai.v1.LoadPipelineResponse\x12h\n\x13LoadPipelineWeights\x12\'.cuvis_ai.v1.LoadPipelineWeightsRequest\x1a(.cuvis_ai.v1.LoadPipelineWeightsResponse\x12\\\n\x0fRestoreTrainRun\x12#.cuvis_ai.v1.RestoreTrainRunRequest\x1a$.cuvis_ai.v1.RestoreTrainRunResponse\x12S\n\x0cSavePipeline\x12 .cuvis_ai.v1.SavePipelineRequest\x1a!.cuvis_ai.v1.SavePipelineResponse\x12S\n\x0cSaveTrainRun\x12 .cuvis_ai.v1.SaveTrainRunRequest\x1a!.cuvis_ai.v1.SaveTrainRunResponse\x12\x62\n\x11GetPipelineInputs\x12%.cuvis_ai.v1.GetPipelineInputsRequest\x1a&.cuvis_ai.v1.GetPipelineInputsResponse\x12\x65\n\x12GetPipelineOutputs\x12&.cuvis_ai.v1.GetPipelineOutputsRequest\x1a\'.cuvis_ai.v1.GetPipelineOutputsResponse\x12w\n\x18GetPipelineVisualization\x12,.cuvis_ai.v1.GetPipelineVisualizationRequest\x1a-.cuvis_ai.v1.GetPipelineVisualizationResponse\x12\x62\n\x11SetTrainRunConfig\x12%.cuvis_ai.v1.SetTrainRunConfigRequest\x1a&.cuvis_ai.v1.SetTrainRunConfigResponse\x12J\n\tInference\x12\x1d.cuvis_ai.v1.InferenceRequest\x1a\x1e.cuvis_ai.v1.InferenceResponse\x12@\n\x05Train\x12\x19.cuvis_ai.v1.TrainRequest\x1a\x1a.cuvis_ai.v1.TrainResponse0\x01\x12Y\n\x0eGetTrainStatus\x12\".cuvis_ai.v1.GetTrainStatusRequest\x1a#.cuvis_ai.v1.GetTrainStatusResponse\x12J\n\nWatchTrain\x12\x1e.cuvis_ai.v1.WatchTrainRequest\x1a\x1a.cuvis_ai.v1.TrainResponse0\x01\x12S\n\x0c\x43loseSession\x12 .cuvis_ai.v1.CloseSessionRequest\x1a!.cuvis_ai.v1.CloseSessionResponse\x12\x44\n\x07StopRun\x12\x1b.cuvis_ai.v1.StopRunRequest\x1a\x1c.cuvis_ai.v1.StopRunResponse\x12P\n\x0bHealthCheck\x12\x1f.cuvis_ai.v1.HealthCheckRequest\x1a .cuvis_ai.v1.HealthCheckResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -49,22 +49,22 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_NODEINFO_INPUTSPECSENTRY']._serialized_options = b'8\001'
   _globals['_NODEINFO_OUTPUTSPECSENTRY']._loaded_options = None
   _globals['_NODEINFO_OUTPUTSPECSENTRY']._serialized_options = b'8\001'
-  _globals['_PROCESSINGMODE']._serialized_start=11321
-  _globals['_PROCESSINGMODE']._serialized_end=11501
-  _globals['_EXECUTIONSTAGE']._serialized_start=11504
-  _globals['_EXECUTIONSTAGE']._serialized_end=11662
-  _globals['_DTYPE']._serialized_start=11665
-  _globals['_DTYPE']._serialized_end=11846
-  _globals['_TRAINERTYPE']._serialized_start=11848
-  _globals['_TRAINERTYPE']._serialized_end=11948
-  _globals['_TRAINSTATUS']._serialized_start=11950
-  _globals['_TRAINSTATUS']._serialized_end=12070
-  _globals['_POINTTYPE']._serialized_start=12072
-  _globals['_POINTTYPE']._serialized_end=12185
-  _globals['_NODECATEGORY']._serialized_start=12188
-  _globals['_NODECATEGORY']._serialized_end=12559
-  _globals['_NODETAG']._serialized_start=12562
-  _globals['_NODETAG']._serialized_end=13772
+  _globals['_PROCESSINGMODE']._serialized_start=12556
+  _globals['_PROCESSINGMODE']._serialized_end=12736
+  _globals['_EXECUTIONSTAGE']._serialized_start=12739
+  _globals['_EXECUTIONSTAGE']._serialized_end=12897
+  _globals['_DTYPE']._serialized_start=12900
+  _globals['_DTYPE']._serialized_end=13081
+  _globals['_TRAINERTYPE']._serialized_start=13083
+  _globals['_TRAINERTYPE']._serialized_end=13183
+  _globals['_TRAINSTATUS']._serialized_start=13185
+  _globals['_TRAINSTATUS']._serialized_end=13305
+  _globals['_POINTTYPE']._serialized_start=13307
+  _globals['_POINTTYPE']._serialized_end=13420
+  _globals['_NODECATEGORY']._serialized_start=13423
+  _globals['_NODECATEGORY']._serialized_end=13794
+  _globals['_NODETAG']._serialized_start=13797
+  _globals['_NODETAG']._serialized_end=15007
   _globals['_SHMREF']._serialized_start=56
   _globals['_SHMREF']._serialized_end=146
   _globals['_TENSOR']._serialized_start=149
@@ -104,167 +104,175 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_TENSORSPEC']._serialized_start=2239
   _globals['_TENSORSPEC']._serialized_end=2363
   _globals['_TRAINRESPONSE']._serialized_start=2366
-  _globals['_TRAINRESPONSE']._serialized_end=2755
-  _globals['_TRAINRESPONSE_LOSSESENTRY']._serialized_start=2638
-  _globals['_TRAINRESPONSE_LOSSESENTRY']._serialized_end=2695
-  _globals['_TRAINRESPONSE_METRICSENTRY']._serialized_start=2697
-  _globals['_TRAINRESPONSE_METRICSENTRY']._serialized_end=2755
-  _globals['_PARAMSPEC']._serialized_start=2758
-  _globals['_PARAMSPEC']._serialized_end=2940
-  _globals['_CALLBACKTYPEINFO']._serialized_start=2943
-  _globals['_CALLBACKTYPEINFO']._serialized_end=3071
-  _globals['_OPTIMIZERPARAMSSCHEMA']._serialized_start=3073
-  _globals['_OPTIMIZERPARAMSSCHEMA']._serialized_end=3152
-  _globals['_SCHEDULERPARAMSSCHEMA']._serialized_start=3154
-  _globals['_SCHEDULERPARAMSSCHEMA']._serialized_end=3233
-  _globals['_LISTAVAILABLEPIPELINESREQUEST']._serialized_start=3235
-  _globals['_LISTAVAILABLEPIPELINESREQUEST']._serialized_end=3317
-  _globals['_LISTAVAILABLEPIPELINESRESPONSE']._serialized_start=3319
-  _globals['_LISTAVAILABLEPIPELINESRESPONSE']._serialized_end=3408
-  _globals['_GETPIPELINEINFOREQUEST']._serialized_start=3410
-  _globals['_GETPIPELINEINFOREQUEST']._serialized_end=3471
-  _globals['_GETPIPELINEINFORESPONSE']._serialized_start=3473
-  _globals['_GETPIPELINEINFORESPONSE']._serialized_end=3562
-  _globals['_CREATESESSIONREQUEST']._serialized_start=3564
-  _globals['_CREATESESSIONREQUEST']._serialized_end=3586
-  _globals['_CREATESESSIONRESPONSE']._serialized_start=3588
-  _globals['_CREATESESSIONRESPONSE']._serialized_end=3642
-  _globals['_SETSESSIONSEARCHPATHSREQUEST']._serialized_start=3645
-  _globals['_SETSESSIONSEARCHPATHSREQUEST']._serialized_end=3781
-  _globals['_SETSESSIONSEARCHPATHSRESPONSE']._serialized_start=3784
-  _globals['_SETSESSIONSEARCHPATHSRESPONSE']._serialized_end=3917
-  _globals['_CLOSESESSIONREQUEST']._serialized_start=3919
-  _globals['_CLOSESESSIONREQUEST']._serialized_end=3971
-  _globals['_CLOSESESSIONRESPONSE']._serialized_start=3973
-  _globals['_CLOSESESSIONRESPONSE']._serialized_end=4021
-  _globals['_RESOLVECONFIGREQUEST']._serialized_start=4024
-  _globals['_RESOLVECONFIGREQUEST']._serialized_end=4160
-  _globals['_RESOLVECONFIGRESPONSE']._serialized_start=4162
-  _globals['_RESOLVECONFIGRESPONSE']._serialized_end=4220
-  _globals['_GETPARAMETERSCHEMAREQUEST']._serialized_start=4222
-  _globals['_GETPARAMETERSCHEMAREQUEST']._serialized_end=4282
-  _globals['_GETPARAMETERSCHEMARESPONSE']._serialized_start=4284
-  _globals['_GETPARAMETERSCHEMARESPONSE']._serialized_end=4345
-  _globals['_VALIDATECONFIGREQUEST']._serialized_start=4347
-  _globals['_VALIDATECONFIGREQUEST']._serialized_end=4438
-  _globals['_VALIDATECONFIGRESPONSE']._serialized_start=4440
-  _globals['_VALIDATECONFIGRESPONSE']._serialized_end=4538
-  _globals['_LOADPIPELINEWEIGHTSREQUEST']._serialized_start=4541
-  _globals['_LOADPIPELINEWEIGHTSREQUEST']._serialized_end=4734
-  _globals['_LOADPIPELINEWEIGHTSRESPONSE']._serialized_start=4736
-  _globals['_LOADPIPELINEWEIGHTSRESPONSE']._serialized_end=4828
-  _globals['_SETTRAINRUNCONFIGREQUEST']._serialized_start=4830
-  _globals['_SETTRAINRUNCONFIGREQUEST']._serialized_end=4940
-  _globals['_SETTRAINRUNCONFIGRESPONSE']._serialized_start=4942
-  _globals['_SETTRAINRUNCONFIGRESPONSE']._serialized_end=5045
-  _globals['_TRAINREQUEST']._serialized_start=5048
-  _globals['_TRAINREQUEST']._serialized_end=5256
-  _globals['_GETTRAINSTATUSREQUEST']._serialized_start=5258
-  _globals['_GETTRAINSTATUSREQUEST']._serialized_end=5312
-  _globals['_GETTRAINSTATUSRESPONSE']._serialized_start=5314
-  _globals['_GETTRAINSTATUSRESPONSE']._serialized_end=5407
-  _globals['_GETTRAININGCAPABILITIESREQUEST']._serialized_start=5409
-  _globals['_GETTRAININGCAPABILITIESREQUEST']._serialized_end=5441
-  _globals['_GETTRAININGCAPABILITIESRESPONSE']._serialized_start=5444
-  _globals['_GETTRAININGCAPABILITIESRESPONSE']._serialized_end=5817
-  _globals['_SAVEPIPELINEREQUEST']._serialized_start=5820
-  _globals['_SAVEPIPELINEREQUEST']._serialized_end=5968
-  _globals['_SAVEPIPELINERESPONSE']._serialized_start=5970
-  _globals['_SAVEPIPELINERESPONSE']._serialized_end=6090
-  _globals['_LOADPIPELINEREQUEST']._serialized_start=6093
-  _globals['_LOADPIPELINEREQUEST']._serialized_end=6235
-  _globals['_LOADPIPELINERESPONSE']._serialized_start=6237
-  _globals['_LOADPIPELINERESPONSE']._serialized_end=6344
-  _globals['_SAVETRAINRUNREQUEST']._serialized_start=6346
-  _globals['_SAVETRAINRUNREQUEST']._serialized_end=6470
-  _globals['_SAVETRAINRUNRESPONSE']._serialized_start=6473
-  _globals['_SAVETRAINRUNRESPONSE']._serialized_end=6630
-  _globals['_RESTORETRAINRUNREQUEST']._serialized_start=6633
-  _globals['_RESTORETRAINRUNREQUEST']._serialized_end=6791
-  _globals['_RESTORETRAINRUNRESPONSE']._serialized_start=6793
-  _globals['_RESTORETRAINRUNRESPONSE']._serialized_end=6906
-  _globals['_GETPIPELINEINPUTSREQUEST']._serialized_start=6908
-  _globals['_GETPIPELINEINPUTSREQUEST']._serialized_end=6965
-  _globals['_GETPIPELINEINPUTSRESPONSE']._serialized_start=6968
-  _globals['_GETPIPELINEINPUTSRESPONSE']._serialized_end=7205
-  _globals['_GETPIPELINEINPUTSRESPONSE_INPUTSPECSENTRY']._serialized_start=7119
-  _globals['_GETPIPELINEINPUTSRESPONSE_INPUTSPECSENTRY']._serialized_end=7205
-  _globals['_GETPIPELINEOUTPUTSREQUEST']._serialized_start=7207
-  _globals['_GETPIPELINEOUTPUTSREQUEST']._serialized_end=7265
-  _globals['_GETPIPELINEOUTPUTSRESPONSE']._serialized_start=7268
-  _globals['_GETPIPELINEOUTPUTSRESPONSE']._serialized_end=7513
-  _globals['_GETPIPELINEOUTPUTSRESPONSE_OUTPUTSPECSENTRY']._serialized_start=7426
-  _globals['_GETPIPELINEOUTPUTSRESPONSE_OUTPUTSPECSENTRY']._serialized_end=7513
-  _globals['_GETPIPELINEVISUALIZATIONREQUEST']._serialized_start=7515
-  _globals['_GETPIPELINEVISUALIZATIONREQUEST']._serialized_end=7642
-  _globals['_GETPIPELINEVISUALIZATIONRESPONSE']._serialized_start=7644
-  _globals['_GETPIPELINEVISUALIZATIONRESPONSE']._serialized_end=7733
-  _globals['_INFERENCEREQUEST']._serialized_start=7736
-  _globals['_INFERENCEREQUEST']._serialized_end=7869
-  _globals['_INFERENCERESPONSE']._serialized_start=7872
-  _globals['_INFERENCERESPONSE']._serialized_end=8174
-  _globals['_INFERENCERESPONSE_OUTPUTSENTRY']._serialized_start=8035
-  _globals['_INFERENCERESPONSE_OUTPUTSENTRY']._serialized_end=8114
-  _globals['_INFERENCERESPONSE_METRICSENTRY']._serialized_start=2697
-  _globals['_INFERENCERESPONSE_METRICSENTRY']._serialized_end=2755
-  _globals['_PLUGINMANIFEST']._serialized_start=8176
-  _globals['_PLUGINMANIFEST']._serialized_end=8227
-  _globals['_PLUGININFO']._serialized_start=8230
-  _globals['_PLUGININFO']._serialized_end=8360
-  _globals['_PORTSPEC']._serialized_start=8363
-  _globals['_PORTSPEC']._serialized_end=8547
-  _globals['_NODEINFO']._serialized_start=8550
-  _globals['_NODEINFO']._serialized_end=9121
-  _globals['_NODEINFO_INPUTSPECSENTRY']._serialized_start=8950
-  _globals['_NODEINFO_INPUTSPECSENTRY']._serialized_end=9034
-  _globals['_NODEINFO_OUTPUTSPECSENTRY']._serialized_start=9036
-  _globals['_NODEINFO_OUTPUTSPECSENTRY']._serialized_end=9121
-  _globals['_LOADPLUGINREQUEST']._serialized_start=9123
-  _globals['_LOADPLUGINREQUEST']._serialized_end=9230
-  _globals['_LOADPLUGINRESPONSE']._serialized_start=9232
-  _globals['_LOADPLUGINRESPONSE']._serialized_end=9319
-  _globals['_LISTLOADEDPLUGINSREQUEST']._serialized_start=9321
-  _globals['_LISTLOADEDPLUGINSREQUEST']._serialized_end=9378
-  _globals['_LISTLOADEDPLUGINSRESPONSE']._serialized_start=9380
-  _globals['_LISTLOADEDPLUGINSRESPONSE']._serialized_end=9458
-  _globals['_GETPLUGININFOREQUEST']._serialized_start=9460
-  _globals['_GETPLUGININFOREQUEST']._serialized_end=9546
-  _globals['_GETPLUGININFORESPONSE']._serialized_start=9548
-  _globals['_GETPLUGININFORESPONSE']._serialized_end=9620
-  _globals['_LISTAVAILABLENODESREQUEST']._serialized_start=9622
-  _globals['_LISTAVAILABLENODESREQUEST']._serialized_end=9680
-  _globals['_LISTAVAILABLENODESRESPONSE']._serialized_start=9682
-  _globals['_LISTAVAILABLENODESRESPONSE']._serialized_end=9755
-  _globals['_CLEARPLUGINCACHEREQUEST']._serialized_start=9757
-  _globals['_CLEARPLUGINCACHEREQUEST']._serialized_end=9815
-  _globals['_CLEARPLUGINCACHERESPONSE']._serialized_start=9817
-  _globals['_CLEARPLUGINCACHERESPONSE']._serialized_end=9880
-  _globals['_SETPROFILINGREQUEST']._serialized_start=9883
-  _globals['_SETPROFILINGREQUEST']._serialized_end=10123
-  _globals['_SETPROFILINGRESPONSE']._serialized_start=10125
-  _globals['_SETPROFILINGRESPONSE']._serialized_end=10192
-  _globals['_GETPROFILINGSUMMARYREQUEST']._serialized_start=10194
-  _globals['_GETPROFILINGSUMMARYREQUEST']._serialized_end=10319
-  _globals['_GETPROFILINGSUMMARYRESPONSE']._serialized_start=10321
-  _globals['_GETPROFILINGSUMMARYRESPONSE']._serialized_end=10414
-  _globals['_NODEPROFILINGSTATS']._serialized_start=10417
-  _globals['_NODEPROFILINGSTATS']._serialized_end=10714
-  _globals['_INITIALIZESESSIONREQUEST']._serialized_start=10717
-  _globals['_INITIALIZESESSIONREQUEST']._serialized_end=10925
-  _globals['_INITIALIZESESSIONRESPONSE']._serialized_start=10927
-  _globals['_INITIALIZESESSIONRESPONSE']._serialized_end=10970
-  _globals['_STOPRUNREQUEST']._serialized_start=10972
-  _globals['_STOPRUNREQUEST']._serialized_end=11056
-  _globals['_STOPRUNRESPONSE']._serialized_start=11058
-  _globals['_STOPRUNRESPONSE']._serialized_end=11091
-  _globals['_HEALTHCHECKREQUEST']._serialized_start=11093
-  _globals['_HEALTHCHECKREQUEST']._serialized_end=11113
-  _globals['_HEALTHCHECKRESPONSE']._serialized_start=11116
-  _globals['_HEALTHCHECKRESPONSE']._serialized_end=11318
-  _globals['_HEALTHCHECKRESPONSE_SERVINGSTATUS']._serialized_start=11211
-  _globals['_HEALTHCHECKRESPONSE_SERVINGSTATUS']._serialized_end=11318
-  _globals['_CUVISAISERVICE']._serialized_start=13775
-  _globals['_CUVISAISERVICE']._serialized_end=16455
-  _globals['_RUNRUNTIME']._serialized_start=16458
-  _globals['_RUNRUNTIME']._serialized_end=17919
+  _globals['_TRAINRESPONSE']._serialized_end=2834
+  _globals['_TRAINRESPONSE_LOSSESENTRY']._serialized_start=2717
+  _globals['_TRAINRESPONSE_LOSSESENTRY']._serialized_end=2774
+  _globals['_TRAINRESPONSE_METRICSENTRY']._serialized_start=2776
+  _globals['_TRAINRESPONSE_METRICSENTRY']._serialized_end=2834
+  _globals['_COMPACTTRAINSTEP']._serialized_start=2837
+  _globals['_COMPACTTRAINSTEP']._serialized_end=3027
+  _globals['_COMPACTTRAINPROGRESS']._serialized_start=3030
+  _globals['_COMPACTTRAINPROGRESS']._serialized_end=3185
+  _globals['_PARAMSPEC']._serialized_start=3188
+  _globals['_PARAMSPEC']._serialized_end=3370
+  _globals['_CALLBACKTYPEINFO']._serialized_start=3373
+  _globals['_CALLBACKTYPEINFO']._serialized_end=3501
+  _globals['_OPTIMIZERPARAMSSCHEMA']._serialized_start=3503
+  _globals['_OPTIMIZERPARAMSSCHEMA']._serialized_end=3582
+  _globals['_SCHEDULERPARAMSSCHEMA']._serialized_start=3584
+  _globals['_SCHEDULERPARAMSSCHEMA']._serialized_end=3663
+  _globals['_LISTAVAILABLEPIPELINESREQUEST']._serialized_start=3665
+  _globals['_LISTAVAILABLEPIPELINESREQUEST']._serialized_end=3747
+  _globals['_LISTAVAILABLEPIPELINESRESPONSE']._serialized_start=3749
+  _globals['_LISTAVAILABLEPIPELINESRESPONSE']._serialized_end=3838
+  _globals['_GETPIPELINEINFOREQUEST']._serialized_start=3840
+  _globals['_GETPIPELINEINFOREQUEST']._serialized_end=3901
+  _globals['_GETPIPELINEINFORESPONSE']._serialized_start=3903
+  _globals['_GETPIPELINEINFORESPONSE']._serialized_end=3992
+  _globals['_CREATESESSIONREQUEST']._serialized_start=3994
+  _globals['_CREATESESSIONREQUEST']._serialized_end=4016
+  _globals['_CREATESESSIONRESPONSE']._serialized_start=4018
+  _globals['_CREATESESSIONRESPONSE']._serialized_end=4072
+  _globals['_SETSESSIONSEARCHPATHSREQUEST']._serialized_start=4075
+  _globals['_SETSESSIONSEARCHPATHSREQUEST']._serialized_end=4211
+  _globals['_SETSESSIONSEARCHPATHSRESPONSE']._serialized_start=4214
+  _globals['_SETSESSIONSEARCHPATHSRESPONSE']._serialized_end=4347
+  _globals['_CLOSESESSIONREQUEST']._serialized_start=4349
+  _globals['_CLOSESESSIONREQUEST']._serialized_end=4401
+  _globals['_CLOSESESSIONRESPONSE']._serialized_start=4403
+  _globals['_CLOSESESSIONRESPONSE']._serialized_end=4451
+  _globals['_RESOLVECONFIGREQUEST']._serialized_start=4454
+  _globals['_RESOLVECONFIGREQUEST']._serialized_end=4590
+  _globals['_RESOLVECONFIGRESPONSE']._serialized_start=4592
+  _globals['_RESOLVECONFIGRESPONSE']._serialized_end=4650
+  _globals['_GETPARAMETERSCHEMAREQUEST']._serialized_start=4652
+  _globals['_GETPARAMETERSCHEMAREQUEST']._serialized_end=4712
+  _globals['_GETPARAMETERSCHEMARESPONSE']._serialized_start=4714
+  _globals['_GETPARAMETERSCHEMARESPONSE']._serialized_end=4775
+  _globals['_VALIDATECONFIGREQUEST']._serialized_start=4777
+  _globals['_VALIDATECONFIGREQUEST']._serialized_end=4868
+  _globals['_VALIDATECONFIGRESPONSE']._serialized_start=4870
+  _globals['_VALIDATECONFIGRESPONSE']._serialized_end=4968
+  _globals['_LOADPIPELINEWEIGHTSREQUEST']._serialized_start=4971
+  _globals['_LOADPIPELINEWEIGHTSREQUEST']._serialized_end=5164
+  _globals['_LOADPIPELINEWEIGHTSRESPONSE']._serialized_start=5166
+  _globals['_LOADPIPELINEWEIGHTSRESPONSE']._serialized_end=5258
+  _globals['_SETTRAINRUNCONFIGREQUEST']._serialized_start=5260
+  _globals['_SETTRAINRUNCONFIGREQUEST']._serialized_end=5370
+  _globals['_SETTRAINRUNCONFIGRESPONSE']._serialized_start=5372
+  _globals['_SETTRAINRUNCONFIGRESPONSE']._serialized_end=5475
+  _globals['_TRAINREQUEST']._serialized_start=5478
+  _globals['_TRAINREQUEST']._serialized_end=5777
+  _globals['_GETTRAINSTATUSREQUEST']._serialized_start=5779
+  _globals['_GETTRAINSTATUSREQUEST']._serialized_end=5833
+  _globals['_GETTRAINSTATUSRESPONSE']._serialized_start=5835
+  _globals['_GETTRAINSTATUSRESPONSE']._serialized_end=5928
+  _globals['_WATCHTRAINREQUEST']._serialized_start=5930
+  _globals['_WATCHTRAINREQUEST']._serialized_end=6007
+  _globals['_GETTRAININGCAPABILITIESREQUEST']._serialized_start=6009
+  _globals['_GETTRAININGCAPABILITIESREQUEST']._serialized_end=6041
+  _globals['_GETTRAININGCAPABILITIESRESPONSE']._serialized_start=6044
+  _globals['_GETTRAININGCAPABILITIESRESPONSE']._serialized_end=6417
+  _globals['_SAVEPIPELINEREQUEST']._serialized_start=6420
+  _globals['_SAVEPIPELINEREQUEST']._serialized_end=6568
+  _globals['_SAVEPIPELINERESPONSE']._serialized_start=6570
+  _globals['_SAVEPIPELINERESPONSE']._serialized_end=6690
+  _globals['_LOADPIPELINEREQUEST']._serialized_start=6693
+  _globals['_LOADPIPELINEREQUEST']._serialized_end=6835
+  _globals['_LOADPIPELINERESPONSE']._serialized_start=6837
+  _globals['_LOADPIPELINERESPONSE']._serialized_end=6944
+  _globals['_SAVETRAINRUNREQUEST']._serialized_start=6946
+  _globals['_SAVETRAINRUNREQUEST']._serialized_end=7070
+  _globals['_SAVETRAINRUNRESPONSE']._serialized_start=7073
+  _globals['_SAVETRAINRUNRESPONSE']._serialized_end=7230
+  _globals['_RESTORETRAINRUNREQUEST']._serialized_start=7233
+  _globals['_RESTORETRAINRUNREQUEST']._serialized_end=7391
+  _globals['_RESTORETRAINRUNRESPONSE']._serialized_start=7393
+  _globals['_RESTORETRAINRUNRESPONSE']._serialized_end=7506
+  _globals['_GETPIPELINEINPUTSREQUEST']._serialized_start=7508
+  _globals['_GETPIPELINEINPUTSREQUEST']._serialized_end=7565
+  _globals['_GETPIPELINEINPUTSRESPONSE']._serialized_start=7568
+  _globals['_GETPIPELINEINPUTSRESPONSE']._serialized_end=7805
+  _globals['_GETPIPELINEINPUTSRESPONSE_INPUTSPECSENTRY']._serialized_start=7719
+  _globals['_GETPIPELINEINPUTSRESPONSE_INPUTSPECSENTRY']._serialized_end=7805
+  _globals['_GETPIPELINEOUTPUTSREQUEST']._serialized_start=7807
+  _globals['_GETPIPELINEOUTPUTSREQUEST']._serialized_end=7865
+  _globals['_GETPIPELINEOUTPUTSRESPONSE']._serialized_start=7868
+  _globals['_GETPIPELINEOUTPUTSRESPONSE']._serialized_end=8113
+  _globals['_GETPIPELINEOUTPUTSRESPONSE_OUTPUTSPECSENTRY']._serialized_start=8026
+  _globals['_GETPIPELINEOUTPUTSRESPONSE_OUTPUTSPECSENTRY']._serialized_end=8113
+  _globals['_GETPIPELINEVISUALIZATIONREQUEST']._serialized_start=8115
+  _globals['_GETPIPELINEVISUALIZATIONREQUEST']._serialized_end=8242
+  _globals['_GETPIPELINEVISUALIZATIONRESPONSE']._serialized_start=8244
+  _globals['_GETPIPELINEVISUALIZATIONRESPONSE']._serialized_end=8333
+  _globals['_INFERENCEREQUEST']._serialized_start=8336
+  _globals['_INFERENCEREQUEST']._serialized_end=8469
+  _globals['_INFERENCERESPONSE']._serialized_start=8472
+  _globals['_INFERENCERESPONSE']._serialized_end=8774
+  _globals['_INFERENCERESPONSE_OUTPUTSENTRY']._serialized_start=8635
+  _globals['_INFERENCERESPONSE_OUTPUTSENTRY']._serialized_end=8714
+  _globals['_INFERENCERESPONSE_METRICSENTRY']._serialized_start=2776
+  _globals['_INFERENCERESPONSE_METRICSENTRY']._serialized_end=2834
+  _globals['_PLUGINMANIFEST']._serialized_start=8776
+  _globals['_PLUGINMANIFEST']._serialized_end=8827
+  _globals['_PLUGININFO']._serialized_start=8830
+  _globals['_PLUGININFO']._serialized_end=8960
+  _globals['_PORTSPEC']._serialized_start=8963
+  _globals['_PORTSPEC']._serialized_end=9147
+  _globals['_NODEINFO']._serialized_start=9150
+  _globals['_NODEINFO']._serialized_end=9721
+  _globals['_NODEINFO_INPUTSPECSENTRY']._serialized_start=9550
+  _globals['_NODEINFO_INPUTSPECSENTRY']._serialized_end=9634
+  _globals['_NODEINFO_OUTPUTSPECSENTRY']._serialized_start=9636
+  _globals['_NODEINFO_OUTPUTSPECSENTRY']._serialized_end=9721
+  _globals['_LOADPLUGINREQUEST']._serialized_start=9723
+  _globals['_LOADPLUGINREQUEST']._serialized_end=9830
+  _globals['_LOADPLUGINRESPONSE']._serialized_start=9832
+  _globals['_LOADPLUGINRESPONSE']._serialized_end=9919
+  _globals['_LISTLOADEDPLUGINSREQUEST']._serialized_start=9921
+  _globals['_LISTLOADEDPLUGINSREQUEST']._serialized_end=9978
+  _globals['_LISTLOADEDPLUGINSRESPONSE']._serialized_start=9980
+  _globals['_LISTLOADEDPLUGINSRESPONSE']._serialized_end=10058
+  _globals['_GETPLUGININFOREQUEST']._serialized_start=10060
+  _globals['_GETPLUGININFOREQUEST']._serialized_end=10146
+  _globals['_GETPLUGININFORESPONSE']._serialized_start=10148
+  _globals['_GETPLUGININFORESPONSE']._serialized_end=10220
+  _globals['_LISTAVAILABLENODESREQUEST']._serialized_start=10222
+  _globals['_LISTAVAILABLENODESREQUEST']._serialized_end=10280
+  _globals['_LISTAVAILABLENODESRESPONSE']._serialized_start=10282
+  _globals['_LISTAVAILABLENODESRESPONSE']._serialized_end=10355
+  _globals['_CLEARPLUGINCACHEREQUEST']._serialized_start=10357
+  _globals['_CLEARPLUGINCACHEREQUEST']._serialized_end=10415
+  _globals['_CLEARPLUGINCACHERESPONSE']._serialized_start=10417
+  _globals['_CLEARPLUGINCACHERESPONSE']._serialized_end=10480
+  _globals['_SETPROFILINGREQUEST']._serialized_start=10483
+  _globals['_SETPROFILINGREQUEST']._serialized_end=10723
+  _globals['_SETPROFILINGRESPONSE']._serialized_start=10725
+  _globals['_SETPROFILINGRESPONSE']._serialized_end=10792
+  _globals['_GETPROFILINGSUMMARYREQUEST']._serialized_start=10794
+  _globals['_GETPROFILINGSUMMARYREQUEST']._serialized_end=10919
+  _globals['_GETPROFILINGSUMMARYRESPONSE']._serialized_start=10922
+  _globals['_GETPROFILINGSUMMARYRESPONSE']._serialized_end=11079
+  _globals['_NODEPROFILINGSTATS']._serialized_start=11082
+  _globals['_NODEPROFILINGSTATS']._serialized_end=11609
+  _globals['_EDGEPROFILINGSTATS']._serialized_start=11612
+  _globals['_EDGEPROFILINGSTATS']._serialized_end=11949
+  _globals['_INITIALIZESESSIONREQUEST']._serialized_start=11952
+  _globals['_INITIALIZESESSIONREQUEST']._serialized_end=12160
+  _globals['_INITIALIZESESSIONRESPONSE']._serialized_start=12162
+  _globals['_INITIALIZESESSIONRESPONSE']._serialized_end=12205
+  _globals['_STOPRUNREQUEST']._serialized_start=12207
+  _globals['_STOPRUNREQUEST']._serialized_end=12291
+  _globals['_STOPRUNRESPONSE']._serialized_start=12293
+  _globals['_STOPRUNRESPONSE']._serialized_end=12326
+  _globals['_HEALTHCHECKREQUEST']._serialized_start=12328
+  _globals['_HEALTHCHECKREQUEST']._serialized_end=12348
+  _globals['_HEALTHCHECKRESPONSE']._serialized_start=12351
+  _globals['_HEALTHCHECKRESPONSE']._serialized_end=12553
+  _globals['_HEALTHCHECKRESPONSE_SERVINGSTATUS']._serialized_start=12446
+  _globals['_HEALTHCHECKRESPONSE_SERVINGSTATUS']._serialized_end=12553
+  _globals['_CUVISAISERVICE']._serialized_start=15010
+  _globals['_CUVISAISERVICE']._serialized_end=17766
+  _globals['_RUNRUNTIME']._serialized_start=17769
+  _globals['_RUNRUNTIME']._serialized_end=19306
 # @@protoc_insertion_point(module_scope)
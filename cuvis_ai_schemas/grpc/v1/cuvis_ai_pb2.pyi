@@ -405,7 +405,7 @@ class TensorSpec(_message.Message):
     def __init__(self, name: _Optional[str] = ..., shape: _Optional[_Iterable[int]] = ..., dtype: _Optional[_Union[DType, str]] = ..., required: bool = ...) -> None: ...
 
 class TrainResponse(_message.Message):
-    __slots__ = ("context", "losses", "metrics", "status", "message")
+    __slots__ = ("context", "losses", "metrics", "status", "message", "compact", "seq")
     class LossesEntry(_message.Message):
         __slots__ = ("key", "value")
         KEY_FIELD_NUMBER: _ClassVar[int]
@@ -425,12 +425,40 @@ class TrainResponse(_message.Message):
     METRICS_FIELD_NUMBER: _ClassVar[int]
     STATUS_FIELD_NUMBER: _ClassVar[int]
     MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    COMPACT_FIELD_NUMBER: _ClassVar[int]
+    SEQ_FIELD_NUMBER: _ClassVar[int]
     context: Context
     losses: _containers.ScalarMap[str, float]
     metrics: _containers.ScalarMap[str, float]
     status: TrainStatus
     message: str
-    def __init__(self, context: _Optional[_Union[Context, _Mapping]] = ..., losses: _Optional[_Mapping[str, float]] = ..., metrics: _Optional[_Mapping[str, float]] = ..., status: _Optional[_Union[TrainStatus, str]] = ..., message: _Optional[str] = ...) -> None: ...
+    compact: CompactTrainProgress
+    seq: int
+    def __init__(self, context: _Optional[_Union[Context, _Mapping]] = ..., losses: _Optional[_Mapping[str, float]] = ..., metrics: _Optional[_Mapping[str, float]] = ..., status: _Optional[_Union[TrainStatus, str]] = ..., message: _Optional[str] = ..., compact: _Optional[_Union[CompactTrainProgress, _Mapping]] = ..., seq: _Optional[int] = ...) -> None: ...
+
+class CompactTrainStep(_message.Message):
+    __slots__ = ("context", "losses", "metrics", "loss_indices", "metric_indices")
+    CONTEXT_FIELD_NUMBER: _ClassVar[int]
+    LOSSES_FIELD_NUMBER: _ClassVar[int]
+    METRICS_FIELD_NUMBER: _ClassVar[int]
+    LOSS_INDICES_FIELD_NUMBER: _ClassVar[int]
+    METRIC_INDICES_FIELD_NUMBER: _ClassVar[int]
+    context: Context
+    losses: _containers.RepeatedScalarFieldContainer[float]
+    metrics: _containers.RepeatedScalarFieldContainer[float]
+    loss_indices: _containers.RepeatedScalarFieldContainer[int]
+    metric_indices: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, context: _Optional[_Union[Context, _Mapping]] = ..., losses: _Optional[_Iterable[float]] = ..., metrics: _Optional[_Iterable[float]] = ..., loss_indices: _Optional[_Iterable[int]] = ..., metric_indices: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class CompactTrainProgress(_message.Message):
+    __slots__ = ("new_loss_names", "new_metric_names", "steps")
+    NEW_LOSS_NAMES_FIELD_NUMBER: _ClassVar[int]
+    NEW_METRIC_NAMES_FIELD_NUMBER: _ClassVar[int]
+    STEPS_FIELD_NUMBER: _ClassVar[int]
+    new_loss_names: _containers.RepeatedScalarFieldContainer[str]
+    new_metric_names: _containers.RepeatedScalarFieldContainer[str]
+    steps: _containers.RepeatedCompositeFieldContainer[CompactTrainStep]
+    def __init__(self, new_loss_names: _Optional[_Iterable[str]] = ..., new_metric_names: _Optional[_Iterable[str]] = ..., steps: _Optional[_Iterable[_Union[CompactTrainStep, _Mapping]]] = ...) -> None: ...
 
 class ParamSpec(_message.Message):
     __slots__ = ("name", "type", "required", "default_value", "description", "validation")
@@ -621,16 +649,20 @@ class SetTrainRunConfigResponse(_message.Message):
     def __init__(self, success: bool = ..., pipeline_from_config: bool = ...) -> None: ...
 
 class TrainRequest(_message.Message):
-    __slots__ = ("session_id", "trainer_type", "data", "training")
+    __slots__ = ("session_id", "trainer_type", "data", "training", "compact_progress", "max_coalesced_steps")
     SESSION_ID_FIELD_NUMBER: _ClassVar[int]
     TRAINER_TYPE_FIELD_NUMBER: _ClassVar[int]
     DATA_FIELD_NUMBER: _ClassVar[int]
     TRAINING_FIELD_NUMBER: _ClassVar[int]
+    COMPACT_PROGRESS_FIELD_NUMBER: _ClassVar[int]
+    MAX_COALESCED_STEPS_FIELD_NUMBER: _ClassVar[int]
     session_id: str
     trainer_type: TrainerType
     data: DataConfig
     training: TrainingConfig
-    def __init__(self, session_id: _Optional[str] = ..., trainer_type: _Optional[_Union[TrainerType, str]] = ..., data: _Optional[_Union[DataConfig, _Mapping]] = ..., training: _Optional[_Union[TrainingConfig, _Mapping]] = ...) -> None: ...
+    compact_progress: bool
+    max_coalesced_steps: int
+    def __init__(self, session_id: _Optional[str] = ..., trainer_type: _Optional[_Union[TrainerType, str]] = ..., data: _Optional[_Union[DataConfig, _Mapping]] = ..., training: _Optional[_Union[TrainingConfig, _Mapping]] = ..., compact_progress: bool = ..., max_coalesced_steps: _Optional[int] = ...) -> None: ...
 
 class GetTrainStatusRequest(_message.Message):
     __slots__ = ("session_id",)
@@ -644,6 +676,14 @@ class GetTrainStatusResponse(_message.Message):
     latest_progress: TrainResponse
     def __init__(self, latest_progress: _Optional[_Union[TrainResponse, _Mapping]] = ...) -> None: ...
 
+class WatchTrainRequest(_message.Message):
+    __slots__ = ("session_id", "from_seq")
+    SESSION_ID_FIELD_NUMBER: _ClassVar[int]
+    FROM_SEQ_FIELD_NUMBER: _ClassVar[int]
+    session_id: str
+    from_seq: int
+    def __init__(self, session_id: _Optional[str] = ..., from_seq: _Optional[int] = ...) -> None: ...
+
 class GetTrainingCapabilitiesRequest(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
@@ -999,13 +1039,15 @@ class GetProfilingSummaryRequest(_message.Message):
     def __init__(self, session_id: _Optional[str] = ..., stage: _Optional[_Union[ExecutionStage, str]] = ...) -> None: ...
 
 class GetProfilingSummaryResponse(_message.Message):
-    __slots__ = ("node_stats",)
+    __slots__ = ("node_stats", "edge_stats")
     NODE_STATS_FIELD_NUMBER: _ClassVar[int]
+    EDGE_STATS_FIELD_NUMBER: _ClassVar[int]
     node_stats: _containers.RepeatedCompositeFieldContainer[NodeProfilingStats]
-    def __init__(self, node_stats: _Optional[_Iterable[_Union[NodeProfilingStats, _Mapping]]] = ...) -> None: ...
+    edge_stats: _containers.RepeatedCompositeFieldContainer[EdgeProfilingStats]
+    def __init__(self, node_stats: _Optional[_Iterable[_Union[NodeProfilingStats, _Mapping]]] = ..., edge_stats: _Optional[_Iterable[_Union[EdgeProfilingStats, _Mapping]]] = ...) -> None: ...
 
 class NodeProfilingStats(_message.Message):
-    __slots__ = ("node_name", "stage", "count", "mean_ms", "median_ms", "std_ms", "min_ms", "max_ms", "total_ms", "last_ms")
+    __slots__ = ("node_name", "stage", "count", "mean_ms", "median_ms", "std_ms", "min_ms", "max_ms", "total_ms", "last_ms", "peak_bytes", "alloc_bytes", "alloc_count", "device_peak_bytes")
     NODE_NAME_FIELD_NUMBER: _ClassVar[int]
     STAGE_FIELD_NUMBER: _ClassVar[int]
     COUNT_FIELD_NUMBER: _ClassVar[int]
@@ -1016,6 +1058,10 @@ class NodeProfilingStats(_message.Message):
     MAX_MS_FIELD_NUMBER: _ClassVar[int]
     TOTAL_MS_FIELD_NUMBER: _ClassVar[int]
     LAST_MS_FIELD_NUMBER: _ClassVar[int]
+    PEAK_BYTES_FIELD_NUMBER: _ClassVar[int]
+    ALLOC_BYTES_FIELD_NUMBER: _ClassVar[int]
+    ALLOC_COUNT_FIELD_NUMBER: _ClassVar[int]
+    DEVICE_PEAK_BYTES_FIELD_NUMBER: _ClassVar[int]
     node_name: str
     stage: ExecutionStage
     count: int
@@ -1026,7 +1072,35 @@ class NodeProfilingStats(_message.Message):
     max_ms: float
     total_ms: float
     last_ms: float
-    def __init__(self, node_name: _Optional[str] = ..., stage: _Optional[_Union[ExecutionStage, str]] = ..., count: _Optional[int] = ..., mean_ms: _Optional[float] = ..., median_ms: _Optional[float] = ..., std_ms: _Optional[float] = ..., min_ms: _Optional[float] = ..., max_ms: _Optional[float] = ..., total_ms: _Optional[float] = ..., last_ms: _Optional[float] = ...) -> None: ...
+    peak_bytes: int
+    alloc_bytes: int
+    alloc_count: int
+    device_peak_bytes: int
+    def __init__(self, node_name: _Optional[str] = ..., stage: _Optional[_Union[ExecutionStage, str]] = ..., count: _Optional[int] = ..., mean_ms: _Optional[float] = ..., median_ms: _Optional[float] = ..., std_ms: _Optional[float] = ..., min_ms: _Optional[float] = ..., max_ms: _Optional[float] = ..., total_ms: _Optional[float] = ..., last_ms: _Optional[float] = ..., peak_bytes: _Optional[int] = ..., alloc_bytes: _Optional[int] = ..., alloc_count: _Optional[int] = ..., device_peak_bytes: _Optional[int] = ...) -> None: ...
+
+class EdgeProfilingStats(_message.Message):
+    __slots__ = ("source", "target", "stage", "count", "total_bytes", "mean_bytes", "max_bytes", "last_bytes", "total_tensors", "last_tensors")
+    SOURCE_FIELD_NUMBER: _ClassVar[int]
+    TARGET_FIELD_NUMBER: _ClassVar[int]
+    STAGE_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_BYTES_FIELD_NUMBER: _ClassVar[int]
+    MEAN_BYTES_FIELD_NUMBER: _ClassVar[int]
+    MAX_BYTES_FIELD_NUMBER: _ClassVar[int]
+    LAST_BYTES_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_TENSORS_FIELD_NUMBER: _ClassVar[int]
+    LAST_TENSORS_FIELD_NUMBER: _ClassVar[int]
+    source: str
+    target: str
+    stage: ExecutionStage
+    count: int
+    total_bytes: int
+    mean_bytes: float
+    max_bytes: int
+    last_bytes: int
+    total_tensors: int
+    last_tensors: int
+    def __init__(self, source: _Optional[str] = ..., target: _Optional[str] = ..., stage: _Optional[_Union[ExecutionStage, str]] = ..., count: _Optional[int] = ..., total_bytes: _Optional[int] = ..., mean_bytes: _Optional[float] = ..., max_bytes: _Optional[int] = ..., last_bytes: _Optional[int] = ..., total_tensors: _Optional[int] = ..., last_tensors: _Optional[int] = ...) -> None: ...
 
 class InitializeSessionRequest(_message.Message):
     __slots__ = ("session_id", "search_paths", "resolved_plugins_json", "output_dir", "scratch_dir")
@@ -78,6 +78,11 @@ class CuvisAIServiceStub:
                 request_serializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.GetTrainStatusRequest.SerializeToString,
                 response_deserializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.GetTrainStatusResponse.FromString,
                 _registered_method=True)
+        self.WatchTrain = channel.unary_stream(
+                '/cuvis_ai.v1.CuvisAIService/WatchTrain',
+                request_serializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.WatchTrainRequest.SerializeToString,
+                response_deserializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.TrainResponse.FromString,
+                _registered_method=True)
         self.GetTrainingCapabilities = channel.unary_unary(
                 '/cuvis_ai.v1.CuvisAIService/GetTrainingCapabilities',
                 request_serializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.GetTrainingCapabilitiesRequest.SerializeToString,
@@ -243,6 +248,12 @@ class CuvisAIServiceServicer:
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchTrain(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetTrainingCapabilities(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -416,6 +427,11 @@ def add_CuvisAIServiceServicer_to_server(servicer, server):
                     request_deserializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.GetTrainStatusRequest.FromString,
                     response_serializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.GetTrainStatusResponse.SerializeToString,
             ),
+            'WatchTrain': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchTrain,
+                    request_deserializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.WatchTrainRequest.FromString,
+                    response_serializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.TrainResponse.SerializeToString,
+            ),
             'GetTrainingCapabilities': grpc.unary_unary_rpc_method_handler(
                     servicer.GetTrainingCapabilities,
                     request_deserializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.GetTrainingCapabilitiesRequest.FromString,
@@ -835,6 +851,33 @@ class CuvisAIService:
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def WatchTrain(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/cuvis_ai.v1.CuvisAIService/WatchTrain',
+            cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.WatchTrainRequest.SerializeToString,
+            cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.TrainResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetTrainingCapabilities(request,
             target,
@@ -1342,6 +1385,11 @@ class RunRuntimeStub:
                 request_serializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.GetTrainStatusRequest.SerializeToString,
                 response_deserializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.GetTrainStatusResponse.FromString,
                 _registered_method=True)
+        self.WatchTrain = channel.unary_stream(
+                '/cuvis_ai.v1.RunRuntime/WatchTrain',
+                request_serializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.WatchTrainRequest.SerializeToString,
+                response_deserializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.TrainResponse.FromString,
+                _registered_method=True)
         self.CloseSession = channel.unary_unary(
                 '/cuvis_ai.v1.RunRuntime/CloseSession',
                 request_serializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.CloseSessionRequest.SerializeToString,
@@ -1446,6 +1494,12 @@ class RunRuntimeServicer:
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchTrain(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CloseSession(self, request, context):
         """Lifecycle.
         """
@@ -1533,6 +1587,11 @@ def add_RunRuntimeServicer_to_server(servicer, server):
                     request_deserializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.GetTrainStatusRequest.FromString,
                     response_serializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.GetTrainStatusResponse.SerializeToString,
             ),
+            'WatchTrain': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchTrain,
+                    request_deserializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.WatchTrainRequest.FromString,
+                    response_serializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.TrainResponse.SerializeToString,
+            ),
             'CloseSession': grpc.unary_unary_rpc_method_handler(
                     servicer.CloseSession,
                     request_deserializer=cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.CloseSessionRequest.FromString,
@@ -1910,6 +1969,33 @@ class RunRuntime:
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def WatchTrain(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/cuvis_ai.v1.RunRuntime/WatchTrain',
+            cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.WatchTrainRequest.SerializeToString,
+            cuvis__ai__schemas_dot_grpc_dot_v1_dot_cuvis__ai__pb2.TrainResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def CloseSession(request,
             target,
@@ -1,29 +1,152 @@
 """Pipeline structure schemas."""
 
+from cuvis_ai_schemas.pipeline.compatibility import (
+    ConnectionVerdict,
+    MismatchKind,
+    PortCompatibilityEngine,
+    PortKey,
+    check_compatibility,
+    dtype_key,
+)
 from cuvis_ai_schemas.pipeline.config import (
     ConnectionConfig,
+    NodeCachePolicy,
     NodeConfig,
     PipelineConfig,
     PipelineMetadata,
 )
-from cuvis_ai_schemas.pipeline.exceptions import PortCompatibilityError
+from cuvis_ai_schemas.pipeline.dedup import MergedPipeline, merge_pipelines
+from cuvis_ai_schemas.pipeline.diff import PipelineDiff, diff_pipelines
+from cuvis_ai_schemas.pipeline.dimensions import (
+    DimensionConflict,
+    DimensionSolution,
+    unify_dimensions,
+)
+from cuvis_ai_schemas.pipeline.exceptions import (
+    PipelineCycleError,
+    PipelineGraphError,
+    PortCompatibilityError,
+)
+from cuvis_ai_schemas.pipeline.execution_plan import (
+    ExecutionBranch,
+    ExecutionPlan,
+    FusionGroup,
+    NodeExecutionHint,
+    ThreadPoolPlanExecutor,
+    node_tags_from_capabilities,
+    plan_execution,
+)
+from cuvis_ai_schemas.pipeline.fingerprint import (
+    cache_key,
+    canonical_json,
+    fingerprint_pipeline,
+    input_digest,
+)
+from cuvis_ai_schemas.pipeline.fusion import find_fusion_groups
+from cuvis_ai_schemas.pipeline.graph import PipelineGraph, RequiredSubgraph
+from cuvis_ai_schemas.pipeline.memory_plan import (
+    MemoryPlan,
+    MemorySlot,
+    TensorLifetime,
+    plan_memory,
+)
+from cuvis_ai_schemas.pipeline.partition import (
+    PartitionPlan,
+    PipelinePartition,
+    ShmChannel,
+    partition_pipeline,
+)
 from cuvis_ai_schemas.pipeline.ports import (
     DimensionResolver,
     InputPort,
     OutputPort,
     PortSpec,
 )
-from cuvis_ai_schemas.pipeline.profiling import NodeProfilingStats
+from cuvis_ai_schemas.pipeline.profiling import (
+    EdgeProfilingStats,
+    EdgeTrafficAccumulator,
+    NodeMemoryAccumulator,
+    NodeProfilingStats,
+    payload_size,
+)
+from cuvis_ai_schemas.pipeline.profiling_compare import (
+    NodeComparison,
+    ProfilingComparison,
+    RegressionThresholds,
+    compare_profiling,
+    load_profiling_snapshot,
+    profiling_snapshot_from_data,
+    profiling_snapshot_from_proto,
+)
+from cuvis_ai_schemas.pipeline.validation import (
+    PipelineValidationReport,
+    ValidationIssue,
+    check_port_specs,
+    validate_pipeline,
+)
 
 __all__ = [
     "ConnectionConfig",
+    "ConnectionVerdict",
+    "DimensionConflict",
     "DimensionResolver",
+    "DimensionSolution",
+    "EdgeProfilingStats",
+    "EdgeTrafficAccumulator",
+    "ExecutionBranch",
+    "ExecutionPlan",
+    "FusionGroup",
     "InputPort",
+    "MemoryPlan",
+    "MemorySlot",
+    "MergedPipeline",
+    "MismatchKind",
+    "NodeCachePolicy",
+    "NodeComparison",
     "NodeConfig",
+    "NodeExecutionHint",
+    "NodeMemoryAccumulator",
     "NodeProfilingStats",
     "OutputPort",
+    "PartitionPlan",
     "PipelineConfig",
+    "PipelineCycleError",
+    "PipelineDiff",
+    "PipelineGraph",
+    "PipelineGraphError",
+    "PipelineValidationReport",
     "PipelineMetadata",
+    "PipelinePartition",
+    "PortCompatibilityEngine",
     "PortCompatibilityError",
+    "PortKey",
     "PortSpec",
+    "ProfilingComparison",
+    "RegressionThresholds",
+    "RequiredSubgraph",
+    "ShmChannel",
+    "TensorLifetime",
+    "ThreadPoolPlanExecutor",
+    "ValidationIssue",
+    "cache_key",
+    "canonical_json",
+    "check_compatibility",
+    "check_port_specs",
+    "compare_profiling",
+    "diff_pipelines",
+    "dtype_key",
+    "find_fusion_groups",
+    "fingerprint_pipeline",
+    "input_digest",
+    "load_profiling_snapshot",
+    "merge_pipelines",
+    "node_tags_from_capabilities",
+    "partition_pipeline",
+    "payload_size",
+    "plan_execution",
+    "plan_memory",
+    "profiling_snapshot_from_data",
+    "profiling_snapshot_from_proto",
+    "unify_dimensions",
+    "validate_pipeline",
 ]
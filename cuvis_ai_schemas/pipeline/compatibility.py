@@ -0,0 +1,317 @@
+"""Torch-free, memoized port compatibility checks.
+
+:meth:`PortSpec.is_compatible_with <cuvis_ai_schemas.pipeline.ports.PortSpec.is_compatible_with>`
+imports torch and re-resolves both shapes on every call. A
+:class:`PortCompatibilityEngine` instead reduces each side to a hashable
+:class:`PortKey` (normalized dtype key + shape) and caches the verdict per
+``(source key, target key)`` pair, so the thousands of checks made by
+drag-to-connect and config validation are dictionary lookups after the first.
+
+Dtype keys, computed without importing torch or NumPy:
+
+- ``torch.float32`` / ``"torch.float32"`` / ``"float32"`` / ``np.float32`` /
+  ``np.dtype("float32")`` → ``"float32"``,
+- bare strings follow NumPy, as ``NodePortSpec.dtype`` does: ``"float"`` →
+  ``"float64"``, ``"int"`` → ``"int64"``, ``"half"`` / ``"double"`` /
+  ``"long"`` → ``"float16"`` / ``"float64"`` / ``"int64"``; torch's meaning
+  of the ambiguous aliases only applies with the prefix (``"torch.float"`` →
+  ``"float32"``, ``"torch.int"`` → ``"int32"``),
+- ``torch.Tensor``, ``np.ndarray``, ``""`` and ``None`` → ``""`` (generic
+  tensor: matches any tensor dtype),
+- other Python types → their qualified name, e.g. ``"builtins.int"`` (must
+  match exactly; never matches a tensor dtype).
+
+Shapes follow ``PortSpec`` rules: ranks must agree and ``-1`` matches any
+size. Symbolic (``str``) dims are resolved from a node instance when one is
+given; unresolved symbols match anything (see
+:mod:`cuvis_ai_schemas.pipeline.dimensions` for cross-edge unification). An
+empty :class:`~cuvis_ai_schemas.plugin.NodePortSpec` shape is unchecked.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+from cuvis_ai_schemas.pipeline.ports import DimensionResolver, PortSpec
+
+if TYPE_CHECKING:
+    from functools import _CacheInfo
+
+    from cuvis_ai_schemas.pipeline.config import ConnectionConfig
+    from cuvis_ai_schemas.plugin.manifest_capabilities import NodePortSpec
+
+    AnySpec = PortSpec | NodePortSpec
+
+GENERIC_DTYPE = ""
+"""Dtype key of a generic tensor (``torch.Tensor``, empty wire dtype)."""
+
+MismatchKind = Literal["dtype", "shape"]
+"""Why two ports are incompatible: dtypes, or shapes (rank, size, unresolvable dims)."""
+
+_DTYPE_ALIASES = {
+    "float": "float64",
+    "double": "float64",
+    "half": "float16",
+    "int": "int64",
+    "long": "int64",
+    "short": "int16",
+    "cdouble": "complex128",
+    "bool_": "bool",
+    "tensor": GENERIC_DTYPE,
+    "ndarray": GENERIC_DTYPE,
+}
+
+_TORCH_DTYPE_ALIASES = {
+    **_DTYPE_ALIASES,
+    "float": "float32",
+    "int": "int32",
+    "cfloat": "complex64",
+}
+
+
+class PortKey(NamedTuple):
+    """Hashable, normalized view of one port spec."""
+
+    dtype: str
+    shape: tuple[int | str, ...] | None
+    """Shape with ``-1`` / symbolic dims; ``None`` when unchecked."""
+
+
+@dataclass(frozen=True)
+class ConnectionVerdict:
+    """Result of checking one connection in :meth:`PortCompatibilityEngine.check_connections`."""
+
+    source: str
+    target: str
+    compatible: bool
+    reason: str = ""
+    kind: MismatchKind | None = None
+
+
+def _normalize_dtype_name(name: str) -> str:
+    """Canonical tensor dtype name from its string spelling."""
+    name = name.strip().lower()
+    if name.startswith("torch."):
+        name = name.removeprefix("torch.")
+        return _TORCH_DTYPE_ALIASES.get(name, name)
+    name = name.removeprefix("numpy.")
+    return _DTYPE_ALIASES.get(name, name)
+
+
+@lru_cache(maxsize=1024)
+def _hashable_dtype_key(dtype: Any) -> str:
+    """Memoized :func:`dtype_key` for hashable dtype objects."""
+    if dtype is None:
+        return GENERIC_DTYPE
+    if isinstance(dtype, str):
+        return _normalize_dtype_name(dtype)
+    if isinstance(dtype, type):
+        module = dtype.__module__.split(".")[0]
+        if module == "torch" and dtype.__name__ == "Tensor":
+            return GENERIC_DTYPE
+        if module == "numpy":
+            return _normalize_dtype_name(dtype.__name__)
+        return f"{dtype.__module__}.{dtype.__qualname__}"
+    module = type(dtype).__module__.split(".")[0]
+    if module == "torch":  # torch.dtype instance, e.g. torch.float32
+        return _normalize_dtype_name(str(dtype))
+    if module == "numpy":  # numpy.dtype instance
+        return _normalize_dtype_name(str(getattr(dtype, "name", dtype)))
+    return _normalize_dtype_name(str(dtype))
+
+
+def dtype_key(dtype: Any) -> str:
+    """Normalized dtype key (see module docstring); never imports torch."""
+    try:
+        return _hashable_dtype_key(dtype)
+    except TypeError:  # unhashable dtype object
+        return _hashable_dtype_key.__wrapped__(dtype)
+
+
+def _is_tensor_key(key: str) -> bool:
+    """Whether a dtype key names a tensor dtype (or the generic tensor)."""
+    return "." not in key
+
+
+def _dtypes_compatible(source: str, target: str) -> bool:
+    """Equal keys, or a generic tensor against any tensor dtype."""
+    if source == target:
+        return True
+    if GENERIC_DTYPE in (source, target):
+        return _is_tensor_key(source) and _is_tensor_key(target)
+    return False
+
+
+def _compare(source: PortKey, target: PortKey) -> tuple[MismatchKind | None, str]:
+    """Uncached ``(mismatch kind, message)`` for two port keys; ``None`` if compatible."""
+    if not _dtypes_compatible(source.dtype, target.dtype):
+        return "dtype", (
+            f"Dtype mismatch: source has {source.dtype or 'Tensor'}, "
+            f"target expects {target.dtype or 'Tensor'}"
+        )
+    if source.shape is None or target.shape is None:
+        return None, ""
+    if len(source.shape) != len(target.shape):
+        return "shape", (
+            f"Shape rank mismatch: source has {len(source.shape)} dimensions, "
+            f"target expects {len(target.shape)}"
+        )
+    for idx, (src_dim, tgt_dim) in enumerate(zip(source.shape, target.shape, strict=True)):
+        if isinstance(src_dim, str) or isinstance(tgt_dim, str):
+            continue
+        if src_dim != -1 and tgt_dim != -1 and src_dim != tgt_dim:
+            return "shape", (
+                f"Dimension {idx} mismatch: source has size {src_dim}, target expects {tgt_dim}"
+            )
+    return None, ""
+
+
+class PortCompatibilityEngine:
+    """Memoized, torch-free port compatibility checker.
+
+    Parameters
+    ----------
+    maxsize : int | None
+        Maximum cached ``(source, target)`` verdicts; ``None`` is unbounded.
+
+    Examples
+    --------
+    >>> engine = PortCompatibilityEngine()
+    >>> engine.check(NodePortSpec(dtype="float32", shape=[-1, 3]),
+    ...              NodePortSpec(dtype="", shape=[8, 3]))
+    (True, '')
+    """
+
+    def __init__(self, maxsize: int | None = 65536) -> None:
+        self._verdict = lru_cache(maxsize=maxsize)(_compare)
+
+    @staticmethod
+    def port_key(spec: AnySpec | PortKey, node: Any | None = None) -> PortKey:
+        """Normalize a ``PortSpec`` or ``NodePortSpec`` to a :class:`PortKey`.
+
+        Symbolic dims of a ``PortSpec`` are resolved from ``node`` when given.
+
+        Raises
+        ------
+        AttributeError, ValueError, TypeError
+            If ``node`` cannot resolve a symbolic dim.
+        """
+        if isinstance(spec, PortKey):
+            return spec
+        if isinstance(spec, PortSpec):
+            shape = DimensionResolver.resolve(spec.shape, node) if node else tuple(spec.shape)
+            return PortKey(dtype_key(spec.dtype), shape)
+        return PortKey(dtype_key(spec.dtype), tuple(spec.shape) if spec.shape else None)
+
+    def check(
+        self,
+        source: AnySpec | PortKey,
+        target: AnySpec | PortKey,
+        source_node: Any | None = None,
+        target_node: Any | None = None,
+    ) -> tuple[bool, str]:
+        """Whether an output ``source`` can feed an input ``target``.
+
+        Returns
+        -------
+        tuple[bool, str]
+            ``(is_compatible, error_message)``, as ``PortSpec.is_compatible_with``.
+        """
+        kind, reason = self.mismatch(source, target, source_node, target_node)
+        return kind is None, reason
+
+    def mismatch(
+        self,
+        source: AnySpec | PortKey,
+        target: AnySpec | PortKey,
+        source_node: Any | None = None,
+        target_node: Any | None = None,
+    ) -> tuple[MismatchKind | None, str]:
+        """Like :meth:`check`, but returns why the ports are incompatible.
+
+        Returns
+        -------
+        tuple[MismatchKind | None, str]
+            ``(kind, error_message)``; ``kind`` is ``None`` when compatible.
+        """
+        try:
+            source_key = self.port_key(source, source_node)
+            target_key = self.port_key(target, target_node)
+        except (AttributeError, ValueError, TypeError) as exc:
+            return "shape", f"Shape resolution failed: {exc}"
+        return self._verdict(source_key, target_key)
+
+    def check_many(
+        self, pairs: Iterable[tuple[AnySpec | PortKey, AnySpec | PortKey]]
+    ) -> list[tuple[bool, str]]:
+        """Check ``(source, target)`` pairs in order."""
+        return [self.check(source, target) for source, target in pairs]
+
+    def check_connections(
+        self,
+        connections: Iterable[ConnectionConfig],
+        output_specs: Mapping[str, Mapping[str, AnySpec]],
+        input_specs: Mapping[str, Mapping[str, AnySpec]],
+    ) -> list[ConnectionVerdict]:
+        """Check a batch of connections against per-node port specs.
+
+        Parameters
+        ----------
+        connections : Iterable[ConnectionConfig]
+            Connections to check.
+        output_specs, input_specs : Mapping[str, Mapping[str, PortSpec | NodePortSpec]]
+            Node name → port name → spec.
+
+        Returns
+        -------
+        list[ConnectionVerdict]
+            One verdict per connection, in input order; a missing node or port
+            is reported as incompatible.
+        """
+        verdicts = []
+        for conn in connections:
+            source = output_specs.get(conn.from_node, {}).get(conn.from_port)
+            target = input_specs.get(conn.to_node, {}).get(conn.to_port)
+            if source is None:
+                ok, reason = False, f"Unknown output port '{conn.from_port}' on '{conn.from_node}'"
+                kind = None
+            elif target is None:
+                ok, reason = False, f"Unknown input port '{conn.to_port}' on '{conn.to_node}'"
+                kind = None
+            else:
+                kind, reason = self.mismatch(source, target)
+                ok = kind is None
+            verdicts.append(ConnectionVerdict(conn.source, conn.target, ok, reason, kind))
+        return verdicts
+
+    def cache_info(self) -> _CacheInfo:
+        """Hit / miss statistics of the verdict cache."""
+        return self._verdict.cache_info()
+
+    def clear_cache(self) -> None:
+        """Drop all cached verdicts."""
+        self._verdict.cache_clear()
+
+
+default_engine = PortCompatibilityEngine()
+"""Process-wide engine shared by :func:`check_compatibility` and pipeline validation."""
+
+
+def check_compatibility(source: AnySpec | PortKey, target: AnySpec | PortKey) -> tuple[bool, str]:
+    """Check two port specs with :data:`default_engine`."""
+    return default_engine.check(source, target)
+
+
+__all__ = [
+    "GENERIC_DTYPE",
+    "ConnectionVerdict",
+    "MismatchKind",
+    "PortCompatibilityEngine",
+    "PortKey",
+    "check_compatibility",
+    "default_engine",
+    "dtype_key",
+]
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 import yaml
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 
 from cuvis_ai_schemas.base import BaseSchemaModel
+from cuvis_ai_schemas.pipeline.graph import PipelineGraph, RequiredSubgraph, _GraphCache
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -49,8 +50,12 @@ def _validate_endpoint(value: str, role: str, expected_middle: str) -> str:
     return value
 
 
+@lru_cache(maxsize=16384)
 def _endpoint_parts(value: str) -> tuple[str, str]:
-    """Return ``(node, port)`` from a validated endpoint string."""
+    """Return ``(node, port)`` from a validated endpoint string.
+
+    Cached: endpoint properties are read in every graph traversal.
+    """
     parts = value.split(".")
     return parts[0], parts[2]
 
@@ -102,6 +107,25 @@ class PipelineMetadata(BaseSchemaModel):
         )
 
 
+class NodeCachePolicy(BaseSchemaModel):
+    """How a runtime may memoize a node's outputs.
+
+    Outputs are keyed by the node's fingerprint (see
+    :mod:`cuvis_ai_schemas.pipeline.fingerprint`) and a hash of its inputs, so
+    only deterministic nodes should enable caching.
+
+    Attributes
+    ----------
+    mode : {"off", "memory", "disk"}
+        Where cached outputs live.
+    max_bytes : int | None
+        Budget for this node's cached outputs; ``None`` is unbounded.
+    """
+
+    mode: Literal["off", "memory", "disk"] = Field(default="off", description="Cache location")
+    max_bytes: int | None = Field(default=None, ge=0, description="Cache budget in bytes")
+
+
 class NodeConfig(BaseSchemaModel):
     """Node configuration within a pipeline.
 
@@ -113,11 +137,14 @@ class NodeConfig(BaseSchemaModel):
         Fully-qualified class name (e.g., 'my_package.MyNode')
     hparams : dict[str, Any]
         Node hyperparameters
+    cache : NodeCachePolicy | None
+        Output caching policy; ``None`` disables caching
     """
 
     name: str = Field(description="Node identifier / base name")
     class_name: str = Field(description="Fully-qualified class name")
     hparams: dict[str, Any] = Field(default_factory=dict, description="Node hyperparameters")
+    cache: NodeCachePolicy | None = Field(default=None, description="Output caching policy")
 
 
 class ConnectionConfig(BaseSchemaModel):
@@ -199,6 +226,55 @@ class PipelineConfig(BaseSchemaModel):
         default=None, description="Optional pipeline metadata"
     )
 
+    _graph_cache: _GraphCache = PrivateAttr(default_factory=_GraphCache)
+
+    @property
+    def graph(self) -> PipelineGraph:
+        """Compiled :class:`PipelineGraph` of the nodes and connections.
+
+        Built once and reused until a node or connection is added, removed,
+        replaced, or renamed / rewired.
+
+        Raises
+        ------
+        PipelineGraphError
+            On duplicate node names or connections to unknown nodes.
+        PipelineCycleError
+            If the connections contain a cycle.
+        """
+        return self._graph_cache.get(self)
+
+    def required_subgraph(self, outputs: Iterable[str]) -> RequiredSubgraph:
+        """Nodes and connections needed to produce ``outputs`` (see ``graph``).
+
+        Cached per output set until the pipeline is mutated.
+        """
+        return self.graph.required_subgraph(outputs)
+
+    def prune(self, outputs: Iterable[str]) -> PipelineConfig:
+        """Copy of this pipeline reduced to what ``outputs`` need.
+
+        Parameters
+        ----------
+        outputs : Iterable[str]
+            Requested outputs as ``"node.outputs.port"``, ``"node.port"``, or
+            ``"node"`` (e.g. ``InferenceRequest.output_specs``).
+
+        Returns
+        -------
+        PipelineConfig
+            A new config with the required nodes and connections; plugins and
+            metadata are carried over.
+        """
+        subgraph = self.required_subgraph(outputs)
+        kept = set(subgraph.nodes)
+        return PipelineConfig(
+            plugins=None if self.plugins is None else list(self.plugins),
+            nodes=[node.model_copy(deep=True) for node in self.nodes if node.name in kept],
+            connections=[conn.model_copy() for conn in subgraph.connections],
+            metadata=None if self.metadata is None else self.metadata.model_copy(deep=True),
+        )
+
     @field_validator("plugins", mode="before")
     @classmethod
     def _validate_plugins(cls, value: object) -> object:
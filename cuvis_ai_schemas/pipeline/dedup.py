@@ -0,0 +1,177 @@
+"""Deduplicate identical upstream subgraphs across pipelines of one session.
+
+Several pipelines loaded together (an ensemble, A/B variants, a preview and a
+full pipeline) often share a prefix: the same reader, normalization, and
+backbone with the same hparams and weights. :func:`merge_pipelines` walks
+each pipeline in topological order and reuses an already merged node when
+it has the same
+:func:`~cuvis_ai_schemas.pipeline.fingerprint.fingerprint_pipeline`
+fingerprint and is fed, port by port and in order, by the same merged
+nodes. Source nodes read their batch inputs by node name, so a source's
+name is part of its identity, and two nodes of the same pipeline are never
+merged into one:
+
+>>> merged = merge_pipelines({"rx": rx_pipeline, "lad": lad_pipeline})
+>>> merged.shared
+{'rx__backbone': ['rx:backbone', 'lad:backbone']}
+>>> merged.endpoint("lad", "head.outputs.scores")
+'lad__head.outputs.scores'
+
+Merged node names are ``"{pipeline}__{node}"`` of the first pipeline that
+contains the node, with a ``"_2"``, ``"_3"``, ... suffix when that name is
+already taken (e.g. key ``"a"`` with node ``"b__c"`` and key ``"a__b"`` with
+node ``"c"``). Nodes for which ``can_share`` returns ``False`` (e.g.
+stateful or stochastic ones) are kept per pipeline, together with everything
+downstream of them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+
+from pydantic import Field
+
+from cuvis_ai_schemas.base import BaseSchemaModel
+from cuvis_ai_schemas.pipeline.config import ConnectionConfig, NodeConfig, PipelineConfig
+from cuvis_ai_schemas.pipeline.fingerprint import canonical_json, fingerprint_pipeline
+
+
+class MergedPipeline(BaseSchemaModel):
+    """Several pipelines merged into one graph with shared nodes."""
+
+    config: PipelineConfig = Field(description="Merged pipeline")
+    node_map: dict[str, dict[str, str]] = Field(
+        default_factory=dict, description="Pipeline → original node → merged node"
+    )
+    shared: dict[str, list[str]] = Field(
+        default_factory=dict,
+        description="Merged node used by several originals → 'pipeline:node' members",
+    )
+    total_nodes: int = Field(default=0, description="Nodes across all input pipelines")
+
+    @property
+    def unique_nodes(self) -> int:
+        """Nodes in the merged pipeline."""
+        return len(self.config.nodes)
+
+    def endpoint(self, pipeline: str, endpoint: str) -> str:
+        """Translate ``"node.{inputs,outputs}.port"`` of one input pipeline.
+
+        Raises
+        ------
+        KeyError
+            If the pipeline or node is unknown.
+        """
+        node, rest = endpoint.split(".", 1)
+        return f"{self.node_map[pipeline][node]}.{rest}"
+
+
+def _unique_name(name: str, taken: set[str]) -> str:
+    """``name``, or ``name`` with the first free ``_<n>`` suffix; marks it taken."""
+    candidate, n = name, 1
+    while candidate in taken:
+        n += 1
+        candidate = f"{name}_{n}"
+    taken.add(candidate)
+    return candidate
+
+
+def merge_pipelines(
+    pipelines: Mapping[str, PipelineConfig],
+    weights: Mapping[str, Mapping[str, str]] | None = None,
+    can_share: Callable[[NodeConfig], bool] | None = None,
+) -> MergedPipeline:
+    """Merge pipelines, instantiating structurally identical nodes once.
+
+    Parameters
+    ----------
+    pipelines : Mapping[str, PipelineConfig]
+        Pipeline key → config; keys prefix merged node names and must not
+        contain ``"."``.
+    weights : Mapping[str, Mapping[str, str]] | None
+        Pipeline key → node → weights identity (see ``fingerprint_pipeline``);
+        nodes with different weights are never shared.
+    can_share : Callable[[NodeConfig], bool] | None
+        Predicate excluding nodes from sharing; ``None`` shares every node.
+
+    Returns
+    -------
+    MergedPipeline
+        The merged config and the mapping back to the originals.
+
+    Raises
+    ------
+    ValueError
+        If a pipeline key contains ``"."``.
+    PipelineGraphError
+        If a pipeline's graph cannot be built.
+    """
+    by_identity: dict[str, list[str]] = {}
+    members: dict[str, list[str]] = {}
+    node_map: dict[str, dict[str, str]] = {}
+    nodes: list[NodeConfig] = []
+    connections: list[ConnectionConfig] = []
+    plugins: list[str] = []
+    taken: set[str] = set()
+    total = 0
+    for key, pipeline in pipelines.items():
+        if "." in key:
+            raise ValueError(f"Pipeline key '{key}' must not contain '.'")
+        graph = pipeline.graph
+        identities = dict((weights or {}).get(key, {}))
+        if can_share is not None:
+            for name, node in graph.nodes.items():
+                if not can_share(node):
+                    # A per-pipeline identity keeps the node and its descendants apart.
+                    identities[name] = canonical_json([identities.get(name), key, name])
+        fingerprints = fingerprint_pipeline(graph, identities)
+        mapping = node_map.setdefault(key, {})
+        created: set[str] = set()
+        used: set[str] = set()
+        for name in graph.topological_order:
+            total += 1
+            in_ports = graph.in_ports(name)
+            identity = canonical_json(
+                [
+                    fingerprints[name],
+                    None if in_ports else name,  # sources read batch inputs by name
+                    {
+                        port: [[mapping[conn.from_node], conn.from_port] for conn in conns]
+                        for port, conns in in_ports.items()
+                    },
+                ]
+            )
+            candidates = by_identity.setdefault(identity, [])
+            merged = next((candidate for candidate in candidates if candidate not in used), None)
+            if merged is None:
+                merged = _unique_name(f"{key}__{name}", taken)
+                candidates.append(merged)
+                created.add(merged)
+                nodes.append(graph.node(name).model_copy(update={"name": merged}, deep=True))
+            mapping[name] = merged
+            used.add(merged)
+            members.setdefault(merged, []).append(f"{key}:{name}")
+        for conn in graph.connections:
+            if mapping[conn.to_node] in created:
+                connections.append(
+                    ConnectionConfig(
+                        source=f"{mapping[conn.from_node]}.outputs.{conn.from_port}",
+                        target=f"{mapping[conn.to_node]}.inputs.{conn.to_port}",
+                    )
+                )
+        plugins.extend(plugin for plugin in pipeline.plugins or () if plugin not in plugins)
+
+    has_plugins = any(pipeline.plugins is not None for pipeline in pipelines.values())
+    return MergedPipeline(
+        config=PipelineConfig(
+            plugins=plugins if has_plugins else None,
+            nodes=nodes,
+            connections=connections,
+        ),
+        node_map=node_map,
+        shared={name: owners for name, owners in members.items() if len(owners) > 1},
+        total_nodes=total,
+    )
+
+
+__all__ = ["MergedPipeline", "merge_pipelines"]
@@ -0,0 +1,154 @@
+"""Structural diff between two pipeline configurations for hot-reload.
+
+:func:`diff_pipelines` compares an old and a new
+:class:`~cuvis_ai_schemas.pipeline.config.PipelineConfig` by node name and
+connection endpoints and classifies every change:
+
+- nodes ``added`` / ``removed``, ``replaced`` (same name, different class),
+  ``hparams_changed`` (with the changed keys), and ``rewired`` (different
+  incoming connections, or the same ones into a multi-input port in a new
+  order, which changes the list the node receives),
+- connections ``added`` / ``removed``.
+
+From that it derives what a runtime must do: ``reload_nodes`` need a fresh
+instance (added, replaced, or new hparams), ``affected_nodes`` additionally
+include rewired nodes and everything downstream of any change (their upstream
+closure changed, so cached or warm state is stale). All other nodes keep their
+instances, weights, and state:
+
+>>> diff = diff_pipelines(running, edited)
+>>> diff.hparams_changed
+{'threshold': ['value']}
+>>> diff.unchanged_nodes
+['reader', 'normalize', 'detector']
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pydantic import Field
+
+from cuvis_ai_schemas.base import BaseSchemaModel
+from cuvis_ai_schemas.pipeline.config import ConnectionConfig, PipelineConfig
+
+if TYPE_CHECKING:
+    from cuvis_ai_schemas.pipeline.graph import PipelineGraph
+
+
+class PipelineDiff(BaseSchemaModel):
+    """Changes from one pipeline configuration to another."""
+
+    added_nodes: list[str] = Field(default_factory=list, description="Nodes only in the new one")
+    removed_nodes: list[str] = Field(default_factory=list, description="Nodes only in the old one")
+    replaced_nodes: list[str] = Field(
+        default_factory=list, description="Nodes whose class_name changed"
+    )
+    hparams_changed: dict[str, list[str]] = Field(
+        default_factory=dict, description="Node → hparam keys added, removed, or changed"
+    )
+    rewired_nodes: list[str] = Field(
+        default_factory=list,
+        description="Nodes whose incoming connections or their per-port order changed",
+    )
+    added_connections: list[ConnectionConfig] = Field(
+        default_factory=list, description="Connections only in the new one"
+    )
+    removed_connections: list[ConnectionConfig] = Field(
+        default_factory=list, description="Connections only in the old one"
+    )
+    plugins_changed: bool = Field(default=False, description="Whether the plugin set changed")
+    reload_nodes: list[str] = Field(
+        default_factory=list, description="Nodes that need a new instance"
+    )
+    affected_nodes: list[str] = Field(
+        default_factory=list,
+        description="Nodes whose own config or upstream closure changed (new order)",
+    )
+    unchanged_nodes: list[str] = Field(
+        default_factory=list, description="Nodes that keep their instance and state"
+    )
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the pipelines are structurally identical."""
+        return not (self.affected_nodes or self.removed_nodes or self.plugins_changed)
+
+
+def _changed_keys(old: dict[str, Any], new: dict[str, Any]) -> list[str]:
+    """Sorted hparam keys that differ between two dicts."""
+    return sorted(key for key in old.keys() | new.keys() if old.get(key, ...) != new.get(key, ...))
+
+
+def _port_sources(graph: PipelineGraph, name: str) -> dict[str, tuple[str, ...]]:
+    """Input port → source endpoints feeding it, in config order."""
+    return {port: tuple(c.source for c in conns) for port, conns in graph.in_ports(name).items()}
+
+
+def diff_pipelines(old: PipelineConfig, new: PipelineConfig) -> PipelineDiff:
+    """Classify node and connection changes from ``old`` to ``new``.
+
+    Parameters
+    ----------
+    old : PipelineConfig
+        Currently loaded pipeline.
+    new : PipelineConfig
+        Edited pipeline.
+
+    Returns
+    -------
+    PipelineDiff
+        Node lists follow the topological order of the pipeline they belong to.
+
+    Raises
+    ------
+    PipelineGraphError
+        If either pipeline's graph cannot be built (duplicate or unknown nodes,
+        cycles).
+    """
+    old_graph, new_graph = old.graph, new.graph
+    old_edges = {(conn.source, conn.target): conn for conn in old_graph.connections}
+    new_edges = {(conn.source, conn.target): conn for conn in new_graph.connections}
+
+    added = [name for name in new_graph.topological_order if name not in old_graph]
+    removed = [name for name in old_graph.topological_order if name not in new_graph]
+    replaced: list[str] = []
+    hparams: dict[str, list[str]] = {}
+    rewired: list[str] = []
+    for name in new_graph.topological_order:
+        if name not in old_graph:
+            continue
+        old_node, new_node = old_graph.node(name), new_graph.node(name)
+        if old_node.class_name != new_node.class_name:
+            replaced.append(name)
+        elif keys := _changed_keys(old_node.hparams, new_node.hparams):
+            hparams[name] = keys
+        if _port_sources(old_graph, name) != _port_sources(new_graph, name):
+            rewired.append(name)
+
+    reload = set(added) | set(replaced) | set(hparams)
+    frontier = list(reload | set(rewired))
+    affected: set[str] = set()
+    while frontier:
+        name = frontier.pop()
+        if name not in affected:
+            affected.add(name)
+            frontier.extend(new_graph.successors(name))
+
+    order = new_graph.topological_order
+    return PipelineDiff(
+        added_nodes=added,
+        removed_nodes=removed,
+        replaced_nodes=replaced,
+        hparams_changed=hparams,
+        rewired_nodes=rewired,
+        added_connections=[conn for key, conn in new_edges.items() if key not in old_edges],
+        removed_connections=[conn for key, conn in old_edges.items() if key not in new_edges],
+        plugins_changed=sorted(old.plugins or []) != sorted(new.plugins or []),
+        reload_nodes=[name for name in order if name in reload],
+        affected_nodes=[name for name in order if name in affected],
+        unchanged_nodes=[name for name in order if name not in affected],
+    )
+
+
+__all__ = ["PipelineDiff", "diff_pipelines"]
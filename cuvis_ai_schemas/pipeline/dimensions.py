@@ -0,0 +1,250 @@
+"""Whole-graph unification of symbolic port dimensions.
+
+:meth:`DimensionResolver.resolve <cuvis_ai_schemas.pipeline.ports.DimensionResolver.resolve>`
+resolves one shape against one node's attributes. :func:`unify_dimensions`
+instead solves every port shape of a pipeline at once with union-find:
+
+- every dim of every port becomes a variable; a symbolic dim (``"n_bands"``)
+  is scoped to its node, so the same symbol on a node's inputs and outputs is
+  one variable and sizes flow *through* the node,
+- fixed dims bind their variable to a size; ``-1`` dims start unbound,
+- symbols are seeded from ``NodeConfig.hparams`` (and explicit ``bindings``),
+- every connection unifies the source and target dims position by position.
+
+The result is a :class:`DimensionSolution`: a per-node binding table, the
+statically known shape of every port (``-1`` where still free), and one
+:class:`DimensionConflict` per clash, naming both sizes and where each came
+from. Runtimes can preallocate buffers from ``port_shape`` and skip per-call
+shape checks when ``solution.ok``.
+
+>>> solution = unify_dimensions(pipeline, input_specs, output_specs)
+>>> solution.bindings["normalize"]
+{'n_bands': 61}
+>>> solution.port_shape("normalize", "cube", "output")
+(-1, -1, -1, 61)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+from cuvis_ai_schemas.pipeline.config import PipelineConfig
+
+if TYPE_CHECKING:
+    from cuvis_ai_schemas.pipeline.graph import PipelineGraph
+    from cuvis_ai_schemas.pipeline.ports import PortSpec
+    from cuvis_ai_schemas.plugin.manifest_capabilities import NodePortSpec
+
+    SpecTable = Mapping[str, Mapping[str, PortSpec | NodePortSpec]]
+
+PortDirection = Literal["input", "output"]
+
+
+@dataclass(frozen=True)
+class DimensionConflict:
+    """Two sizes that cannot both hold for a connection.
+
+    Attributes
+    ----------
+    source, target : str
+        Connection endpoints (``"node.outputs.port"`` / ``"node.inputs.port"``).
+    dim : int | None
+        Dim index on the connection, ``None`` for a rank mismatch.
+    message : str
+        Human-readable explanation naming both sizes and their origins.
+    """
+
+    source: str
+    target: str
+    dim: int | None
+    message: str
+
+
+@dataclass(frozen=True)
+class DimensionSolution:
+    """Result of :func:`unify_dimensions`.
+
+    Attributes
+    ----------
+    bindings : dict[str, dict[str, int]]
+        Node name → symbolic dim → inferred size.
+    unresolved : dict[str, tuple[str, ...]]
+        Node name → symbolic dims no constraint determined.
+    shapes : dict[tuple[str, str, str], tuple[int, ...]]
+        ``(node, direction, port)`` → static shape, ``-1`` for free dims.
+    conflicts : tuple[DimensionConflict, ...]
+        Every clash found, in connection order.
+    """
+
+    bindings: dict[str, dict[str, int]] = field(default_factory=dict)
+    unresolved: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    shapes: dict[tuple[str, str, str], tuple[int, ...]] = field(default_factory=dict)
+    conflicts: tuple[DimensionConflict, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        """Whether all constraints are satisfiable."""
+        return not self.conflicts
+
+    def port_shape(
+        self, node: str, port: str, direction: PortDirection = "input"
+    ) -> tuple[int, ...] | None:
+        """Static shape of a port, or ``None`` if it has no (checked) shape."""
+        return self.shapes.get((node, direction, port))
+
+
+class _UnionFind:
+    """Union-find over dim variables; each root carries an optional size + origin."""
+
+    def __init__(self) -> None:
+        self.parent: list[int] = []
+        self.value: list[int | None] = []
+        self.origin: list[str] = []
+
+    def add(self, value: int | None = None, origin: str = "") -> int:
+        """New singleton variable."""
+        self.parent.append(len(self.parent))
+        self.value.append(value)
+        self.origin.append(origin)
+        return len(self.parent) - 1
+
+    def find(self, var: int) -> int:
+        """Root of ``var`` with path halving."""
+        parent = self.parent
+        while parent[var] != var:
+            parent[var] = parent[parent[var]]
+            var = parent[var]
+        return var
+
+    def union(self, a: int, b: int) -> tuple[int, str, int, str] | None:
+        """Merge two classes; on a size clash keep them apart and return both sides."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return None
+        value_a, value_b = self.value[root_a], self.value[root_b]
+        if value_a is not None and value_b is not None and value_a != value_b:
+            return value_a, self.origin[root_a], value_b, self.origin[root_b]
+        if value_a is None:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        return None
+
+
+def unify_dimensions(
+    pipeline: PipelineConfig | PipelineGraph,
+    input_specs: SpecTable,
+    output_specs: SpecTable,
+    bindings: Mapping[str, Mapping[str, int]] | None = None,
+) -> DimensionSolution:
+    """Solve all symbolic and fixed dims of a pipeline along its connections.
+
+    Parameters
+    ----------
+    pipeline : PipelineConfig | PipelineGraph
+        Pipeline whose connections constrain the dims.
+    input_specs, output_specs : Mapping[str, Mapping[str, PortSpec | NodePortSpec]]
+        Node name → port name → spec. Ports missing here, and empty
+        ``NodePortSpec`` shapes, are unconstrained.
+    bindings : Mapping[str, Mapping[str, int]] | None
+        Known symbol sizes per node; they take precedence over integer
+        ``NodeConfig.hparams`` of the same name.
+
+    Returns
+    -------
+    DimensionSolution
+        Binding table, static port shapes, and conflicts.
+
+    Raises
+    ------
+    PipelineGraphError
+        If ``pipeline`` is a config whose graph cannot be built.
+    """
+    graph = pipeline.graph if isinstance(pipeline, PipelineConfig) else pipeline
+    uf = _UnionFind()
+    symbols: dict[str, dict[str, int]] = {}
+    terms: dict[tuple[str, str, str], list[int]] = {}
+
+    def symbol_var(node: str, symbol: str) -> int:
+        """Union-find variable for ``symbol`` on ``node``, seeded from bindings or hparams."""
+        scope = symbols.setdefault(node, {})
+        if symbol not in scope:
+            explicit = (bindings or {}).get(node, {})
+            hparams = graph.nodes[node].hparams if node in graph else {}
+            if symbol in explicit:
+                scope[symbol] = uf.add(explicit[symbol], f"binding {node}.{symbol}")
+            elif isinstance(hparams.get(symbol), int) and not isinstance(hparams[symbol], bool):
+                scope[symbol] = uf.add(hparams[symbol], f"hparam {node}.{symbol}")
+            else:
+                scope[symbol] = uf.add()
+        return scope[symbol]
+
+    for direction, table in (("input", input_specs), ("output", output_specs)):
+        plural = f"{direction}s"
+        for node, ports in table.items():
+            for port, spec in ports.items():
+                if not spec.shape:
+                    continue
+                variables = []
+                for idx, dim in enumerate(spec.shape):
+                    if isinstance(dim, str):
+                        variables.append(symbol_var(node, dim))
+                    elif dim == -1:
+                        variables.append(uf.add())
+                    else:
+                        variables.append(uf.add(dim, f"{node}.{plural}.{port}[{idx}]"))
+                terms[(node, direction, port)] = variables
+
+    conflicts: list[DimensionConflict] = []
+    for conn in graph.connections:
+        source_vars = terms.get((conn.from_node, "output", conn.from_port))
+        target_vars = terms.get((conn.to_node, "input", conn.to_port))
+        if source_vars is None or target_vars is None:
+            continue
+        if len(source_vars) != len(target_vars):
+            conflicts.append(
+                DimensionConflict(
+                    conn.source,
+                    conn.target,
+                    None,
+                    f"{conn.source} -> {conn.target}: rank {len(source_vars)} vs "
+                    f"rank {len(target_vars)}",
+                )
+            )
+            continue
+        for idx, (source_var, target_var) in enumerate(zip(source_vars, target_vars, strict=True)):
+            clash = uf.union(source_var, target_var)
+            if clash is not None:
+                size_a, origin_a, size_b, origin_b = clash
+                conflicts.append(
+                    DimensionConflict(
+                        conn.source,
+                        conn.target,
+                        idx,
+                        f"{conn.source} -> {conn.target}: dimension {idx} is {size_a} "
+                        f"(from {origin_a}) but {size_b} (from {origin_b})",
+                    )
+                )
+
+    def size(var: int) -> int | None:
+        """Concrete size bound to ``var``'s class, if any."""
+        return uf.value[uf.find(var)]
+
+    resolved: dict[str, dict[str, int]] = {}
+    unresolved: dict[str, tuple[str, ...]] = {}
+    for node, scope in symbols.items():
+        known = {symbol: value for symbol, var in scope.items() if (value := size(var)) is not None}
+        if known:
+            resolved[node] = known
+        free = tuple(symbol for symbol in scope if symbol not in known)
+        if free:
+            unresolved[node] = free
+    shapes = {
+        key: tuple(-1 if (value := size(var)) is None else value for var in variables)
+        for key, variables in terms.items()
+    }
+    return DimensionSolution(resolved, unresolved, shapes, tuple(conflicts))
+
+
+__all__ = ["DimensionConflict", "DimensionSolution", "PortDirection", "unify_dimensions"]
@@ -2,9 +2,29 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 
 class PortCompatibilityError(Exception):
     """Raised when attempting to connect incompatible ports."""
 
 
-__all__ = ["PortCompatibilityError"]
+class PipelineGraphError(Exception):
+    """Raised when a pipeline's nodes and connections do not form a valid graph."""
+
+
+class PipelineCycleError(PipelineGraphError):
+    """Raised when a pipeline's connections contain a cycle.
+
+    Parameters
+    ----------
+    cycle : Sequence[str]
+        Node names along the cycle, starting and ending with the same node.
+    """
+
+    def __init__(self, cycle: Sequence[str]) -> None:
+        self.cycle = list(cycle)
+        super().__init__(f"Pipeline contains a cycle: {' -> '.join(self.cycle)}")
+
+
+__all__ = ["PipelineCycleError", "PipelineGraphError", "PortCompatibilityError"]
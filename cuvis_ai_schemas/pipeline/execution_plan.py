@@ -0,0 +1,319 @@
+"""Parallel execution plans derived from the pipeline DAG.
+
+:func:`plan_execution` turns a pipeline into an :class:`ExecutionPlan`:
+
+- ``levels``: wavefronts of nodes whose inputs all come from earlier levels,
+- ``branches``: maximal linear chains of nodes with their dependencies on
+  other branches; branches without a dependency path between them (e.g. the
+  per-sensor arms of a fusion pipeline) can run concurrently,
+- one :class:`NodeExecutionHint` per node derived from its
+  :class:`~cuvis_ai_schemas.enums.NodeTag` values: ``STATEFUL`` nodes run
+  ``"serial"`` (never concurrently with any other node, since they may hold
+  shared state), ``BATCHED`` / ``STREAMING`` nodes accept micro-batches,
+- optional :class:`FusionGroup` annotations (see
+  :func:`~cuvis_ai_schemas.pipeline.fusion.find_fusion_groups`): chains a
+  runtime may run in one pass without materializing the intermediates.
+
+:class:`ThreadPoolPlanExecutor` is a CPU-only reference executor that follows
+a plan for pure-Python node callables, starting every node as soon as its
+predecessors finished. Runtimes with real devices implement their own
+scheduling from the same plan.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import Field
+
+from cuvis_ai_schemas.base import BaseSchemaModel
+from cuvis_ai_schemas.enums import NodeTag
+from cuvis_ai_schemas.pipeline.config import PipelineConfig
+
+if TYPE_CHECKING:
+    from cuvis_ai_schemas.pipeline.graph import PipelineGraph
+    from cuvis_ai_schemas.plugin.manifest_capabilities import PluginCapabilities
+
+NodeCallable = Callable[..., Mapping[str, Any]]
+"""Pure-Python node: input port values as keyword arguments → output port values."""
+
+_MICRO_BATCH_TAGS = frozenset({NodeTag.BATCHED, NodeTag.STREAMING})
+
+
+class NodeExecutionHint(BaseSchemaModel):
+    """Scheduling hints for one node."""
+
+    node: str = Field(description="Node name")
+    level: int = Field(ge=0, description="Index of the node's level")
+    branch: int = Field(ge=0, description="Index of the node's branch")
+    concurrency: Literal["parallel", "serial"] = Field(
+        default="parallel",
+        description="'serial' nodes (STATEFUL) never run concurrently with other nodes",
+    )
+    micro_batch: bool = Field(
+        default=False, description="Whether the node accepts micro-batches (BATCHED/STREAMING)"
+    )
+    fusion_group: int | None = Field(
+        default=None, description="Index of the fusion group containing the node"
+    )
+
+
+class FusionGroup(BaseSchemaModel):
+    """A linear chain of shape-preserving transforms that can run as one pass."""
+
+    index: int = Field(ge=0, description="Group index")
+    nodes: list[str] = Field(min_length=2, description="Chain nodes in execution order")
+    input: str = Field(description='Endpoint feeding the chain, "node.inputs.port"')
+    output: str = Field(description='Endpoint leaving the chain, "node.outputs.port"')
+    eliminated: list[str] = Field(
+        default_factory=list,
+        description="Intermediate output endpoints that need not be materialized",
+    )
+
+
+class ExecutionBranch(BaseSchemaModel):
+    """A maximal linear chain of nodes."""
+
+    index: int = Field(ge=0, description="Branch index")
+    nodes: list[str] = Field(description="Nodes in execution order")
+    depends_on: list[int] = Field(
+        default_factory=list, description="Branches that must finish first"
+    )
+
+
+class ExecutionPlan(BaseSchemaModel):
+    """Concurrency structure of a pipeline."""
+
+    levels: list[list[str]] = Field(default_factory=list, description="Wavefronts of nodes")
+    branches: list[ExecutionBranch] = Field(default_factory=list, description="Linear chains")
+    nodes: list[NodeExecutionHint] = Field(
+        default_factory=list, description="Per-node hints, in topological order"
+    )
+    fusion_groups: list[FusionGroup] = Field(
+        default_factory=list, description="Chains that can be fused into one pass"
+    )
+
+    @property
+    def order(self) -> list[str]:
+        """Node names in topological (level) order."""
+        return [name for level in self.levels for name in level]
+
+    @property
+    def max_parallelism(self) -> int:
+        """Widest level counting parallel nodes (serial nodes run alone)."""
+        serial = {hint.node for hint in self.nodes if hint.concurrency == "serial"}
+        return max(
+            (max(sum(name not in serial for name in level), 1) for level in self.levels),
+            default=0,
+        )
+
+    def hint(self, node: str) -> NodeExecutionHint:
+        """Hints of ``node``.
+
+        Raises
+        ------
+        KeyError
+            If the node is not in the plan.
+        """
+        for hint in self.nodes:
+            if hint.node == node:
+                return hint
+        raise KeyError(f"Unknown node '{node}'")
+
+    def concurrent_branches(self) -> list[tuple[int, int]]:
+        """Pairs of branches with no dependency path between them."""
+        ancestors: list[set[int]] = []
+        for branch in self.branches:  # branches are in topological order
+            seen = set(branch.depends_on)
+            for dep in branch.depends_on:
+                seen |= ancestors[dep]
+            ancestors.append(seen)
+        return [
+            (a, b) for b in range(len(self.branches)) for a in range(b) if a not in ancestors[b]
+        ]
+
+
+def node_tags_from_capabilities(
+    pipeline: PipelineConfig | PipelineGraph, capabilities: Iterable[PluginCapabilities]
+) -> dict[str, list[str]]:
+    """Node name → manifest tags of its class, for :func:`plan_execution`."""
+    graph = pipeline.graph if isinstance(pipeline, PipelineConfig) else pipeline
+    by_class: dict[str, list[str]] = {}
+    for plugin in capabilities:
+        for capability in plugin.capabilities:
+            by_class.setdefault(capability.class_name, list(capability.tags))
+    return {name: by_class.get(node.class_name, []) for name, node in graph.nodes.items()}
+
+
+def _chains(graph: PipelineGraph) -> tuple[list[list[str]], dict[str, int]]:
+    """Maximal single-predecessor / single-successor chains in topological order."""
+    chains: list[list[str]] = []
+    branch_of: dict[str, int] = {}
+    for name in graph.topological_order:
+        preds = graph.predecessors(name)
+        if len(preds) == 1 and len(graph.successors(preds[0])) == 1:
+            index = branch_of[preds[0]]
+            chains[index].append(name)
+        else:
+            index = len(chains)
+            chains.append([name])
+        branch_of[name] = index
+    return chains, branch_of
+
+
+def plan_execution(
+    pipeline: PipelineConfig | PipelineGraph,
+    tags: Mapping[str, Iterable[NodeTag | str]] | None = None,
+    fusion_groups: Iterable[FusionGroup] = (),
+) -> ExecutionPlan:
+    """Derive levels, branches, and per-node hints from a pipeline.
+
+    Parameters
+    ----------
+    pipeline : PipelineConfig | PipelineGraph
+        Pipeline to plan.
+    tags : Mapping[str, Iterable[NodeTag | str]] | None
+        Node name → tags (see :func:`node_tags_from_capabilities`); nodes
+        without tags are parallel and not micro-batched.
+    fusion_groups : Iterable[FusionGroup]
+        Fusion annotations to attach, e.g. from ``find_fusion_groups``.
+
+    Returns
+    -------
+    ExecutionPlan
+        The plan.
+    """
+    graph = pipeline.graph if isinstance(pipeline, PipelineConfig) else pipeline
+    chains, branch_of = _chains(graph)
+    branches = [
+        ExecutionBranch(
+            index=index,
+            nodes=chain,
+            depends_on=sorted({branch_of[pred] for pred in graph.predecessors(chain[0])}),
+        )
+        for index, chain in enumerate(chains)
+    ]
+    groups = list(fusion_groups)
+    group_of = {name: group.index for group in groups for name in group.nodes}
+    hints = []
+    for level_index, level in enumerate(graph.levels):
+        for name in level:
+            node_tags = {str(tag).lower() for tag in (tags or {}).get(name, ())}
+            hints.append(
+                NodeExecutionHint(
+                    node=name,
+                    level=level_index,
+                    branch=branch_of[name],
+                    concurrency="serial" if NodeTag.STATEFUL in node_tags else "parallel",
+                    micro_batch=bool(node_tags & _MICRO_BATCH_TAGS),
+                    fusion_group=group_of.get(name),
+                )
+            )
+    return ExecutionPlan(
+        levels=[list(level) for level in graph.levels],
+        branches=branches,
+        nodes=hints,
+        fusion_groups=groups,
+    )
+
+
+class ThreadPoolPlanExecutor:
+    """Reference executor running pure-Python nodes on a thread pool.
+
+    Parameters
+    ----------
+    max_workers : int | None
+        Pool size; ``None`` uses the :class:`~concurrent.futures.ThreadPoolExecutor`
+        default.
+
+    Examples
+    --------
+    >>> plan = plan_execution(pipeline, tags)
+    >>> outputs = ThreadPoolPlanExecutor(4).run(plan, pipeline, node_callables,
+    ...                                         inputs={"reader": {"path": "a.cu3s"}})
+    >>> outputs["head"]["scores"]
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        plan: ExecutionPlan,
+        pipeline: PipelineConfig | PipelineGraph,
+        nodes: Mapping[str, NodeCallable],
+        inputs: Mapping[str, Mapping[str, Any]] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Execute every node once, honoring dependencies and hints.
+
+        Each node is called with its input ports as keyword arguments: the
+        upstream value, a list of values for ports with several incoming
+        connections, or the value from ``inputs[node][port]`` for unconnected
+        ports. Serial nodes run on the calling thread while nothing else runs.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Node name → output port → value.
+
+        Raises
+        ------
+        KeyError
+            If a node has no callable.
+        Exception
+            The first exception raised by a node; nodes not yet started are
+            skipped.
+        """
+        graph = pipeline.graph if isinstance(pipeline, PipelineConfig) else pipeline
+        missing = [name for name in plan.order if name not in nodes]
+        if missing:
+            raise KeyError(f"No callable for nodes: {', '.join(missing)}")
+        serial = {hint.node for hint in plan.nodes if hint.concurrency == "serial"}
+        pending = {name: len(graph.predecessors(name)) for name in plan.order}
+        ready = [name for name in plan.order if pending[name] == 0]
+        outputs: dict[str, dict[str, Any]] = {}
+
+        def call(name: str) -> dict[str, Any]:
+            """Run node ``name`` on its external inputs and upstream outputs."""
+            kwargs = dict((inputs or {}).get(name, {}))
+            for port, conns in graph.in_ports(name).items():
+                values = [outputs[conn.from_node][conn.from_port] for conn in conns]
+                kwargs[port] = values[0] if len(values) == 1 else values
+            return dict(nodes[name](**kwargs))
+
+        def finish(name: str, result: dict[str, Any]) -> None:
+            """Store ``name``'s outputs and queue successors that became ready."""
+            outputs[name] = result
+            for succ in graph.successors(name):
+                pending[succ] -= 1
+                if pending[succ] == 0:
+                    ready.append(succ)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running: dict[Future[dict[str, Any]], str] = {}
+            while ready or running:
+                for name in [name for name in ready if name not in serial]:
+                    ready.remove(name)
+                    running[pool.submit(call, name)] = name
+                if not running:
+                    name = ready.pop(0)
+                    finish(name, call(name))
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finish(running.pop(future), future.result())
+        return outputs
+
+
+__all__ = [
+    "ExecutionBranch",
+    "ExecutionPlan",
+    "FusionGroup",
+    "NodeCallable",
+    "NodeExecutionHint",
+    "ThreadPoolPlanExecutor",
+    "node_tags_from_capabilities",
+    "plan_execution",
+]
@@ -0,0 +1,156 @@
+"""Merkle-style per-node fingerprints for intermediate-result caching.
+
+A node's fingerprint is a SHA-256 over its ``class_name``, canonicalized
+``hparams``, weights identity, and, for every input port, the fingerprints
+and output ports of the upstream nodes feeding it, in config order (a
+multi-input port receives its values as a list in that order). A
+fingerprint identifies the computation a node performs, not the data it
+sees: two source nodes reading different batch inputs share a fingerprint,
+so only a :func:`cache_key` that also includes :func:`input_digest` of the
+actual inputs identifies a result. Consequently:
+
+- changing a node's hparams changes its fingerprint and every downstream one,
+  but leaves upstream fingerprints (e.g. a backbone) untouched,
+- node names and :class:`~cuvis_ai_schemas.pipeline.config.NodeCachePolicy`
+  do not contribute; renaming a node keeps its cache entries.
+
+Runtimes memoize deterministic node outputs under
+:func:`cache_key` ``(fingerprint, input_digest(inputs))`` when the node's
+``cache`` policy allows it:
+
+>>> fingerprints = fingerprint_pipeline(pipeline, weights={"backbone": ckpt_sha})
+>>> key = cache_key(fingerprints["backbone"], input_digest({"cube": cube}))
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from collections.abc import Mapping
+from enum import Enum
+from pathlib import PurePath
+from typing import TYPE_CHECKING, Any
+
+from cuvis_ai_schemas.pipeline.config import PipelineConfig
+
+if TYPE_CHECKING:
+    from cuvis_ai_schemas.pipeline.graph import PipelineGraph
+
+FINGERPRINT_VERSION = 2
+"""Bumped when the fingerprint payload changes, invalidating old caches."""
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-compatible canonical form: sorted sets, lists for tuples, tagged specials."""
+    if isinstance(value, Mapping):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(item) for item in value), key=canonical_json)
+    if isinstance(value, float) and not math.isfinite(value):
+        return {"__float__": repr(value)}
+    if isinstance(value, Enum):
+        return _canonical(value.value)
+    if isinstance(value, PurePath):
+        return value.as_posix()
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": bytes(value).hex()}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "item") and callable(value.item):  # NumPy / torch scalars
+        return _canonical(value.item())
+    raise TypeError(f"Cannot fingerprint value of type {type(value).__name__}")
+
+
+def canonical_json(value: Any) -> str:
+    """Deterministic JSON of ``value`` (sorted keys, no whitespace).
+
+    Raises
+    ------
+    TypeError
+        If ``value`` contains objects without a canonical form.
+    """
+    return json.dumps(_canonical(value), sort_keys=True, separators=(",", ":"))
+
+
+def fingerprint_pipeline(
+    pipeline: PipelineConfig | PipelineGraph,
+    weights: Mapping[str, str] | None = None,
+) -> dict[str, str]:
+    """Fingerprint every node of a pipeline.
+
+    Parameters
+    ----------
+    pipeline : PipelineConfig | PipelineGraph
+        Pipeline to fingerprint.
+    weights : Mapping[str, str] | None
+        Node name → weights identity (e.g. checkpoint digest); nodes without
+        an entry have no weights.
+
+    Returns
+    -------
+    dict[str, str]
+        Node name → hex SHA-256, in topological order.
+
+    Raises
+    ------
+    TypeError
+        If an hparam value has no canonical form.
+    """
+    graph = pipeline.graph if isinstance(pipeline, PipelineConfig) else pipeline
+    fingerprints: dict[str, str] = {}
+    for name in graph.topological_order:
+        node = graph.node(name)
+        inputs = {
+            port: [[fingerprints[conn.from_node], conn.from_port] for conn in conns]
+            for port, conns in graph.in_ports(name).items()
+        }
+        payload = canonical_json(
+            {
+                "version": FINGERPRINT_VERSION,
+                "class_name": node.class_name,
+                "hparams": node.hparams,
+                "weights": (weights or {}).get(name),
+                "inputs": inputs,
+            }
+        )
+        fingerprints[name] = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return fingerprints
+
+
+def input_digest(inputs: Mapping[str, Any]) -> str:
+    """Hex SHA-256 of a node's input values.
+
+    Buffer-protocol values (``bytes``, contiguous NumPy arrays, ...) are hashed
+    by format, shape, and raw bytes; other values by their canonical JSON.
+    """
+    digest = hashlib.sha256()
+    for port in sorted(inputs):
+        digest.update(port.encode("utf-8") + b"\0")
+        value = inputs[port]
+        try:
+            view = memoryview(value)
+        except TypeError:
+            digest.update(b"j" + canonical_json(value).encode("utf-8"))
+        else:
+            header = f"b{view.format}:{view.shape}:"
+            digest.update(header.encode("utf-8"))
+            digest.update(view.cast("B") if view.c_contiguous else view.tobytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def cache_key(fingerprint: str, inputs_digest: str) -> str:
+    """Memoization key of one node call."""
+    return f"{fingerprint}:{inputs_digest}"
+
+
+__all__ = [
+    "FINGERPRINT_VERSION",
+    "cache_key",
+    "canonical_json",
+    "fingerprint_pipeline",
+    "input_digest",
+]
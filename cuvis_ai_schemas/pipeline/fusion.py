@@ -0,0 +1,127 @@
+"""Detect fusible chains of elementwise transforms in a pipeline.
+
+Chains such as normalize → band-select → clamp read and write the full cube
+once per node. :func:`find_fusion_groups` finds maximal linear chains a
+runtime or JIT can run in a single pass, using only plugin manifests:
+
+- every node is a :attr:`NodeCategory.TRANSFORM <cuvis_ai_schemas.enums.NodeCategory.TRANSFORM>`
+  with exactly one incoming connection and one connected output port,
+- the connected input and output ``NodePortSpec`` shapes are identical
+  (same rank, same fixed sizes, ``-1`` in the same places),
+- each intermediate output has a single consumer: the next node of the chain.
+
+The groups are :class:`~cuvis_ai_schemas.pipeline.execution_plan.FusionGroup`
+annotations for :func:`~cuvis_ai_schemas.pipeline.execution_plan.plan_execution`:
+
+>>> groups = find_fusion_groups(pipeline, capabilities)
+>>> plan = plan_execution(pipeline, tags, fusion_groups=groups)
+>>> plan.fusion_groups[0].nodes
+['normalize', 'band_select', 'clamp']
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from cuvis_ai_schemas.enums import NodeCategory
+from cuvis_ai_schemas.pipeline.config import PipelineConfig
+from cuvis_ai_schemas.pipeline.execution_plan import FusionGroup
+
+if TYPE_CHECKING:
+    from cuvis_ai_schemas.pipeline.config import ConnectionConfig
+    from cuvis_ai_schemas.pipeline.graph import PipelineGraph
+    from cuvis_ai_schemas.plugin.manifest_capabilities import (
+        PluginCapabilities,
+        PluginCapabilityEntry,
+    )
+
+
+def _fusible(
+    graph: PipelineGraph, name: str, entry: PluginCapabilityEntry | None
+) -> tuple[ConnectionConfig, str] | None:
+    """``(incoming connection, output port)`` of a shape-preserving transform, else ``None``."""
+    if entry is None or entry.category != NodeCategory.TRANSFORM:
+        return None
+    incoming = graph.incoming(name)
+    out_ports = list(graph.out_ports(name))
+    if len(incoming) != 1 or len(out_ports) != 1:
+        return None
+    source = entry.input_specs.get(incoming[0].to_port)
+    target = entry.output_specs.get(out_ports[0])
+    if source is None or target is None or not source.shape or source.shape != target.shape:
+        return None
+    return incoming[0], out_ports[0]
+
+
+def find_fusion_groups(
+    pipeline: PipelineConfig | PipelineGraph,
+    capabilities: Iterable[PluginCapabilities],
+    min_length: int = 2,
+) -> list[FusionGroup]:
+    """Find maximal fusible chains of shape-preserving transforms.
+
+    Parameters
+    ----------
+    pipeline : PipelineConfig | PipelineGraph
+        Pipeline to analyze.
+    capabilities : Iterable[PluginCapabilities]
+        Manifests providing each node class's category and port specs; nodes
+        of unknown classes are never fused.
+    min_length : int
+        Shortest chain reported.
+
+    Returns
+    -------
+    list[FusionGroup]
+        Groups in topological order of their first node.
+
+    Raises
+    ------
+    ValueError
+        If ``min_length`` < 2.
+    """
+    if min_length < 2:
+        raise ValueError(f"min_length must be >= 2, got {min_length}")
+    graph = pipeline.graph if isinstance(pipeline, PipelineConfig) else pipeline
+    catalog: dict[str, PluginCapabilityEntry] = {}
+    for plugin in capabilities:
+        for capability in plugin.capabilities:
+            if capability.kind == "node":
+                catalog.setdefault(capability.class_name, capability)
+    fusible = {
+        name: info
+        for name in graph.topological_order
+        if (info := _fusible(graph, name, catalog.get(graph.node(name).class_name))) is not None
+    }
+
+    def next_in_chain(name: str) -> str | None:
+        """The fusible node that is ``name``'s only consumer, if any."""
+        outgoing = graph.outgoing(name)
+        if len(outgoing) == 1 and outgoing[0].to_node in fusible:
+            return outgoing[0].to_node
+        return None
+
+    linked = {succ for name in fusible if (succ := next_in_chain(name)) is not None}
+    groups: list[FusionGroup] = []
+    for head in fusible:
+        if head in linked:
+            continue
+        chain = [head]
+        while (succ := next_in_chain(chain[-1])) is not None:
+            chain.append(succ)
+        if len(chain) < min_length:
+            continue
+        groups.append(
+            FusionGroup(
+                index=len(groups),
+                nodes=chain,
+                input=fusible[head][0].target,
+                output=f"{chain[-1]}.outputs.{fusible[chain[-1]][1]}",
+                eliminated=[f"{name}.outputs.{fusible[name][1]}" for name in chain[:-1]],
+            )
+        )
+    return groups
+
+
+__all__ = ["find_fusion_groups"]
@@ -0,0 +1,361 @@
+"""Compiled, immutable graph index over a ``PipelineConfig``.
+
+``PipelineConfig`` stores flat lists of nodes and connections. A
+:class:`PipelineGraph` indexes them once in O(V + E): a name → ``NodeConfig``
+mapping, incoming / outgoing connections per node and per port, a stable
+topological order, and the level (wavefront) sets of nodes whose inputs are all
+produced by earlier levels. Consumers query it instead of rescanning the lists:
+
+>>> graph = pipeline.graph  # cached on the config, rebuilt after mutation
+>>> graph.topological_order
+('reader', 'normalize', 'detector')
+>>> graph.in_ports("detector")["cube"][0].source
+'normalize.outputs.cube'
+
+:meth:`PipelineGraph.required_subgraph` returns the minimal ancestor subgraph
+producing a set of requested outputs (e.g. ``InferenceRequest.output_specs``),
+cached per output set for the lifetime of the graph.
+
+Building raises :class:`~cuvis_ai_schemas.pipeline.exceptions.PipelineGraphError`
+for duplicate node names or connections to unknown nodes, and
+:class:`~cuvis_ai_schemas.pipeline.exceptions.PipelineCycleError` (naming the
+nodes on the cycle) when the connections are not acyclic.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from cuvis_ai_schemas.pipeline.exceptions import PipelineCycleError, PipelineGraphError
+
+if TYPE_CHECKING:
+    from cuvis_ai_schemas.pipeline.config import ConnectionConfig, NodeConfig, PipelineConfig
+
+PortMap = Mapping[str, tuple["ConnectionConfig", ...]]
+"""Port name → connections attached to that port, in config order."""
+
+
+@dataclass(frozen=True)
+class RequiredSubgraph:
+    """Minimal part of a pipeline needed for a set of requested outputs.
+
+    Attributes
+    ----------
+    outputs : frozenset[str]
+        Requested outputs as given.
+    nodes : tuple[str, ...]
+        Required nodes in topological order.
+    connections : tuple[ConnectionConfig, ...]
+        Connections into required nodes, in config order.
+    sources : tuple[str, ...]
+        Required nodes without incoming connections (pipeline entry points).
+    pruned : tuple[str, ...]
+        Nodes that can be skipped, in topological order.
+    """
+
+    outputs: frozenset[str]
+    nodes: tuple[str, ...]
+    connections: tuple[ConnectionConfig, ...]
+    sources: tuple[str, ...]
+    pruned: tuple[str, ...]
+
+    def required_inputs(self, input_specs: Mapping[str, Mapping[str, object]]) -> tuple[str, ...]:
+        """Unconnected, non-optional input ports of required nodes.
+
+        Parameters
+        ----------
+        input_specs : Mapping[str, Mapping[str, object]]
+            Node name → input port → spec; specs with a truthy ``optional``
+            attribute are skipped.
+
+        Returns
+        -------
+        tuple[str, ...]
+            ``"node.inputs.port"`` endpoints the caller must feed.
+        """
+        connected = {conn.target for conn in self.connections}
+        return tuple(
+            f"{name}.inputs.{port}"
+            for name in self.nodes
+            for port, spec in input_specs.get(name, {}).items()
+            if f"{name}.inputs.{port}" not in connected and not getattr(spec, "optional", False)
+        )
+
+
+def _output_node(output: str) -> str:
+    """Node of an output given as ``"node.outputs.port"``, ``"node.port"``, or ``"node"``."""
+    return output.split(".", 1)[0]
+
+
+def _freeze(ports: dict[str, list[ConnectionConfig]]) -> PortMap:
+    """Read-only view of a port → connections dict."""
+    return MappingProxyType({port: tuple(conns) for port, conns in ports.items()})
+
+
+class PipelineGraph:
+    """Immutable adjacency index of a pipeline.
+
+    Parameters
+    ----------
+    nodes : Iterable[NodeConfig]
+        Node definitions; names must be unique.
+    connections : Iterable[ConnectionConfig]
+        Connections between those nodes.
+
+    Raises
+    ------
+    PipelineGraphError
+        On duplicate node names or connections referencing unknown nodes.
+    PipelineCycleError
+        If the connections contain a cycle.
+    """
+
+    __slots__ = (
+        "_connections",
+        "_in_ports",
+        "_levels",
+        "_nodes",
+        "_order",
+        "_out_ports",
+        "_predecessors",
+        "_subgraphs",
+        "_successors",
+    )
+
+    def __init__(
+        self, nodes: Iterable[NodeConfig], connections: Iterable[ConnectionConfig]
+    ) -> None:
+        by_name: dict[str, NodeConfig] = {}
+        for node in nodes:
+            if node.name in by_name:
+                raise PipelineGraphError(f"Duplicate node name '{node.name}'")
+            by_name[node.name] = node
+        in_ports: dict[str, dict[str, list[ConnectionConfig]]] = {name: {} for name in by_name}
+        out_ports: dict[str, dict[str, list[ConnectionConfig]]] = {name: {} for name in by_name}
+        successors: dict[str, dict[str, None]] = {name: {} for name in by_name}
+        predecessors: dict[str, dict[str, None]] = {name: {} for name in by_name}
+        edges = tuple(connections)
+        for conn in edges:
+            source, target = conn.from_node, conn.to_node
+            for role, name in (("source", source), ("target", target)):
+                if name not in by_name:
+                    raise PipelineGraphError(
+                        f"Connection {conn.source} -> {conn.target} references unknown "
+                        f"{role} node '{name}'"
+                    )
+            out_ports[source].setdefault(conn.from_port, []).append(conn)
+            in_ports[target].setdefault(conn.to_port, []).append(conn)
+            successors[source][target] = None
+            predecessors[target][source] = None
+
+        self._nodes: Mapping[str, NodeConfig] = MappingProxyType(by_name)
+        self._connections = edges
+        self._in_ports = {name: _freeze(ports) for name, ports in in_ports.items()}
+        self._out_ports = {name: _freeze(ports) for name, ports in out_ports.items()}
+        self._successors = {name: tuple(succ) for name, succ in successors.items()}
+        self._predecessors = {name: tuple(pred) for name, pred in predecessors.items()}
+        self._levels = self._compute_levels()
+        self._order = tuple(name for level in self._levels for name in level)
+        self._subgraphs: dict[frozenset[str], RequiredSubgraph] = {}
+
+    @classmethod
+    def from_config(cls, config: PipelineConfig) -> PipelineGraph:
+        """Build the graph of ``config`` (prefer the cached ``config.graph``)."""
+        return cls(config.nodes, config.connections)
+
+    def _compute_levels(self) -> tuple[tuple[str, ...], ...]:
+        """Kahn's algorithm by wavefront; raises on a cycle."""
+        remaining = {name: len(preds) for name, preds in self._predecessors.items()}
+        level = [name for name, count in remaining.items() if count == 0]
+        levels: list[tuple[str, ...]] = []
+        placed = 0
+        while level:
+            levels.append(tuple(level))
+            placed += len(level)
+            following: list[str] = []
+            for name in level:
+                for succ in self._successors[name]:
+                    remaining[succ] -= 1
+                    if remaining[succ] == 0:
+                        following.append(succ)
+            level = following
+        if placed != len(self._nodes):
+            raise PipelineCycleError(self._find_cycle({n for n, c in remaining.items() if c}))
+        return tuple(levels)
+
+    def _find_cycle(self, blocked: set[str]) -> list[str]:
+        """Walk predecessors among nodes Kahn could not place until one repeats."""
+        start = next(name for name in self._nodes if name in blocked)
+        path: list[str] = []
+        seen: dict[str, int] = {}
+        node = start
+        while node not in seen:
+            seen[node] = len(path)
+            path.append(node)
+            node = next(pred for pred in self._predecessors[node] if pred in blocked)
+        cycle = path[seen[node] :] + [node]
+        return cycle[::-1]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Number of nodes."""
+        return len(self._nodes)
+
+    def __contains__(self, name: object) -> bool:
+        """Whether a node with this name exists."""
+        return name in self._nodes
+
+    @property
+    def nodes(self) -> Mapping[str, NodeConfig]:
+        """Read-only node name → ``NodeConfig`` mapping, in config order."""
+        return self._nodes
+
+    @property
+    def connections(self) -> tuple[ConnectionConfig, ...]:
+        """All connections in config order."""
+        return self._connections
+
+    @property
+    def topological_order(self) -> tuple[str, ...]:
+        """Node names such that every connection points forward (level by level)."""
+        return self._order
+
+    @property
+    def levels(self) -> tuple[tuple[str, ...], ...]:
+        """Wavefronts: each level depends only on nodes in earlier levels."""
+        return self._levels
+
+    def node(self, name: str) -> NodeConfig:
+        """The ``NodeConfig`` called ``name``.
+
+        Raises
+        ------
+        KeyError
+            If there is no such node.
+        """
+        try:
+            return self._nodes[name]
+        except KeyError:
+            raise KeyError(f"Unknown node '{name}'") from None
+
+    def in_ports(self, name: str) -> PortMap:
+        """Input port → incoming connections of node ``name``."""
+        self.node(name)
+        return self._in_ports[name]
+
+    def out_ports(self, name: str) -> PortMap:
+        """Output port → outgoing connections of node ``name``."""
+        self.node(name)
+        return self._out_ports[name]
+
+    def incoming(self, name: str) -> tuple[ConnectionConfig, ...]:
+        """All connections into node ``name``."""
+        return tuple(conn for conns in self.in_ports(name).values() for conn in conns)
+
+    def outgoing(self, name: str) -> tuple[ConnectionConfig, ...]:
+        """All connections out of node ``name``."""
+        return tuple(conn for conns in self.out_ports(name).values() for conn in conns)
+
+    def predecessors(self, name: str) -> tuple[str, ...]:
+        """Distinct nodes feeding node ``name``."""
+        self.node(name)
+        return self._predecessors[name]
+
+    def successors(self, name: str) -> tuple[str, ...]:
+        """Distinct nodes fed by node ``name``."""
+        self.node(name)
+        return self._successors[name]
+
+    def sources(self) -> tuple[str, ...]:
+        """Nodes without incoming connections."""
+        return self._levels[0] if self._levels else ()
+
+    def sinks(self) -> tuple[str, ...]:
+        """Nodes without outgoing connections."""
+        return tuple(name for name in self._order if not self._successors[name])
+
+    def required_subgraph(self, outputs: Iterable[str]) -> RequiredSubgraph:
+        """Minimal ancestor subgraph producing ``outputs``; cached per output set.
+
+        Parameters
+        ----------
+        outputs : Iterable[str]
+            Requested outputs as ``"node.outputs.port"``, ``"node.port"``, or
+            ``"node"``. Only the producing node matters: a node runs all of
+            its ports. An empty set requests the whole pipeline.
+
+        Raises
+        ------
+        KeyError
+            If an output names an unknown node.
+        """
+        key = frozenset(outputs)
+        cached = self._subgraphs.get(key)
+        if cached is not None:
+            return cached
+        wanted = [_output_node(output) for output in key] if key else list(self._order)
+        required: set[str] = set()
+        while wanted:
+            name = wanted.pop()
+            if name in required:
+                continue
+            self.node(name)
+            required.add(name)
+            wanted.extend(self._predecessors[name])
+        subgraph = RequiredSubgraph(
+            outputs=key,
+            nodes=tuple(name for name in self._order if name in required),
+            connections=tuple(conn for conn in self._connections if conn.to_node in required),
+            sources=tuple(
+                name for name in self._order if name in required and not self._predecessors[name]
+            ),
+            pruned=tuple(name for name in self._order if name not in required),
+        )
+        self._subgraphs[key] = subgraph
+        return subgraph
+
+
+class _GraphCache:
+    """Private holder for a config's compiled graph, invisible to ``==`` and pickling.
+
+    The graph is keyed on the node objects, names and connection endpoints it
+    was built from; any mutation of those triggers a rebuild.
+    """
+
+    __slots__ = ("graph", "key")
+
+    def __init__(self) -> None:
+        self.key: tuple[object, ...] | None = None
+        self.graph: PipelineGraph | None = None
+
+    def __eq__(self, other: object) -> bool:
+        """Holders never make two configs unequal."""
+        return isinstance(other, _GraphCache)
+
+    def __hash__(self) -> int:
+        """Constant hash, consistent with ``__eq__``."""
+        return 0
+
+    def __reduce__(self) -> tuple[type[_GraphCache], tuple[()]]:
+        """Copies and pickles start with an empty cache."""
+        return _GraphCache, ()
+
+    def get(self, config: PipelineConfig) -> PipelineGraph:
+        """Return the cached graph of ``config``, rebuilding it if stale."""
+        key = (
+            tuple((id(node), node.name) for node in config.nodes),
+            tuple((conn.source, conn.target) for conn in config.connections),
+        )
+        if self.graph is None or key != self.key:
+            self.graph = PipelineGraph.from_config(config)
+            self.key = key
+        return self.graph
+
+
+__all__ = ["PipelineGraph", "PortMap", "RequiredSubgraph"]
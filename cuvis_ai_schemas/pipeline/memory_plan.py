@@ -0,0 +1,251 @@
+"""Tensor liveness analysis and buffer-reuse planning for pipeline execution.
+
+Executing a pipeline in topological order, an output tensor is needed from the
+step that produces it until the step of its last consumer; holding it longer
+only costs memory. :func:`plan_memory` computes, from port shapes and dtypes:
+
+- the lifetime ``[produced_at, last_use]`` (step indices) and estimated size of
+  every intermediate tensor,
+- the peak of the summed sizes of simultaneously live tensors,
+- a greedy buffer-reuse plan: tensors are assigned largest-first to shared
+  slots whose previous occupants are dead, so ``planned_bytes`` (the sum of
+  slot sizes) approaches the peak instead of the sum of all tensors.
+
+The :class:`MemoryPlan` is a schema object a runtime can follow (allocate
+``slots``, write each output into its ``slot``, free after
+``releases_after(step)``) and ships a plain-text ``report()``.
+
+Sizes come from a :class:`~cuvis_ai_schemas.pipeline.dimensions.DimensionSolution`
+when given, otherwise from the spec shapes; dims still unknown count as
+``unknown_dim`` and mark the estimate as inexact.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING
+
+from pydantic import Field
+
+from cuvis_ai_schemas.base import BaseSchemaModel
+from cuvis_ai_schemas.pipeline.compatibility import dtype_key
+from cuvis_ai_schemas.pipeline.config import PipelineConfig
+
+if TYPE_CHECKING:
+    from cuvis_ai_schemas.pipeline.dimensions import DimensionSolution
+    from cuvis_ai_schemas.pipeline.graph import PipelineGraph
+    from cuvis_ai_schemas.pipeline.ports import PortSpec
+    from cuvis_ai_schemas.plugin.manifest_capabilities import NodePortSpec
+
+_ITEMSIZE = {
+    "bool": 1,
+    "uint8": 1,
+    "int8": 1,
+    "float16": 2,
+    "bfloat16": 2,
+    "int16": 2,
+    "uint16": 2,
+    "float32": 4,
+    "int32": 4,
+    "uint32": 4,
+    "float64": 8,
+    "int64": 8,
+    "uint64": 8,
+    "complex64": 8,
+    "complex128": 16,
+}
+
+
+class TensorLifetime(BaseSchemaModel):
+    """Lifetime, size, and buffer slot of one output tensor."""
+
+    tensor: str = Field(description='Producing endpoint, e.g. "node.outputs.port"')
+    node: str = Field(description="Producing node")
+    port: str = Field(description="Producing output port")
+    dtype: str = Field(default="", description="Normalized dtype key ('' if generic)")
+    shape: list[int] = Field(default_factory=list, description="Shape used for the estimate")
+    nbytes: int = Field(ge=0, description="Estimated size in bytes")
+    exact: bool = Field(description="Whether every dim and the dtype were known")
+    produced_at: int = Field(ge=0, description="Step index of the producing node")
+    last_use: int = Field(ge=0, description="Step index after which the tensor is dead")
+    slot: int = Field(ge=0, description="Index of the shared buffer slot")
+
+
+class MemorySlot(BaseSchemaModel):
+    """One reusable buffer."""
+
+    index: int = Field(ge=0, description="Slot index")
+    nbytes: int = Field(ge=0, description="Capacity: size of its largest tenant")
+    tensors: list[str] = Field(default_factory=list, description="Tenants, in step order")
+
+
+class MemoryPlan(BaseSchemaModel):
+    """Liveness-based memory plan for one execution order."""
+
+    order: list[str] = Field(description="Node execution order; step i runs order[i]")
+    tensors: list[TensorLifetime] = Field(default_factory=list, description="Tensors by step")
+    slots: list[MemorySlot] = Field(default_factory=list, description="Shared buffers")
+    peak_bytes: int = Field(default=0, description="Peak summed size of live tensors")
+    naive_bytes: int = Field(default=0, description="Sum of all tensor sizes (no reuse)")
+    planned_bytes: int = Field(default=0, description="Sum of slot capacities")
+
+    def tensor(self, name: str) -> TensorLifetime:
+        """Lifetime of the tensor produced at endpoint ``name``.
+
+        Raises
+        ------
+        KeyError
+            If no such tensor was planned.
+        """
+        for entry in self.tensors:
+            if entry.tensor == name:
+                return entry
+        raise KeyError(f"Unknown tensor '{name}'")
+
+    def live_at(self, step: int) -> list[TensorLifetime]:
+        """Tensors alive while step ``step`` runs."""
+        return [t for t in self.tensors if t.produced_at <= step <= t.last_use]
+
+    def releases_after(self, step: int) -> list[str]:
+        """Tensors whose buffers can be reused once step ``step`` finished."""
+        return [t.tensor for t in self.tensors if t.last_use == step]
+
+    def report(self) -> str:
+        """Plain-text table of lifetimes and slots plus the byte totals."""
+        lines = [f"{'tensor':<40} {'bytes':>14} {'live':>9} {'slot':>4}"]
+        for t in self.tensors:
+            approx = "" if t.exact else "~"
+            lines.append(
+                f"{t.tensor:<40} {approx + str(t.nbytes):>14} "
+                f"{f'{t.produced_at}-{t.last_use}':>9} {t.slot:>4}"
+            )
+        lines.append(
+            f"peak {self.peak_bytes} B, planned {self.planned_bytes} B in "
+            f"{len(self.slots)} slots, naive {self.naive_bytes} B"
+        )
+        return "\n".join(lines)
+
+
+def _estimate(
+    spec: PortSpec | NodePortSpec | None,
+    shape: tuple[int, ...] | None,
+    unknown_dim: int,
+    default_itemsize: int,
+) -> tuple[str, list[int], int, bool]:
+    """``(dtype key, shape, nbytes, exact)`` for one output."""
+    if spec is None:
+        return "", [], 0, False
+    key = dtype_key(spec.dtype)
+    exact = key in _ITEMSIZE
+    itemsize = _ITEMSIZE.get(key, default_itemsize)
+    if shape is None:
+        shape = tuple(-1 if isinstance(dim, str) else dim for dim in spec.shape)
+    if not spec.shape:
+        exact = False
+    dims = [unknown_dim if dim < 0 else dim for dim in shape]
+    exact = exact and all(dim >= 0 for dim in shape)
+    return key, dims, itemsize * math.prod(dims), exact
+
+
+def plan_memory(
+    pipeline: PipelineConfig | PipelineGraph,
+    output_specs: Mapping[str, Mapping[str, PortSpec | NodePortSpec]],
+    dimensions: DimensionSolution | None = None,
+    keep: Iterable[str] = (),
+    unknown_dim: int = 1,
+    default_itemsize: int = 4,
+) -> MemoryPlan:
+    """Compute tensor lifetimes, peak memory, and a buffer-reuse plan.
+
+    Parameters
+    ----------
+    pipeline : PipelineConfig | PipelineGraph
+        Pipeline to plan; steps follow its topological order.
+    output_specs : Mapping[str, Mapping[str, PortSpec | NodePortSpec]]
+        Node name → output port → spec.
+    dimensions : DimensionSolution | None
+        Unified shapes (see :func:`~cuvis_ai_schemas.pipeline.dimensions.unify_dimensions`).
+    keep : Iterable[str]
+        Output endpoints (``"node.outputs.port"``) that are pipeline results
+        and must stay alive until the last step.
+    unknown_dim : int
+        Size assumed for dims that are still ``-1`` / symbolic.
+    default_itemsize : int
+        Bytes per element for generic or unknown dtypes.
+
+    Returns
+    -------
+    MemoryPlan
+        The plan; an output nobody consumes dies at its own step.
+    """
+    graph = pipeline.graph if isinstance(pipeline, PipelineConfig) else pipeline
+    order = graph.topological_order
+    step_of = {name: step for step, name in enumerate(order)}
+    kept = set(keep)
+    last_step = len(order) - 1
+
+    tensors: list[TensorLifetime] = []
+    for step, name in enumerate(order):
+        specs = output_specs.get(name, {})
+        out_ports = graph.out_ports(name)
+        for port in dict.fromkeys([*specs, *out_ports]):
+            endpoint = f"{name}.outputs.{port}"
+            consumers = [step_of[conn.to_node] for conn in out_ports.get(port, ())]
+            last_use = last_step if endpoint in kept else max(consumers, default=step)
+            shape = dimensions.port_shape(name, port, "output") if dimensions else None
+            key, dims, nbytes, exact = _estimate(
+                specs.get(port), shape, unknown_dim, default_itemsize
+            )
+            tensors.append(
+                TensorLifetime(
+                    tensor=endpoint,
+                    node=name,
+                    port=port,
+                    dtype=key,
+                    shape=dims,
+                    nbytes=nbytes,
+                    exact=exact,
+                    produced_at=step,
+                    last_use=last_use,
+                    slot=0,
+                )
+            )
+
+    live = [0] * len(order)
+    for t in tensors:
+        for step in range(t.produced_at, t.last_use + 1):
+            live[step] += t.nbytes
+
+    slots: list[MemorySlot] = []
+    busy: list[list[tuple[int, int]]] = []
+    for t in sorted(tensors, key=lambda t: (-t.nbytes, t.produced_at)):
+        index = next(
+            (
+                i
+                for i, intervals in enumerate(busy)
+                if all(t.last_use < start or end < t.produced_at for start, end in intervals)
+            ),
+            len(slots),
+        )
+        if index == len(slots):
+            slots.append(MemorySlot(index=index, nbytes=t.nbytes))
+            busy.append([])
+        busy[index].append((t.produced_at, t.last_use))
+        slots[index].tensors.append(t.tensor)
+        t.slot = index
+    step_rank = {t.tensor: (t.produced_at, i) for i, t in enumerate(tensors)}
+    for slot in slots:
+        slot.tensors.sort(key=step_rank.__getitem__)
+
+    return MemoryPlan(
+        order=list(order),
+        tensors=tensors,
+        slots=slots,
+        peak_bytes=max(live, default=0),
+        naive_bytes=sum(t.nbytes for t in tensors),
+        planned_bytes=sum(slot.nbytes for slot in slots),
+    )
+
+
+__all__ = ["MemoryPlan", "MemorySlot", "TensorLifetime", "plan_memory"]
@@ -0,0 +1,244 @@
+"""Split a pipeline into process stages connected by shared-memory channels.
+
+GIL-bound Python nodes cap a session at one core. :func:`partition_pipeline`
+cuts the topological order of a pipeline into ``num_partitions`` contiguous
+stages, one per worker process, minimizing the most expensive stage (the
+pipeline-parallel throughput bottleneck). Node costs are the recorded
+``mean_ms`` of :class:`~cuvis_ai_schemas.pipeline.profiling.NodeProfilingStats`.
+
+Because stages are contiguous in topological order, every connection either
+stays inside a stage or points to a later one. Each value crossing stages is
+a :class:`ShmChannel`: a shared-memory segment named like ``ShmRef.name``,
+sized like ``ShmRef.byte_size`` from recorded
+:class:`~cuvis_ai_schemas.pipeline.profiling.EdgeProfilingStats` (``0`` when
+unknown), written by the producing stage and read by the consuming one (see
+:mod:`cuvis_ai_schemas.execution.shm_ring` for the ring transport). A value
+consumed by several nodes of one stage travels through one channel.
+
+>>> plan = partition_pipeline(pipeline, 3, stats=snapshot, stage="inference")
+>>> [p.nodes for p in plan.partitions]
+[['reader', 'normalize'], ['backbone'], ['head', 'viz']]
+>>> plan.channels[0].source
+'normalize.outputs.cube'
+"""
+
+from __future__ import annotations
+
+import secrets
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from pydantic import Field
+
+from cuvis_ai_schemas.base import BaseSchemaModel
+from cuvis_ai_schemas.pipeline.config import PipelineConfig
+
+if TYPE_CHECKING:
+    from cuvis_ai_schemas.pipeline.graph import PipelineGraph
+    from cuvis_ai_schemas.pipeline.profiling import EdgeProfilingStats, NodeProfilingStats
+
+
+class ShmChannel(BaseSchemaModel):
+    """One output value handed from one partition to a later one."""
+
+    name: str = Field(description="Shared-memory segment name (as ShmRef.name)")
+    source: str = Field(description='Producing endpoint, "node.outputs.port"')
+    targets: list[str] = Field(description='Consuming endpoints, "node.inputs.port"')
+    from_partition: int = Field(ge=0, description="Producing partition")
+    to_partition: int = Field(ge=0, description="Consuming partition")
+    byte_size: int = Field(
+        default=0, ge=0, description="Largest recorded payload (as ShmRef.byte_size); 0 if unknown"
+    )
+
+
+class PipelinePartition(BaseSchemaModel):
+    """Nodes run by one worker process."""
+
+    index: int = Field(ge=0, description="Partition index (stage order)")
+    nodes: list[str] = Field(description="Nodes in execution order")
+    cost_ms: float = Field(ge=0.0, description="Summed node cost")
+    inputs: list[str] = Field(default_factory=list, description="Channels read")
+    outputs: list[str] = Field(default_factory=list, description="Channels written")
+
+
+class PartitionPlan(BaseSchemaModel):
+    """Pipeline split into process stages."""
+
+    partitions: list[PipelinePartition] = Field(default_factory=list, description="Stages")
+    channels: list[ShmChannel] = Field(default_factory=list, description="Cross-stage edges")
+
+    @property
+    def total_cost_ms(self) -> float:
+        """Cost of running every node once."""
+        return sum(partition.cost_ms for partition in self.partitions)
+
+    @property
+    def bottleneck_ms(self) -> float:
+        """Cost of the most expensive stage, which bounds pipelined throughput."""
+        return max((partition.cost_ms for partition in self.partitions), default=0.0)
+
+    @property
+    def speedup(self) -> float:
+        """Ideal steady-state throughput gain over running all stages in one process."""
+        return self.total_cost_ms / self.bottleneck_ms if self.bottleneck_ms else 1.0
+
+    def partition_of(self, node: str) -> int:
+        """Index of the partition running ``node``.
+
+        Raises
+        ------
+        KeyError
+            If the node is not in the plan.
+        """
+        for partition in self.partitions:
+            if node in partition.nodes:
+                return partition.index
+        raise KeyError(f"Unknown node '{node}'")
+
+
+def _node_costs(
+    order: tuple[str, ...],
+    stats: Iterable[NodeProfilingStats],
+    stage: str | None,
+    default_cost_ms: float | None,
+) -> list[float]:
+    """Per-node ``mean_ms`` (of the most-sampled matching entry), defaults filled in."""
+    best: dict[str, NodeProfilingStats] = {}
+    for entry in stats:
+        if stage is not None and entry.stage != stage:
+            continue
+        current = best.get(entry.node_name)
+        if current is None or entry.count > current.count:
+            best[entry.node_name] = entry
+    known = [best[name].mean_ms for name in order if name in best]
+    if default_cost_ms is None:
+        default_cost_ms = sum(known) / len(known) if known else 1.0
+    return [best[name].mean_ms if name in best else default_cost_ms for name in order]
+
+
+def _pack(costs: list[float], parts: int, bound: float) -> list[int] | None:
+    """Start indices of left-to-right runs of sum <= ``bound``, or ``None`` if > ``parts``.
+
+    Runs are split early so that exactly ``parts`` non-empty runs come out.
+    """
+    starts = [0]
+    total = 0.0
+    for i, cost in enumerate(costs):
+        if i and (total + cost > bound or len(costs) - i == parts - len(starts)):
+            if len(starts) == parts:
+                return None
+            starts.append(i)
+            total = 0.0
+        total += cost
+    return starts
+
+
+def _split(costs: list[float], parts: int) -> list[int]:
+    """Start indices of ``parts`` contiguous runs minimizing the largest run sum.
+
+    Bisects the bottleneck between the largest cost and the total, checking
+    each candidate with a greedy packing: O(n log(1 / tolerance)) with a
+    relative tolerance of 1e-9.
+    """
+    low, high = max(costs), sum(costs)
+    # What _pack returns for the total: one long run, then single nodes.
+    best = [0, *range(len(costs) - parts + 1, len(costs))]
+    tolerance = high * 1e-9
+    while high - low > tolerance:
+        mid = (low + high) / 2
+        starts = _pack(costs, parts, mid)
+        if starts is None:
+            low = mid
+        else:
+            high, best = mid, starts
+    return best
+
+
+def partition_pipeline(
+    pipeline: PipelineConfig | PipelineGraph,
+    num_partitions: int,
+    stats: Iterable[NodeProfilingStats] = (),
+    stage: str | None = None,
+    edge_stats: Iterable[EdgeProfilingStats] = (),
+    default_cost_ms: float | None = None,
+    channel_prefix: str | None = None,
+) -> PartitionPlan:
+    """Partition a pipeline into balanced, contiguous process stages.
+
+    Parameters
+    ----------
+    pipeline : PipelineConfig | PipelineGraph
+        Pipeline to split.
+    num_partitions : int
+        Worker processes; capped at the number of nodes.
+    stats : Iterable[NodeProfilingStats]
+        Recorded node costs.
+    stage : str | None
+        Only use stats (node and edge) of this ``ExecutionStage`` value; ``None``
+        takes, per node, the entry with the most samples.
+    edge_stats : Iterable[EdgeProfilingStats]
+        Recorded transfer sizes, used for ``ShmChannel.byte_size``.
+    default_cost_ms : float | None
+        Cost of nodes without stats; ``None`` uses the mean known cost (or 1 ms).
+    channel_prefix : str | None
+        Prefix of the generated shared-memory segment names, e.g. a session
+        id. Segment names are host-global, so it must be unique per plan;
+        ``None`` uses ``"cuvis_pp_"`` plus a random token.
+
+    Returns
+    -------
+    PartitionPlan
+        Stages in execution order and the channels between them.
+
+    Raises
+    ------
+    ValueError
+        If ``num_partitions`` < 1.
+    """
+    if num_partitions < 1:
+        raise ValueError(f"num_partitions must be >= 1, got {num_partitions}")
+    if channel_prefix is None:
+        channel_prefix = f"cuvis_pp_{secrets.token_hex(4)}"
+    graph = pipeline.graph if isinstance(pipeline, PipelineConfig) else pipeline
+    order = graph.topological_order
+    if not order:
+        return PartitionPlan()
+    costs = _node_costs(order, stats, stage, default_cost_ms)
+    starts = [*_split(costs, min(num_partitions, len(order))), len(order)]
+    partitions = [
+        PipelinePartition(
+            index=index,
+            nodes=list(order[start:end]),
+            cost_ms=sum(costs[start:end]),
+        )
+        for index, (start, end) in enumerate(zip(starts, starts[1:], strict=False))
+    ]
+    partition_of = {name: p.index for p in partitions for name in p.nodes}
+
+    sizes: dict[str, int] = {}
+    for edge in edge_stats:
+        if stage is None or edge.stage == stage:
+            sizes[edge.source] = max(sizes.get(edge.source, 0), edge.max_bytes)
+
+    channels: dict[tuple[str, int], ShmChannel] = {}
+    for conn in graph.connections:
+        src, dst = partition_of[conn.from_node], partition_of[conn.to_node]
+        if src == dst:
+            continue
+        channel = channels.get((conn.source, dst))
+        if channel is None:
+            channel = channels[(conn.source, dst)] = ShmChannel(
+                name=f"{channel_prefix}_{src}_{dst}_{len(channels)}",
+                source=conn.source,
+                targets=[],
+                from_partition=src,
+                to_partition=dst,
+                byte_size=sizes.get(conn.source, 0),
+            )
+            partitions[src].outputs.append(channel.name)
+            partitions[dst].inputs.append(channel.name)
+        channel.targets.append(conn.target)
+    return PartitionPlan(partitions=partitions, channels=list(channels.values()))
+
+
+__all__ = ["PartitionPlan", "PipelinePartition", "ShmChannel", "partition_pipeline"]
@@ -1,8 +1,12 @@
-"""Profiling statistics dataclass for pipeline node runtime profiling."""
+"""Profiling statistics dataclasses for pipeline node and edge runtime profiling."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+import tracemalloc
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from typing import Any
 
 
 @dataclass(frozen=True)
@@ -35,6 +39,18 @@ class NodeProfilingStats:
         Sum of all recorded durations.
     last_ms : float
         Most recently recorded duration.
+    peak_bytes : int | None
+        Largest transient host allocation above the node-entry baseline in any
+        recorded call (``tracemalloc`` peak). ``None`` when memory was not traced.
+    alloc_bytes : int | None
+        Largest net host allocation still held at node exit (typically the
+        node's outputs) in any recorded call. ``None`` when memory was not traced.
+    alloc_count : int | None
+        Largest net number of allocated memory blocks at node exit in any
+        recorded call. ``None`` when memory was not traced.
+    device_peak_bytes : int | None
+        Largest device (e.g. CUDA) peak allocation reported by the runtime for
+        this node. ``None`` when no device probe is available.
     """
 
     node_name: str
@@ -47,3 +63,230 @@ class NodeProfilingStats:
     max_ms: float
     total_ms: float
     last_ms: float
+    peak_bytes: int | None = None
+    alloc_bytes: int | None = None
+    alloc_count: int | None = None
+    device_peak_bytes: int | None = None
+
+
+@dataclass(frozen=True)
+class EdgeProfilingStats:
+    """Immutable snapshot of the data volume moved across one pipeline edge.
+
+    An edge is one :class:`~cuvis_ai_schemas.pipeline.config.ConnectionConfig`,
+    keyed by its ``source`` / ``target`` endpoint strings. Heavy edges are the
+    candidates for fusion, dtype reduction, or co-locating both endpoints.
+
+    Attributes
+    ----------
+    source : str
+        Source endpoint in format ``"node.outputs.port"``.
+    target : str
+        Target endpoint in format ``"node.inputs.port"``.
+    stage : str
+        Canonical lowercase execution stage value from ``ExecutionStage.value``.
+    count : int
+        Number of recorded steps (one per forward pass that fed this edge).
+    total_bytes : int
+        Sum of payload bytes moved across the edge.
+    mean_bytes : float
+        Mean payload bytes per step.
+    max_bytes : int
+        Largest single-step payload in bytes.
+    last_bytes : int
+        Payload bytes of the most recent step.
+    total_tensors : int
+        Sum of array/tensor objects moved across the edge (a variadic or
+        list-valued port moves several per step).
+    last_tensors : int
+        Array/tensor count of the most recent step.
+    """
+
+    source: str
+    target: str
+    stage: str
+    count: int
+    total_bytes: int
+    mean_bytes: float
+    max_bytes: int
+    last_bytes: int
+    total_tensors: int
+    last_tensors: int
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """``(source, target)`` pair identifying the edge within a pipeline."""
+        return self.source, self.target
+
+
+def payload_size(value: Any) -> tuple[int, int]:
+    """Return ``(nbytes, tensor_count)`` for a value flowing across an edge.
+
+    Duck-typed so it needs neither torch nor numpy: anything exposing
+    ``nbytes`` (NumPy arrays, torch tensors) counts as one tensor; lists,
+    tuples, and mapping values are summed recursively; everything else
+    (scalars, strings, metadata objects) counts as zero.
+
+    Parameters
+    ----------
+    value : Any
+        The port payload (tensor, array, list of tensors for variadic ports, ...).
+
+    Returns
+    -------
+    tuple[int, int]
+        Total payload bytes and number of array/tensor objects.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes, 1
+    if isinstance(value, list | tuple):
+        items: Any = value
+    elif isinstance(value, Mapping):
+        items = value.values()
+    else:
+        return 0, 0
+    total_bytes = 0
+    total_tensors = 0
+    for item in items:
+        item_bytes, item_tensors = payload_size(item)
+        total_bytes += item_bytes
+        total_tensors += item_tensors
+    return total_bytes, total_tensors
+
+
+class EdgeTrafficAccumulator:
+    """Mutable per-edge running totals, cheap enough to update on every step.
+
+    The runtime keeps one accumulator per ``(source, target, stage)`` and calls
+    :meth:`record` after each forward pass; :meth:`snapshot` freezes the totals
+    into an :class:`EdgeProfilingStats` for the profiling summary.
+    """
+
+    __slots__ = ("count", "total_bytes", "max_bytes", "last_bytes", "total_tensors", "last_tensors")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_bytes = 0
+        self.max_bytes = 0
+        self.last_bytes = 0
+        self.total_tensors = 0
+        self.last_tensors = 0
+
+    def record(self, nbytes: int, tensors: int = 1) -> None:
+        """Add one step's payload to the running totals.
+
+        Parameters
+        ----------
+        nbytes : int
+            Payload bytes moved across the edge in this step.
+        tensors : int
+            Number of array/tensor objects in the payload.
+        """
+        self.count += 1
+        self.total_bytes += nbytes
+        self.last_bytes = nbytes
+        if nbytes > self.max_bytes:
+            self.max_bytes = nbytes
+        self.total_tensors += tensors
+        self.last_tensors = tensors
+
+    def record_value(self, value: Any) -> None:
+        """Measure ``value`` with :func:`payload_size` and record it."""
+        self.record(*payload_size(value))
+
+    def snapshot(self, source: str, target: str, stage: str) -> EdgeProfilingStats:
+        """Freeze the running totals into an :class:`EdgeProfilingStats`."""
+        return EdgeProfilingStats(
+            source=source,
+            target=target,
+            stage=stage,
+            count=self.count,
+            total_bytes=self.total_bytes,
+            mean_bytes=self.total_bytes / self.count if self.count else 0.0,
+            max_bytes=self.max_bytes,
+            last_bytes=self.last_bytes,
+            total_tensors=self.total_tensors,
+            last_tensors=self.last_tensors,
+        )
+
+
+def _max_or(current: int | None, value: int) -> int:
+    """Return ``value`` when ``current`` is unset, else the larger of the two."""
+    return value if current is None or value > current else current
+
+
+class NodeMemoryAccumulator:
+    """Per-node memory high-water marks, recorded around each node call.
+
+    Host-side numbers come from :mod:`tracemalloc` and only when the runtime
+    has started tracing (``tracemalloc.start()``); otherwise :meth:`start` and
+    :meth:`stop` cost two attribute checks and record nothing. Block counts use
+    :func:`sys.getallocatedblocks`, which is O(1). Device peaks are passed in
+    by the runtime (e.g. ``torch.cuda.max_memory_allocated()``) because this
+    package never imports torch.
+
+    ``tracemalloc`` keeps one process-wide peak, so nodes must be measured one
+    at a time (sequential execution) for the host peaks to be attributable.
+    """
+
+    __slots__ = (
+        "peak_bytes",
+        "alloc_bytes",
+        "alloc_count",
+        "device_peak_bytes",
+        "_start_bytes",
+        "_start_blocks",
+    )
+
+    def __init__(self) -> None:
+        self.peak_bytes: int | None = None
+        self.alloc_bytes: int | None = None
+        self.alloc_count: int | None = None
+        self.device_peak_bytes: int | None = None
+        self._start_bytes: int | None = None
+        self._start_blocks = 0
+
+    def start(self) -> None:
+        """Mark the node-entry baseline (resets the ``tracemalloc`` peak)."""
+        if not tracemalloc.is_tracing():
+            self._start_bytes = None
+            return
+        tracemalloc.reset_peak()
+        self._start_bytes = tracemalloc.get_traced_memory()[0]
+        self._start_blocks = sys.getallocatedblocks()
+
+    def stop(self, device_peak_bytes: int | None = None) -> None:
+        """Record the call that began at the matching :meth:`start`.
+
+        Parameters
+        ----------
+        device_peak_bytes : int | None
+            Device peak allocation for this call, when the runtime can probe it.
+        """
+        if self._start_bytes is not None and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            self.record(
+                peak_bytes=max(peak - self._start_bytes, 0),
+                alloc_bytes=max(current - self._start_bytes, 0),
+                alloc_count=max(sys.getallocatedblocks() - self._start_blocks, 0),
+            )
+            self._start_bytes = None
+        if device_peak_bytes is not None:
+            self.device_peak_bytes = _max_or(self.device_peak_bytes, device_peak_bytes)
+
+    def record(self, peak_bytes: int, alloc_bytes: int, alloc_count: int) -> None:
+        """Fold one externally measured host sample into the high-water marks."""
+        self.peak_bytes = _max_or(self.peak_bytes, peak_bytes)
+        self.alloc_bytes = _max_or(self.alloc_bytes, alloc_bytes)
+        self.alloc_count = _max_or(self.alloc_count, alloc_count)
+
+    def apply(self, stats: NodeProfilingStats) -> NodeProfilingStats:
+        """Return ``stats`` with this accumulator's memory fields filled in."""
+        return replace(
+            stats,
+            peak_bytes=self.peak_bytes,
+            alloc_bytes=self.alloc_bytes,
+            alloc_count=self.alloc_count,
+            device_peak_bytes=self.device_peak_bytes,
+        )
@@ -0,0 +1,413 @@
+"""Compare two profiling snapshots and flag per-node latency regressions.
+
+A snapshot is a list of :class:`~cuvis_ai_schemas.pipeline.profiling.NodeProfilingStats`
+(as returned by ``GetProfilingSummary``). :func:`compare_profiling` aligns a
+baseline and a candidate snapshot by ``(node_name, stage)``, runs a one-sided
+Welch t-test on each pair from the stored mean / std / count, and applies
+:class:`RegressionThresholds` so that only changes that are both statistically
+significant and practically large count. The resulting
+:class:`ProfilingComparison` carries a machine-readable ``verdict`` suitable
+for gating pipeline and plugin upgrades in CI.
+
+Snapshots load from JSON (:func:`load_profiling_snapshot`) or from the proto
+messages (:func:`profiling_snapshot_from_proto`, requires the ``[proto]`` extra).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import Field
+
+from cuvis_ai_schemas.base import BaseSchemaModel
+from cuvis_ai_schemas.pipeline.profiling import NodeProfilingStats
+
+ComparisonStatus = Literal[
+    "regressed", "improved", "unchanged", "insufficient_data", "added", "removed"
+]
+
+_STATS_FIELDS = frozenset(f.name for f in fields(NodeProfilingStats))
+_STAGE_PREFIX = "EXECUTION_STAGE_"
+
+
+class RegressionThresholds(BaseSchemaModel):
+    """Gate thresholds: a change must pass every one to count as a regression."""
+
+    alpha: float = Field(
+        default=0.05,
+        gt=0.0,
+        lt=1.0,
+        description="One-sided significance level of the Welch t-test",
+    )
+    max_relative_increase: float = Field(
+        default=0.10,
+        ge=0.0,
+        description="Tolerated relative increase of the mean latency (0.10 = +10%)",
+    )
+    min_absolute_increase_ms: float = Field(
+        default=0.5,
+        ge=0.0,
+        description="Smallest mean-latency increase in milliseconds worth reporting",
+    )
+    min_count: int = Field(
+        default=5,
+        ge=2,
+        description="Minimum samples on each side; fewer yields 'insufficient_data'",
+    )
+    fail_on_removed: bool = Field(
+        default=False,
+        description="Fail the verdict when a baseline node is missing from the candidate",
+    )
+
+
+class NodeComparison(BaseSchemaModel):
+    """Baseline vs. candidate outcome for one ``(node_name, stage)``."""
+
+    node_name: str = Field(description="Node identifier")
+    stage: str = Field(description="Execution stage value")
+    status: ComparisonStatus = Field(description="Classification of the change")
+    baseline_mean_ms: float | None = Field(default=None, description="Baseline mean latency")
+    candidate_mean_ms: float | None = Field(default=None, description="Candidate mean latency")
+    baseline_count: int = Field(default=0, ge=0, description="Baseline sample count")
+    candidate_count: int = Field(default=0, ge=0, description="Candidate sample count")
+    delta_ms: float | None = Field(default=None, description="Candidate minus baseline mean")
+    relative_change: float | None = Field(
+        default=None, description="delta_ms / baseline_mean_ms (None for a zero baseline)"
+    )
+    t_statistic: float | None = Field(default=None, description="Welch t statistic")
+    p_value: float | None = Field(
+        default=None, description="One-sided p-value in the direction of the change"
+    )
+
+
+class ProfilingComparison(BaseSchemaModel):
+    """Full comparison report with a machine-readable verdict."""
+
+    verdict: Literal["pass", "fail"] = Field(description="'fail' when any node regressed")
+    thresholds: RegressionThresholds = Field(description="Thresholds the report was gated on")
+    nodes: list[NodeComparison] = Field(
+        default_factory=list, description="Per-node outcomes, sorted by (stage, node_name)"
+    )
+
+    @property
+    def passed(self) -> bool:
+        """Whether the candidate passed the gate."""
+        return self.verdict == "pass"
+
+    def with_status(self, *statuses: ComparisonStatus) -> list[NodeComparison]:
+        """Return the node outcomes whose status is one of ``statuses``."""
+        return [node for node in self.nodes if node.status in statuses]
+
+    @property
+    def regressions(self) -> list[NodeComparison]:
+        """Node outcomes classified as ``"regressed"``."""
+        return self.with_status("regressed")
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction for the regularized incomplete beta (modified Lentz)."""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c = 1.0
+    d = 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 301):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-14:
+            break
+    return h
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function ``I_x(a, b)``."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = (
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    )
+    front = math.exp(log_front)
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+def student_t_sf(t: float, df: float) -> float:
+    """Survival function ``P(T > t)`` of Student's t distribution.
+
+    Parameters
+    ----------
+    t : float
+        Test statistic.
+    df : float
+        Degrees of freedom (may be fractional, as in Welch's test).
+
+    Returns
+    -------
+    float
+        Upper-tail probability.
+    """
+    if math.isinf(t):
+        return 0.0 if t > 0 else 1.0
+    tail = 0.5 * _betainc(df / 2.0, 0.5, df / (df + t * t))
+    return tail if t >= 0 else 1.0 - tail
+
+
+def welch_t_test(
+    mean_a: float, std_a: float, count_a: int, mean_b: float, std_b: float, count_b: int
+) -> tuple[float, float]:
+    """One-sided Welch t-test of ``mean_b > mean_a`` from summary statistics.
+
+    ``std_*`` are population standard deviations (as stored on
+    ``NodeProfilingStats``) and are corrected to sample variances here.
+
+    Returns
+    -------
+    tuple[float, float]
+        ``(t, p)`` where ``p`` is ``P(T >= t)`` under equal means; swap the
+        arguments to test for a decrease.
+    """
+    var_a = std_a * std_a * count_a / (count_a - 1)
+    var_b = std_b * std_b * count_b / (count_b - 1)
+    se_a = var_a / count_a
+    se_b = var_b / count_b
+    diff = mean_b - mean_a
+    se = se_a + se_b
+    if se == 0.0:
+        if diff == 0.0:
+            return 0.0, 0.5
+        return math.copysign(math.inf, diff), 0.0 if diff > 0 else 1.0
+    t = diff / math.sqrt(se)
+    df = se * se / (se_a * se_a / (count_a - 1) + se_b * se_b / (count_b - 1))
+    return t, student_t_sf(t, df)
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+
+def _index(snapshot: Iterable[NodeProfilingStats]) -> dict[tuple[str, str], NodeProfilingStats]:
+    """Key a snapshot by ``(node_name, stage)``; duplicate keys are an error."""
+    index: dict[tuple[str, str], NodeProfilingStats] = {}
+    for stats in snapshot:
+        key = (stats.node_name, stats.stage)
+        if key in index:
+            raise ValueError(f"Duplicate profiling entry for node {key[0]!r} stage {key[1]!r}")
+        index[key] = stats
+    return index
+
+
+def _compare_pair(
+    base: NodeProfilingStats, cand: NodeProfilingStats, thresholds: RegressionThresholds
+) -> NodeComparison:
+    """Classify one aligned baseline/candidate pair."""
+    delta = cand.mean_ms - base.mean_ms
+    result = NodeComparison(
+        node_name=base.node_name,
+        stage=base.stage,
+        status="unchanged",
+        baseline_mean_ms=base.mean_ms,
+        candidate_mean_ms=cand.mean_ms,
+        baseline_count=base.count,
+        candidate_count=cand.count,
+        delta_ms=delta,
+        relative_change=delta / base.mean_ms if base.mean_ms > 0 else None,
+    )
+    if min(base.count, cand.count) < max(thresholds.min_count, 2):
+        result.status = "insufficient_data"
+        return result
+
+    if delta >= 0:
+        t, p = welch_t_test(
+            base.mean_ms, base.std_ms, base.count, cand.mean_ms, cand.std_ms, cand.count
+        )
+    else:
+        t, p = welch_t_test(
+            cand.mean_ms, cand.std_ms, cand.count, base.mean_ms, base.std_ms, base.count
+        )
+        t = -t
+    result.t_statistic = t if math.isfinite(t) else None
+    result.p_value = p
+
+    relative = abs(delta) / base.mean_ms if base.mean_ms > 0 else math.inf
+    if (
+        p < thresholds.alpha
+        and abs(delta) >= thresholds.min_absolute_increase_ms
+        and relative > thresholds.max_relative_increase
+    ):
+        result.status = "regressed" if delta > 0 else "improved"
+    return result
+
+
+def compare_profiling(
+    baseline: Iterable[NodeProfilingStats],
+    candidate: Iterable[NodeProfilingStats],
+    thresholds: RegressionThresholds | None = None,
+) -> ProfilingComparison:
+    """Align two snapshots by ``(node_name, stage)`` and gate on regressions.
+
+    Parameters
+    ----------
+    baseline : Iterable[NodeProfilingStats]
+        Reference snapshot (e.g. the currently deployed pipeline/plugin).
+    candidate : Iterable[NodeProfilingStats]
+        Snapshot of the upgrade under test.
+    thresholds : RegressionThresholds | None
+        Gate thresholds; defaults to ``RegressionThresholds()``.
+
+    Returns
+    -------
+    ProfilingComparison
+        Per-node outcomes and a ``"pass"`` / ``"fail"`` verdict. Nodes only in
+        the candidate are ``"added"``; nodes only in the baseline are
+        ``"removed"`` (failing the verdict only with ``fail_on_removed``).
+
+    Raises
+    ------
+    ValueError
+        If either snapshot lists the same ``(node_name, stage)`` twice.
+    """
+    thresholds = thresholds or RegressionThresholds()
+    base_index = _index(baseline)
+    cand_index = _index(candidate)
+
+    nodes: list[NodeComparison] = []
+    for key in sorted(base_index.keys() | cand_index.keys(), key=lambda k: (k[1], k[0])):
+        base = base_index.get(key)
+        cand = cand_index.get(key)
+        if base is not None and cand is not None:
+            nodes.append(_compare_pair(base, cand, thresholds))
+        elif base is not None:
+            nodes.append(
+                NodeComparison(
+                    node_name=key[0],
+                    stage=key[1],
+                    status="removed",
+                    baseline_mean_ms=base.mean_ms,
+                    baseline_count=base.count,
+                )
+            )
+        elif cand is not None:
+            nodes.append(
+                NodeComparison(
+                    node_name=key[0],
+                    stage=key[1],
+                    status="added",
+                    candidate_mean_ms=cand.mean_ms,
+                    candidate_count=cand.count,
+                )
+            )
+
+    failed = any(node.status == "regressed" for node in nodes) or (
+        thresholds.fail_on_removed and any(node.status == "removed" for node in nodes)
+    )
+    return ProfilingComparison(
+        verdict="fail" if failed else "pass", thresholds=thresholds, nodes=nodes
+    )
+
+
+# ---------------------------------------------------------------------------
+# Snapshot loading
+# ---------------------------------------------------------------------------
+
+
+def _snake(name: str) -> str:
+    """Convert a proto-JSON ``lowerCamel`` key to ``snake_case``."""
+    return "".join(f"_{ch.lower()}" if ch.isupper() else ch for ch in name)
+
+
+def _stats_from_mapping(entry: Mapping[str, Any]) -> NodeProfilingStats:
+    """Build stats from a dataclass-style or proto-JSON (``MessageToDict``) mapping."""
+    values = {_snake(key): value for key, value in entry.items()}
+    unknown = values.keys() - _STATS_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown NodeProfilingStats fields: {sorted(unknown)}")
+    stage = str(values.get("stage", "always"))
+    if stage.startswith(_STAGE_PREFIX):
+        stage = stage[len(_STAGE_PREFIX) :].lower()
+        stage = "always" if stage == "unspecified" else stage
+    values["stage"] = stage
+    values.setdefault("node_name", "")
+    for name in ("count", "peak_bytes", "alloc_bytes", "alloc_count", "device_peak_bytes"):
+        if values.get(name) is not None:
+            values[name] = int(values[name])  # proto JSON renders int64 as a string
+    for name in ("mean_ms", "median_ms", "std_ms", "min_ms", "max_ms", "total_ms", "last_ms"):
+        values[name] = float(values.get(name, 0.0))
+    values.setdefault("count", 0)
+    return NodeProfilingStats(**values)
+
+
+def profiling_snapshot_from_data(data: Any) -> list[NodeProfilingStats]:
+    """Build a snapshot from parsed JSON data.
+
+    Accepts a list of stats mappings, or a mapping with a ``node_stats`` /
+    ``nodeStats`` list (the JSON form of ``GetProfilingSummaryResponse``).
+    Keys may be ``snake_case`` or proto-JSON ``lowerCamel``; stages may be
+    ``ExecutionStage`` values or proto enum names.
+
+    Raises
+    ------
+    ValueError
+        If the data has neither shape or contains unknown fields.
+    """
+    if isinstance(data, Mapping):
+        data = data.get("node_stats", data.get("nodeStats"))
+    if not isinstance(data, list):
+        raise ValueError("Expected a list of node stats or a mapping with 'node_stats'")
+    return [_stats_from_mapping(entry) for entry in data]
+
+
+def load_profiling_snapshot(source: str | Path) -> list[NodeProfilingStats]:
+    """Load a snapshot from a JSON file path (see :func:`profiling_snapshot_from_data`)."""
+    return profiling_snapshot_from_data(json.loads(Path(source).read_text(encoding="utf-8")))
+
+
+def profiling_snapshot_from_proto(message: Any) -> list[NodeProfilingStats]:
+    """Build a snapshot from a ``GetProfilingSummaryResponse`` or its ``node_stats``.
+
+    Requires the ``[proto]`` extra.
+    """
+    from cuvis_ai_schemas.grpc.conversions import proto_to_node_profiling_stats
+
+    items = getattr(message, "node_stats", message)
+    return [proto_to_node_profiling_stats(item) for item in items]
+
+
+__all__ = [
+    "ComparisonStatus",
+    "NodeComparison",
+    "ProfilingComparison",
+    "RegressionThresholds",
+    "compare_profiling",
+    "load_profiling_snapshot",
+    "profiling_snapshot_from_data",
+    "profiling_snapshot_from_proto",
+    "student_t_sf",
+    "welch_t_test",
+]
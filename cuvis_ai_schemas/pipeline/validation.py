@@ -0,0 +1,311 @@
+"""Offline whole-pipeline validation against plugin manifests.
+
+:meth:`PortSpec.is_compatible_with <cuvis_ai_schemas.pipeline.ports.PortSpec.is_compatible_with>`
+needs torch and live node instances, so it only runs after a plugin
+environment is built and the pipeline is materialized. :func:`validate_pipeline`
+checks a :class:`~cuvis_ai_schemas.pipeline.config.PipelineConfig` much
+earlier, using only the :class:`~cuvis_ai_schemas.plugin.NodePortSpec` entries
+that plugins declare in their manifests (no plugin imports, no torch). One pass
+collects every problem into a :class:`PipelineValidationReport`:
+
+- node classes no supplied plugin provides, and declared plugins not supplied,
+- duplicate node names, connections to unknown nodes or ports, and cycles,
+- dtype and shape mismatches on each connection,
+- required inputs without an incoming connection,
+- fan-in into a non-variadic input and ``variadic`` on an output.
+
+Wire-spec conventions: an empty ``dtype`` is a generic marker that matches any
+dtype, an empty ``shape`` is unchecked, and ``-1`` dims match any size. Port
+checks go through the memoized
+:mod:`~cuvis_ai_schemas.pipeline.compatibility` engine.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Literal
+
+from pydantic import Field
+
+from cuvis_ai_schemas.base import BaseSchemaModel
+from cuvis_ai_schemas.pipeline.compatibility import MismatchKind, default_engine
+from cuvis_ai_schemas.pipeline.config import ConnectionConfig, PipelineConfig
+from cuvis_ai_schemas.pipeline.exceptions import PipelineCycleError
+from cuvis_ai_schemas.plugin.manifest_capabilities import (
+    NodePortSpec,
+    PluginCapabilities,
+    PluginCapabilityEntry,
+)
+
+IssueCode = Literal[
+    "unknown_node_class",
+    "missing_plugin",
+    "no_port_specs",
+    "duplicate_node",
+    "unknown_node",
+    "unknown_port",
+    "cycle",
+    "dtype_mismatch",
+    "shape_mismatch",
+    "missing_required_input",
+    "fan_in",
+    "variadic_output",
+]
+
+_MISMATCH_CODES: dict[MismatchKind, IssueCode] = {
+    "dtype": "dtype_mismatch",
+    "shape": "shape_mismatch",
+}
+
+
+class ValidationIssue(BaseSchemaModel):
+    """One problem found by :func:`validate_pipeline`."""
+
+    code: IssueCode = Field(description="Machine-readable issue kind")
+    severity: Literal["error", "warning"] = Field(default="error", description="Issue severity")
+    message: str = Field(description="Human-readable explanation")
+    node: str | None = Field(default=None, description="Node the issue is about, if any")
+    port: str | None = Field(default=None, description="Port the issue is about, if any")
+    source: str | None = Field(default=None, description="Connection source endpoint, if any")
+    target: str | None = Field(default=None, description="Connection target endpoint, if any")
+
+
+class PipelineValidationReport(BaseSchemaModel):
+    """All issues found in one validation pass."""
+
+    issues: list[ValidationIssue] = Field(default_factory=list, description="Issues found")
+
+    @property
+    def errors(self) -> list[ValidationIssue]:
+        """Issues with severity ``"error"``."""
+        return [issue for issue in self.issues if issue.severity == "error"]
+
+    @property
+    def warnings(self) -> list[ValidationIssue]:
+        """Issues with severity ``"warning"``."""
+        return [issue for issue in self.issues if issue.severity == "warning"]
+
+    @property
+    def ok(self) -> bool:
+        """Whether no errors were found (warnings allowed)."""
+        return not self.errors
+
+    def by_code(self, code: IssueCode) -> list[ValidationIssue]:
+        """Issues of one kind."""
+        return [issue for issue in self.issues if issue.code == code]
+
+
+def check_port_specs(source: NodePortSpec, target: NodePortSpec) -> tuple[bool, str]:
+    """Torch-free counterpart of ``PortSpec.is_compatible_with`` for wire specs.
+
+    Delegates to the shared, memoized
+    :data:`~cuvis_ai_schemas.pipeline.compatibility.default_engine`.
+
+    Returns
+    -------
+    tuple[bool, str]
+        ``(is_compatible, error_message)``.
+    """
+    return default_engine.check(source, target)
+
+
+def _has_specs(entry: PluginCapabilityEntry) -> bool:
+    """Whether the manifest declares any ports for a node class."""
+    return bool(entry.input_specs or entry.output_specs)
+
+
+def validate_pipeline(
+    config: PipelineConfig,
+    capabilities: Iterable[PluginCapabilities],
+    unconnected_inputs: Literal["error", "warning"] = "warning",
+) -> PipelineValidationReport:
+    """Validate a pipeline's structure and port compatibility from manifests.
+
+    Parameters
+    ----------
+    config : PipelineConfig
+        Pipeline to check.
+    capabilities : Iterable[PluginCapabilities]
+        Capability sets of the plugins the pipeline uses.
+    unconnected_inputs : {"warning", "error"}
+        Severity for required inputs without an incoming connection. They are
+        warnings by default because unconnected inputs become pipeline inputs
+        fed from the batch.
+
+    Returns
+    -------
+    PipelineValidationReport
+        Every issue found; ``report.ok`` is ``True`` when there are no errors.
+    """
+    issues: list[ValidationIssue] = []
+    supplied: set[str] = set()
+    catalog: dict[str, PluginCapabilityEntry] = {}
+    for plugin in capabilities:
+        supplied.add(plugin.plugin_name)
+        for capability in plugin.capabilities:
+            if capability.kind == "node":
+                catalog.setdefault(capability.class_name, capability)
+    for plugin_name in config.plugins or ():
+        if plugin_name not in supplied:
+            issues.append(
+                ValidationIssue(
+                    code="missing_plugin",
+                    severity="warning",
+                    message=f"Declared plugin '{plugin_name}' was not supplied; "
+                    "its nodes cannot be checked",
+                )
+            )
+
+    # Node name -> manifest entry (None: class unknown or declares no ports).
+    specs: dict[str, PluginCapabilityEntry | None] = {}
+    for node in config.nodes:
+        if node.name in specs:
+            issues.append(
+                ValidationIssue(
+                    code="duplicate_node",
+                    message=f"Duplicate node name '{node.name}'",
+                    node=node.name,
+                )
+            )
+            continue
+        entry = catalog.get(node.class_name)
+        if entry is None:
+            issues.append(
+                ValidationIssue(
+                    code="unknown_node_class",
+                    message=f"Node '{node.name}': class '{node.class_name}' is not provided "
+                    "by any supplied plugin",
+                    node=node.name,
+                )
+            )
+        elif not _has_specs(entry):
+            issues.append(
+                ValidationIssue(
+                    code="no_port_specs",
+                    severity="warning",
+                    message=f"Node '{node.name}': manifest declares no ports for "
+                    f"'{node.class_name}'; its connections are not checked",
+                    node=node.name,
+                )
+            )
+            entry = None
+        else:
+            for port, spec in entry.output_specs.items():
+                if spec.variadic:
+                    issues.append(
+                        ValidationIssue(
+                            code="variadic_output",
+                            message=f"Node '{node.name}': output '{port}' is marked variadic; "
+                            "variadic applies to inputs only",
+                            node=node.name,
+                            port=port,
+                        )
+                    )
+        specs[node.name] = entry
+
+    fan_in: dict[tuple[str, str], list[ConnectionConfig]] = {}
+    dangling = False
+    for conn in config.connections:
+        fan_in.setdefault((conn.to_node, conn.to_port), []).append(conn)
+        issue = _check_connection(conn, specs)
+        if issue is not None:
+            dangling = dangling or issue.code == "unknown_node"
+            issues.append(issue)
+
+    for name, entry in specs.items():
+        if entry is None:
+            continue
+        for port, spec in entry.input_specs.items():
+            incoming = fan_in.get((name, port), [])
+            if not incoming and not spec.optional:
+                issues.append(
+                    ValidationIssue(
+                        code="missing_required_input",
+                        severity=unconnected_inputs,
+                        message=f"Node '{name}': required input '{port}' has no incoming "
+                        "connection",
+                        node=name,
+                        port=port,
+                    )
+                )
+            elif len(incoming) > 1 and not spec.variadic:
+                sources = ", ".join(conn.source for conn in incoming)
+                issues.append(
+                    ValidationIssue(
+                        code="fan_in",
+                        message=f"Node '{name}': input '{port}' is not variadic but has "
+                        f"{len(incoming)} incoming connections ({sources})",
+                        node=name,
+                        port=port,
+                    )
+                )
+
+    if not dangling and not any(issue.code == "duplicate_node" for issue in issues):
+        try:
+            _ = config.graph
+        except PipelineCycleError as exc:
+            issues.append(ValidationIssue(code="cycle", message=str(exc), node=exc.cycle[0]))
+
+    return PipelineValidationReport(issues=issues)
+
+
+def _check_connection(
+    conn: ConnectionConfig, specs: dict[str, PluginCapabilityEntry | None]
+) -> ValidationIssue | None:
+    """First problem with one connection, or ``None`` when it checks out."""
+    for role, name in (("source", conn.from_node), ("target", conn.to_node)):
+        if name not in specs:
+            return ValidationIssue(
+                code="unknown_node",
+                message=f"Connection {conn.source} -> {conn.target} references unknown "
+                f"{role} node '{name}'",
+                node=name,
+                source=conn.source,
+                target=conn.target,
+            )
+    source_entry, target_entry = specs[conn.from_node], specs[conn.to_node]
+    source_spec = target_spec = None
+    if source_entry is not None:
+        source_spec = source_entry.output_specs.get(conn.from_port)
+        if source_spec is None:
+            return ValidationIssue(
+                code="unknown_port",
+                message=f"Node '{conn.from_node}' has no output port '{conn.from_port}'",
+                node=conn.from_node,
+                port=conn.from_port,
+                source=conn.source,
+                target=conn.target,
+            )
+    if target_entry is not None:
+        target_spec = target_entry.input_specs.get(conn.to_port)
+        if target_spec is None:
+            return ValidationIssue(
+                code="unknown_port",
+                message=f"Node '{conn.to_node}' has no input port '{conn.to_port}'",
+                node=conn.to_node,
+                port=conn.to_port,
+                source=conn.source,
+                target=conn.target,
+            )
+    if source_spec is None or target_spec is None:
+        return None
+    kind, reason = default_engine.mismatch(source_spec, target_spec)
+    if kind is None:
+        return None
+    return ValidationIssue(
+        code=_MISMATCH_CODES[kind],
+        message=f"{conn.source} -> {conn.target}: {reason}",
+        node=conn.to_node,
+        port=conn.to_port,
+        source=conn.source,
+        target=conn.target,
+    )
+
+
+__all__ = [
+    "IssueCode",
+    "PipelineValidationReport",
+    "ValidationIssue",
+    "check_port_specs",
+    "validate_pipeline",
+]
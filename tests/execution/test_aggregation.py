@@ -0,0 +1,103 @@
+"""Tests for online metric aggregation."""
+
+from __future__ import annotations
+
+import math
+import pickle
+import random
+import statistics
+
+import pytest
+
+from cuvis_ai_schemas.enums import ExecutionStage
+from cuvis_ai_schemas.execution import (
+    ExponentialMovingAverage,
+    Metric,
+    MetricAggregator,
+    MetricSummary,
+    RollingWindow,
+    merge_summaries,
+)
+
+
+def test_rolling_window_matches_brute_force():
+    """Window mean/min/max equal recomputation over the last N samples."""
+    rng = random.Random(3)
+    values = [rng.uniform(-5, 5) for _ in range(200)]
+    window = RollingWindow(7)
+    for i, value in enumerate(values):
+        window.update(value)
+        tail = values[max(0, i - 6) : i + 1]
+        assert len(window) == len(tail)
+        assert window.mean == pytest.approx(sum(tail) / len(tail))
+        assert (window.min, window.max) == (min(tail), max(tail))
+    assert math.isnan(RollingWindow(3).mean)
+    with pytest.raises(ValueError):
+        RollingWindow(0)
+
+
+def test_ema_is_bias_corrected():
+    """A constant series has EMA equal to the constant from the first sample on."""
+    ema = ExponentialMovingAverage(0.1)
+    assert math.isnan(ema.value)
+    for _ in range(3):
+        ema.update(4.0)
+        assert ema.value == pytest.approx(4.0)
+    ema.update(5.0)
+    assert 4.0 < ema.value < 5.0
+    with pytest.raises(ValueError):
+        ExponentialMovingAverage(0.0)
+
+
+def test_summary_merge_equals_single_pass():
+    """Merging split summaries reproduces the statistics of the whole series."""
+    rng = random.Random(0)
+    values = [rng.gauss(1.0, 2.0) for _ in range(101)]
+    whole = MetricSummary()
+    for value in values:
+        whole = whole.update(value)
+    left, right = MetricSummary(), MetricSummary()
+    for value in values[:40]:
+        left = left.update(value)
+    for value in values[40:]:
+        right = right.update(value)
+    merged = left.merge(right)
+    assert merged.count == 101
+    assert merged.mean == pytest.approx(statistics.fmean(values))
+    assert merged.std == pytest.approx(statistics.pstdev(values))
+    assert (merged.min, merged.max, merged.last) == (whole.min, whole.max, values[-1])
+    assert MetricSummary().merge(whole) == whole
+
+
+def test_aggregator_epochs_and_ranks():
+    """Per-epoch summaries merge across ranks and emit one metric per series."""
+    ranks = [MetricAggregator(), MetricAggregator()]
+    for rank, aggregator in enumerate(ranks):
+        for step in range(4):
+            aggregator.update(
+                Metric(name="loss", value=float(rank * 4 + step), stage=ExecutionStage.TRAIN)
+            )
+        aggregator.update(Metric(name="loss", value=9.0, stage=ExecutionStage.VAL))
+    merged = merge_summaries(pickle.loads(pickle.dumps(a.snapshot())) for a in ranks)
+    assert merged[("loss", ExecutionStage.TRAIN, 0)].mean == pytest.approx(3.5)
+
+    ranks[0].merge(ranks[1].snapshot())
+    emitted = ranks[0].emit_epoch(ExecutionStage.TRAIN, 0, field="max", pop=True)
+    assert emitted == [Metric(name="loss", value=7.0, stage=ExecutionStage.TRAIN, epoch=0)]
+    assert ranks[0].summary("loss", ExecutionStage.TRAIN, 0).count == 0
+    assert ranks[0].summary("loss", ExecutionStage.VAL, 0).count == 2
+
+
+def test_aggregator_window_and_ema_emission():
+    """Windowed values are emitted per stage, EMAs under a '/ema' suffix."""
+    aggregator = MetricAggregator(window=2, ema_alpha=0.5)
+    for value in (1.0, 2.0, 6.0):
+        aggregator.update(Metric(name="loss", value=value, stage=ExecutionStage.TRAIN))
+    window = aggregator.window("loss", ExecutionStage.TRAIN)
+    assert window is not None and window.mean == pytest.approx(4.0)
+    emitted = {m.name: m.value for m in aggregator.emit_window(ExecutionStage.TRAIN, batch_idx=3)}
+    assert emitted["loss"] == pytest.approx(4.0)
+    assert emitted["loss/ema"] == pytest.approx(aggregator.ema("loss", ExecutionStage.TRAIN))
+    assert aggregator.emit_window(ExecutionStage.VAL) == []
+    aggregator.reset()
+    assert math.isnan(aggregator.ema("loss", ExecutionStage.TRAIN))
@@ -0,0 +1,141 @@
+"""Tests for worker-pool artifact encoding and downsampling."""
+
+from __future__ import annotations
+
+import struct
+import zlib
+
+import pytest
+from pydantic import ValidationError
+
+from cuvis_ai_schemas.enums import ArtifactType, ExecutionStage
+from cuvis_ai_schemas.execution import (
+    Artifact,
+    ArtifactEncoder,
+    ImageEncodingPolicy,
+)
+from cuvis_ai_schemas.execution.encoding import downsample, encode_artifact, encode_png
+
+np = pytest.importorskip("numpy")
+
+
+def _artifact(value, name: str = "heatmap") -> Artifact:
+    return Artifact(
+        name=name,
+        value=value,
+        el_id=3,
+        desc="d",
+        type=ArtifactType.IMAGE,
+        stage=ExecutionStage.VAL,
+        epoch=2,
+        batch_idx=5,
+    )
+
+
+def _decode_png(data: bytes):
+    """Minimal decoder for the unfiltered 8-bit PNGs the encoder writes."""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    pos, chunks = 8, {}
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos : pos + 4])
+        tag = data[pos + 4 : pos + 8]
+        payload = data[pos + 8 : pos + 8 + length]
+        (crc,) = struct.unpack(">I", data[pos + 8 + length : pos + 12 + length])
+        assert crc == zlib.crc32(tag + payload)
+        chunks[tag] = payload
+        pos += 12 + length
+    width, height, depth, color, *_ = struct.unpack(">IIBBBBB", chunks[b"IHDR"])
+    channels = 1 if color == 0 else 3
+    raw = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8)
+    rows = raw.reshape(height, 1 + width * channels)
+    assert depth == 8 and not rows[:, 0].any()
+    return rows[:, 1:].reshape(height, width, channels)
+
+
+def test_policy_validation():
+    """Policies bound the compression level and format."""
+    assert ImageEncodingPolicy().format == "png"
+    with pytest.raises(ValidationError):
+        ImageEncodingPolicy(quality=10)
+    with pytest.raises(ValidationError):
+        ImageEncodingPolicy(format="jpeg")
+
+
+@pytest.mark.parametrize("channels", [1, 3])
+def test_png_roundtrip(channels):
+    """uint8 pixels survive PNG encoding unchanged."""
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, size=(7, 5, channels), dtype=np.uint8)
+    np.testing.assert_array_equal(_decode_png(encode_png(pixels)), pixels)
+
+
+def test_png_float_scaling():
+    """Float heatmaps map [0, 1] to [0, 255], clipping outliers and NaN."""
+    value = np.array([[[0.0], [1.0], [0.5], [2.0], [np.nan]]])
+    np.testing.assert_array_equal(_decode_png(encode_png(value)).ravel(), [0, 255, 128, 255, 0])
+
+
+def test_downsample_area_mean():
+    """Longest side is capped with an integer block mean; dtype is preserved."""
+    value = np.arange(16, dtype=np.float32).reshape(4, 4, 1)
+    small = downsample(value, 2)
+    assert small.shape == (2, 2, 1) and small.dtype == np.float32
+    np.testing.assert_allclose(small[..., 0], [[2.5, 4.5], [10.5, 12.5]])
+    assert downsample(value, 8) is value
+    assert downsample(value, None) is value
+    ints = downsample(np.full((10, 3, 3), 7, dtype=np.uint8), 4)
+    assert ints.shape == (3, 1, 3) and ints.dtype == np.uint8 and (ints == 7).all()
+
+
+def test_encode_artifact_metadata_and_npy():
+    """Encoded artifacts keep metadata and record both shapes."""
+    value = np.random.default_rng(1).random((64, 32, 3))
+    encoded = encode_artifact(
+        _artifact(value), ImageEncodingPolicy(max_resolution=16, format="npy")
+    )
+    assert (encoded.name, encoded.el_id, encoded.stage, encoded.epoch, encoded.batch_idx) == (
+        "heatmap",
+        3,
+        ExecutionStage.VAL,
+        2,
+        5,
+    )
+    assert encoded.source_shape == (64, 32, 3)
+    assert encoded.shape == (16, 8, 3)
+    assert encoded.media_type == "application/x-npy"
+    import io
+
+    restored = np.load(io.BytesIO(encoded.data))
+    assert restored.dtype == np.float64 and restored.shape == (16, 8, 3)
+
+
+@pytest.mark.parametrize("shape", [(4, 4), (4, 4, 2), (0, 4, 1), (2, 4, 4, 3)])
+def test_shape_validated_on_calling_thread(shape):
+    """Bad shapes raise from submit() before any work is scheduled."""
+    with ArtifactEncoder(max_workers=1) as encoder, pytest.raises(ValueError, match="shape"):
+        encoder.submit(_artifact(np.zeros(shape)))
+
+
+def test_pool_encodes_in_order():
+    """encode_many returns results in input order with the type's policy applied."""
+    artifacts = [_artifact(np.full((40, 20, 1), i / 10), name=f"a{i}") for i in range(6)]
+    policies = {ArtifactType.IMAGE: ImageEncodingPolicy(max_resolution=10)}
+    with ArtifactEncoder(policies, max_workers=3) as encoder:
+        encoded = encoder.encode_many(artifacts)
+    assert [e.name for e in encoded] == [f"a{i}" for i in range(6)]
+    assert all(e.shape == (10, 5, 1) and e.media_type == "image/png" for e in encoded)
+    assert _decode_png(encoded[5].data)[0, 0, 0] == 128
+
+
+def test_missing_policy():
+    """An encoder without a policy for the type refuses the artifact."""
+    with ArtifactEncoder(policies={}, max_workers=1) as encoder, pytest.raises(KeyError):
+        encoder.submit(_artifact(np.zeros((2, 2, 1))))
+
+
+def test_process_pool():
+    """The process pool produces the same encoding as inline encoding."""
+    value = np.random.default_rng(2).random((8, 8, 3))
+    with ArtifactEncoder(max_workers=1, executor="process") as encoder:
+        pooled = encoder.submit(_artifact(value)).result(timeout=60)
+    assert pooled == encode_artifact(_artifact(value), ImageEncodingPolicy())
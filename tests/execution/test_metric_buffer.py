@@ -0,0 +1,143 @@
+"""Tests for the columnar MetricBuffer."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+
+import pytest
+
+from cuvis_ai_schemas.enums import ExecutionStage
+from cuvis_ai_schemas.execution import Metric, MetricBuffer
+
+
+def _filled() -> MetricBuffer:
+    buffer = MetricBuffer()
+    step = 0
+    for epoch in range(3):
+        for batch in range(4):
+            buffer.append("loss", float(epoch * 10 + batch), step, epoch, ExecutionStage.TRAIN)
+            buffer.append("acc", 0.5, step, epoch, ExecutionStage.TRAIN)
+            step += 1
+        buffer.append("loss", 100.0 + epoch, step, epoch, ExecutionStage.VAL)
+    return buffer
+
+
+def test_append_interns_names_and_counts_bytes():
+    """Names are stored once; each sample costs a fixed number of column bytes."""
+    buffer = MetricBuffer()
+    buffer.append("loss", 1.0, step=0)
+    buffer.add(Metric(name="loss", value=0.5, stage=ExecutionStage.TRAIN, epoch=1, batch_idx=7))
+    buffer.extend([Metric(name="acc", value=0.9)])
+    assert len(buffer) == 3
+    assert buffer.names == ("loss", "acc")
+    assert buffer.nbytes == 3 * (4 + 8 + 8 + 8 + 1)
+    assert list(buffer.iter_rows()) == [
+        ("loss", 1.0, 0, 0, "inference"),
+        ("loss", 0.5, 7, 1, "train"),
+        ("acc", 0.9, 0, 0, "inference"),
+    ]
+
+
+def test_no_per_sample_python_objects():
+    """Column storage does not grow the set of GC-tracked objects."""
+    import gc
+
+    buffer = MetricBuffer()
+    buffer.append("loss", 0.0, 0)
+    gc.collect()
+    before = len(gc.get_objects())
+    for step in range(20_000):
+        buffer.append("loss", float(step), step)
+    gc.collect()
+    assert len(gc.get_objects()) - before < 100
+
+
+def test_clear():
+    """clear() drops samples and the name table."""
+    buffer = _filled()
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.names == ()
+
+
+def test_reduce_by_epoch():
+    """Per-epoch reductions are computed for the selected name and stage."""
+    np = pytest.importorskip("numpy")
+    result = _filled().reduce_by_epoch("loss", ExecutionStage.TRAIN)
+    np.testing.assert_array_equal(result["epoch"], [0, 1, 2])
+    np.testing.assert_array_equal(result["count"], [4, 4, 4])
+    np.testing.assert_allclose(result["mean"], [1.5, 11.5, 21.5])
+    np.testing.assert_allclose(result["min"], [0.0, 10.0, 20.0])
+    np.testing.assert_allclose(result["max"], [3.0, 13.0, 23.0])
+    np.testing.assert_allclose(result["last"], [3.0, 13.0, 23.0])
+
+    pooled = _filled().reduce_by_epoch("loss")
+    np.testing.assert_array_equal(pooled["count"], [5, 5, 5])
+    np.testing.assert_allclose(pooled["last"], [100.0, 101.0, 102.0])
+
+
+def test_reduce_unknown_name_is_empty():
+    """Unknown names reduce to empty arrays rather than raising."""
+    pytest.importorskip("numpy")
+    result = _filled().reduce_by_epoch("missing")
+    assert all(len(values) == 0 for values in result.values())
+    assert len(MetricBuffer().reduce_by_epoch("loss")["epoch"]) == 0
+
+
+def test_series_and_columns_do_not_pin_buffer():
+    """Returned arrays are copies, so the buffer keeps growing afterwards."""
+    np = pytest.importorskip("numpy")
+    buffer = _filled()
+    steps, values = buffer.series("loss", ExecutionStage.VAL)
+    cols = buffer.columns()
+    np.testing.assert_array_equal(values, [100.0, 101.0, 102.0])
+    assert steps.tolist() == [4, 8, 12]
+    assert cols["value"].shape == (len(buffer),)
+    buffer.append("loss", 0.0, 99)
+    assert len(buffer) == 28
+
+
+def test_ndjson_and_csv_export(tmp_path):
+    """Bulk exports write one row per sample in append order."""
+    buffer = _filled()
+    ndjson = tmp_path / "metrics.ndjson"
+    buffer.to_ndjson(ndjson)
+    rows = [json.loads(line) for line in ndjson.read_text().splitlines()]
+    assert len(rows) == len(buffer)
+    assert rows[0] == {"name": "loss", "value": 0.0, "step": 0, "epoch": 0, "stage": "train"}
+
+    stream = io.StringIO()
+    buffer.to_csv(stream)
+    table = list(csv.reader(io.StringIO(stream.getvalue())))
+    assert table[0] == ["name", "value", "step", "epoch", "stage"]
+    assert table[-1] == ["loss", "102.0", "12", "2", "val"]
+    assert len(table) == len(buffer) + 1
+
+
+def test_ndjson_writes_non_finite_values_as_null():
+    """NaN and infinite samples export as ``null`` instead of bare JSON tokens."""
+    buffer = MetricBuffer()
+    buffer.append("loss", float("nan"), 0)
+    buffer.append("loss", float("inf"), 1)
+    buffer.append("loss", 0.5, 2)
+    stream = io.StringIO()
+    buffer.to_ndjson(stream)
+    lines = stream.getvalue().splitlines()
+    assert "NaN" not in stream.getvalue() and "Infinity" not in stream.getvalue()
+    values = [json.loads(line, parse_constant=pytest.fail)["value"] for line in lines]
+    assert values == [None, None, 0.5]
+
+
+def test_parquet_export(tmp_path):
+    """Parquet export round-trips with dictionary-encoded name/stage columns."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    buffer = _filled()
+    path = tmp_path / "metrics.parquet"
+    buffer.to_parquet(path)
+    table = pq.read_table(path).to_pydict()
+    assert table["name"][:2] == ["loss", "acc"]
+    assert table["stage"][-1] == "val"
+    assert table["step"] == [row[2] for row in buffer.iter_rows()]
+    buffer.append("loss", 0.0, 99)  # the export released its buffer views
@@ -0,0 +1,166 @@
+"""Tests for the OpenMetrics exposition renderer."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from cuvis_ai_schemas.enums import ExecutionStage
+from cuvis_ai_schemas.execution import (
+    OPENMETRICS_CONTENT_TYPE,
+    Metric,
+    OpenMetricsRenderer,
+    render_openmetrics,
+)
+from cuvis_ai_schemas.pipeline import EdgeProfilingStats, NodeProfilingStats
+
+
+def _node(name: str = "Normalizer", stage: str = "inference", **overrides) -> NodeProfilingStats:
+    fields: dict[str, Any] = {
+        "node_name": name,
+        "stage": stage,
+        "count": 4,
+        "mean_ms": 2.0,
+        "median_ms": 1.5,
+        "std_ms": 0.5,
+        "min_ms": 1.0,
+        "max_ms": 3.0,
+        "total_ms": 8.0,
+        "last_ms": 2.5,
+    }
+    fields.update(overrides)
+    return NodeProfilingStats(**fields)
+
+
+def _sample_lines(text: str) -> list[str]:
+    return [line for line in text.splitlines() if line and not line.startswith("#")]
+
+
+def test_empty_exposition_is_just_eof():
+    """With nothing recorded the exposition is the terminator alone."""
+    assert render_openmetrics() == "# EOF\n"
+    assert OPENMETRICS_CONTENT_TYPE.startswith("application/openmetrics-text")
+
+
+def test_node_stats_render_summary_and_gauges():
+    """Node stats become a seconds summary plus per-statistic gauges."""
+    text = render_openmetrics(node_stats=[_node()], session="s1")
+    labels = '{node="Normalizer",stage="inference",session="s1"}'
+    assert "# TYPE cuvis_ai_node_duration_seconds summary" in text
+    assert "# UNIT cuvis_ai_node_duration_seconds seconds" in text
+    assert (
+        'cuvis_ai_node_duration_seconds{node="Normalizer",stage="inference",session="s1",'
+        'quantile="0.5"} 0.0015' in text
+    )
+    assert f"cuvis_ai_node_duration_seconds_sum{labels} 0.008" in text
+    assert f"cuvis_ai_node_duration_seconds_count{labels} 4" in text
+    assert f"cuvis_ai_node_duration_mean_seconds{labels} 0.002" in text
+    assert f"cuvis_ai_node_duration_last_seconds{labels} 0.0025" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_memory_families_only_when_traced():
+    """Memory gauges are emitted only for nodes with memory fields set."""
+    text = render_openmetrics(node_stats=[_node()])
+    assert "cuvis_ai_node_peak_bytes" not in text
+
+    traced = render_openmetrics(
+        node_stats=[_node(), _node("Decoder", peak_bytes=2048, alloc_bytes=512, alloc_count=3)]
+    )
+    assert 'cuvis_ai_node_peak_bytes{node="Decoder",stage="inference"} 2048' in traced
+    assert 'cuvis_ai_node_alloc_blocks{node="Decoder",stage="inference"} 3' in traced
+    assert 'cuvis_ai_node_peak_bytes{node="Normalizer"' not in traced
+    assert "cuvis_ai_node_device_peak_bytes" not in traced
+
+
+def test_families_are_contiguous():
+    """Every sample of a family follows its own metadata block."""
+    text = render_openmetrics(
+        node_stats=[_node("A"), _node("B"), _node("A", stage="train")],
+        metrics=[Metric(name="loss", value=0.5, stage=ExecutionStage.TRAIN)],
+    )
+    seen: list[str] = []
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            family = line.split()[2]
+            assert family not in seen
+            seen.append(family)
+        elif not line.startswith("#"):
+            assert line.startswith(seen[-1])
+
+
+def test_metric_stream_keeps_latest_value_per_series():
+    """The last Metric per (name, stage) wins, with the name carried as a label."""
+    metrics = [
+        Metric(name="loss/train", value=1.0, stage=ExecutionStage.TRAIN),
+        Metric(name="loss/train", value=0.25, stage=ExecutionStage.TRAIN),
+        Metric(name="loss/train", value=0.5, stage=ExecutionStage.VAL),
+    ]
+    lines = _sample_lines(render_openmetrics(metrics=metrics, session="s"))
+    assert lines == [
+        'cuvis_ai_metric{name="loss/train",stage="train",session="s"} 0.25',
+        'cuvis_ai_metric{name="loss/train",stage="val",session="s"} 0.5',
+    ]
+
+
+def test_edge_stats_render_counters():
+    """Edge stats become ``_total`` counters labelled by source and target."""
+    edge = EdgeProfilingStats(
+        source="a.outputs.x",
+        target="b.inputs.y",
+        stage="inference",
+        count=2,
+        total_bytes=64,
+        mean_bytes=32.0,
+        max_bytes=40,
+        last_bytes=24,
+        total_tensors=2,
+        last_tensors=1,
+    )
+    text = render_openmetrics(edge_stats=[edge])
+    assert "# TYPE cuvis_ai_edge_transfer_bytes counter" in text
+    assert (
+        'cuvis_ai_edge_transfer_bytes_total{source="a.outputs.x",target="b.inputs.y",'
+        'stage="inference"} 64' in text
+    )
+    assert "cuvis_ai_edge_steps_total" in text
+
+
+def test_label_values_are_escaped():
+    """Backslashes, quotes, and newlines in label values are escaped."""
+    text = render_openmetrics(metrics=[Metric(name='a"b\\c\nd', value=1.0)])
+    assert 'name="a\\"b\\\\c\\nd"' in text
+
+
+def test_non_finite_values():
+    """NaN and infinities use the OpenMetrics spellings."""
+    lines = _sample_lines(
+        render_openmetrics(
+            metrics=[
+                Metric(name="nan", value=float("nan")),
+                Metric(name="inf", value=float("inf")),
+                Metric(name="ninf", value=float("-inf")),
+            ]
+        )
+    )
+    assert [line.rsplit(" ", 1)[1] for line in lines] == ["NaN", "+Inf", "-Inf"]
+
+
+def test_incremental_renderer_reuses_label_strings():
+    """Updating an existing series swaps the value but keeps the cached labels."""
+    renderer = OpenMetricsRenderer(session="s")
+    renderer.update_node_stats([_node()])
+    renderer.observe([Metric(name="loss", value=1.0)])
+    node_labels = renderer._nodes[("Normalizer", "inference")][0]
+    metric_labels = renderer._metrics[("loss", "inference")][0]
+
+    renderer.update_node_stats([_node(count=9, last_ms=4.0)])
+    renderer.observe([Metric(name="loss", value=0.5)])
+    assert renderer._nodes[("Normalizer", "inference")][0] is node_labels
+    assert renderer._metrics[("loss", "inference")][0] is metric_labels
+
+    text = renderer.render()
+    assert f"cuvis_ai_node_duration_seconds_count{node_labels} 9" in text
+    assert f"cuvis_ai_metric{metric_labels} 0.5" in text
+
+    renderer.clear()
+    assert renderer.render() == "# EOF\n"
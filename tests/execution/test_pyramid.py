@@ -0,0 +1,82 @@
+"""Tests for tiled artifact pyramids."""
+
+from __future__ import annotations
+
+import pytest
+
+from cuvis_ai_schemas.enums import ArtifactType
+from cuvis_ai_schemas.execution import (
+    Artifact,
+    ArtifactPyramidReader,
+    PyramidIndex,
+    write_artifact_pyramid,
+    write_pyramid,
+)
+from cuvis_ai_schemas.execution.pyramid import pyramid_index_path
+
+np = pytest.importorskip("numpy")
+
+
+def _image(height: int = 300, width: int = 200, channels: int = 3):
+    return np.random.default_rng(0).random((height, width, channels)).astype(np.float32)
+
+
+def test_levels_halve_until_single_tile(tmp_path):
+    """Level geometry halves (rounding up) and the index sidecar round-trips."""
+    index = write_pyramid(_image(), tmp_path / "map.pyr", tile_size=64, name="heatmap")
+    shapes = [(level.height, level.width, level.rows, level.cols) for level in index.levels]
+    assert shapes == [(300, 200, 5, 4), (150, 100, 3, 2), (75, 50, 2, 1), (38, 25, 1, 1)]
+    assert (tmp_path / "map.pyr").stat().st_size == sum(
+        level.rows * level.cols for level in index.levels
+    ) * index.tile_nbytes
+    stored = PyramidIndex.from_json(pyramid_index_path(tmp_path / "map.pyr").read_text())
+    assert stored == index and stored.name == "heatmap"
+
+
+def test_tiles_and_regions_match_source(tmp_path):
+    """Level 0 tiles and regions reproduce the source pixels exactly."""
+    value = _image()
+    path = tmp_path / "map.pyr"
+    write_pyramid(value, path, tile_size=64)
+    with ArtifactPyramidReader(path) as pyramid:
+        np.testing.assert_array_equal(pyramid.tile(0, 1, 2), value[64:128, 128:192])
+        edge = pyramid.tile(0, 4, 3)
+        assert edge.shape == (300 - 256, 200 - 192, 3)
+        np.testing.assert_array_equal(edge, value[256:, 192:])
+        assert pyramid.tiles_for_region(0, 60, 60, 10, 10) == [(0, 0), (0, 1), (1, 0), (1, 1)]
+        np.testing.assert_array_equal(
+            pyramid.read_region(0, 60, 50, 100, 90), value[60:160, 50:140]
+        )
+        np.testing.assert_array_equal(pyramid.read_level(0), value)
+        with pytest.raises(IndexError):
+            pyramid.tile(0, 5, 0)
+
+
+def test_coarser_levels_are_area_means(tmp_path):
+    """Each level is the 2x2 mean of the one before it."""
+    value = np.arange(8 * 8, dtype=np.float64).reshape(8, 8, 1)
+    with ArtifactPyramidReader(
+        tmp_path / "m.pyr", write_pyramid(value, tmp_path / "m.pyr", 4)
+    ) as p:
+        expected = value.reshape(4, 2, 4, 2, 1).mean(axis=(1, 3))
+        np.testing.assert_allclose(p.read_level(1), expected)
+        assert p.num_levels == 2
+
+
+def test_level_for_and_thumbnail(tmp_path):
+    """Thumbnails come from the coarsest sufficient level, not full resolution."""
+    artifact = Artifact(
+        name="heatmap", value=_image(1000, 600, 1), el_id=0, desc="", type=ArtifactType.IMAGE
+    )
+    write_artifact_pyramid(artifact, tmp_path / "a.pyr", tile_size=128)
+    with ArtifactPyramidReader(tmp_path / "a.pyr") as pyramid:
+        assert pyramid.level_shape(pyramid.level_for(200)) == (250, 150, 1)
+        assert pyramid.level_for(5000) == 0
+        thumb = pyramid.thumbnail(100)
+        assert max(thumb.shape[:2]) <= 100 and thumb.dtype == np.float32
+
+
+def test_rejects_non_image_arrays(tmp_path):
+    """Sources must be non-empty (H, W, C) arrays."""
+    with pytest.raises(ValueError, match="H, W, C"):
+        write_pyramid(np.zeros((4, 4)), tmp_path / "x.pyr")
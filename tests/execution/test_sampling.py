@@ -0,0 +1,108 @@
+"""Tests for artifact sampling policies and the sampler."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from cuvis_ai_schemas.enums import ArtifactType, ExecutionStage
+from cuvis_ai_schemas.execution import (
+    Artifact,
+    ArtifactSampler,
+    ArtifactSamplingPolicy,
+    ArtifactSamplingRule,
+)
+
+VAL = ExecutionStage.VAL
+TRAIN = ExecutionStage.TRAIN
+
+
+def _sampler(*rules: ArtifactSamplingRule, **policy) -> ArtifactSampler:
+    return ArtifactSampler(ArtifactSamplingPolicy(rules=list(rules), **policy))
+
+
+def test_default_keeps_everything():
+    """Without rules every artifact is kept."""
+    sampler = ArtifactSampler()
+    assert all(sampler.should_log("x", TRAIN, 0, step) for step in range(5))
+
+
+def test_policy_roundtrips_yaml_shape():
+    """The policy is a plain schema that loads from dict/JSON."""
+    policy = ArtifactSamplingPolicy.from_dict(
+        {
+            "rules": [{"pattern": "heatmap*", "every_n_steps": 5, "stages": ["val"]}],
+            "default": "drop",
+            "stage_budgets": {"train": 10},
+        }
+    )
+    assert policy.rules[0].stages == [VAL]
+    assert policy.stage_budgets == {TRAIN: 10}
+    assert ArtifactSamplingPolicy.from_json(policy.to_json()) == policy
+    with pytest.raises(ValidationError):
+        ArtifactSamplingRule(every_n_steps=0)
+
+
+def test_every_n_steps():
+    """Only batches whose index is a multiple of N pass."""
+    sampler = _sampler(ArtifactSamplingRule(pattern="heatmap*", every_n_steps=3))
+    assert [s for s in range(10) if sampler.should_log("heatmap_a", VAL, 0, s)] == [0, 3, 6, 9]
+    assert all(sampler.should_log("mask", VAL, 0, s) for s in range(10))
+
+
+def test_first_match_wins_and_stage_scoping():
+    """Rules are tried in order and may be restricted to stages."""
+    sampler = _sampler(
+        ArtifactSamplingRule(pattern="debug_*", drop=True),
+        ArtifactSamplingRule(stages=[TRAIN], max_elements=1),
+        default="drop",
+    )
+    assert not sampler.should_log("debug_x", TRAIN, 0, 0)
+    assert sampler.should_log("img", TRAIN, 0, 0, el_id=0)
+    assert not sampler.should_log("img", TRAIN, 0, 0, el_id=1)
+    assert not sampler.should_log("img", VAL, 0, 0)  # no rule matches -> default drop
+
+
+def test_stage_budget_per_epoch():
+    """A stage budget caps kept artifacts per (stage, epoch)."""
+    sampler = _sampler(stage_budgets={VAL: 2})
+    assert [sampler.should_log("a", VAL, 0, s) for s in range(4)] == [True, True, False, False]
+    assert sampler.remaining_budget(VAL, 0) == 0
+    assert sampler.should_log("a", VAL, 1, 0)
+    assert sampler.remaining_budget(TRAIN, 0) is None
+    sampler.reset()
+    assert sampler.remaining_budget(VAL, 0) == 2
+
+
+def test_select_top_k_by_score():
+    """select() keeps the highest-scoring elements, returned by el_id."""
+    sampler = _sampler(ArtifactSamplingRule(top_k=2))
+    assert sampler.select("heatmap", VAL, 0, 0, [0.1, 0.9, 0.3, 0.8]) == [1, 3]
+
+
+def test_select_combines_limits_and_budget():
+    """First-K narrows candidates, top-K ranks them, the budget takes the best."""
+    sampler = _sampler(
+        ArtifactSamplingRule(max_elements=3, top_k=2, every_n_steps=2), stage_budgets={VAL: 3}
+    )
+    assert sampler.select("h", VAL, 0, 1, [1.0, 2.0, 3.0]) == []  # odd step
+    assert sampler.select("h", VAL, 0, 0, [0.5, 0.1, 0.7, 0.99]) == [0, 2]  # el 3 beyond K
+    assert sampler.select("h", VAL, 0, 2, [0.2, 0.9, 0.1]) == [1]  # budget leaves one slot
+    assert sampler.select("h", VAL, 0, 4, 8) == []
+
+
+def test_select_with_batch_size_only():
+    """Without scores select() keeps the first elements."""
+    sampler = _sampler(ArtifactSamplingRule(top_k=3))
+    assert sampler.select("h", TRAIN, 0, 0, 5) == [0, 1, 2]
+
+
+def test_filter_existing_artifacts():
+    """filter() applies the metadata decision to built artifacts."""
+    np = pytest.importorskip("numpy")
+    sampler = _sampler(ArtifactSamplingRule(max_elements=1))
+    artifacts = [
+        Artifact(name="img", value=np.zeros((2, 2, 1)), el_id=i, desc="", type=ArtifactType.IMAGE)
+        for i in range(3)
+    ]
+    assert [a.el_id for a in sampler.filter(artifacts)] == [0]
@@ -0,0 +1,130 @@
+"""Tests for the shared-memory artifact ring."""
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+
+import pytest
+
+from cuvis_ai_schemas.enums import ArtifactType, ExecutionStage
+from cuvis_ai_schemas.execution import (
+    Artifact,
+    ArtifactDescriptor,
+    ArtifactRingReader,
+    ArtifactRingWriter,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def _artifact(value, el_id: int = 0) -> Artifact:
+    return Artifact(
+        name="heatmap",
+        value=value,
+        el_id=el_id,
+        desc="d",
+        type=ArtifactType.IMAGE,
+        stage=ExecutionStage.VAL,
+        epoch=1,
+        batch_idx=4,
+    )
+
+
+def test_roundtrip_through_ring():
+    """Arrays and metadata survive the hand-off; descriptors stay small."""
+    value = np.random.default_rng(0).random((32, 16, 3)).astype(np.float32)
+    with ArtifactRingWriter(slot_size=value.nbytes, num_slots=2) as writer:
+        descriptor = writer.write(_artifact(value, el_id=7))
+        assert descriptor is not None and descriptor.inline is None
+        assert descriptor.byte_size == value.nbytes
+        assert len(pickle.dumps(descriptor)) < 1024
+        with ArtifactRingReader(writer.name) as reader:
+            restored = reader.read(pickle.loads(pickle.dumps(descriptor)))
+    np.testing.assert_array_equal(restored.value, value)
+    assert (restored.name, restored.el_id, restored.stage, restored.epoch, restored.batch_idx) == (
+        "heatmap",
+        7,
+        ExecutionStage.VAL,
+        1,
+        4,
+    )
+
+
+def test_full_ring_waits_for_release():
+    """Slots are reused only after the reader releases them."""
+    value = np.zeros((4, 4, 1), dtype=np.uint8)
+    with ArtifactRingWriter(slot_size=64, num_slots=2) as writer:
+        reader = ArtifactRingReader(writer.name)
+        first = writer.write(_artifact(value))
+        second = writer.write(_artifact(value + 1))
+        assert first is not None and second is not None
+        assert writer.write(_artifact(value + 2)) is None  # ring full, no wait
+        view = reader.read(first, copy=False)
+        assert not view.value.flags.writeable
+        with pytest.raises(ValueError, match="read-only"):
+            view.value[0, 0, 0] = 7
+        del view
+        reader.release(first)
+        third = writer.write(_artifact(value + 2))
+        assert third is not None and third.byte_offset == first.byte_offset
+        with pytest.raises(RuntimeError, match="overwritten"):
+            reader.read(first)
+        assert int(reader.read(second).value[0, 0, 0]) == 1
+        assert int(reader.read(third).value[0, 0, 0]) == 2
+        reader.close()
+
+
+def test_oversized_array_goes_inline():
+    """Arrays larger than a slot travel inline, like Tensor.raw_data."""
+    value = np.arange(100, dtype=np.int64).reshape(10, 10, 1)
+    with ArtifactRingWriter(slot_size=64, num_slots=1) as writer:
+        descriptor = writer.write(_artifact(value))
+        assert isinstance(descriptor, ArtifactDescriptor)
+        assert descriptor.inline is not None and descriptor.seq == 0
+        with ArtifactRingReader(writer.name) as reader:
+            np.testing.assert_array_equal(reader.read(descriptor).value, value)
+
+
+def test_reader_rejects_foreign_segment():
+    """Attaching to a segment without the ring header fails clearly."""
+    from multiprocessing import shared_memory
+
+    segment = shared_memory.SharedMemory(create=True, size=128)
+    try:
+        with pytest.raises(ValueError, match="not an artifact ring"):
+            ArtifactRingReader(segment.name)
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def _logger_process(ring_name, queue, results):
+    reader = ArtifactRingReader(ring_name)
+    while (descriptor := queue.get()) is not None:
+        artifact = reader.read(descriptor)
+        results.put((artifact.el_id, float(artifact.value.sum())))
+    reader.close()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs the fork start method"
+)
+def test_cross_process_handoff():
+    """A separate logger process consumes descriptors and frees the slots."""
+    ctx = multiprocessing.get_context("fork")
+    queue, results = ctx.Queue(), ctx.Queue()
+    with ArtifactRingWriter(slot_size=8 * 8 * 8, num_slots=2) as writer:
+        process = ctx.Process(target=_logger_process, args=(writer.name, queue, results))
+        process.start()
+        for el_id in range(6):
+            descriptor = writer.write(
+                _artifact(np.full((8, 8, 1), el_id, np.float64), el_id=el_id), timeout=10
+            )
+            assert descriptor is not None
+            queue.put(descriptor)
+        queue.put(None)
+        received = sorted(results.get(timeout=10) for _ in range(6))
+        process.join(10)
+    assert received == [(i, 64.0 * i) for i in range(6)]
+    assert process.exitcode == 0
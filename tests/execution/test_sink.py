@@ -0,0 +1,167 @@
+"""Tests for the asynchronous batched Artifact/Metric sink."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+from pydantic import ValidationError
+
+from cuvis_ai_schemas.enums import ExecutionStage
+from cuvis_ai_schemas.execution import AsyncRecordSink, Metric, SinkConfig
+
+
+class _GatedWriter:
+    """Writer that blocks until released, recording every batch."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[Metric]] = []
+        self.release = threading.Event()
+        self.entered = threading.Event()
+
+    def __call__(self, batch):
+        self.entered.set()
+        self.release.wait(5)
+        self.batches.append(list(batch))
+
+    @property
+    def values(self) -> list[float]:
+        return [m.value for batch in self.batches for m in batch]
+
+
+def _metric(value: float, epoch: int = 0, stage: ExecutionStage = ExecutionStage.TRAIN) -> Metric:
+    return Metric(name="loss", value=value, stage=stage, epoch=epoch)
+
+
+def test_config_validation():
+    """Sink settings are validated like any other schema."""
+    assert SinkConfig().backpressure == "block"
+    with pytest.raises(ValidationError):
+        SinkConfig(backpressure="spill")
+    with pytest.raises(ValidationError):
+        SinkConfig(batch_size=0)
+
+
+def test_batches_by_size_and_flush():
+    """Records arrive in order, in batches of at most batch_size."""
+    batches: list[list[Metric]] = []
+    with AsyncRecordSink(batches.append, SinkConfig(batch_size=4)) as sink:
+        for i in range(10):
+            assert sink.submit(_metric(float(i)))
+        assert sink.flush(timeout=5)
+        assert [m.value for b in batches for m in b] == [float(i) for i in range(10)]
+        assert all(len(b) <= 4 for b in batches)
+        stats = sink.stats
+    assert (stats.submitted, stats.written, stats.dropped, stats.queued) == (10, 10, 0, 0)
+
+
+def test_batches_never_span_epoch_boundaries():
+    """A change of (stage, epoch) cuts the current batch."""
+    writer = _GatedWriter()
+    writer.release.set()
+    sink = AsyncRecordSink(writer, SinkConfig(batch_size=100, flush_interval_s=5.0))
+    records = [
+        _metric(0, epoch=0),
+        _metric(1, epoch=0),
+        _metric(2, epoch=1),
+        _metric(3, epoch=1, stage=ExecutionStage.VAL),
+    ]
+    for record in records:
+        sink.submit(record)
+    sink.close()
+    assert [[(m.stage, m.epoch) for m in b] for b in writer.batches] == [
+        [(ExecutionStage.TRAIN, 0), (ExecutionStage.TRAIN, 0)],
+        [(ExecutionStage.TRAIN, 1)],
+        [(ExecutionStage.VAL, 1)],
+    ]
+
+
+def test_partial_batch_written_after_interval():
+    """A lone record is written once flush_interval_s elapses."""
+    done = threading.Event()
+    sink = AsyncRecordSink(lambda batch: done.set(), SinkConfig(flush_interval_s=0.01))
+    sink.submit(_metric(1.0))
+    assert done.wait(5)
+    sink.close()
+
+
+def test_drop_oldest_policy():
+    """A full queue evicts the oldest queued record."""
+    writer = _GatedWriter()
+    sink = AsyncRecordSink(
+        writer, SinkConfig(max_queue_size=2, batch_size=1, backpressure="drop_oldest")
+    )
+    sink.submit(_metric(0))
+    assert writer.entered.wait(5)  # record 0 is in the writer, queue is empty
+    for value in (1, 2, 3, 4):
+        assert sink.submit(_metric(value))
+    writer.release.set()
+    sink.close()
+    assert writer.values == [0, 3, 4]
+    assert sink.stats.dropped == 2
+
+
+def test_sample_policy():
+    """Under pressure only one of every sample_every new records is kept."""
+    writer = _GatedWriter()
+    config = SinkConfig(max_queue_size=1, batch_size=1, backpressure="sample", sample_every=2)
+    sink = AsyncRecordSink(writer, config)
+    sink.submit(_metric(0))
+    assert writer.entered.wait(5)
+    accepted = [sink.submit(_metric(value)) for value in (1, 2, 3, 4, 5)]
+    writer.release.set()
+    sink.close()
+    assert accepted == [True, False, True, False, True]
+    assert writer.values == [0, 5]
+    assert sink.stats.dropped == 4
+
+
+def test_block_policy_with_timeout():
+    """A blocking producer gives up after block_timeout_s and drops the record."""
+    writer = _GatedWriter()
+    config = SinkConfig(max_queue_size=1, batch_size=1, block_timeout_s=0.01)
+    sink = AsyncRecordSink(writer, config)
+    sink.submit(_metric(0))
+    assert writer.entered.wait(5)
+    assert sink.submit(_metric(1))
+    assert not sink.submit(_metric(2))
+    writer.release.set()
+    sink.close()
+    assert writer.values == [0, 1]
+
+
+def test_block_policy_waits_for_room():
+    """Without a timeout the producer waits until the writer frees a slot."""
+    writer = _GatedWriter()
+    sink = AsyncRecordSink(writer, SinkConfig(max_queue_size=1, batch_size=1))
+    sink.submit(_metric(0))
+    assert writer.entered.wait(5)
+    sink.submit(_metric(1))
+    threading.Timer(0.05, writer.release.set).start()
+    assert sink.submit(_metric(2))
+    sink.close()
+    assert writer.values == [0, 1, 2]
+
+
+def test_writer_errors_surface_on_close():
+    """Writer exceptions are counted and re-raised by close()."""
+
+    def failing(batch):
+        raise OSError("disk full")
+
+    sink = AsyncRecordSink(failing)
+    sink.submit(_metric(1.0))
+    assert sink.flush(timeout=5)
+    assert sink.stats.failed == 1
+    with pytest.raises(RuntimeError, match="writer failed") as info:
+        sink.close()
+    assert isinstance(info.value.__cause__, OSError)
+
+
+def test_submit_after_close_raises():
+    """A closed sink rejects new records; flush on it returns immediately."""
+    sink = AsyncRecordSink(lambda batch: None)
+    sink.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        sink.submit(_metric(1.0))
+    assert sink.flush(timeout=1)
@@ -0,0 +1,109 @@
+"""Tests for the resumable train event ring."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+pytest.importorskip("google.protobuf")
+
+from cuvis_ai_schemas.enums import ExecutionStage  # noqa: E402
+from cuvis_ai_schemas.execution import Context  # noqa: E402
+from cuvis_ai_schemas.grpc import (  # noqa: E402
+    CompactProgressDecoder,
+    CompactProgressEncoder,
+    TrainEventRing,
+)
+from cuvis_ai_schemas.grpc.v1 import cuvis_ai_pb2  # noqa: E402
+
+
+def _event(message: str = "") -> cuvis_ai_pb2.TrainResponse:
+    return cuvis_ai_pb2.TrainResponse(status=cuvis_ai_pb2.TRAIN_STATUS_RUNNING, message=message)
+
+
+def test_append_stamps_sequence_numbers():
+    """Events get consecutive seq values starting at 1."""
+    ring = TrainEventRing(capacity=3)
+    assert ring.latest() is None and ring.oldest_seq == 0
+    assert [ring.append(_event(str(i))) for i in range(5)] == [1, 2, 3, 4, 5]
+    assert [e.seq for e in ring.replay()] == [3, 4, 5]
+    assert ring.oldest_seq == 3 and ring.latest_seq == 5
+    latest = ring.latest()
+    assert latest is not None and latest.message == "4"
+
+
+def test_replay_from_seq_and_gap():
+    """Replay is inclusive; evicted history starts at the oldest retained event."""
+    ring = TrainEventRing(capacity=4)
+    for i in range(6):
+        ring.append(_event(str(i)))
+    assert [e.seq for e in ring.replay(5)] == [5, 6]
+    assert [e.seq for e in ring.replay(1)] == [3, 4, 5, 6]
+    assert ring.replay(7) == []
+
+
+def test_watch_replays_then_tails_until_closed():
+    """A reconnecting watcher gets missed events, then live ones, then stops."""
+    ring = TrainEventRing()
+    for _ in range(3):
+        ring.append(_event())
+    seen: list[int] = []
+
+    def consume() -> None:
+        seen.extend(event.seq for event in ring.watch(from_seq=2, poll_interval=0.05))
+
+    watcher = threading.Thread(target=consume)
+    watcher.start()
+    for _ in range(2):
+        ring.append(_event())
+    ring.close()
+    watcher.join(5)
+    assert not watcher.is_alive()
+    assert seen == [2, 3, 4, 5]
+    with pytest.raises(RuntimeError):
+        ring.append(_event())
+
+
+def test_watch_stops_when_client_goes_away():
+    """is_active lets the server end a watch for a disconnected client."""
+    ring = TrainEventRing()
+    ring.append(_event())
+    active = iter([True, True, False])
+    events = list(ring.watch(is_active=lambda: next(active), poll_interval=0.01))
+    assert [e.seq for e in events] == [1]
+
+
+def _compact_ring(capacity: int = 16) -> TrainEventRing:
+    """Ring with 6 compact events; "b" and the metric "acc" appear at step 3."""
+    ring = TrainEventRing(capacity)
+    encoder = CompactProgressEncoder()
+    for step in range(6):
+        context = Context(stage=ExecutionStage.TRAIN, epoch=0, batch_idx=step, global_step=step)
+        losses = {"a": float(step)} if step < 3 else {"a": float(step), "b": 1.0}
+        response = encoder.add_step(context, losses, {"acc": 0.5} if step >= 3 else {})
+        assert response is not None
+        ring.append(response)
+    return ring
+
+
+def test_mid_stream_watch_decodes_losses():
+    """A subscriber joining after the names were announced still decodes them."""
+    ring = _compact_ring()
+    ring.close()
+    decoder = CompactProgressDecoder()
+    steps = [step for event in ring.watch(from_seq=5) for step in decoder.decode(event)]
+    assert [step.losses for step in steps] == [{"a": 4.0, "b": 1.0}, {"a": 5.0, "b": 1.0}]
+    assert steps[0].metrics == {"acc": 0.5}
+    # The stored events are untouched; a replay from the start announces each name once.
+    assert list(ring.replay(5)[1].compact.new_loss_names) == []
+    full = [name for event in ring.replay() for name in event.compact.new_loss_names]
+    assert full == ["a", "b"]
+
+
+def test_replay_after_eviction_announces_evicted_names():
+    """Names announced only in evicted events are repeated in the first retained one."""
+    ring = _compact_ring(capacity=2)
+    decoder = CompactProgressDecoder()
+    steps = [step for event in ring.replay(1) for step in decoder.decode(event)]
+    assert [step.losses for step in steps] == [{"a": 4.0, "b": 1.0}, {"a": 5.0, "b": 1.0}]
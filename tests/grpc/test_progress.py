@@ -0,0 +1,111 @@
+"""Tests for the compact training progress stream."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+pytest.importorskip("google.protobuf")
+
+from cuvis_ai_schemas.enums import ExecutionStage  # noqa: E402
+from cuvis_ai_schemas.execution import Context  # noqa: E402
+from cuvis_ai_schemas.grpc import (  # noqa: E402
+    CompactProgressDecoder,
+    CompactProgressEncoder,
+    context_to_proto,
+    proto_to_context,
+)
+from cuvis_ai_schemas.grpc.v1 import cuvis_ai_pb2  # noqa: E402
+
+
+def _context(step: int) -> Context:
+    return Context(stage=ExecutionStage.TRAIN, epoch=1, batch_idx=step, global_step=step)
+
+
+def test_context_roundtrip():
+    """Context survives proto conversion."""
+    context = Context(stage=ExecutionStage.VAL, epoch=2, batch_idx=3, global_step=40)
+    assert proto_to_context(context_to_proto(context)) == context
+
+
+def test_names_are_sent_once_and_steps_coalesced():
+    """Names travel only in the first message that uses them; steps are batched."""
+    encoder = CompactProgressEncoder(max_coalesced_steps=3)
+    decoder = CompactProgressDecoder()
+    responses = []
+    for step in range(7):
+        metrics = {"acc": 0.5} if step >= 4 else {}
+        response = encoder.add_step(_context(step), {"total": float(step), "l1": 1.0}, metrics)
+        if response is not None:
+            responses.append(response)
+    responses.append(encoder.finish(message="done"))
+    assert [len(r.compact.steps) for r in responses] == [3, 3, 1]
+    assert list(responses[0].compact.new_loss_names) == ["total", "l1"]
+    assert list(responses[1].compact.new_loss_names) == []
+    assert list(responses[1].compact.new_metric_names) == ["acc"]
+    assert responses[0].context.batch_idx == 2
+    assert responses[-1].status == cuvis_ai_pb2.TRAIN_STATUS_COMPLETE
+
+    steps = [step for r in responses for step in decoder.decode(r)]
+    assert [s.context.batch_idx for s in steps] == list(range(7))
+    assert steps[5].losses == {"total": 5.0, "l1": 1.0}
+    assert steps[5].metrics == {"acc": 0.5}
+    assert steps[0].metrics == {}
+
+
+def test_missing_values_are_omitted_after_decode():
+    """Partial steps carry table indices; unreported names are absent after decode."""
+    encoder = CompactProgressEncoder()
+    decoder = CompactProgressDecoder()
+    first = encoder.add_step(_context(0), {"a": 1.0, "b": 2.0})
+    second = encoder.add_step(_context(1), {"b": 3.0})
+    third = encoder.add_step(_context(2), {"a": 4.0})
+    assert first is not None and second is not None and third is not None
+    assert list(first.compact.steps[0].loss_indices) == []  # dense step
+    assert list(second.compact.steps[0].loss_indices) == [1]
+    assert list(third.compact.steps[0].losses) == [4.0]
+    decoded = [decoder.decode(r)[0].losses for r in (first, second, third)]
+    assert decoded == [{"a": 1.0, "b": 2.0}, {"b": 3.0}, {"a": 4.0}]
+    assert encoder.flush() is None
+
+
+def test_nan_values_survive_roundtrip():
+    """A diverging (NaN) loss or metric is decoded, not mistaken for a gap."""
+    encoder = CompactProgressEncoder()
+    decoder = CompactProgressDecoder()
+    responses = [
+        encoder.add_step(_context(0), {"a": 1.0, "b": 2.0}, {"acc": 0.5}),
+        encoder.add_step(_context(1), {"a": float("nan"), "b": float("nan")}),
+        encoder.add_step(_context(2), {"b": float("nan")}, {"acc": float("nan")}),
+    ]
+    steps = [decoder.decode(r)[0] for r in responses if r is not None]
+    assert set(steps[1].losses) == {"a", "b"}
+    assert all(math.isnan(v) for v in steps[1].losses.values())
+    assert list(steps[2].losses) == ["b"] and math.isnan(steps[2].losses["b"])
+    assert math.isnan(steps[2].metrics["acc"])
+
+
+def test_decoder_accepts_legacy_responses():
+    """Map-based TrainResponse messages decode to a single step."""
+    response = cuvis_ai_pb2.TrainResponse(
+        context=context_to_proto(_context(9)), losses={"total": 0.25}, metrics={"acc": 0.75}
+    )
+    (step,) = CompactProgressDecoder().decode(response)
+    assert step.context.batch_idx == 9
+    assert step.losses == {"total": 0.25} and step.metrics == {"acc": 0.75}
+
+
+def test_compact_is_smaller_than_maps():
+    """With many metrics the compact stream is much smaller than per-step maps."""
+    names = {f"metric/{i:02d}/some_long_name": 0.5 for i in range(40)}
+    encoder = CompactProgressEncoder(max_coalesced_steps=10)
+    compact_bytes = 0
+    legacy_bytes = 0
+    for step in range(100):
+        legacy = cuvis_ai_pb2.TrainResponse(context=context_to_proto(_context(step)), metrics=names)
+        legacy_bytes += legacy.ByteSize()
+        response = encoder.add_step(_context(step), metrics=names)
+        if response is not None:
+            compact_bytes += response.ByteSize()
+    assert compact_bytes * 3 < legacy_bytes
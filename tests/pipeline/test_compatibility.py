@@ -0,0 +1,142 @@
+"""Tests for the torch-free, memoized port compatibility engine."""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pytest
+
+from cuvis_ai_schemas.pipeline import (
+    ConnectionConfig,
+    PortCompatibilityEngine,
+    PortKey,
+    PortSpec,
+    dtype_key,
+)
+from cuvis_ai_schemas.plugin import NodePortSpec
+
+
+class dtype:  # noqa: N801 - mimics ``torch.dtype`` without importing torch
+    __module__ = "torch"
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __str__(self) -> str:
+        return f"torch.{self.name}"
+
+
+class Tensor:
+    __module__ = "torch"
+
+
+def test_dtype_key_normalizes_spellings_without_torch():
+    """Torch, NumPy and string spellings map to one key without importing torch."""
+    had_torch = "torch" in sys.modules
+    assert dtype_key(dtype("float32")) == "float32"
+    assert dtype_key("torch.float") == "float32"
+    assert dtype_key(" Float64 ") == "float64"
+    assert dtype_key(np.float32) == "float32"
+    assert dtype_key(np.dtype("int64")) == "int64"
+    assert dtype_key("long") == "int64"
+    assert dtype_key("float") == dtype_key(np.dtype("float")) == "float64"
+    assert dtype_key("int") == dtype_key(np.dtype("int")) == "int64"
+    assert dtype_key("torch.int") == "int32"
+    assert dtype_key(Tensor) == dtype_key(np.ndarray) == dtype_key("") == ""
+    assert dtype_key(int) == "builtins.int"
+    assert ("torch" in sys.modules) == had_torch
+
+
+def test_check_applies_dtype_and_shape_rules():
+    """Dtype and shape rules match PortSpec semantics and report a mismatch kind."""
+    engine = PortCompatibilityEngine()
+    cube = PortSpec(dtype=dtype("float32"), shape=(-1, -1, -1, 61))
+
+    assert engine.check(cube, PortSpec(dtype=Tensor, shape=(1, 8, 8, 61))) == (True, "")
+    assert engine.check(cube, NodePortSpec(dtype="float32", shape=[]))[0]
+    ok, reason = engine.check(cube, PortSpec(dtype="int64", shape=(-1, -1, -1, 61)))
+    assert not ok and reason == "Dtype mismatch: source has float32, target expects int64"
+    ok, reason = engine.check(cube, PortSpec(dtype=dtype("float32"), shape=(-1, 61)))
+    assert not ok and reason.startswith("Shape rank mismatch")
+    ok, reason = engine.check(cube, PortSpec(dtype=dtype("float32"), shape=(-1, -1, -1, 3)))
+    assert not ok and reason.startswith("Dimension 3 mismatch")
+    assert engine.mismatch(cube, PortSpec(dtype="int64", shape=(-1, -1, -1, 61)))[0] == "dtype"
+    assert engine.mismatch(cube, PortSpec(dtype=dtype("float32"), shape=(-1, 61)))[0] == "shape"
+    assert engine.mismatch(cube, PortSpec(dtype=Tensor, shape=(1, 8, 8, 61))) == (None, "")
+    assert not engine.check(PortSpec(dtype=int, shape=()), PortSpec(dtype=Tensor, shape=()))[0]
+    assert engine.check(NodePortSpec(dtype="float"), NodePortSpec(dtype="float64"))[0]
+
+
+def test_symbolic_dims_resolve_from_nodes():
+    """Symbolic dims resolve from node attributes and stay flexible otherwise."""
+
+    class Node:
+        num_channels = 61
+
+    engine = PortCompatibilityEngine()
+    source = PortSpec(dtype="float32", shape=(-1, "num_channels"))
+    target = PortSpec(dtype="float32", shape=(-1, 3))
+
+    assert engine.check(source, target)[0]  # unresolved symbols stay flexible
+    ok, reason = engine.check(source, target, source_node=Node())
+    assert not ok and reason.startswith("Dimension 1 mismatch")
+    ok, reason = engine.check(source, target, source_node=object())
+    assert not ok and reason.startswith("Shape resolution failed")
+
+
+def test_verdicts_are_cached_per_key_pair():
+    """Repeated checks of the same port keys hit the verdict cache."""
+    engine = PortCompatibilityEngine()
+    source = NodePortSpec(dtype="torch.float32", shape=[-1, 61])
+    target = NodePortSpec(dtype="float32", shape=[4, 61])
+
+    assert engine.port_key(source) == PortKey("float32", (-1, 61))
+    results = engine.check_many([(source, target)] * 100)
+    assert all(ok for ok, _ in results)
+    info = engine.cache_info()
+    assert (info.hits, info.misses) == (99, 1)
+    engine.clear_cache()
+    assert engine.cache_info().currsize == 0
+
+
+def test_check_connections_batches_and_reports_unknown_ports():
+    """Connection batches yield one verdict each, naming unknown ports."""
+    engine = PortCompatibilityEngine()
+    outputs = {"reader": {"cube": NodePortSpec(dtype="float32", shape=[-1, 61])}}
+    inputs = {
+        "norm": {"cube": NodePortSpec(dtype="float32", shape=[-1, 61])},
+        "mask": {"mask": NodePortSpec(dtype="bool")},
+    }
+    connections = [
+        ConnectionConfig(source="reader.outputs.cube", target="norm.inputs.cube"),
+        ConnectionConfig(source="reader.outputs.cube", target="mask.inputs.mask"),
+        ConnectionConfig(source="reader.outputs.nope", target="norm.inputs.cube"),
+        ConnectionConfig(source="reader.outputs.cube", target="norm.inputs.nope"),
+    ]
+
+    verdicts = engine.check_connections(connections, outputs, inputs)
+
+    assert [v.compatible for v in verdicts] == [True, False, False, False]
+    assert verdicts[1].reason.startswith("Dtype mismatch") and verdicts[1].kind == "dtype"
+    assert verdicts[0].kind is None and verdicts[2].kind is None
+    assert verdicts[2].reason == "Unknown output port 'nope' on 'reader'"
+    assert verdicts[3].target == "norm.inputs.nope"
+
+
+def test_matches_port_spec_is_compatible_with():
+    """The engine agrees with PortSpec.is_compatible_with on real torch specs."""
+    torch = pytest.importorskip("torch")
+    engine = PortCompatibilityEngine()
+    specs = [
+        PortSpec(dtype=torch.float32, shape=(-1, 61)),
+        PortSpec(dtype=torch.Tensor, shape=(4, 61)),
+        PortSpec(dtype=torch.int64, shape=(-1, 61)),
+        PortSpec(dtype=torch.float32, shape=(-1, 3)),
+        PortSpec(dtype=torch.float32, shape=(-1,)),
+    ]
+    for source in specs:
+        for target in specs:
+            assert (
+                engine.check(source, target)[0] == source.is_compatible_with(target, None, None)[0]
+            )
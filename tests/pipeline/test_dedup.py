@@ -0,0 +1,151 @@
+"""Tests for shared-node deduplication across pipelines."""
+
+from __future__ import annotations
+
+import pytest
+
+from cuvis_ai_schemas.pipeline import (
+    ConnectionConfig,
+    MergedPipeline,
+    NodeConfig,
+    PipelineConfig,
+    merge_pipelines,
+)
+
+
+def _pipeline(head: str, threshold: float = 0.5) -> PipelineConfig:
+    return PipelineConfig(
+        plugins=["demo", head],
+        nodes=[
+            NodeConfig(name="reader", class_name="demo.Reader"),
+            NodeConfig(name="backbone", class_name="demo.Backbone", hparams={"depth": 4}),
+            NodeConfig(name="head", class_name=f"demo.{head}", hparams={"t": threshold}),
+        ],
+        connections=[
+            ConnectionConfig(source="reader.outputs.cube", target="backbone.inputs.x"),
+            ConnectionConfig(source="backbone.outputs.y", target="head.inputs.x"),
+        ],
+    )
+
+
+def _graph(nodes: dict[str, str], edges: list[tuple[str, str]]) -> PipelineConfig:
+    return PipelineConfig(
+        nodes=[NodeConfig(name=name, class_name=cls) for name, cls in nodes.items()],
+        connections=[ConnectionConfig(source=s, target=t) for s, t in edges],
+    )
+
+
+def test_identical_prefix_is_instantiated_once():
+    """A shared reader/backbone prefix is merged; differing heads stay separate."""
+    merged = merge_pipelines({"rx": _pipeline("rx"), "lad": _pipeline("lad")})
+
+    assert [node.name for node in merged.config.nodes] == [
+        "rx__reader",
+        "rx__backbone",
+        "rx__head",
+        "lad__head",
+    ]
+    assert merged.shared == {
+        "rx__reader": ["rx:reader", "lad:reader"],
+        "rx__backbone": ["rx:backbone", "lad:backbone"],
+    }
+    assert (merged.total_nodes, merged.unique_nodes) == (6, 4)
+    assert [c.target for c in merged.config.connections] == [
+        "rx__backbone.inputs.x",
+        "rx__head.inputs.x",
+        "lad__head.inputs.x",
+    ]
+    assert merged.endpoint("lad", "head.outputs.scores") == "lad__head.outputs.scores"
+    assert merged.config.plugins == ["demo", "rx", "lad"]
+    assert merged.config.graph.levels == (
+        ("rx__reader",),
+        ("rx__backbone",),
+        ("rx__head", "lad__head"),
+    )
+    assert MergedPipeline.from_json(merged.to_json()) == merged
+
+
+def test_weights_and_can_share_keep_nodes_apart():
+    """Different weights or a can_share veto keep a node and its downstream per pipeline."""
+    pipelines = {"a": _pipeline("rx"), "b": _pipeline("rx")}
+
+    assert merge_pipelines(pipelines).unique_nodes == 3
+    by_weights = merge_pipelines(pipelines, weights={"b": {"backbone": "other-ckpt"}})
+    assert by_weights.shared == {"a__reader": ["a:reader", "b:reader"]}
+    assert by_weights.unique_nodes == 5
+
+    no_backbone = merge_pipelines(pipelines, can_share=lambda n: n.class_name != "demo.Backbone")
+    assert list(no_backbone.shared) == ["a__reader"]
+    assert no_backbone.node_map["b"]["head"] == "b__head"
+
+
+def test_pipeline_keys_must_not_contain_dots():
+    """Pipeline keys with dots are rejected."""
+    with pytest.raises(ValueError, match="must not contain '.'"):
+        merge_pipelines({"a.b": _pipeline("rx")})
+
+
+def test_nodes_with_reordered_list_inputs_are_not_shared():
+    """A multi-input node fed in a different order is not shared."""
+    nodes = {"a": "demo.a", "b": "demo.b", "c": "demo.c"}
+    edges = [("a.outputs.y", "c.inputs.parts"), ("b.outputs.y", "c.inputs.parts")]
+
+    merged = merge_pipelines({"p": _graph(nodes, edges), "q": _graph(nodes, edges[::-1])})
+
+    assert list(merged.shared) == ["p__a", "p__b"]
+    assert merged.node_map["q"]["c"] == "q__c"
+
+
+def test_colliding_merged_names_are_disambiguated():
+    """Merged names that would collide get a numeric suffix."""
+    merged = merge_pipelines(
+        {
+            "a": _graph({"b__c": "demo.Reader"}, []),
+            "a__b": _graph({"c": "demo.Other"}, []),
+        }
+    )
+
+    assert [node.name for node in merged.config.nodes] == ["a__b__c", "a__b__c_2"]
+    assert merged.endpoint("a__b", "c.outputs.y") == "a__b__c_2.outputs.y"
+
+
+def test_identical_nodes_of_one_pipeline_are_kept_apart():
+    """Same-class readers fanning into one port stay separate, with both connections."""
+    fan_in = _graph(
+        {"left": "pkg.Reader", "right": "pkg.Reader", "fuse": "pkg.Fuse"},
+        [("left.outputs.cube", "fuse.inputs.cubes"), ("right.outputs.cube", "fuse.inputs.cubes")],
+    )
+
+    merged = merge_pipelines({"a": fan_in})
+    assert [node.name for node in merged.config.nodes] == ["a__left", "a__right", "a__fuse"]
+    assert merged.node_map["a"]["right"] == "a__right"
+    assert [c.source for c in merged.config.connections] == [
+        "a__left.outputs.cube",
+        "a__right.outputs.cube",
+    ]
+
+    twice = merge_pipelines({"a": fan_in, "b": fan_in})
+    assert twice.unique_nodes == 3 and len(twice.config.connections) == 2
+    assert twice.node_map["b"] == twice.node_map["a"]
+
+
+def test_siblings_and_repeated_port_sources_are_not_collapsed():
+    """Twin nodes on one input stay apart and a source fed twice into a port keeps both edges."""
+    config = _graph(
+        {"reader": "pkg.Reader", "n1": "pkg.Norm", "n2": "pkg.Norm", "cat": "pkg.Concat"},
+        [
+            ("reader.outputs.cube", "n1.inputs.x"),
+            ("reader.outputs.cube", "n2.inputs.x"),
+            ("n1.outputs.y", "cat.inputs.parts"),
+            ("n1.outputs.y", "cat.inputs.parts"),
+            ("n2.outputs.y", "cat.inputs.parts"),
+        ],
+    )
+
+    merged = merge_pipelines({"p": config, "q": config})
+    assert merged.unique_nodes == 4 and merged.shared["p__n2"] == ["p:n2", "q:n2"]
+    assert [c.source for c in merged.config.connections if c.to_node == "p__cat"] == [
+        "p__n1.outputs.y",
+        "p__n1.outputs.y",
+        "p__n2.outputs.y",
+    ]
@@ -0,0 +1,95 @@
+"""Tests for the structural pipeline diff."""
+
+from __future__ import annotations
+
+from cuvis_ai_schemas.pipeline import (
+    ConnectionConfig,
+    NodeConfig,
+    PipelineConfig,
+    PipelineDiff,
+    diff_pipelines,
+)
+
+
+def _pipeline() -> PipelineConfig:
+    names = ["reader", "normalize", "detector", "threshold", "viz"]
+    edges = [
+        ("reader.outputs.cube", "normalize.inputs.cube"),
+        ("normalize.outputs.cube", "detector.inputs.cube"),
+        ("detector.outputs.scores", "threshold.inputs.scores"),
+        ("normalize.outputs.cube", "viz.inputs.image"),
+    ]
+    return PipelineConfig(
+        plugins=["demo"],
+        nodes=[NodeConfig(name=n, class_name=f"demo.{n}", hparams={"value": 0.5}) for n in names],
+        connections=[ConnectionConfig(source=s, target=t) for s, t in edges],
+    )
+
+
+def _concat(edges: list[tuple[str, str]]) -> PipelineConfig:
+    return PipelineConfig(
+        nodes=[NodeConfig(name=n, class_name=f"demo.{n}") for n in ["a", "b", "concat", "head"]],
+        connections=[ConnectionConfig(source=s, target=t) for s, t in edges],
+    )
+
+
+def test_identical_pipelines_have_an_empty_diff():
+    """Equal configs diff to nothing, with every node unchanged."""
+    diff = diff_pipelines(_pipeline(), _pipeline())
+
+    assert diff.is_empty
+    assert diff.unchanged_nodes == ["reader", "normalize", "detector", "viz", "threshold"]
+
+
+def test_hparam_edit_reloads_only_that_node_and_its_downstream():
+    """An hparam edit reloads that node and affects nothing upstream or alongside it."""
+    new = _pipeline()
+    new.nodes[3].hparams["value"] = 0.7
+
+    diff = diff_pipelines(_pipeline(), new)
+
+    assert diff.hparams_changed == {"threshold": ["value"]}
+    assert diff.reload_nodes == diff.affected_nodes == ["threshold"]
+    assert diff.unchanged_nodes == ["reader", "normalize", "detector", "viz"]
+    assert not diff.added_connections and not diff.rewired_nodes
+
+
+def test_structural_changes_are_classified():
+    """Node, connection and plugin changes land in their own buckets."""
+    new = _pipeline()
+    new.nodes[1] = NodeConfig(name="normalize", class_name="demo.other")
+    new.nodes.pop()  # viz
+    new.nodes.append(NodeConfig(name="mask", class_name="demo.mask"))
+    new.connections = [c for c in new.connections if c.to_node != "viz"]
+    new.connections.append(
+        ConnectionConfig(source="reader.outputs.cube", target="threshold.inputs.cube")
+    )
+    new.plugins = ["demo", "extra"]
+
+    diff = diff_pipelines(_pipeline(), new)
+
+    assert diff.added_nodes == ["mask"] and diff.removed_nodes == ["viz"]
+    assert diff.replaced_nodes == ["normalize"]
+    assert diff.rewired_nodes == ["threshold"]
+    assert [c.target for c in diff.added_connections] == ["threshold.inputs.cube"]
+    assert [c.target for c in diff.removed_connections] == ["viz.inputs.image"]
+    assert diff.reload_nodes == ["mask", "normalize"]
+    assert diff.affected_nodes == ["mask", "normalize", "detector", "threshold"]
+    assert diff.unchanged_nodes == ["reader"]
+    assert diff.plugins_changed and not diff.is_empty
+    assert PipelineDiff.from_json(diff.to_json()) == diff
+
+
+def test_reordered_multi_input_connections_are_rewired():
+    """Swapping the sources of a multi-input port rewires its node."""
+    edges = [
+        ("a.outputs.y", "concat.inputs.parts"),
+        ("b.outputs.y", "concat.inputs.parts"),
+        ("concat.outputs.y", "head.inputs.x"),
+    ]
+    diff = diff_pipelines(_concat(edges), _concat([edges[1], edges[0], edges[2]]))
+
+    assert diff.rewired_nodes == ["concat"]
+    assert diff.affected_nodes == ["concat", "head"]
+    assert not diff.added_connections and not diff.removed_connections
+    assert not diff.is_empty
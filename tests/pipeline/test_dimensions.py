@@ -0,0 +1,100 @@
+"""Tests for whole-graph symbolic dimension unification."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from cuvis_ai_schemas.pipeline import (
+    ConnectionConfig,
+    NodeConfig,
+    PipelineConfig,
+    PortSpec,
+    unify_dimensions,
+)
+from cuvis_ai_schemas.plugin import NodePortSpec
+
+
+def _pipeline(**hparams: dict[str, Any]) -> PipelineConfig:
+    return PipelineConfig(
+        nodes=[
+            NodeConfig(name=name, class_name=f"demo.{name}", hparams=hparams.get(name, {}))
+            for name in ["reader", "normalize", "head"]
+        ],
+        connections=[
+            ConnectionConfig(source="reader.outputs.cube", target="normalize.inputs.cube"),
+            ConnectionConfig(source="normalize.outputs.cube", target="head.inputs.x"),
+        ],
+    )
+
+
+Specs = dict[str, dict[str, PortSpec | NodePortSpec]]
+
+OUTPUTS: Specs = {
+    "reader": {"cube": PortSpec(dtype="float32", shape=(-1, -1, -1, "n_bands"))},
+    "normalize": {"cube": PortSpec(dtype="float32", shape=(-1, -1, -1, "n_bands"))},
+}
+INPUTS: Specs = {
+    "normalize": {"cube": PortSpec(dtype="float32", shape=(-1, -1, -1, "n_bands"))},
+    "head": {"x": PortSpec(dtype="float32", shape=(-1, -1, -1, "in_channels"))},
+}
+
+
+def test_symbols_propagate_along_edges_and_through_nodes():
+    """An hparam size flows along connections and through each node's shared symbols."""
+    solution = unify_dimensions(_pipeline(reader={"n_bands": 61}), INPUTS, OUTPUTS)
+
+    assert solution.ok
+    assert solution.bindings == {
+        "reader": {"n_bands": 61},
+        "normalize": {"n_bands": 61},
+        "head": {"in_channels": 61},
+    }
+    assert solution.unresolved == {}
+    assert solution.port_shape("head", "x") == (-1, -1, -1, 61)
+    assert solution.port_shape("normalize", "cube", "output") == (-1, -1, -1, 61)
+    assert solution.port_shape("head", "missing") is None
+
+
+def test_sizes_are_inferred_from_downstream_fixed_dims():
+    """A fixed downstream dim binds the upstream symbol it is connected to."""
+    inputs: Specs = {**INPUTS, "head": {"x": NodePortSpec(dtype="float32", shape=[-1, -1, -1, 3])}}
+    solution = unify_dimensions(_pipeline(), inputs, OUTPUTS, bindings={})
+
+    assert solution.bindings["reader"] == {"n_bands": 3}
+
+
+def test_unbound_symbols_are_reported_unresolved():
+    """Symbols without any size source are listed per node."""
+    solution = unify_dimensions(_pipeline(), INPUTS, OUTPUTS)
+
+    assert solution.ok and solution.bindings == {}
+    assert solution.unresolved == {
+        "reader": ("n_bands",),
+        "normalize": ("n_bands",),
+        "head": ("in_channels",),
+    }
+
+
+def test_conflicts_name_both_sizes_and_origins():
+    """A conflict reports the edge, dim, and where each size came from."""
+    config = _pipeline(reader={"n_bands": 61}, head={"in_channels": 3})
+    solution = unify_dimensions(config, INPUTS, OUTPUTS, bindings={"head": {"in_channels": 4}})
+
+    assert not solution.ok
+    (conflict,) = solution.conflicts
+    assert (conflict.source, conflict.target, conflict.dim) == (
+        "normalize.outputs.cube",
+        "head.inputs.x",
+        3,
+    )
+    assert "61 (from hparam reader.n_bands)" in conflict.message
+    assert "4 (from binding head.in_channels)" in conflict.message
+
+
+def test_rank_mismatch_is_a_conflict():
+    """Connected ports of different rank conflict without a dim index."""
+    inputs: Specs = {**INPUTS, "head": {"x": NodePortSpec(dtype="float32", shape=[-1, 61])}}
+    solution = unify_dimensions(_pipeline().graph, inputs, OUTPUTS)
+
+    assert [c.dim for c in solution.conflicts] == [None]
+    assert "rank 4 vs rank 2" in solution.conflicts[0].message
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import pytest
 
-from cuvis_ai_schemas.pipeline import PortCompatibilityError
+from cuvis_ai_schemas.pipeline import (
+    PipelineCycleError,
+    PipelineGraphError,
+    PortCompatibilityError,
+)
 
 
 def test_is_an_exception_subclass():
@@ -16,3 +20,10 @@ def test_raise_and_catch_preserves_message():
     """The error round-trips its message when raised and caught."""
     with pytest.raises(PortCompatibilityError, match="ports x and y"):
         raise PortCompatibilityError("ports x and y are incompatible")
+
+
+def test_cycle_error_is_a_graph_error():
+    """PipelineCycleError carries the cycle and is caught as PipelineGraphError."""
+    with pytest.raises(PipelineGraphError, match="a -> b -> a") as info:
+        raise PipelineCycleError(["a", "b", "a"])
+    assert info.value.cycle == ["a", "b", "a"]
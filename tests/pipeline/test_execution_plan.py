@@ -0,0 +1,142 @@
+"""Tests for parallel execution plans and the thread-pool reference executor."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from cuvis_ai_schemas.enums import NodeTag
+from cuvis_ai_schemas.pipeline import (
+    ConnectionConfig,
+    ExecutionPlan,
+    NodeConfig,
+    PipelineConfig,
+    ThreadPoolPlanExecutor,
+    node_tags_from_capabilities,
+    plan_execution,
+)
+from cuvis_ai_schemas.plugin import PluginCapabilities
+
+
+def _fusion() -> PipelineConfig:
+    """reader -> (rgb_a -> rgb_b | hsi) -> fuse -> head."""
+    edges = [
+        ("reader.outputs.cube", "rgb_a.inputs.x"),
+        ("rgb_a.outputs.y", "rgb_b.inputs.x"),
+        ("reader.outputs.cube", "hsi.inputs.x"),
+        ("rgb_b.outputs.y", "fuse.inputs.parts"),
+        ("hsi.outputs.y", "fuse.inputs.parts"),
+        ("fuse.outputs.y", "head.inputs.x"),
+    ]
+    return PipelineConfig(
+        nodes=[
+            NodeConfig(name=name, class_name=f"demo.{name}")
+            for name in ["reader", "rgb_a", "rgb_b", "hsi", "fuse", "head"]
+        ],
+        connections=[ConnectionConfig(source=s, target=t) for s, t in edges],
+    )
+
+
+def test_plan_lists_levels_branches_and_hints():
+    """The plan exposes levels, the branch DAG, concurrent branches and per-node hints."""
+    fusion = _fusion()
+    plan = plan_execution(
+        fusion, {"hsi": [NodeTag.BATCHED], "fuse": ["stateful"], "head": ["streaming"]}
+    )
+
+    assert plan.levels == [["reader"], ["rgb_a", "hsi"], ["rgb_b"], ["fuse"], ["head"]]
+    assert [(b.nodes, b.depends_on) for b in plan.branches] == [
+        (["reader"], []),
+        (["rgb_a", "rgb_b"], [0]),
+        (["hsi"], [0]),
+        (["fuse", "head"], [1, 2]),
+    ]
+    assert plan.concurrent_branches() == [(1, 2)]
+    assert plan.hint("fuse").concurrency == "serial"
+    assert [h.node for h in plan.nodes if h.micro_batch] == ["hsi", "head"]
+    assert plan.max_parallelism == 2
+    assert ExecutionPlan.from_json(plan.to_json()) == plan
+    with pytest.raises(KeyError, match="Unknown node 'nope'"):
+        plan.hint("nope")
+
+
+def test_tags_come_from_manifest_capabilities():
+    """Node tags are looked up from plugin capability manifests by class name."""
+    fusion = _fusion()
+    capabilities = PluginCapabilities.model_validate(
+        {
+            "plugin_name": "demo",
+            "capabilities": [{"class_name": "demo.fuse", "tags": ["stateful"]}],
+        }
+    )
+    tags = node_tags_from_capabilities(fusion, [capabilities])
+
+    assert tags["fuse"] == ["stateful"] and tags["reader"] == []
+    assert plan_execution(fusion, tags).hint("fuse").concurrency == "serial"
+
+
+def test_executor_runs_independent_branches_concurrently():
+    """Independent branches overlap while serial nodes run alone."""
+    fusion = _fusion()
+    plan = plan_execution(fusion, {"fuse": [NodeTag.STATEFUL]})
+    barrier = threading.Barrier(2, timeout=5)
+    active = 0
+    overlap_with_serial = False
+    lock = threading.Lock()
+
+    def branch(x: int) -> dict[str, Any]:
+        barrier.wait()  # deadlocks unless rgb_a and hsi run at the same time
+        return {"y": x + 1}
+
+    def tracked(fn: Any) -> Any:
+        def run(**kwargs: Any) -> dict[str, Any]:
+            nonlocal active, overlap_with_serial
+            with lock:
+                active += 1
+            time.sleep(0.01)
+            try:
+                return fn(**kwargs)
+            finally:
+                with lock:
+                    active -= 1
+
+        return run
+
+    def fuse(parts: list[int]) -> dict[str, Any]:
+        nonlocal overlap_with_serial
+        overlap_with_serial = active > 0
+        return {"y": sum(parts)}
+
+    nodes = {
+        "reader": lambda path: {"cube": len(path)},
+        "rgb_a": tracked(branch),
+        "rgb_b": lambda x: {"y": x * 10},
+        "hsi": tracked(branch),
+        "fuse": fuse,
+        "head": lambda x: {"y": -x},
+    }
+    outputs = ThreadPoolPlanExecutor(max_workers=4).run(
+        plan, fusion, nodes, inputs={"reader": {"path": "abc"}}
+    )
+
+    assert outputs["head"] == {"y": -(40 + 4)}
+    assert not overlap_with_serial
+
+
+def test_executor_propagates_node_errors_and_missing_callables():
+    """Missing callables fail up front and node exceptions propagate."""
+    fusion = _fusion()
+    plan = plan_execution(fusion)
+    nodes: dict[str, Any] = {name: (lambda **_: {"cube": 1, "y": 1}) for name in plan.order}
+
+    with pytest.raises(KeyError, match="No callable for nodes: head"):
+        ThreadPoolPlanExecutor().run(plan, fusion, {k: v for k, v in nodes.items() if k != "head"})
+
+    def boom(**_: Any) -> dict[str, Any]:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        ThreadPoolPlanExecutor().run(plan, fusion, {**nodes, "hsi": boom})
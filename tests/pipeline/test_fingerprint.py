@@ -0,0 +1,113 @@
+"""Tests for Merkle-style node fingerprints and the node cache policy."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from cuvis_ai_schemas.pipeline import (
+    ConnectionConfig,
+    NodeCachePolicy,
+    NodeConfig,
+    PipelineConfig,
+    cache_key,
+    canonical_json,
+    fingerprint_pipeline,
+    input_digest,
+)
+
+
+def _pipeline(threshold: float = 0.5, backbone_name: str = "backbone") -> PipelineConfig:
+    return PipelineConfig(
+        nodes=[
+            NodeConfig(name="reader", class_name="demo.Reader", hparams={"bands": [1, 2]}),
+            NodeConfig(
+                name=backbone_name,
+                class_name="demo.Backbone",
+                cache=NodeCachePolicy(mode="disk", max_bytes=1 << 30),
+            ),
+            NodeConfig(name="threshold", class_name="demo.Threshold", hparams={"t": threshold}),
+        ],
+        connections=[
+            ConnectionConfig(source="reader.outputs.cube", target=f"{backbone_name}.inputs.x"),
+            ConnectionConfig(source=f"{backbone_name}.outputs.y", target="threshold.inputs.x"),
+        ],
+    )
+
+
+def _concat(edges: list[tuple[str, str]]) -> PipelineConfig:
+    return PipelineConfig(
+        nodes=[NodeConfig(name=n, class_name=f"demo.{n}") for n in ["a", "b", "concat"]],
+        connections=[ConnectionConfig(source=s, target=t) for s, t in edges],
+    )
+
+
+def test_changing_a_downstream_hparam_keeps_upstream_fingerprints():
+    """An hparam edit changes that node's fingerprint but none upstream of it."""
+    before = fingerprint_pipeline(_pipeline())
+    after = fingerprint_pipeline(_pipeline(threshold=0.7))
+
+    assert list(before) == ["reader", "backbone", "threshold"]
+    assert before["reader"] == after["reader"]
+    assert before["backbone"] == after["backbone"]
+    assert before["threshold"] != after["threshold"]
+    assert fingerprint_pipeline(_pipeline()) == before  # deterministic
+
+
+def test_weights_and_upstream_changes_propagate_but_names_do_not():
+    """Weights changes propagate downstream; renaming a node does not."""
+    base = fingerprint_pipeline(_pipeline())
+    new_weights = fingerprint_pipeline(_pipeline(), weights={"backbone": "sha-2"})
+    renamed = fingerprint_pipeline(_pipeline(backbone_name="encoder"))
+
+    assert new_weights["reader"] == base["reader"]
+    assert new_weights["backbone"] != base["backbone"]
+    assert new_weights["threshold"] != base["threshold"]
+    assert renamed["encoder"] == base["backbone"]
+    assert renamed["threshold"] == base["threshold"]
+
+
+def test_canonical_json_is_order_independent():
+    """Mappings and sets canonicalize independent of order; unknown types are rejected."""
+    assert canonical_json({"b": (1, 2), "a": {3, 1}}) == canonical_json({"a": [1, 3], "b": [1, 2]})
+    assert canonical_json(np.float32(0.5)) == "0.5"
+    assert canonical_json(math.nan) == '{"__float__":"nan"}'
+    with pytest.raises(TypeError, match="Cannot fingerprint value of type object"):
+        canonical_json({"x": object()})
+
+
+def test_input_digest_and_cache_key():
+    """Input digests depend on content, dtype and shape, not on memory layout."""
+    cube = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+    digest = input_digest({"cube": cube, "meta": {"id": 1}})
+    assert digest == input_digest({"meta": {"id": 1}, "cube": cube.copy()})
+    assert digest != input_digest({"cube": cube.reshape(4, 3), "meta": {"id": 1}})
+    assert digest != input_digest({"cube": cube.astype(np.float64), "meta": {"id": 1}})
+    assert input_digest({"cube": cube.T}) == input_digest({"cube": np.ascontiguousarray(cube.T)})
+    assert cache_key("abc", digest) == f"abc:{digest}"
+
+
+def test_node_cache_policy_field():
+    """NodeConfig carries an optional, validated cache policy."""
+    node = NodeConfig.from_dict(
+        {"name": "n", "class_name": "x.Y", "cache": {"mode": "memory", "max_bytes": 1024}}
+    )
+    assert node.cache == NodeCachePolicy(mode="memory", max_bytes=1024)
+    assert NodeConfig(name="n", class_name="x.Y").cache is None
+    with pytest.raises(ValidationError):
+        NodeCachePolicy(mode="gpu")  # type: ignore[arg-type]
+
+
+def test_multi_input_order_is_part_of_the_fingerprint():
+    """Reordering the sources of a multi-input port changes the fingerprint."""
+    edges = [("a.outputs.y", "concat.inputs.parts"), ("b.outputs.y", "concat.inputs.parts")]
+
+    forward = fingerprint_pipeline(_concat(edges))
+    backward = fingerprint_pipeline(_concat(edges[::-1]))
+
+    assert forward["a"] == backward["a"] and forward["b"] == backward["b"]
+    assert forward["concat"] != backward["concat"]
@@ -0,0 +1,90 @@
+"""Tests for elementwise-chain fusion detection."""
+
+from __future__ import annotations
+
+import pytest
+
+from cuvis_ai_schemas.pipeline import (
+    ConnectionConfig,
+    NodeConfig,
+    PipelineConfig,
+    find_fusion_groups,
+    plan_execution,
+)
+from cuvis_ai_schemas.plugin import PluginCapabilities
+
+CUBE = {"dtype": "float32", "shape": [-1, -1, -1, -1]}
+
+
+def _capabilities() -> PluginCapabilities:
+    ports = {"input_specs": {"x": CUBE}, "output_specs": {"y": CUBE}}
+    return PluginCapabilities.model_validate(
+        {
+            "plugin_name": "demo",
+            "capabilities": [
+                {"class_name": "demo.Reader", "category": "source", "output_specs": {"y": CUBE}},
+                {"class_name": "demo.Elementwise", "category": "transform", **ports},
+                {
+                    "class_name": "demo.Pool",
+                    "category": "transform",
+                    "input_specs": {"x": CUBE},
+                    "output_specs": {"y": {"dtype": "float32", "shape": [-1, 8]}},
+                },
+                {"class_name": "demo.Model", "category": "model", **ports},
+            ],
+        }
+    )
+
+
+def _pipeline(*chain: tuple[str, str], extra: tuple[tuple[str, str], ...] = ()) -> PipelineConfig:
+    nodes = [("reader", "Reader"), *chain]
+    edges = [(a[0], b[0]) for a, b in zip(nodes, nodes[1:], strict=False)] + list(extra)
+    names = {name for name, _ in nodes}
+    nodes += [(target, "Model") for _, target in extra if target not in names]
+    return PipelineConfig(
+        nodes=[NodeConfig(name=name, class_name=f"demo.{cls}") for name, cls in nodes],
+        connections=[
+            ConnectionConfig(source=f"{a}.outputs.y", target=f"{b}.inputs.x") for a, b in edges
+        ],
+    )
+
+
+def test_finds_shape_preserving_transform_chain():
+    """A run of shape-preserving transforms becomes one group the plan annotates."""
+    pipeline = _pipeline(
+        ("normalize", "Elementwise"),
+        ("band_select", "Elementwise"),
+        ("clamp", "Elementwise"),
+        ("head", "Model"),
+    )
+    (group,) = find_fusion_groups(pipeline, [_capabilities()])
+
+    assert group.nodes == ["normalize", "band_select", "clamp"]
+    assert group.input == "normalize.inputs.x"
+    assert group.output == "clamp.outputs.y"
+    assert group.eliminated == ["normalize.outputs.y", "band_select.outputs.y"]
+
+    plan = plan_execution(pipeline, fusion_groups=[group])
+    assert plan.fusion_groups == [group]
+    assert [h.fusion_group for h in plan.nodes] == [None, 0, 0, 0, None]
+
+
+def test_chains_break_at_fan_out_shape_changes_and_non_transforms():
+    """Fan-out, shape changes and non-transform nodes end a chain."""
+    pipeline = _pipeline(
+        ("a", "Elementwise"),
+        ("b", "Elementwise"),  # fans out to viz: ends the chain a -> b
+        ("c", "Elementwise"),
+        ("d", "Elementwise"),
+        ("pool", "Pool"),  # not shape-preserving
+        ("e", "Elementwise"),
+        extra=(("b", "viz"),),
+    )
+    groups = find_fusion_groups(pipeline, [_capabilities()])
+
+    assert [g.nodes for g in groups] == [["a", "b"], ["c", "d"]]
+    assert [g.index for g in groups] == [0, 1]
+    assert find_fusion_groups(pipeline, []) == []
+    assert find_fusion_groups(pipeline, [_capabilities()], min_length=3) == []
+    with pytest.raises(ValueError, match="min_length must be >= 2"):
+        find_fusion_groups(pipeline, [_capabilities()], min_length=1)
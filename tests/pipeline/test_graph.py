@@ -0,0 +1,165 @@
+"""Tests for the compiled PipelineGraph index."""
+
+from __future__ import annotations
+
+import pickle
+import time
+
+import pytest
+
+from cuvis_ai_schemas.pipeline import (
+    ConnectionConfig,
+    NodeConfig,
+    PipelineConfig,
+    PipelineCycleError,
+    PipelineGraph,
+    PipelineGraphError,
+)
+
+
+def _conn(source: str, target: str) -> ConnectionConfig:
+    return ConnectionConfig(source=source, target=target)
+
+
+def _diamond() -> PipelineConfig:
+    return PipelineConfig(
+        nodes=[NodeConfig(name=name, class_name=f"pkg.{name}") for name in "abcd"],
+        connections=[
+            _conn("a.outputs.cube", "b.inputs.cube"),
+            _conn("a.outputs.cube", "c.inputs.cube"),
+            _conn("a.outputs.mask", "c.inputs.mask"),
+            _conn("b.outputs.out", "d.inputs.left"),
+            _conn("c.outputs.out", "d.inputs.right"),
+        ],
+    )
+
+
+def test_adjacency_and_ports():
+    """Per-node and per-port adjacency mirrors the connection list."""
+    graph = _diamond().graph
+    assert graph.node("c").class_name == "pkg.c"
+    assert list(graph.out_ports("a")) == ["cube", "mask"]
+    assert [c.to_node for c in graph.out_ports("a")["cube"]] == ["b", "c"]
+    assert [c.from_port for c in graph.incoming("c")] == ["cube", "mask"]
+    assert graph.predecessors("c") == ("a",)
+    assert graph.successors("a") == ("b", "c")
+    assert graph.sources() == ("a",) and graph.sinks() == ("d",)
+    assert len(graph) == 4 and "d" in graph
+    with pytest.raises(KeyError, match="Unknown node 'z'"):
+        graph.in_ports("z")
+
+
+def test_topological_order_and_levels():
+    """Levels are wavefronts and the order respects every connection."""
+    graph = _diamond().graph
+    assert graph.levels == (("a",), ("b", "c"), ("d",))
+    position = {name: i for i, name in enumerate(graph.topological_order)}
+    assert all(position[c.from_node] < position[c.to_node] for c in graph.connections)
+
+
+def test_cycle_error_names_the_cycle():
+    """A cycle is reported as the path of node names around it."""
+    config = _diamond()
+    config.connections.append(_conn("d.outputs.out", "b.inputs.feedback"))
+    with pytest.raises(PipelineCycleError, match=r"b -> d -> b") as info:
+        PipelineGraph.from_config(config)
+    assert info.value.cycle == ["b", "d", "b"]
+
+
+def test_invalid_graphs():
+    """Duplicate names and dangling connections are rejected."""
+    nodes = [NodeConfig(name="a", class_name="x"), NodeConfig(name="a", class_name="y")]
+    with pytest.raises(PipelineGraphError, match="Duplicate node name 'a'"):
+        PipelineGraph(nodes, [])
+    with pytest.raises(PipelineGraphError, match="unknown target node 'ghost'"):
+        PipelineGraph(nodes[:1], [_conn("a.outputs.x", "ghost.inputs.y")])
+
+
+def test_graph_is_cached_and_invalidated_on_mutation():
+    """config.graph is reused until nodes or connections change."""
+    config = _diamond()
+    graph = config.graph
+    assert config.graph is graph
+    config.nodes[3].hparams["threshold"] = 0.5  # not structural
+    assert config.graph is graph
+    config.nodes.append(NodeConfig(name="e", class_name="pkg.e"))
+    assert config.graph is not graph and "e" in config.graph
+    graph = config.graph
+    config.connections[0].target = "e.inputs.cube"
+    assert config.graph.predecessors("e") == ("a",)
+    config.nodes = config.nodes[:4]
+    with pytest.raises(PipelineGraphError):
+        _ = config.graph
+
+
+def test_cache_does_not_affect_equality_or_serialization():
+    """The private cache is invisible to ==, dumps, and copies."""
+    config = _diamond()
+    _ = config.graph
+    assert config == _diamond()
+    assert "graph" not in config.to_dict()
+    assert PipelineConfig.from_json(config.to_json()) == config
+    assert config.model_copy(deep=True).graph.levels == config.graph.levels
+    assert pickle.loads(pickle.dumps(config)) == config
+
+
+def _skip_chain(n: int) -> PipelineConfig:
+    nodes = [NodeConfig(name=f"n{i}", class_name="pkg.Node") for i in range(n)]
+    connections = [_conn(f"n{i}.outputs.out", f"n{i + 1}.inputs.in") for i in range(n - 1)]
+    connections += [_conn(f"n{i}.outputs.out", f"n{i + 2}.inputs.skip") for i in range(n - 2)]
+    return PipelineConfig(nodes=nodes, connections=connections)
+
+
+def _build_seconds(n: int) -> float:
+    timings = []
+    for _ in range(3):
+        config = _skip_chain(n)
+        start = time.perf_counter()
+        _ = config.graph
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_large_pipeline_builds_in_linear_time():
+    """Quadrupling the node count roughly quadruples build time (quadratic would be 16x)."""
+    graph = _skip_chain(2000).graph
+    assert len(graph.levels) == 2000
+    assert graph.predecessors("n1999") == ("n1998", "n1997")
+    assert _build_seconds(8000) / _build_seconds(2000) < 10
+
+
+def test_required_subgraph_prunes_unrequested_branches():
+    """Only ancestors of the requested outputs are kept; results are cached per set."""
+    config = _diamond()
+    config.nodes.append(NodeConfig(name="viz", class_name="pkg.viz"))
+    config.connections.append(_conn("b.outputs.out", "viz.inputs.image"))
+    graph = config.graph
+
+    subgraph = graph.required_subgraph(["b.outputs.out"])
+    assert subgraph.nodes == ("a", "b")
+    assert subgraph.pruned == ("c", "viz", "d")
+    assert [conn.target for conn in subgraph.connections] == ["b.inputs.cube"]
+    assert subgraph.sources == ("a",)
+    assert graph.required_subgraph({"b.outputs.out"}) is subgraph
+    assert graph.required_subgraph(["d"]).pruned == ("viz",)
+    assert graph.required_subgraph([]).pruned == ()
+    assert subgraph.required_inputs({"a": {"path": object()}, "b": {"cube": object()}}) == (
+        "a.inputs.path",
+    )
+    with pytest.raises(KeyError, match="Unknown node 'nope'"):
+        graph.required_subgraph(["nope.outputs.x"])
+
+
+def test_prune_returns_standalone_config():
+    """``prune`` copies the required part; mutation invalidates the cached subgraph."""
+    config = _diamond()
+    pruned = config.prune(["c.outputs.out"])
+
+    assert [node.name for node in pruned.nodes] == ["a", "c"]
+    assert pruned.graph.topological_order == ("a", "c")
+    assert len(config.nodes) == 4
+
+    before = config.required_subgraph(["d.outputs.out"])
+    config.connections.pop()
+    assert config.required_subgraph(["d.outputs.out"]) is not before
+    assert config.required_subgraph(["d.outputs.out"]).nodes == ("a", "b", "d")
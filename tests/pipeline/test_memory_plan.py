@@ -0,0 +1,99 @@
+"""Tests for tensor liveness analysis and buffer-reuse planning."""
+
+from __future__ import annotations
+
+from cuvis_ai_schemas.pipeline import (
+    ConnectionConfig,
+    MemoryPlan,
+    NodeConfig,
+    PipelineConfig,
+    PortSpec,
+    plan_memory,
+    unify_dimensions,
+)
+from cuvis_ai_schemas.plugin import NodePortSpec
+
+CUBE = NodePortSpec(dtype="float32", shape=[1, 100, 100, 61])
+
+
+def _chain() -> PipelineConfig:
+    names = ["reader", "a", "b", "c", "d"]
+    return PipelineConfig(
+        nodes=[NodeConfig(name=name, class_name=f"demo.{name}") for name in names],
+        connections=[
+            ConnectionConfig(source=f"{src}.outputs.cube", target=f"{dst}.inputs.cube")
+            for src, dst in zip(names, names[1:], strict=False)
+        ],
+    )
+
+
+def test_chain_lifetimes_peak_and_slot_reuse():
+    """In a chain each tensor dies after its consumer, so two slots suffice."""
+    specs = {name: {"cube": CUBE} for name in ["reader", "a", "b", "c", "d"]}
+    plan = plan_memory(_chain(), specs)
+    cube_bytes = 4 * 100 * 100 * 61
+
+    assert plan.order == ["reader", "a", "b", "c", "d"]
+    assert [(t.produced_at, t.last_use) for t in plan.tensors] == [
+        (0, 1),
+        (1, 2),
+        (2, 3),
+        (3, 4),
+        (4, 4),
+    ]
+    assert all(t.exact and t.nbytes == cube_bytes for t in plan.tensors)
+    assert plan.naive_bytes == 5 * cube_bytes
+    assert plan.peak_bytes == plan.planned_bytes == 2 * cube_bytes
+    assert len(plan.slots) == 2
+    assert plan.releases_after(2) == ["a.outputs.cube"]
+    assert [t.tensor for t in plan.live_at(2)] == ["a.outputs.cube", "b.outputs.cube"]
+
+
+def test_kept_outputs_live_to_the_end_and_block_reuse():
+    """Kept outputs stay live to the last step and need their own slot."""
+    specs = {name: {"cube": CUBE} for name in ["reader", "a", "b", "c", "d"]}
+    plan = plan_memory(_chain(), specs, keep=["a.outputs.cube"])
+
+    assert plan.tensor("a.outputs.cube").last_use == 4
+    assert plan.peak_bytes == 3 * plan.tensor("a.outputs.cube").nbytes
+    assert len(plan.slots) == 3
+
+
+def test_sizes_use_unified_dimensions_and_flag_estimates():
+    """Symbolic dims use unified sizes; unknown dims and dtypes are flagged as estimates."""
+    pipeline = PipelineConfig(
+        nodes=[
+            NodeConfig(name="reader", class_name="demo.Reader", hparams={"n_bands": 61}),
+            NodeConfig(name="head", class_name="demo.Head"),
+        ],
+        connections=[ConnectionConfig(source="reader.outputs.cube", target="head.inputs.x")],
+    )
+    outputs: dict[str, dict[str, PortSpec | NodePortSpec]] = {
+        "reader": {"cube": PortSpec(dtype="float32", shape=(-1, 10, "n_bands"))},
+        "head": {"scores": NodePortSpec(dtype="", shape=[-1])},
+    }
+    solution = unify_dimensions(pipeline, {}, outputs)
+    plan = plan_memory(pipeline, outputs, solution, unknown_dim=2)
+
+    reader = plan.tensor("reader.outputs.cube")
+    assert (reader.shape, reader.nbytes, reader.exact) == ([2, 10, 61], 4 * 2 * 10 * 61, False)
+    scores = plan.tensor("head.outputs.scores")
+    assert (scores.nbytes, scores.exact) == (8, False)
+    assert MemoryPlan.from_json(plan.to_json()) == plan
+    report = plan.report()
+    assert "~4880" in report and "in 2 slots" in report
+
+
+def test_bare_numpy_dtype_names_use_numpy_itemsizes():
+    """Bare float/int dtype names size as float64/int64, like NumPy."""
+    pipeline = PipelineConfig(nodes=[NodeConfig(name="reader", class_name="demo.Reader")])
+    specs = {
+        "reader": {
+            "cube": NodePortSpec(dtype="float", shape=[2, 3]),
+            "labels": NodePortSpec(dtype="int", shape=[2]),
+        }
+    }
+    plan = plan_memory(pipeline, specs)
+
+    assert plan.tensor("reader.outputs.cube").nbytes == 8 * 2 * 3
+    assert plan.tensor("reader.outputs.labels").nbytes == 8 * 2
@@ -0,0 +1,146 @@
+"""Tests for multi-process pipeline partitioning."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from cuvis_ai_schemas.pipeline import (
+    ConnectionConfig,
+    EdgeTrafficAccumulator,
+    NodeConfig,
+    NodeProfilingStats,
+    PartitionPlan,
+    PipelineConfig,
+    partition_pipeline,
+)
+
+
+def _stats(
+    node: str, mean_ms: float, stage: str = "inference", count: int = 10
+) -> NodeProfilingStats:
+    return NodeProfilingStats(
+        node_name=node,
+        stage=stage,
+        count=count,
+        mean_ms=mean_ms,
+        median_ms=mean_ms,
+        std_ms=0.0,
+        min_ms=mean_ms,
+        max_ms=mean_ms,
+        total_ms=mean_ms * count,
+        last_ms=mean_ms,
+    )
+
+
+def _graph(names: list[str], edges: list[tuple[str, str]]) -> PipelineConfig:
+    return PipelineConfig(
+        nodes=[NodeConfig(name=name, class_name=f"demo.{name}") for name in names],
+        connections=[ConnectionConfig(source=s, target=t) for s, t in edges],
+    )
+
+
+def _pipeline() -> PipelineConfig:
+    return _graph(
+        ["reader", "normalize", "backbone", "head", "viz"],
+        [
+            ("reader.outputs.cube", "normalize.inputs.cube"),
+            ("normalize.outputs.cube", "backbone.inputs.x"),
+            ("backbone.outputs.y", "head.inputs.x"),
+            ("normalize.outputs.cube", "viz.inputs.image"),
+            ("backbone.outputs.y", "viz.inputs.overlay"),
+        ],
+    )
+
+
+def _chain_seconds(n: int) -> float:
+    names = [f"n{i}" for i in range(n)]
+    pipeline = _graph(
+        names,
+        [(f"{a}.outputs.y", f"{b}.inputs.x") for a, b in zip(names, names[1:], strict=False)],
+    )
+    stats = [_stats(name, float(i % 7 + 1)) for i, name in enumerate(names)]
+    _ = pipeline.graph  # build the cached graph outside the timed region
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        plan = partition_pipeline(pipeline, 8, stats)
+        timings.append(time.perf_counter() - start)
+    assert len(plan.partitions) == 8
+    assert plan.bottleneck_ms <= plan.total_cost_ms / 8 + 7.0
+    return min(timings)
+
+
+COSTS = {"reader": 4.0, "normalize": 6.0, "backbone": 10.0, "head": 3.0, "viz": 5.0}
+
+
+def test_stages_are_balanced_and_contiguous():
+    """Stages are contiguous in topological order and balance the chosen stage's costs."""
+    pipeline = _pipeline()
+    stats = [_stats(name, cost) for name, cost in COSTS.items()]
+    stats.append(_stats("backbone", 100.0, stage="train"))
+    traffic = EdgeTrafficAccumulator()
+    traffic.record(4096)
+    edges = [traffic.snapshot("backbone.outputs.y", "head.inputs.x", "inference")]
+
+    plan = partition_pipeline(pipeline, 3, stats, stage="inference", edge_stats=edges)
+
+    assert [p.nodes for p in plan.partitions] == [
+        ["reader", "normalize"],
+        ["backbone"],
+        ["head", "viz"],
+    ]
+    assert [p.cost_ms for p in plan.partitions] == [10.0, 10.0, 8.0]
+    assert plan.bottleneck_ms == 10.0
+    assert plan.speedup == pytest.approx(2.8)
+    assert plan.partition_of("viz") == 2
+
+
+def test_cross_partition_edges_become_shared_memory_channels():
+    """Each cut output becomes one named channel listing its targets and traffic."""
+    pipeline = _pipeline()
+    stats = [_stats(name, cost) for name, cost in COSTS.items()]
+    traffic = EdgeTrafficAccumulator()
+    traffic.record(4096)
+    edges = [traffic.snapshot("backbone.outputs.y", "head.inputs.x", "inference")]
+
+    plan = partition_pipeline(pipeline, 3, stats, edge_stats=edges, channel_prefix="s1")
+
+    assert [(c.source, c.targets, c.from_partition, c.to_partition) for c in plan.channels] == [
+        ("normalize.outputs.cube", ["backbone.inputs.x"], 0, 1),
+        ("backbone.outputs.y", ["head.inputs.x", "viz.inputs.overlay"], 1, 2),
+        ("normalize.outputs.cube", ["viz.inputs.image"], 0, 2),
+    ]
+    assert [c.name for c in plan.channels] == ["s1_0_1_0", "s1_1_2_1", "s1_0_2_2"]
+    assert plan.channels[1].byte_size == 4096 and plan.channels[0].byte_size == 0
+    assert plan.partitions[2].inputs == ["s1_1_2_1", "s1_0_2_2"]
+    assert plan.partitions[0].outputs == ["s1_0_1_0", "s1_0_2_2"]
+    assert PartitionPlan.from_json(plan.to_json()) == plan
+
+
+def test_defaults_caps_and_errors():
+    """Partition count is capped at the node count, unknown costs default to the mean, and bad input is rejected."""
+    pipeline = _pipeline()
+    single = partition_pipeline(pipeline, 1)
+    assert len(single.partitions) == 1 and single.channels == []
+    assert single.speedup == 1.0
+
+    capped = partition_pipeline(pipeline, 10, [_stats("backbone", 10.0)])
+    assert [p.nodes for p in capped.partitions] == [[n] for n in pipeline.graph.topological_order]
+    names = [c.name for c in capped.channels]
+    assert all(name.startswith("cuvis_pp_") for name in names) and len(set(names)) == len(names)
+    again = partition_pipeline(pipeline, 10, [_stats("backbone", 10.0)])
+    assert not {c.name for c in again.channels} & set(names)  # unique per plan
+    assert capped.partitions[0].cost_ms == 10.0  # unknown nodes cost the mean known cost
+
+    assert partition_pipeline(PipelineConfig(), 2) == PartitionPlan()
+    with pytest.raises(ValueError, match="num_partitions must be >= 1"):
+        partition_pipeline(pipeline, 0)
+    with pytest.raises(KeyError, match="Unknown node 'nope'"):
+        single.partition_of("nope")
+
+
+def test_large_pipeline_partitions_in_near_linear_time():
+    """Quadrupling the node count stays far below the 16x of a quadratic split."""
+    assert _chain_seconds(8000) / _chain_seconds(2000) < 10
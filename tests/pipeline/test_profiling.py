@@ -1,13 +1,19 @@
-"""Tests for the NodeProfilingStats frozen dataclass."""
+"""Tests for the node/edge profiling dataclasses and accumulators."""
 
 from __future__ import annotations
 
 import dataclasses
+import tracemalloc
 from typing import Any
 
 import pytest
 
-from cuvis_ai_schemas.pipeline.profiling import NodeProfilingStats
+from cuvis_ai_schemas.pipeline.profiling import (
+    EdgeTrafficAccumulator,
+    NodeMemoryAccumulator,
+    NodeProfilingStats,
+    payload_size,
+)
 
 
 def _stats(**overrides: Any) -> NodeProfilingStats:
@@ -48,3 +54,92 @@ def test_equality_by_value():
     """Two stats with identical fields compare equal."""
     assert _stats() == _stats()
     assert _stats(count=11) != _stats(count=10)
+
+
+def test_edge_accumulator_snapshot_totals():
+    """The edge accumulator keeps running byte/tensor totals and the last step."""
+    acc = EdgeTrafficAccumulator()
+    acc.record(100, 1)
+    acc.record(300, 2)
+    stats = acc.snapshot("a.outputs.x", "b.inputs.y", "inference")
+    assert stats.key == ("a.outputs.x", "b.inputs.y")
+    assert (stats.count, stats.total_bytes, stats.max_bytes, stats.last_bytes) == (2, 400, 300, 300)
+    assert stats.mean_bytes == 200.0
+    assert (stats.total_tensors, stats.last_tensors) == (3, 2)
+
+
+def test_edge_accumulator_empty_snapshot_has_zero_mean():
+    """A never-recorded edge snapshots to zeros instead of dividing by zero."""
+    stats = EdgeTrafficAccumulator().snapshot("a.outputs.x", "b.inputs.y", "train")
+    assert stats.count == 0
+    assert stats.mean_bytes == 0.0
+
+
+def test_payload_size_recurses_into_containers():
+    """payload_size counts nbytes-bearing objects inside lists and mappings."""
+
+    class _Buf:
+        def __init__(self, nbytes: int) -> None:
+            self.nbytes = nbytes
+
+    assert payload_size(_Buf(64)) == (64, 1)
+    assert payload_size([_Buf(8), (_Buf(16), "meta")]) == (24, 2)
+    assert payload_size({"a": _Buf(4), "b": 3.0}) == (4, 1)
+    assert payload_size("not a tensor") == (0, 0)
+
+
+def test_record_value_measures_numpy_arrays():
+    """record_value measures real arrays via their nbytes."""
+    np = pytest.importorskip("numpy")
+    acc = EdgeTrafficAccumulator()
+    acc.record_value([np.zeros((4, 4), dtype=np.float32), np.zeros(2, dtype=np.uint8)])
+    assert (acc.last_bytes, acc.last_tensors) == (66, 2)
+
+
+def test_memory_fields_default_to_none():
+    """Memory fields are optional so existing producers keep constructing stats."""
+    stats = _stats()
+    assert stats.peak_bytes is None
+    assert stats.alloc_bytes is None
+    assert stats.alloc_count is None
+    assert stats.device_peak_bytes is None
+
+
+def test_memory_accumulator_without_tracing_records_only_device_peak():
+    """When tracemalloc is off, host fields stay None and device peaks still land."""
+    assert not tracemalloc.is_tracing()
+    acc = NodeMemoryAccumulator()
+    acc.start()
+    acc.stop(device_peak_bytes=2048)
+    acc.start()
+    acc.stop(device_peak_bytes=1024)
+    stats = acc.apply(_stats())
+    assert stats.peak_bytes is None
+    assert stats.device_peak_bytes == 2048
+
+
+def test_memory_accumulator_traces_host_allocations():
+    """Under tracemalloc, a transient allocation shows up in peak but not alloc."""
+    acc = NodeMemoryAccumulator()
+    tracemalloc.start()
+    try:
+        acc.start()
+        transient = bytearray(1_000_000)
+        kept = bytearray(10_000)
+        del transient
+        acc.stop()
+    finally:
+        tracemalloc.stop()
+    assert kept
+    assert acc.peak_bytes is not None and acc.peak_bytes >= 1_000_000
+    assert acc.alloc_bytes is not None and 10_000 <= acc.alloc_bytes < 1_000_000
+
+
+def test_memory_accumulator_keeps_high_water_marks():
+    """record() keeps the maximum of each field across calls."""
+    acc = NodeMemoryAccumulator()
+    acc.record(peak_bytes=10, alloc_bytes=5, alloc_count=2)
+    acc.record(peak_bytes=7, alloc_bytes=9, alloc_count=1)
+    stats = acc.apply(_stats(count=2))
+    assert (stats.peak_bytes, stats.alloc_bytes, stats.alloc_count) == (10, 9, 2)
+    assert stats.count == 2
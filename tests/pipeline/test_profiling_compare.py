@@ -0,0 +1,201 @@
+"""Tests for profiling snapshot comparison and regression gating."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from cuvis_ai_schemas.pipeline import (
+    NodeProfilingStats,
+    ProfilingComparison,
+    RegressionThresholds,
+    compare_profiling,
+    load_profiling_snapshot,
+    profiling_snapshot_from_data,
+    profiling_snapshot_from_proto,
+)
+from cuvis_ai_schemas.pipeline.profiling_compare import student_t_sf, welch_t_test
+
+
+def _stats(
+    name: str = "Decoder", stage: str = "inference", mean: float = 10.0, **overrides: Any
+) -> NodeProfilingStats:
+    fields: dict[str, Any] = {
+        "node_name": name,
+        "stage": stage,
+        "count": 50,
+        "mean_ms": mean,
+        "median_ms": mean,
+        "std_ms": 1.0,
+        "min_ms": mean - 2.0,
+        "max_ms": mean + 2.0,
+        "total_ms": mean * 50,
+        "last_ms": mean,
+    }
+    fields.update(overrides)
+    return NodeProfilingStats(**fields)
+
+
+class TestStatistics:
+    """Student-t tail and Welch test against known reference values."""
+
+    @pytest.mark.parametrize(
+        ("t", "df", "expected"),
+        [
+            (0.0, 3.0, 0.5),
+            (2.0, 10.0, 0.036694017385370),
+            (-1.0, 5.0, 0.818391266175438),
+            (2.228138851986, 10.0, 0.025),
+        ],
+    )
+    def test_student_t_sf(self, t, df, expected):
+        """Upper-tail probabilities match tabulated Student-t values."""
+        assert student_t_sf(t, df) == pytest.approx(expected, abs=1e-9)
+
+    def test_welch_detects_shift(self):
+        """A one-sigma shift over 20 samples is significant in the right direction."""
+        t, p = welch_t_test(10.0, 1.0, 20, 11.0, 1.0, 20)
+        assert t > 0
+        assert p < 0.01
+        _, p_reverse = welch_t_test(11.0, 1.0, 20, 10.0, 1.0, 20)
+        assert p_reverse > 0.99
+
+    def test_welch_zero_variance(self):
+        """Deterministic timings decide by the sign of the difference."""
+        assert welch_t_test(1.0, 0.0, 5, 2.0, 0.0, 5)[1] == 0.0
+        assert welch_t_test(1.0, 0.0, 5, 1.0, 0.0, 5) == (0.0, 0.5)
+
+
+class TestCompareProfiling:
+    """Alignment, classification, and verdict."""
+
+    def test_regression_fails_verdict(self):
+        """A significant, large increase is a regression and fails the gate."""
+        report = compare_profiling([_stats(mean=10.0)], [_stats(mean=13.0)])
+        assert report.verdict == "fail"
+        assert not report.passed
+        (node,) = report.regressions
+        assert node.node_name == "Decoder"
+        assert node.delta_ms == pytest.approx(3.0)
+        assert node.relative_change == pytest.approx(0.3)
+        assert node.p_value is not None and node.p_value < 1e-6
+
+    def test_improvement_passes(self):
+        """A significant decrease is reported as improved and passes."""
+        report = compare_profiling([_stats(mean=13.0)], [_stats(mean=10.0)])
+        assert report.passed
+        assert [n.status for n in report.nodes] == ["improved"]
+        assert report.nodes[0].t_statistic is not None and report.nodes[0].t_statistic < 0
+
+    def test_noise_within_thresholds_is_unchanged(self):
+        """Significant but tiny changes stay below the practical thresholds."""
+        report = compare_profiling([_stats(mean=10.0)], [_stats(mean=10.4, std_ms=0.1)])
+        assert [n.status for n in report.nodes] == ["unchanged"]
+        noisy = compare_profiling([_stats(mean=10.0, std_ms=8.0)], [_stats(mean=12.0, std_ms=8.0)])
+        assert noisy.nodes[0].status == "unchanged"
+        assert noisy.nodes[0].p_value is not None and noisy.nodes[0].p_value > 0.05
+
+    def test_insufficient_data(self):
+        """Too few samples on either side are never gated."""
+        report = compare_profiling([_stats(count=3)], [_stats(mean=50.0)])
+        assert report.passed
+        assert report.nodes[0].status == "insufficient_data"
+        assert report.nodes[0].p_value is None
+
+    def test_alignment_by_node_and_stage(self):
+        """Pairs align on (node_name, stage); unmatched entries are added/removed."""
+        baseline = [_stats("A"), _stats("A", stage="train"), _stats("Gone")]
+        candidate = [_stats("A", mean=20.0), _stats("A", stage="train"), _stats("New")]
+        report = compare_profiling(baseline, candidate)
+        statuses = {(n.node_name, n.stage): n.status for n in report.nodes}
+        assert statuses == {
+            ("A", "inference"): "regressed",
+            ("A", "train"): "unchanged",
+            ("Gone", "inference"): "removed",
+            ("New", "inference"): "added",
+        }
+        assert [(n.stage, n.node_name) for n in report.nodes] == sorted(
+            (n.stage, n.node_name) for n in report.nodes
+        )
+
+    def test_fail_on_removed(self):
+        """Missing candidate nodes fail the verdict only when asked to."""
+        assert compare_profiling([_stats("Gone")], []).passed
+        strict = RegressionThresholds(fail_on_removed=True)
+        assert compare_profiling([_stats("Gone")], [], strict).verdict == "fail"
+
+    def test_custom_thresholds(self):
+        """Looser thresholds let a moderate slowdown pass."""
+        loose = RegressionThresholds(max_relative_increase=0.5)
+        assert compare_profiling([_stats(mean=10.0)], [_stats(mean=13.0)], loose).passed
+
+    def test_duplicate_entries_rejected(self):
+        """A snapshot may list each (node_name, stage) once."""
+        with pytest.raises(ValueError, match="Duplicate"):
+            compare_profiling([_stats(), _stats()], [])
+
+    def test_report_roundtrips_json(self):
+        """The report is a schema model that serializes for CI artifacts."""
+        report = compare_profiling([_stats(mean=10.0)], [_stats(mean=13.0)])
+        restored = ProfilingComparison.from_json(report.to_json())
+        assert restored == report
+
+
+class TestSnapshotLoading:
+    """JSON and proto snapshot loaders."""
+
+    def test_dataclass_style_json(self, tmp_path):
+        """A list of snake_case dicts loads verbatim."""
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps([_stats(peak_bytes=128).__dict__]))
+        assert load_profiling_snapshot(path) == [_stats(peak_bytes=128)]
+
+    def test_proto_json_shape(self):
+        """MessageToDict output (camelCase keys, enum names, int64 strings) loads."""
+        data = {
+            "nodeStats": [
+                {
+                    "nodeName": "Decoder",
+                    "stage": "EXECUTION_STAGE_TRAIN",
+                    "count": "50",
+                    "meanMs": 10.0,
+                    "medianMs": 10.0,
+                    "stdMs": 1.0,
+                    "minMs": 8.0,
+                    "maxMs": 12.0,
+                    "totalMs": 500.0,
+                    "lastMs": 10.0,
+                    "peakBytes": "64",
+                },
+                {"nodeName": "Reader", "stage": "EXECUTION_STAGE_UNSPECIFIED", "count": "1"},
+            ]
+        }
+        decoder, reader = profiling_snapshot_from_data(data)
+        assert decoder == _stats(stage="train", peak_bytes=64)
+        assert reader.stage == "always"
+        assert reader.mean_ms == 0.0
+
+    def test_rejects_unknown_shapes(self):
+        """Non-list payloads and unknown keys raise ValueError."""
+        with pytest.raises(ValueError, match="Expected a list"):
+            profiling_snapshot_from_data({"stats": []})
+        with pytest.raises(ValueError, match="Unknown"):
+            profiling_snapshot_from_data([{"node_name": "a", "bogus": 1}])
+
+    def test_from_proto(self):
+        """Proto summaries convert with stage mapping and optional memory fields."""
+        pytest.importorskip("google.protobuf")
+        from cuvis_ai_schemas.grpc.conversions import node_profiling_stats_to_proto
+        from cuvis_ai_schemas.grpc.v1 import cuvis_ai_pb2
+
+        original = [_stats(stage="val", alloc_bytes=0), _stats("Head", stage="always")]
+        response = cuvis_ai_pb2.GetProfilingSummaryResponse(
+            node_stats=[node_profiling_stats_to_proto(s) for s in original]
+        )
+        assert response.node_stats[0].stage == cuvis_ai_pb2.EXECUTION_STAGE_VAL
+        assert response.node_stats[0].HasField("alloc_bytes")
+        assert not response.node_stats[0].HasField("peak_bytes")
+        assert profiling_snapshot_from_proto(response) == original
+        assert profiling_snapshot_from_proto(response.node_stats) == original
@@ -0,0 +1,140 @@
+"""Tests for offline pipeline validation from plugin manifests."""
+
+from __future__ import annotations
+
+from cuvis_ai_schemas.pipeline import (
+    ConnectionConfig,
+    NodeConfig,
+    PipelineConfig,
+    check_port_specs,
+    validate_pipeline,
+)
+from cuvis_ai_schemas.plugin import NodePortSpec, PluginCapabilities
+
+
+def _capabilities() -> PluginCapabilities:
+    cube = {"dtype": "float32", "shape": [-1, -1, -1, 61]}
+    return PluginCapabilities.model_validate(
+        {
+            "plugin_name": "demo",
+            "capabilities": [
+                {"class_name": "demo.Reader", "output_specs": {"cube": cube}},
+                {
+                    "class_name": "demo.Normalize",
+                    "input_specs": {"cube": cube, "mask": {"dtype": "bool", "optional": True}},
+                    "output_specs": {"cube": cube, "scale": {"dtype": "float64", "shape": [1]}},
+                },
+                {
+                    "class_name": "demo.Stack",
+                    "input_specs": {"parts": {**cube, "variadic": True}},
+                    "output_specs": {"out": {"dtype": "float32", "shape": [-1, -1]}},
+                },
+                {"class_name": "demo.Opaque"},
+            ],
+        }
+    )
+
+
+def _node(name: str, cls: str) -> NodeConfig:
+    return NodeConfig(name=name, class_name=f"demo.{cls}")
+
+
+def _conn(source: str, target: str) -> ConnectionConfig:
+    return ConnectionConfig(source=source, target=target)
+
+
+def test_valid_pipeline_has_no_issues():
+    """A well-formed pipeline with variadic fan-in validates clean."""
+    config = PipelineConfig(
+        plugins=["demo"],
+        nodes=[_node("r", "Reader"), _node("n", "Normalize"), _node("s", "Stack")],
+        connections=[
+            _conn("r.outputs.cube", "n.inputs.cube"),
+            _conn("r.outputs.cube", "s.inputs.parts"),
+            _conn("n.outputs.cube", "s.inputs.parts"),
+        ],
+    )
+    report = validate_pipeline(config, [_capabilities()])
+    assert report.issues == [] and report.ok
+
+
+def test_all_problems_reported_in_one_pass():
+    """Every kind of connection problem is collected, not just the first."""
+    config = PipelineConfig(
+        plugins=["demo", "other"],
+        nodes=[
+            _node("r", "Reader"),
+            _node("n", "Normalize"),
+            _node("m", "Normalize"),
+            _node("x", "Missing"),
+            _node("o", "Opaque"),
+        ],
+        connections=[
+            _conn("n.outputs.scale", "m.inputs.cube"),  # dtype mismatch
+            _conn("r.outputs.cube", "m.inputs.mask"),  # dtype mismatch (bool)
+            _conn("r.outputs.cube", "n.inputs.cube"),
+            _conn("r.outputs.cube", "m.inputs.cube"),  # fan-in into non-variadic
+            _conn("r.outputs.nope", "o.inputs.x"),  # unknown output port
+            _conn("r.outputs.cube", "ghost.inputs.x"),  # unknown node
+        ],
+    )
+    report = validate_pipeline(config, [_capabilities()])
+    codes = sorted(issue.code for issue in report.issues)
+    assert codes == sorted(
+        [
+            "missing_plugin",
+            "unknown_node_class",
+            "no_port_specs",
+            "dtype_mismatch",
+            "dtype_mismatch",
+            "fan_in",
+            "unknown_port",
+            "unknown_node",
+        ]
+    )
+    assert not report.ok
+    assert {issue.code for issue in report.warnings} == {"missing_plugin", "no_port_specs"}
+    (fan_in,) = report.by_code("fan_in")
+    assert (fan_in.node, fan_in.port) == ("m", "cube")
+
+
+def test_required_inputs_and_cycles():
+    """Unconnected required inputs are flagged (severity configurable); cycles are errors."""
+    config = PipelineConfig(
+        nodes=[_node("n", "Normalize"), _node("m", "Normalize")],
+        connections=[_conn("n.outputs.cube", "m.inputs.cube")],
+    )
+    report = validate_pipeline(config, [_capabilities()])
+    (missing,) = report.by_code("missing_required_input")
+    assert (missing.node, missing.port, missing.severity) == ("n", "cube", "warning")
+    strict = validate_pipeline(config, [_capabilities()], unconnected_inputs="error")
+    assert not strict.ok
+
+    config.connections.append(_conn("m.outputs.cube", "n.inputs.cube"))
+    (cycle,) = validate_pipeline(config, [_capabilities()]).by_code("cycle")
+    assert "n -> m -> n" in cycle.message or "m -> n -> m" in cycle.message
+
+
+def test_mismatch_codes_follow_mismatch_kind():
+    """Issue codes come from the structured mismatch kind, not the message text."""
+    config = PipelineConfig(
+        nodes=[_node("r", "Reader"), _node("s", "Stack"), _node("n", "Normalize")],
+        connections=[
+            _conn("r.outputs.cube", "s.inputs.parts"),
+            _conn("s.outputs.out", "n.inputs.cube"),  # rank mismatch
+        ],
+    )
+    (issue,) = validate_pipeline(config, [_capabilities()]).issues
+    assert issue.code == "shape_mismatch" and "rank" in issue.message
+
+
+def test_check_port_specs_rules():
+    """Generic dtypes and empty shapes match; fixed dims must agree."""
+    spec = NodePortSpec
+    assert check_port_specs(spec(dtype="torch.float32"), spec(dtype="float32"))[0]
+    assert check_port_specs(spec(dtype=""), spec(dtype="uint8", shape=[1, 2]))[0]
+    ok, reason = check_port_specs(spec(shape=[-1, 3]), spec(shape=[-1, 4]))
+    assert not ok and reason.startswith("Dimension 1 mismatch")
+    ok, reason = check_port_specs(spec(shape=[1]), spec(shape=[1, 1]))
+    assert not ok and "rank" in reason
+    assert not check_port_specs(spec(dtype="int64"), spec(dtype="float32"))[0]
@@ -48,3 +48,51 @@ def test_pipeline_discovery_uses_explicit_lookup_and_resolved_paths() -> None:
     assert info_fields["resolved_path"].number == 2
     assert "pipeline_path" in request_fields
     assert request_fields["pipeline_path"].number == 1
+
+
+def test_profiling_summary_carries_edge_stats() -> None:
+    """Edge data-volume stats ride alongside node timing in the profiling summary."""
+    summary_fields = cuvis_ai_pb2.GetProfilingSummaryResponse.DESCRIPTOR.fields_by_name
+    edge_fields = cuvis_ai_pb2.EdgeProfilingStats.DESCRIPTOR.fields_by_name
+
+    assert summary_fields["node_stats"].number == 1
+    assert summary_fields["edge_stats"].number == 2
+    assert edge_fields["source"].number == 1
+    assert edge_fields["target"].number == 2
+    assert "total_bytes" in edge_fields
+    assert "total_tensors" in edge_fields
+
+
+def test_node_profiling_stats_memory_fields_are_optional() -> None:
+    """Memory fields track presence so 'not traced' differs from a zero reading."""
+    stats = cuvis_ai_pb2.NodeProfilingStats(node_name="n", peak_bytes=0)
+
+    assert stats.HasField("peak_bytes")
+    assert not stats.HasField("alloc_bytes")
+    assert not stats.HasField("device_peak_bytes")
+    assert cuvis_ai_pb2.NodeProfilingStats.DESCRIPTOR.fields_by_name["peak_bytes"].number == 11
+
+
+def test_train_response_has_compact_progress() -> None:
+    """Compact progress is an additive TrainResponse field negotiated by TrainRequest."""
+    response_fields = cuvis_ai_pb2.TrainResponse.DESCRIPTOR.fields_by_name
+    request_fields = cuvis_ai_pb2.TrainRequest.DESCRIPTOR.fields_by_name
+    step_fields = cuvis_ai_pb2.CompactTrainStep.DESCRIPTOR.fields_by_name
+
+    assert response_fields["compact"].number == 6
+    assert request_fields["compact_progress"].number == 5
+    assert request_fields["max_coalesced_steps"].number == 6
+    assert step_fields["losses"].is_packed
+    assert step_fields["metrics"].is_packed
+
+
+def test_watch_train_resumes_by_sequence() -> None:
+    """TrainResponse carries a seq and WatchTrain resumes from one."""
+    assert cuvis_ai_pb2.TrainResponse.DESCRIPTOR.fields_by_name["seq"].number == 7
+    request_fields = cuvis_ai_pb2.WatchTrainRequest.DESCRIPTOR.fields_by_name
+    assert request_fields["session_id"].number == 1
+    assert request_fields["from_seq"].number == 2
+    for service in ("CuvisAIService", "RunRuntime"):
+        method = cuvis_ai_pb2.DESCRIPTOR.services_by_name[service].methods_by_name["WatchTrain"]
+        assert method.output_type.name == "TrainResponse"
+        assert method.server_streaming